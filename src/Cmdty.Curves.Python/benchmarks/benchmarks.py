@@ -0,0 +1,226 @@
+# Copyright(c) 2026 Jake Fowler
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use, 
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, 
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, 
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+""" Benchmarks of the curve builders, in the format of airspeed velocity (asv).
+
+Run from the directory containing asv.conf.json, in an environment with the package installed in development mode,
+as set up by the build.cake script:
+    asv run --python=same
+    asv run --python=same --bench BuildScaling
+
+Each benchmark class can also be run without asv, as done by plot_scaling.py.
+"""
+
+import time
+import tracemalloc
+import numpy as np
+import pandas as pd
+import curves
+from curves import testing, weighting
+
+ENGINES = ['bootstrap_contracts', 'max_smooth_interp', 'hyperbolic_tension_spline']
+FREQS = ['15min', '30min', 'H', 'D', 'M']
+HORIZON_MONTHS = [12, 36, 120]
+
+# Sub-daily curves over long horizons have too many points for a benchmark run to complete in reasonable time
+_MAX_POINTS = 400_000
+
+
+def monthly_contracts(horizon_months, start='2025-01'):
+    """Contracts for each month of the horizon, priced from a seeded synthetic curve."""
+    months = pd.period_range(start=start, periods=horizon_months, freq='M')
+    curve = testing.synthetic_curve(months[0], months[-1], 'D', seed=0, base_price=60.0, volatility=0.0)
+    return testing.contracts_from_curve(curve, months)
+
+
+def num_points(freq, horizon_months, start='2025-01'):
+    start_period = pd.Period(start, freq='M')
+    return len(pd.period_range(start=start_period.asfreq(freq, 's'), end=(start_period + horizon_months - 1)
+                               .asfreq(freq, 'e'), freq=freq))
+
+
+def skip_if_too_large(freq, horizon_months):
+    """Raising NotImplementedError in setup makes asv skip the parameter combination."""
+    if num_points(freq, horizon_months) > _MAX_POINTS:
+        raise NotImplementedError('{} curve over {} months too large to benchmark'.format(freq, horizon_months))
+
+
+def build_kwargs(engine, freq, horizon_months):
+    kwargs = {'contracts': monthly_contracts(horizon_months), 'freq': freq}
+    if engine == 'hyperbolic_tension_spline':
+        kwargs['tension'] = 0.5
+    elif engine == 'bootstrap_contracts':
+        kwargs['allow_redundancy'] = True
+    return kwargs
+
+
+def _python_average_weight(period):
+    return 0.0 if period.dayofweek >= 5 else 1.0
+
+
+class _TimedCallable:
+    """Wraps a callable, accumulating the time spent in calls, which for the .NET builders is time spent calling back
+    into Python."""
+
+    def __init__(self, func):
+        self.func = func
+        self.seconds = 0.0
+        self.calls = 0
+        if hasattr(func, 'evaluate'):
+            self.evaluate = self._timed(func.evaluate)  # Keeps the vectorised path of curves.arrays.evaluate_on_index
+
+    def _timed(self, func):
+        def timed(*args):
+            start_time = time.perf_counter()
+            try:
+                return func(*args)
+            finally:
+                self.seconds += time.perf_counter() - start_time
+                self.calls += 1
+        return timed
+
+    def __call__(self, *args):
+        return self._timed(self.func)(*args)
+
+
+class BuildScaling:
+    """Wall time and memory of each engine across granularities and horizons, with monthly contracts."""
+    params = [ENGINES, FREQS, HORIZON_MONTHS]
+    param_names = ['engine', 'freq', 'horizon_months']
+    timeout = 300
+
+    def setup(self, engine, freq, horizon_months):
+        skip_if_too_large(freq, horizon_months)
+        self.builder = getattr(curves, engine)
+        self.kwargs = build_kwargs(engine, freq, horizon_months)
+        self.builder(**self.kwargs)  # Warm up JIT compilation and caches
+
+    def time_build(self, engine, freq, horizon_months):
+        self.builder(**self.kwargs)
+
+    def time_build_numpy_output(self, engine, freq, horizon_months):
+        self.builder(output='numpy', **self.kwargs)
+
+    def peakmem_build(self, engine, freq, horizon_months):
+        self.builder(**self.kwargs)
+
+    def track_tracemalloc_peak(self, engine, freq, horizon_months):
+        tracemalloc.start()
+        try:
+            self.builder(**self.kwargs)
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    track_tracemalloc_peak.unit = 'bytes'
+
+
+class KnotScaling:
+    """Hyperbolic tension spline with extra knots, evenly spaced over the curve."""
+    params = [['H', 'D'], [0, 50, 200, 800]]
+    param_names = ['freq', 'num_extra_knots']
+
+    def setup(self, freq, num_extra_knots):
+        horizon_months = 36
+        self.kwargs = build_kwargs('hyperbolic_tension_spline', freq, horizon_months)
+        points = pd.period_range(start=pd.Period('2025-01', freq='M').asfreq(freq, 's'),
+                                 periods=num_points(freq, horizon_months), freq=freq)
+        knot_positions = np.linspace(1, len(points) - 2, num_extra_knots).astype(np.int64) if num_extra_knots else []
+        self.kwargs['knots'] = [points[position] for position in np.unique(knot_positions)]
+
+    def time_build(self, freq, num_extra_knots):
+        curves.hyperbolic_tension_spline(**self.kwargs)
+
+
+class ShapingScaling:
+    """Builds with increasing numbers of shaping spread constraints between consecutive weeks."""
+    params = [['bootstrap_contracts', 'hyperbolic_tension_spline'], [0, 10, 50, 150]]
+    param_names = ['engine', 'num_constraints']
+
+    def setup(self, engine, num_constraints):
+        horizon_months = 36
+        self.builder = getattr(curves, engine)
+        self.kwargs = build_kwargs(engine, 'D', horizon_months)
+        weeks = pd.period_range(start='2025-01-06', periods=num_constraints + 1, freq='W')
+        if num_constraints > num_points('W', horizon_months) - 2:
+            raise NotImplementedError('More constraints than weeks in the horizon')
+        self.kwargs['shaping_spreads'] = [((weeks[i].asfreq('D', 's'), weeks[i].asfreq('D', 'e')),
+                                           (weeks[i + 1].asfreq('D', 's'), weeks[i + 1].asfreq('D', 'e')), 0.1)
+                                          for i in range(num_constraints)]
+        self.builder(**self.kwargs)
+
+    def time_build(self, engine, num_constraints):
+        self.builder(**self.kwargs)
+
+
+class CallableOptions:
+    """Cost of the average weighting callable, as a Python function, a vectorised weighting object, or precomputed
+    before the .NET solve, together with the time spent calling back into Python."""
+    params = [ENGINES, ['none', 'function', 'object', 'precomputed']]
+    param_names = ['engine', 'average_weight']
+
+    def setup(self, engine, average_weight):
+        if average_weight == 'precomputed' and engine == 'hyperbolic_tension_spline':
+            raise NotImplementedError('hyperbolic_tension_spline evaluates callables in Python')
+        self.builder = getattr(curves, engine)
+        self.kwargs = build_kwargs(engine, 'H', 12)
+        if average_weight == 'function':
+            self.kwargs['average_weight'] = _python_average_weight
+        elif average_weight in ('object', 'precomputed'):
+            self.kwargs['average_weight'] = weighting.num_weekdays()
+        if average_weight == 'precomputed':
+            self.kwargs['precompute_callbacks'] = True
+        self.builder(**self.kwargs)
+
+    def time_build(self, engine, average_weight):
+        self.builder(**self.kwargs)
+
+    def track_interop_seconds(self, engine, average_weight):
+        if 'average_weight' not in self.kwargs:
+            return 0.0
+        timed_callable = _TimedCallable(self.kwargs['average_weight'])
+        self.builder(**dict(self.kwargs, average_weight=timed_callable))
+        return timed_callable.seconds
+    track_interop_seconds.unit = 'seconds'
+
+
+class TimeZones:
+    """Hyperbolic tension spline for hourly curves, with and without a time zone with clock changes."""
+    params = [[None, 'Europe/London'], [12, 36]]
+    param_names = ['time_zone', 'horizon_months']
+
+    def setup(self, time_zone, horizon_months):
+        self.kwargs = build_kwargs('hyperbolic_tension_spline', 'H', horizon_months)
+        self.kwargs['time_zone'] = time_zone
+
+    def time_build(self, time_zone, horizon_months):
+        curves.hyperbolic_tension_spline(**self.kwargs)
+
+
+def timeraw_import_curves():
+    """Time to import the package in a fresh process, which doesn't load the .NET runtime."""
+    return 'import curves'
+
+
+def timeraw_import_dotnet_builders():
+    """Time to import the builders which use .NET in a fresh process, including loading the .NET runtime."""
+    return 'import curves.bootstrap, curves.max_smoothness_spline'
@@ -0,0 +1,106 @@
+# Copyright(c) 2026 Jake Fowler
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use, 
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, 
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, 
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+""" Runs the BuildScaling benchmarks directly, without asv, and plots build time and peak traced memory against the
+number of curve points, with one line per engine and freq.
+
+Usage:
+    python benchmarks/plot_scaling.py --engines hyperbolic_tension_spline max_smooth_interp --freqs H D --output scaling.png
+
+Requires matplotlib.
+"""
+
+import argparse
+import os
+import sys
+import time
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from benchmarks import BuildScaling, ENGINES, FREQS, HORIZON_MONTHS, num_points  # noqa: E402
+
+
+def measure(engine, freq, horizon_months, repeats):
+    """Returns the median build time in seconds and the peak traced memory in bytes, or None if the combination is
+    skipped."""
+    benchmark = BuildScaling()
+    try:
+        benchmark.setup(engine, freq, horizon_months)
+    except NotImplementedError:
+        return None
+    times = []
+    for _ in range(repeats):
+        start_time = time.perf_counter()
+        benchmark.time_build(engine, freq, horizon_months)
+        times.append(time.perf_counter() - start_time)
+    return float(np.median(times)), benchmark.track_tracemalloc_peak(engine, freq, horizon_months)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--engines', nargs='+', choices=ENGINES, default=ENGINES)
+    parser.add_argument('--freqs', nargs='+', choices=FREQS, default=FREQS)
+    parser.add_argument('--horizons', type=int, nargs='+', default=HORIZON_MONTHS, help='Horizons in months.')
+    parser.add_argument('--repeats', type=int, default=5)
+    parser.add_argument('--output', default='scaling.png')
+    args = parser.parse_args(argv)
+    try:
+        import matplotlib
+        matplotlib.use('Agg')
+        import matplotlib.pyplot as plt
+    except ImportError:
+        raise ImportError('The matplotlib package must be installed to plot benchmark results.')
+
+    fig, (time_axes, memory_axes) = plt.subplots(1, 2, figsize=(14, 6))
+    print('{:<28} {:>6} {:>8} {:>10} {:>12} {:>14}'.format('engine', 'freq', 'months', 'points', 'seconds',
+                                                            'peak bytes'))
+    for engine in args.engines:
+        for freq in args.freqs:
+            points, seconds, peak_bytes = [], [], []
+            for horizon_months in args.horizons:
+                measurement = measure(engine, freq, horizon_months, args.repeats)
+                if measurement is None:
+                    continue
+                points.append(num_points(freq, horizon_months))
+                seconds.append(measurement[0])
+                peak_bytes.append(measurement[1])
+                print('{:<28} {:>6} {:>8} {:>10} {:>12.5f} {:>14}'.format(engine, freq, horizon_months, points[-1],
+                                                                          seconds[-1], peak_bytes[-1]))
+            if points:
+                label = '{} {}'.format(engine, freq)
+                time_axes.plot(points, seconds, marker='o', label=label)
+                memory_axes.plot(points, peak_bytes, marker='o', label=label)
+    for axes, ylabel in ((time_axes, 'build time (s)'), (memory_axes, 'peak traced memory (bytes)')):
+        axes.set_xscale('log')
+        axes.set_yscale('log')
+        axes.set_xlabel('curve points')
+        axes.set_ylabel(ylabel)
+        axes.grid(True, which='both', alpha=0.3)
+    time_axes.legend(fontsize='small')
+    fig.tight_layout()
+    fig.savefig(args.output)
+    print('Saved plot to {}'.format(args.output))
+
+
+if __name__ == '__main__':
+    main()
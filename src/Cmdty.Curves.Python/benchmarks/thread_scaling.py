@@ -0,0 +1,80 @@
+# Copyright(c) 2026 Jake Fowler
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use, 
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, 
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, 
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+""" Measures throughput of the .NET backed curve builders run concurrently on a thread pool.
+
+Usage:
+    python benchmarks/thread_scaling.py --builder max_smooth_interp --builds 64 --threads 1 2 4 8
+
+With precompute_callbacks=True the .NET solve runs without the GIL, so throughput should scale close to linearly with
+the number of threads, up to the number of physical cores. Run with --callbacks to compare against builds which call
+back into Python for the average weighting.
+"""
+
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+import curves
+from curves import contract_period as cp, weighting
+
+
+def _build_args(builder, precompute_callbacks):
+    contracts = [(cp.month(2024, m), 50.0 + m) for m in range(1, 13)] + \
+                [(cp.quarter(2025, q), 48.0 + q) for q in range(1, 5)] + \
+                [(cp.summer(2026), 45.0), (cp.winter(2026), 55.0)]
+    args = dict(contracts=contracts, freq='D', average_weight=weighting.num_weekdays(),
+                precompute_callbacks=precompute_callbacks)
+    if builder == 'bootstrap_contracts':
+        args['allow_redundancy'] = True
+    return args
+
+
+def _run(builder_func, args, num_builds, num_threads):
+    start_time = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=num_threads) as executor:
+        for _ in executor.map(lambda _: builder_func(**args), range(num_builds)):
+            pass
+    return num_builds / (time.perf_counter() - start_time)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--builder', choices=('max_smooth_interp', 'bootstrap_contracts'), default='max_smooth_interp')
+    parser.add_argument('--builds', type=int, default=64, help='Number of curves built for each thread count.')
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 2, 4, 8])
+    parser.add_argument('--callbacks', action='store_true', help='Call back into Python for the average weighting, '
+                                                                 'rather than precomputing it.')
+    args = parser.parse_args(argv)
+    builder_func = getattr(curves, args.builder)
+    build_args = _build_args(args.builder, not args.callbacks)
+    builder_func(**build_args)  # Warm up the runtime and JIT compilation
+    print('{:>8} {:>14} {:>8}'.format('threads', 'builds/sec', 'scaling'))
+    base_throughput = None
+    for num_threads in args.threads:
+        throughput = _run(builder_func, build_args, args.builds, num_threads)
+        base_throughput = base_throughput or throughput
+        print('{:>8} {:>14.1f} {:>8.2f}'.format(num_threads, throughput, throughput / base_throughput))
+
+
+if __name__ == '__main__':
+    main()
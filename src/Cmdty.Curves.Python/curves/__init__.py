@@ -21,20 +21,30 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
 # OTHER DEALINGS IN THE SOFTWARE.
 
-import platform
+""" Curve construction. The builders which use .NET, bootstrap_contracts and max_smooth_interp, are imported on first
+use, so that the .NET runtime is only loaded when they are used, and modules not requiring it, e.g. curves.client, can
+be imported without it."""
 
-os = platform.system()
-# On non-Windows platform try to load Core CLR, rather than the default behaviour which is to load Mono.
-if os != 'Windows':
-    from pythonnet import load
+from curves.hyperbolic_tension_spline import hyperbolic_tension_spline, hyperbolic_tension_system, KnotPositions
+from curves.arrays import CurveArray, to_arrow
+from curves.instrumentation import BuildStats, StatsEvent, collect_stats, InteropProfile, profile_interop
+from curves.cost import estimate, CostEstimate
+from curves.__version__ import __version__
 
-    try:
-        load('coreclr')
-    except:
-        print('Could not load Core CLR runtime, on non-Windows OS, so falling back to Mono.')
+_DOTNET_ATTRIBUTE_MODULES = {
+    'bootstrap_contracts': 'curves.bootstrap',
+    'max_smooth_interp': 'curves.max_smoothness_spline',
+    'FREQ_TO_PERIOD_TYPE': 'curves._common',
+}
 
-from curves.bootstrap import bootstrap_contracts
-from curves.max_smoothness_spline import max_smooth_interp
-from curves.hyperbolic_tension_spline import hyperbolic_tension_spline, KnotPositions
-from curves._common import FREQ_TO_PERIOD_TYPE
-from curves.__version__ import __version__
\ No newline at end of file
+
+def __getattr__(name):
+    module_name = _DOTNET_ATTRIBUTE_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError("module 'curves' has no attribute '{}'".format(name))
+    import importlib
+    return getattr(importlib.import_module(module_name), name)
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_DOTNET_ATTRIBUTE_MODULES))
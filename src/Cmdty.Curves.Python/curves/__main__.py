@@ -0,0 +1,311 @@
+# Copyright(c) 2026 Jake Fowler
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use, 
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, 
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, 
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+""" Command line interface of the curves package.
+
+Usage:
+    python -m curves build --contracts contracts.csv --spec spec.yaml --output curves.parquet
+
+The contracts file, CSV or Parquet, has one row per contract, with columns curve, start, end and price. The end column
+is optional, with a missing or empty end meaning the contract is for the single period start. Start and end are dates
+or date-times, with end inclusive, so a January 2025 contract has start 2025-01-01 and end 2025-01-31.
+
+The spec file, YAML or JSON, gives the builder arguments for each curve, with defaults applying to all curves:
+
+    defaults:
+      engine: hyperbolic_tension_spline
+      freq: D
+      tension: 0.5
+    curves:
+      nbp:
+        average_weight: {num_business_days: {holidays: ['2025-12-25', '2025-12-26']}}
+      power_de:
+        freq: h
+        time_zone: Europe/Berlin
+        add_season_adjust: {dayofweek: {default: 0.0, saturday: -4.5, sunday: -7.0}}
+
+Callable arguments are specified as a mapping from the name of a function in curves.weighting or curves.adjustments to
+its keyword arguments, or just the function name if it has no arguments, e.g. num_weekdays.
+"""
+
+import argparse
+import json
+import math
+import multiprocessing
+import os
+import sys
+import time
+import typing as tp
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import numpy as np
+import pandas as pd
+from curves import adjustments, weighting
+from curves.arrays import CurveArray, curve_array_from_series
+from curves.parallel import _build_chunk, _init_worker, _validate_engine
+
+OUTPUT_FORMATS = ('parquet', 'npz')
+
+_CALLABLE_FACTORIES = {
+    'num_business_days': weighting.num_business_days,
+    'num_weekdays': weighting.num_weekdays,
+    'num_periods': weighting.num_periods,
+    'dayofweek': adjustments.dayofweek,
+}
+
+
+def main(argv: tp.Optional[tp.Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='curves', description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    subparsers = parser.add_subparsers(dest='command')
+    subparsers.required = True
+    build_parser = subparsers.add_parser('build', help='Build curves from a file of contracts.')
+    build_parser.add_argument('--contracts', required=True, help='CSV or Parquet file of contracts.')
+    build_parser.add_argument('--spec', required=True, help='YAML or JSON file of builder arguments for each curve.')
+    build_parser.add_argument('--output', required=True, help='Output file, to which curves are written as built.')
+    build_parser.add_argument('--format', choices=OUTPUT_FORMATS,
+                              help='Output format. Defaults to the extension of the output file.')
+    build_parser.add_argument('--workers', type=int, help='Number of worker processes. Defaults to the number of '
+                                                          'CPUs. If 1, curves are built in the current process.')
+    build_parser.add_argument('--quiet', action='store_true', help="Don't output progress of each curve.")
+    args = parser.parse_args(argv)
+    try:
+        return build(args.contracts, args.spec, args.output, args.format, args.workers, args.quiet)
+    except (OSError, ValueError, ImportError) as e:
+        print('error: {}'.format(e), file=sys.stderr)
+        return 2
+
+
+def build(contracts_path: str, spec_path: str, output_path: str, output_format: tp.Optional[str] = None,
+          workers: tp.Optional[int] = None, quiet: bool = False) -> int:
+    """
+    Builds the curves for all contracts in a file, writing them to an output file. Used by the command line interface.
+
+    Returns:
+        int: Exit status, being 0 if all curves were built, and 1 if any failed.
+    """
+    start_time = time.perf_counter()
+    output_format = output_format or os.path.splitext(output_path)[1].lstrip('.').lower()
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError("Output format '{}' not supported. Must be one of {}."
+                         .format(output_format, ', '.join(OUTPUT_FORMATS)))
+    jobs = curve_jobs(read_contracts(contracts_path), read_spec(spec_path))
+    workers = os.cpu_count() if workers is None else workers
+    if workers < 1:
+        raise ValueError('workers must be a positive integer, but value of {} has been provided.'.format(workers))
+    num_failed = 0
+    with _WRITERS[output_format](output_path) as writer:
+        for progress, (curve_id, build_result) in enumerate(_build_all(jobs, workers), 1):
+            if build_result.ok:
+                result = build_result.result
+                writer.write(curve_id, result[0] if isinstance(result, tuple) else result)
+                status = 'ok'
+            else:
+                num_failed += 1
+                status = 'FAILED {}: {}'.format(type(build_result.error).__name__, build_result.error)
+            if not quiet:
+                print('[{}/{}] {} {:.3f}s {}'.format(progress, len(jobs), curve_id, build_result.elapsed, status),
+                      file=sys.stderr, flush=True)
+    if not quiet:
+        print('Built {} of {} curves in {:.1f}s.'.format(len(jobs) - num_failed, len(jobs),
+                                                        time.perf_counter() - start_time), file=sys.stderr)
+    return 1 if num_failed else 0
+
+
+def read_contracts(path: str) -> pd.DataFrame:
+    """Reads a CSV or Parquet file of contracts, with columns curve, start, optional end, and price."""
+    if path.lower().endswith('.parquet'):
+        contracts = pd.read_parquet(path)
+    else:
+        contracts = pd.read_csv(path, dtype={'curve': str})
+    missing_columns = [column for column in ('curve', 'start', 'price') if column not in contracts]
+    if missing_columns:
+        raise ValueError('Contracts file {} is missing columns: {}.'.format(path, ', '.join(missing_columns)))
+    if 'end' not in contracts:
+        contracts['end'] = contracts['start']
+    else:
+        contracts['end'] = contracts['end'].where(contracts['end'].notna(), contracts['start'])
+    return contracts
+
+
+def read_spec(path: str) -> tp.Dict[str, tp.Any]:
+    """Reads a YAML or JSON file of builder arguments."""
+    with open(path, 'r') as spec_file:
+        if path.lower().endswith(('.yaml', '.yml')):
+            try:
+                import yaml
+            except ImportError:
+                raise ImportError('The PyYAML package must be installed to read YAML spec files.')
+            spec = yaml.safe_load(spec_file)
+        else:
+            spec = json.load(spec_file)
+    if not isinstance(spec, dict) or set(spec) - {'defaults', 'curves'}:
+        raise ValueError('Spec file {} must be a mapping with keys defaults and/or curves.'.format(path))
+    return spec
+
+
+def curve_jobs(contracts: pd.DataFrame, spec: tp.Mapping[str, tp.Any]) -> tp.List[tp.Tuple[str, str, dict]]:
+    """Creates the (curve_id, engine, builder kwargs) tuple for each curve in the contracts."""
+    defaults = spec.get('defaults') or {}
+    curve_specs = spec.get('curves') or {}
+    unknown_curves = set(curve_specs) - set(contracts['curve'])
+    if unknown_curves:
+        raise ValueError('Spec contains curves which have no contracts: {}.'.format(', '.join(sorted(unknown_curves))))
+    jobs = []
+    for curve_id, curve_contracts in contracts.groupby('curve', sort=False):
+        kwargs = dict(defaults, **(curve_specs.get(curve_id) or {}))
+        engine = kwargs.pop('engine', 'hyperbolic_tension_spline')
+        _validate_engine(engine)
+        if 'freq' not in kwargs:
+            raise ValueError('No freq specified for curve {}.'.format(curve_id))
+        kwargs = {name: _callable_from_spec(value) if name in _CALLABLE_ARGUMENTS else value
+                  for name, value in kwargs.items()}
+        kwargs['contracts'] = {'start': curve_contracts['start'].to_numpy(), 'end': curve_contracts['end'].to_numpy(),
+                               'price': curve_contracts['price'].to_numpy(dtype=np.float64)}
+        kwargs['output'] = 'numpy'
+        jobs.append((str(curve_id), engine, kwargs))
+    return jobs
+
+
+_CALLABLE_ARGUMENTS = ('average_weight', 'mult_season_adjust', 'add_season_adjust')
+
+
+def _callable_from_spec(spec) -> tp.Any:
+    if spec is None:
+        return spec
+    if isinstance(spec, str):
+        name, kwargs = spec, {}
+    elif isinstance(spec, dict) and len(spec) == 1:
+        (name, kwargs), = spec.items()
+        kwargs = kwargs or {}
+    else:
+        raise ValueError('Callable spec {!r} must be a function name, or a mapping from a single function name to its '
+                         'arguments.'.format(spec))
+    factory = _CALLABLE_FACTORIES.get(name)
+    if factory is None:
+        raise ValueError("Callable '{}' not supported. Must be one of {}."
+                         .format(name, ', '.join(sorted(_CALLABLE_FACTORIES))))
+    return factory(**kwargs)
+
+
+def _build_all(jobs, workers) -> tp.Iterator[tp.Tuple[str, tp.Any]]:
+    """Yields (curve_id, BuildResult) for each job, in order of completion."""
+    if workers == 1 or len(jobs) <= 1:
+        for curve_id, engine, kwargs in jobs:
+            yield curve_id, _build_chunk(engine, [kwargs])[0]
+        return
+    # Small chunks so results are written, and progress reported, as curves complete
+    chunksize = max(1, min(8, math.ceil(len(jobs) / (workers * 4))))
+    with ProcessPoolExecutor(max_workers=min(workers, len(jobs)), initializer=_init_worker,
+                             mp_context=multiprocessing.get_context('spawn')) as executor:
+        futures = {}
+        for i in range(0, len(jobs), chunksize):
+            chunk = jobs[i:i + chunksize]
+            engines = {engine for _, engine, _ in chunk}
+            for engine in engines:
+                engine_chunk = [job for job in chunk if job[1] == engine]
+                future = executor.submit(_build_chunk, engine, [kwargs for _, _, kwargs in engine_chunk])
+                futures[future] = [curve_id for curve_id, _, _ in engine_chunk]
+        for future in as_completed(futures):
+            for curve_id, build_result in zip(futures[future], future.result()):
+                yield curve_id, build_result
+
+
+class _ParquetWriter:
+    """Writes curves in long form, with columns curve, freq, time_zone, delivery_start and value, one row group per
+    curve. delivery_start is the wall-clock start of the delivery period, without time zone."""
+
+    def __init__(self, path):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError('The pyarrow package must be installed to write Parquet files.')
+        self._pa = pa
+        schema = pa.schema([('curve', pa.string()), ('freq', pa.string()), ('time_zone', pa.string()),
+                            ('delivery_start', pa.timestamp('ns')), ('value', pa.float64())])
+        self._writer = pq.ParquetWriter(path, schema)
+
+    def write(self, curve_id, curve) -> None:
+        curve_array = _to_curve_array(curve)
+        pa = self._pa
+        num_periods = len(curve_array)
+        delivery_start = _period_starts(curve_array)
+        table = pa.table({'curve': pa.array([curve_id] * num_periods, pa.string()),
+                          'freq': pa.array([curve_array.freq] * num_periods, pa.string()),
+                          'time_zone': pa.array([None if curve_array.tz is None else str(curve_array.tz)] * num_periods,
+                                                pa.string()),
+                          'delivery_start': pa.array(delivery_start, pa.timestamp('ns')),
+                          'value': pa.array(np.asarray(curve_array.values, dtype=np.float64))},
+                         schema=self._writer.schema)
+        self._writer.write_table(table)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._writer.close()
+
+
+class _NpzWriter:
+    """Writes curves to a file readable by numpy.load, with arrays '<curve>' of values, and '<curve>.start_ordinal',
+    '<curve>.freq' and '<curve>.tz' describing the delivery periods, as for CurveArray."""
+
+    def __init__(self, path):
+        self._zip_file = zipfile.ZipFile(path, 'w', compression=zipfile.ZIP_STORED, allowZip64=True)
+
+    def write(self, curve_id, curve) -> None:
+        curve_array = _to_curve_array(curve)
+        self._write_array(curve_id, np.asarray(curve_array.values, dtype=np.float64))
+        self._write_array(curve_id + '.start_ordinal', np.array(curve_array.start_ordinal, dtype=np.int64))
+        self._write_array(curve_id + '.freq', np.array(curve_array.freq))
+        self._write_array(curve_id + '.tz', np.array('' if curve_array.tz is None else str(curve_array.tz)))
+
+    def _write_array(self, name, array) -> None:
+        with self._zip_file.open(name + '.npy', 'w', force_zip64=True) as array_file:
+            np.lib.format.write_array(array_file, array, allow_pickle=False)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._zip_file.close()
+
+
+_WRITERS = {'parquet': _ParquetWriter, 'npz': _NpzWriter}
+
+
+def _to_curve_array(curve) -> CurveArray:
+    return curve if isinstance(curve, CurveArray) else curve_array_from_series(curve)
+
+
+def _period_starts(curve_array: CurveArray) -> np.ndarray:
+    index = curve_array.index()
+    if curve_array.tz is None:
+        return index.start_time.to_numpy()
+    # Wall-clock times of the elapsed periods, so there is no row for nonexistent times, and ambiguous times repeat
+    return index.tz_localize(None).to_numpy()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -21,15 +21,22 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
 # OTHER DEALINGS IN THE SOFTWARE.
 
+from curves import _runtime  # noqa: F401
 import clr
 from System import DateTime
 import System as dotnet
+from System.Runtime.InteropServices import Marshal
 import pandas as pd
-import re
-from datetime import datetime, date
-from typing import Union, Tuple, Iterable
-import typing as tp # TODO consolidate with above line
+import numpy as np
+import operator
+import functools
+from datetime import datetime
 from pathlib import Path
+from curves.arrays import evaluate_on_index
+from curves.contract_period import _last_period
+from curves._contracts import ContractsType, ColumnarContractsType, ShapingTypes, deconstruct_contract, \
+    contract_pandas_periods, is_columnar_contracts, columnar_contract_periods, curve_positions  # noqa: F401
+from curves.instrumentation import interop_profile
 clr.AddReference(str(Path("curves/lib/Cmdty.TimePeriodValueTypes")))
 from Cmdty.TimePeriodValueTypes import QuarterHour, HalfHour, Hour, Day, Month, Quarter, TimePeriodFactory
 
@@ -59,7 +66,7 @@ def transform_time_func(freq, py_time_func):
     def wrapper_time_func(net_time_period):
         pandas_period = net_time_period_to_pandas_period(net_time_period, freq)
         return py_time_func(pandas_period)
-    return wrapper_time_func
+    return interop_profile().wrap('callback', wrapper_time_func)
 
 
 def transform_two_period_func(freq, py_two_period_func):
@@ -67,7 +74,25 @@ def wrapper_time_func(net_time_period1, net_time_period2):
         pandas_period1 = net_time_period_to_pandas_period(net_time_period1, freq)
         pandas_period2 = net_time_period_to_pandas_period(net_time_period2, freq)
         return py_two_period_func(pandas_period1, pandas_period2)
-    return wrapper_time_func
+    return interop_profile().wrap('callback', wrapper_time_func)
+
+
+def precomputed_time_func(freq, time_period_type, py_time_func, net_time_periods_covered):
+    """Evaluates py_time_func over the range of .NET Time Periods spanned by net_time_periods_covered, and returns a .NET
+    Func delegate bound to the indexer of a DoubleTimeSeries holding the results. Invoking the delegate from .NET does not
+    call back into Python, so does not need to acquire the GIL."""
+    covered_periods = [net_time_period_to_pandas_period(net_period, freq) for net_period in net_time_periods_covered]
+    start = min(covered_periods)
+    index = pd.period_range(start=start, end=max(covered_periods), freq=freq)
+    values = np.ascontiguousarray(evaluate_on_index(py_time_func, index), dtype=np.float64)
+    net_values = dotnet.Array.CreateInstance(dotnet.Double, len(values))
+    # Single bulk copy from the numpy buffer, rather than crossing into .NET to set each element
+    Marshal.Copy(dotnet.IntPtr.__overloads__[dotnet.Int64](values.ctypes.data), net_values, 0, len(values))
+    # The time series indices are consecutive from the start, so are created within .NET
+    net_start = net_time_periods_covered[covered_periods.index(start)]
+    net_time_series = ts.DoubleTimeSeries[time_period_type](net_start, net_values)
+    func_type = clr.GetClrType(dotnet.Func[time_period_type, dotnet.Double])
+    return dotnet.Delegate.CreateDelegate(func_type, net_time_series, 'get_Item')
 
 
 def net_datetime_to_py_datetime(net_datetime):
@@ -79,25 +104,28 @@ def net_time_series_to_pandas_series(net_time_series, freq):
     curve_start = net_time_series.Indices[0].Start
     curve_start_datetime = net_datetime_to_py_datetime(curve_start)
     index = pd.period_range(start=curve_start_datetime, freq=freq, periods=net_time_series.Count)
-    prices = [net_time_series.Data[idx] for idx in range(0, net_time_series.Count)]
+    read = interop_profile().wrap('Data[idx]', functools.partial(operator.getitem, net_time_series.Data))
+    prices = [read(idx) for idx in range(0, net_time_series.Count)]
     return pd.Series(prices, index)
 
 
+def net_time_series_values(net_time_series) -> np.ndarray:
+    """Copies the data of an instance of class Cmdty.TimeSeries.TimeSeries into a numpy array"""
+    read = interop_profile().wrap('Data[idx]', functools.partial(operator.getitem, net_time_series.Data))
+    return np.fromiter((read(idx) for idx in range(0, net_time_series.Count)), dtype=np.float64,
+                       count=net_time_series.Count)
+
+
+def net_time_series_start_ordinal(net_time_series, freq) -> int:
+    """Returns the pandas Period ordinal of the first index of an instance of class Cmdty.TimeSeries.TimeSeries"""
+    return net_time_period_to_pandas_period(net_time_series.Indices[0], freq).ordinal
+
+
 def net_time_period_to_pandas_period(net_time_period, freq):
     start_datetime = net_datetime_to_py_datetime(net_time_period.Start)
     return pd.Period(start_datetime, freq=freq)
 
 
-def deconstruct_contract(contract):
-    if len(contract) == 2:
-        (period, price) = contract
-    elif len(contract) == 3:
-        (period, price) = ((contract[0], contract[1]), contract[2])
-    else:
-        raise ValueError("contract tuple must have either 2 or 3 items")
-    return period, price
-
-
 def contract_period(input_period, freq, time_period_type):
     """Converts inputs specifying the contract period from Python types to .NET TimePeriod Start and End"""
     if isinstance(input_period, tuple):
@@ -115,16 +143,6 @@ def contract_period(input_period, freq, time_period_type):
     return start_net, end_net
 
 
-def _last_period(period, freq):
-    """Find the last pandas Period instance of a specific frequency within a Period instance"""
-    if not freq[0].isdigit():
-        return period.asfreq(freq, 'e')
-    m = re.match("(\d+)(\w+)", freq)
-    num = int(m.group(1))
-    sub_freq = m.group(2)
-    return (period.asfreq(sub_freq, 'e') - num + 1).asfreq(freq)
-
-
 def from_datetime_like(datetime_like, time_period_type):
     """ Converts either a pandas Period, datetime or date to a .NET Time Period"""
     if hasattr(datetime_like, 'hour'):
@@ -132,7 +150,19 @@ def from_datetime_like(datetime_like, time_period_type):
     else:
         time_args = (0, 0, 0)
     date_time = DateTime(datetime_like.year, datetime_like.month, datetime_like.day, *time_args)
-    return TimePeriodFactory.FromDateTime[time_period_type](date_time)
+    return interop_profile().wrap('FromDateTime', TimePeriodFactory.FromDateTime[time_period_type])(date_time)
+
+
+def net_time_periods(period_index, time_period_type):
+    """Converts a pandas PeriodIndex to a list of .NET Time Periods, using vectorised extraction of the date-time fields"""
+    years = period_index.year
+    months = period_index.month
+    days = period_index.day
+    hours = period_index.hour
+    minutes = period_index.minute
+    from_date_time = interop_profile().wrap('FromDateTime', TimePeriodFactory.FromDateTime[time_period_type])
+    return [from_date_time(DateTime(int(years[i]), int(months[i]), int(days[i]), int(hours[i]), int(minutes[i]), 0))
+            for i in range(len(period_index))]
 
 
 def series_to_double_time_series(series, time_period_type):
@@ -144,34 +174,3 @@ def series_to_double_time_series(series, time_period_type):
         net_indices[i] = from_datetime_like(series.index[i], time_period_type)
         net_values[i] = series.values[i]
     return ts.DoubleTimeSeries[time_period_type](net_indices, net_values)
-
-
-ContractsType = Iterable[Union[Tuple[date, float], Tuple[datetime, float], Tuple[pd.Period, float],
-                               Tuple[pd.Timestamp, float],
-                               Tuple[date, date, float], Tuple[datetime, datetime, float],
-                               Tuple[pd.Period, pd.Period, float],
-                               Tuple[pd.Timestamp, pd.Timestamp, float],
-                               Tuple[Tuple[date, date], float], Tuple[Tuple[datetime, datetime], float],
-                               Tuple[Tuple[pd.Period, pd.Period], float], Tuple[Tuple[pd.Timestamp, pd.Timestamp], float]]]
-
-ShapingTypes = Iterable[
-    Union[Tuple[pd.Period, pd.Period, float], Tuple[date, date, float], Tuple[datetime, datetime, float],
-          Tuple[Tuple[pd.Period, pd.Period], float], Tuple[Tuple[date, date], float], Tuple[
-              Tuple[datetime, datetime], float]]]
-
-
-def contract_pandas_periods(input_period, freq) -> tp.Tuple[pd.Period, pd.Period]:
-    if isinstance(input_period, tuple):
-        start = pd.Period(input_period[0], freq=freq)
-        end = pd.Period(input_period[1], freq=freq)
-        if start > end: # TODO push this up to get better error message about which argument is causing this?
-            raise ValueError('Contract start must be earlier than or equal to contract end. '
-                             'However start is {} and end is {}.'.format(start, end))
-    else:
-        if isinstance(input_period, pd.Period):
-            start = input_period.asfreq(freq, 's')
-            end = _last_period(input_period, freq)
-        else:
-            start = pd.Period(input_period, freq=freq)
-            end = pd.Period(input_period, freq=freq)
-    return start, end
@@ -0,0 +1,176 @@
+# Copyright(c) 2026 Jake Fowler
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use, 
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, 
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, 
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+""" Conversion of contracts and delivery periods between the forms accepted by the curve builders, using only pandas and
+numpy, so that it can be used by the modules which don't need the .NET runtime."""
+
+import numpy as np
+import pandas as pd
+import typing as tp
+from datetime import datetime, date
+from typing import Union, Tuple, Iterable, Mapping
+from curves.arrays import CurveArray, period_index_from_ordinals
+from curves.contract_period import _last_period
+
+
+def deconstruct_contract(contract):
+    if len(contract) == 2:
+        (period, price) = contract
+    elif len(contract) == 3:
+        (period, price) = ((contract[0], contract[1]), contract[2])
+    else:
+        raise ValueError("contract tuple must have either 2 or 3 items")
+    return period, price
+
+
+ContractsType = Iterable[Union[Tuple[date, float], Tuple[datetime, float], Tuple[pd.Period, float],
+                               Tuple[pd.Timestamp, float],
+                               Tuple[date, date, float], Tuple[datetime, datetime, float],
+                               Tuple[pd.Period, pd.Period, float],
+                               Tuple[pd.Timestamp, pd.Timestamp, float],
+                               Tuple[Tuple[date, date], float], Tuple[Tuple[datetime, datetime], float],
+                               Tuple[Tuple[pd.Period, pd.Period], float], Tuple[Tuple[pd.Timestamp, pd.Timestamp], float]]]
+
+ColumnarContractsType = Union[pd.DataFrame, Mapping[str, Iterable]]
+
+ColumnarShapingType = Union[pd.DataFrame, Mapping[str, Iterable]]
+
+ShapingTypes = Iterable[
+    Union[Tuple[pd.Period, pd.Period, float], Tuple[date, date, float], Tuple[datetime, datetime, float],
+          Tuple[Tuple[pd.Period, pd.Period], float], Tuple[Tuple[date, date], float], Tuple[
+              Tuple[datetime, datetime], float]]]
+
+
+def contract_pandas_periods(input_period, freq) -> tp.Tuple[pd.Period, pd.Period]:
+    if isinstance(input_period, tuple):
+        start = pd.Period(input_period[0], freq=freq)
+        end = pd.Period(input_period[1], freq=freq)
+        if start > end: # TODO push this up to get better error message about which argument is causing this?
+            raise ValueError('Contract start must be earlier than or equal to contract end. '
+                             'However start is {} and end is {}.'.format(start, end))
+    else:
+        if isinstance(input_period, pd.Period):
+            start = input_period.asfreq(freq, 's')
+            end = _last_period(input_period, freq)
+        else:
+            start = pd.Period(input_period, freq=freq)
+            end = pd.Period(input_period, freq=freq)
+    return start, end
+
+
+def is_columnar_contracts(contracts) -> bool:
+    return isinstance(contracts, (pd.DataFrame, Mapping))
+
+
+def columnar_contract_periods(contracts, freq) -> tp.Tuple[pd.PeriodIndex, pd.PeriodIndex, np.ndarray]:
+    """Converts contracts in columnar form, i.e. a DataFrame or mapping with 'start', 'end' and 'price' columns, into
+    PeriodIndex instances of the contract starts and (inclusive) ends, plus an array of prices."""
+    missing_columns = [column for column in ('start', 'end', 'price') if column not in contracts]
+    if missing_columns:
+        raise ValueError('Columnar contracts must contain start, end and price columns. However the following are '
+                         'missing: {}.'.format(', '.join(missing_columns)))
+    starts = _to_period_index(contracts['start'], freq, 's')
+    ends = _to_period_index(contracts['end'], freq, 'e')
+    prices = np.asarray(contracts['price'], dtype=np.float64)
+    if not (len(starts) == len(ends) == len(prices)):
+        raise ValueError('Columnar contracts start, end and price columns must all have the same length. However the '
+                         'lengths are {}, {} and {} respectively.'.format(len(starts), len(ends), len(prices)))
+    start_after_end = starts.asi8 > ends.asi8
+    if start_after_end.any():
+        idx = np.argmax(start_after_end)
+        raise ValueError('Contract start must be earlier than or equal to contract end. However for the contract at '
+                         'position {} start is {} and end is {}.'.format(idx, starts[idx], ends[idx]))
+    non_finite_price = ~np.isfinite(prices)
+    if non_finite_price.any():
+        idx = np.argmax(non_finite_price)
+        raise ValueError('Contract prices must be finite. However the contract at position {} has price {}.'
+                         .format(idx, prices[idx]))
+    return starts, ends, prices
+
+
+def columnar_shaping_periods(shaping, freq, first_name, second_name, value_name) \
+        -> tp.Tuple[pd.PeriodIndex, pd.PeriodIndex, pd.PeriodIndex, pd.PeriodIndex, np.ndarray]:
+    """Converts shaping constraints in columnar form, e.g. a DataFrame with 'long_start', 'long_end', 'short_start',
+    'short_end' and 'spread' columns for first_name 'long', second_name 'short' and value_name 'spread', into PeriodIndex
+    instances of the starts and (inclusive) ends of both delivery periods, plus an array of the values."""
+    columns = (first_name + '_start', first_name + '_end', second_name + '_start', second_name + '_end', value_name)
+    missing_columns = [column for column in columns if column not in shaping]
+    if missing_columns:
+        raise ValueError('Columnar {} shaping must contain {} columns. However the following are missing: {}.'
+                         .format(value_name, ', '.join(columns), ', '.join(missing_columns)))
+    periods = []
+    for start_column, end_column in (columns[:2], columns[2:4]):
+        starts = _to_period_index(shaping[start_column], freq, 's')
+        ends = _to_period_index(shaping[end_column], freq, 'e')
+        if len(starts) == len(ends):
+            start_after_end = starts.asi8 > ends.asi8
+            if start_after_end.any():
+                idx = np.argmax(start_after_end)
+                raise ValueError('Shaping period start must be earlier than or equal to end. However at position {} '
+                                 '{} is {} and {} is {}.'.format(idx, start_column, starts[idx], end_column, ends[idx]))
+        periods += [starts, ends]
+    values = np.asarray(shaping[value_name], dtype=np.float64)
+    lengths = [len(column) for column in periods + [values]]
+    if len(set(lengths)) > 1:
+        raise ValueError('Columnar {} shaping columns must all have the same length. However the lengths of {} are {} '
+                         'respectively.'.format(value_name, ', '.join(columns), ', '.join(map(str, lengths))))
+    return periods[0], periods[1], periods[2], periods[3], values
+
+
+def curve_positions(curve: CurveArray, values, how) -> np.ndarray:
+    """Converts an array-like of pandas Period, date-like or str, as accepted by _to_period_index, to positions of the
+    curve points containing them, with how being 's' for starts and 'e' for inclusive ends. Values outside the curve
+    give positions of -1 or greater than the last point, rather than being clipped. For time zone aware curves
+    ambiguous wall-clock times are taken as the earlier occurrence for starts, and the later for ends."""
+    periods = _to_period_index(values, curve.freq, how)
+    freq_offset = pd.tseries.frequencies.to_offset(curve.freq)
+    if curve.tz is None:
+        # Ordinals of multiple frequencies, e.g. '30min', count the base unit, so aren't consecutive integers
+        return (periods.asi8 - curve.start_ordinal) // freq_offset.n
+    ambiguous = np.full(len(periods), how == 's')
+    timestamps = periods.to_timestamp().tz_localize(curve.tz, ambiguous=ambiguous,
+                                                    nonexistent='shift_forward' if how == 's' else 'shift_backward')
+    index = curve.index()
+    positions = index.searchsorted(timestamps, side='right') - 1
+    positions[timestamps >= index[-1] + freq_offset] = len(index)
+    return positions
+
+
+def _to_period_index(values, freq, how) -> pd.PeriodIndex:
+    """Converts an array-like of pandas Period, date-like or str to a PeriodIndex with a specific freq. Integer
+    array-likes are interpreted as ordinals of Periods which already have the required freq."""
+    if isinstance(getattr(values, 'dtype', None), pd.PeriodDtype):
+        period_index = pd.PeriodIndex(values)
+        return period_index.asfreq(freq, 's') if how == 's' else _last_period(period_index, freq)
+    array = np.asarray(values)
+    if np.issubdtype(array.dtype, np.integer):
+        return period_index_from_ordinals(array, freq)
+    if len(array) > 0 and isinstance(array[0], pd.Period):
+        try:
+            period_index = pd.PeriodIndex(array)
+        except ValueError:
+            # Periods of mixed granularity
+            return pd.PeriodIndex([p.asfreq(freq, 's') if how == 's' else _last_period(p, freq) for p in array],
+                                  freq=freq)
+        return _to_period_index(period_index, freq, how)
+    return pd.DatetimeIndex(pd.to_datetime(array)).to_period(freq)
@@ -0,0 +1,135 @@
+# Copyright(c) 2026 Jake Fowler
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use, 
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, 
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, 
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+import hashlib
+import json
+import pickle
+import types
+import typing as tp
+from datetime import date, datetime, time
+from enum import Enum
+import numpy as np
+import pandas as pd
+
+
+def request_key(engine: tp.Any, args: tp.Sequence[tp.Any], kwargs: tp.Mapping[str, tp.Any]) -> tp.Optional[str]:
+    """Returns a digest identifying a curve build request, or None if the arguments can't be pickled, e.g. because one
+    of them is a lambda. Equal arguments pickle to the same bytes, so requests with equal arguments have equal keys."""
+    engine_id = engine if isinstance(engine, str) else '{}.{}'.format(getattr(engine, '__module__', ''),
+                                                                        getattr(engine, '__qualname__', repr(engine)))
+    try:
+        pickled = pickle.dumps((engine_id, tuple(args), sorted(kwargs.items())), protocol=4)
+    except Exception:
+        return None
+    return hashlib.sha256(pickled).hexdigest()
+
+
+class UnhashableArgument(Exception):
+    """Raised when a curve build argument can't be converted into a stable content hash."""
+
+
+def engine_id(engine: tp.Any) -> str:
+    return engine if isinstance(engine, str) else _function_id(engine)
+
+
+def content_key(engine: tp.Any, kwargs: tp.Mapping[str, tp.Any], salt: str = '') -> str:
+    """
+    Returns a digest of the content of a curve build request, which is stable across processes and sessions.
+
+    Arguments are normalised before hashing, so for example equal pandas.Period instances created separately, or
+    numpy arrays with equal contents, give equal keys. Callable arguments are identified by their module and qualified
+    name, plus their state: the constructor arguments of the classes in curves.weighting and curves.adjustments, or
+    the bytecode, constants, defaults and closure of plain functions.
+
+    Raises:
+        UnhashableArgument: If an argument is of a type which can't be normalised.
+    """
+    normalised = [salt, engine_id(engine), sorted((name, _normalise(value)) for name, value in kwargs.items())]
+    return hashlib.sha256(json.dumps(normalised, separators=(',', ':')).encode()).hexdigest()
+
+
+def _normalise(value) -> tp.Any:
+    if value is None or isinstance(value, (bool, int, str)):
+        return value
+    if isinstance(value, float):
+        return ['float', value.hex()]
+    if isinstance(value, bytes):
+        return ['bytes', hashlib.sha256(value).hexdigest()]
+    if isinstance(value, np.generic):
+        return _normalise(value.item())
+    if isinstance(value, pd.Period):
+        return ['Period', value.freqstr, value.ordinal]
+    if isinstance(value, (datetime, date, time)):
+        return [type(value).__name__, value.isoformat()]
+    if isinstance(value, Enum):
+        return ['Enum', _function_id(type(value)), _normalise(value.value)]
+    if isinstance(value, np.ndarray):
+        return ['ndarray', _array_digest(value)]
+    if isinstance(value, pd.Index):
+        return ['Index', str(value.dtype), _array_digest(pd.util.hash_pandas_object(value).to_numpy())]
+    if isinstance(value, pd.Series):
+        return ['Series', str(value.dtype), _normalise(value.index),
+                _array_digest(pd.util.hash_pandas_object(value, index=False).to_numpy())]
+    if isinstance(value, pd.DataFrame):
+        return ['DataFrame', [str(dtype) for dtype in value.dtypes], _normalise(value.columns), _normalise(value.index),
+                _array_digest(pd.util.hash_pandas_object(value, index=False).to_numpy())]
+    if isinstance(value, (tuple, list)):
+        return ['seq', [_normalise(item) for item in value]]
+    if isinstance(value, tp.Mapping):
+        return ['map', sorted([_normalise(key), _normalise(item)] for key, item in value.items())]
+    if isinstance(value, (set, frozenset)):
+        return ['set', sorted(json.dumps(_normalise(item)) for item in value)]
+    if isinstance(value, types.FunctionType):
+        return ['function', _function_id(value), _function_state(value)]
+    if callable(value) and hasattr(type(value), '__slots__') and type(value).__reduce__ is not object.__reduce__:
+        # Picklable callable classes, such as those in curves.weighting and curves.adjustments
+        constructor, args = value.__reduce__()[:2]
+        return ['callable', _function_id(constructor), _normalise(args)]
+    raise UnhashableArgument('Argument of type {} can\'t be hashed.'.format(type(value).__name__))
+
+
+def _function_id(func) -> str:
+    return '{}.{}'.format(getattr(func, '__module__', ''), getattr(func, '__qualname__', repr(func)))
+
+
+def _function_state(func) -> tp.Any:
+    code = func.__code__
+    closure = [] if func.__closure__ is None else [_normalise(cell.cell_contents) for cell in func.__closure__]
+    return [hashlib.sha256(code.co_code).hexdigest(), _normalise_code_constants(code.co_consts),
+            _normalise(func.__defaults__ or ()), _normalise(func.__kwdefaults__ or {}), closure]
+
+
+def _normalise_code_constants(constants) -> tp.Any:
+    return [_function_state_of_code(constant) if isinstance(constant, types.CodeType) else _normalise(constant)
+            for constant in constants]
+
+
+def _function_state_of_code(code) -> tp.Any:
+    return [hashlib.sha256(code.co_code).hexdigest(), _normalise_code_constants(code.co_consts)]
+
+
+def _array_digest(array: np.ndarray) -> tp.List[tp.Any]:
+    array = np.ascontiguousarray(array)
+    if array.dtype == object:
+        raise UnhashableArgument('Arrays of dtype object can\'t be hashed.')
+    return [array.dtype.str, list(array.shape), hashlib.sha256(array.tobytes()).hexdigest()]
@@ -0,0 +1,177 @@
+# Copyright(c) 2026 Jake Fowler
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use, 
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, 
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, 
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+""" JSON encoding of curve build arguments and results, used by curves.server and curves.client.
+
+numpy, pandas and the rest of the curves package are only imported when needed, so that curves.client is cheap to
+import."""
+
+import base64
+import sys
+import typing as tp
+from datetime import date, datetime
+
+DEFAULT_PORT = 8765
+
+# Callables which can be sent to the server, by their constructor arguments. Arbitrary functions can't be sent, as
+# the server would need to import or execute code named by the client.
+_CALLABLE_CLASSES = {
+    'curves.weighting.NumBusinessDays': ('curves.weighting', 'NumBusinessDays'),
+    'curves.weighting.NumPeriods': ('curves.weighting', 'NumPeriods'),
+    'curves.adjustments.DayOfWeekAdjustment': ('curves.adjustments', 'DayOfWeekAdjustment'),
+}
+
+
+def encode(value) -> tp.Any:
+    """Converts a value into JSON serialisable form, which can be converted back using decode.
+
+    Raises:
+        TypeError: If the value, or an element of it, is of a type which isn't supported.
+    """
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    # Values of numpy, pandas or curves types can only exist if their modules have already been imported
+    np = sys.modules.get('numpy')
+    pd = sys.modules.get('pandas')
+    if np is None or pd is None:
+        return _encode_builtin(value)
+    from curves.arrays import CurveArray
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, pd.Period):
+        return {'$period': str(value), 'freq': value.freqstr}
+    if isinstance(value, pd.Timestamp):
+        return {'$timestamp': value.isoformat(), 'tz': None if value.tzinfo is None else str(value.tz)}
+    if isinstance(value, CurveArray):
+        return {'$curve_array': [encode(np.asarray(value.values)), int(value.start_ordinal), value.freq,
+                                 None if value.tz is None else str(value.tz)]}
+    if type(value).__name__ == 'KnotPositions':
+        return {'$knot_positions': int(value.value)}
+    if type(value).__name__ == 'Contract' and isinstance(value, tuple):
+        return {'$contract': [encode(item) for item in value]}
+    if isinstance(value, np.ndarray):
+        if value.dtype == object:
+            return {'$objects': [encode(item) for item in value.tolist()]}
+        array = np.ascontiguousarray(value)
+        return {'$array': base64.b64encode(array.tobytes()).decode('ascii'), 'dtype': array.dtype.str,
+                'shape': list(array.shape)}
+    if isinstance(value, pd.PeriodIndex):
+        return {'$period_index': encode(value.asi8), 'freq': value.freqstr}
+    if isinstance(value, pd.DatetimeIndex):
+        # asi8 is UTC for time zone aware indices, avoiding ambiguity of local times around clock changes
+        return {'$datetime_index': encode(value.asi8), 'tz': None if value.tz is None else str(value.tz),
+                'freq': value.freqstr}
+    if isinstance(value, pd.Index):
+        return {'$index': encode(value.to_numpy())}
+    if isinstance(value, pd.Series):
+        return {'$series': encode(value.to_numpy()), 'index': encode(value.index), 'name': encode(value.name)}
+    if isinstance(value, pd.DataFrame):
+        return {'$frame': [encode(value[column].to_numpy()) for column in value.columns],
+                'columns': encode(value.columns), 'index': encode(value.index)}
+    return _encode_builtin(value)
+
+
+def _encode_builtin(value) -> tp.Any:
+    if isinstance(value, datetime):
+        return {'$datetime': value.isoformat()}
+    if isinstance(value, date):
+        return {'$date': value.isoformat()}
+    if isinstance(value, tuple):
+        return {'$tuple': [encode(item) for item in value]}
+    if isinstance(value, list):
+        return [encode(item) for item in value]
+    if isinstance(value, tp.Mapping):
+        return {'$map': [[encode(key), encode(item)] for key, item in value.items()]}
+    callable_name = '{}.{}'.format(type(value).__module__, type(value).__name__)
+    if callable_name in _CALLABLE_CLASSES:
+        return {'$callable': callable_name, 'args': encode(value.__reduce__()[1])}
+    raise TypeError('Value of type {} can\'t be sent to the curve server. Callable arguments must be instances of the '
+                    'classes in curves.weighting or curves.adjustments.'.format(type(value).__name__))
+
+
+def decode(value) -> tp.Any:
+    """Converts a value created by encode back to its original form.
+
+    Raises:
+        ValueError: If the value is malformed, or names a callable which isn't supported.
+    """
+    if isinstance(value, list):
+        return [decode(item) for item in value]
+    if not isinstance(value, dict):
+        return value
+    if '$datetime' in value:
+        return datetime.fromisoformat(value['$datetime'])
+    if '$date' in value:
+        return date.fromisoformat(value['$date'])
+    if '$tuple' in value:
+        return tuple(decode(item) for item in value['$tuple'])
+    if '$map' in value:
+        return {decode(key): decode(item) for key, item in value['$map']}
+    import numpy as np
+    import pandas as pd
+    if '$period' in value:
+        return pd.Period(value['$period'], freq=value['freq'])
+    if '$timestamp' in value:
+        timestamp = pd.Timestamp(value['$timestamp'])
+        return timestamp if value['tz'] is None else timestamp.tz_convert(value['tz'])
+    if '$curve_array' in value:
+        from curves.arrays import CurveArray
+        values, start_ordinal, freq, tz = value['$curve_array']
+        return CurveArray(decode(values), start_ordinal, freq, tz)
+    if '$knot_positions' in value:
+        from curves.hyperbolic_tension_spline import KnotPositions
+        return KnotPositions(value['$knot_positions'])
+    if '$contract' in value:
+        from curves.contract_period import Contract
+        return Contract(*decode(value['$contract']))
+    if '$objects' in value:
+        array = np.empty(len(value['$objects']), dtype=object)
+        array[:] = [decode(item) for item in value['$objects']]
+        return array
+    if '$array' in value:
+        return np.frombuffer(base64.b64decode(value['$array']), dtype=np.dtype(value['dtype'])) \
+            .reshape(value['shape']).copy()
+    if '$period_index' in value:
+        from curves.arrays import period_index_from_ordinals
+        return period_index_from_ordinals(decode(value['$period_index']), value['freq'])
+    if '$datetime_index' in value:
+        index = pd.DatetimeIndex(decode(value['$datetime_index']).astype('datetime64[ns]'))
+        if value['tz'] is not None:
+            index = index.tz_localize('UTC').tz_convert(value['tz'])
+        return index if value['freq'] is None else pd.DatetimeIndex(index, freq=value['freq'])
+    if '$index' in value:
+        return pd.Index(decode(value['$index']))
+    if '$series' in value:
+        return pd.Series(data=decode(value['$series']), index=decode(value['index']), name=decode(value['name']))
+    if '$frame' in value:
+        columns = decode(value['columns'])
+        return pd.DataFrame({column: decode(data) for column, data in zip(columns, value['$frame'])},
+                            index=decode(value['index']), columns=columns)
+    if '$callable' in value:
+        module_and_class = _CALLABLE_CLASSES.get(value['$callable'])
+        if module_and_class is None:
+            raise ValueError("Callable '{}' is not supported.".format(value['$callable']))
+        import importlib
+        callable_class = getattr(importlib.import_module(module_and_class[0]), module_and_class[1])
+        return callable_class(*decode(value['args']))
+    raise ValueError('Malformed encoded value with keys {}.'.format(', '.join(sorted(value))))
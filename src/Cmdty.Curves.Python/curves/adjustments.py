@@ -24,10 +24,61 @@
 """ Provides functions to use as the mult_season_adjust and add_season_adjust parameters to curve construction
 functions. """
 
-from typing import Callable, Optional
+from typing import Callable, Optional, Sequence
+import numpy as np
 import pandas as pd
 
 
+class DayOfWeekAdjustment:
+    """
+    Callable which returns a float based on the day of week of it's parameter. Instances are picklable, comparable and
+    hashable, so can be sent to worker processes and used as part of cache keys.
+
+    Args:
+        values (sequence of float): Seven values, returned for parameters representing Monday to Sunday respectively.
+    """
+    __slots__ = ('_values',)
+
+    def __init__(self, values: Sequence[float]):
+        values = tuple(float(value) for value in values)
+        if len(values) != 7:
+            raise ValueError('values must contain 7 elements, one for each day of the week, but {} elements have been '
+                             'provided.'.format(len(values)))
+        self._values = values
+
+    @property
+    def values(self) -> tuple:
+        """tuple of float: The values returned for Monday to Sunday respectively."""
+        return self._values
+
+    def __call__(self, period) -> float:
+        return self._values[period.dayofweek]
+
+    def evaluate(self, index: pd.Index) -> np.ndarray:
+        """
+        Calculates the adjustment for each element of an index.
+
+        Args:
+            index (pandas.PeriodIndex or pandas.DatetimeIndex): The periods or timestamps to calculate adjustments for.
+
+        Returns:
+            numpy.ndarray: Adjustment value for each element of index, as float64.
+        """
+        return np.asarray(self._values)[np.asarray(index.dayofweek)]
+
+    def __reduce__(self):
+        return DayOfWeekAdjustment, (self._values,)
+
+    def __eq__(self, other):
+        return isinstance(other, DayOfWeekAdjustment) and self._values == other._values
+
+    def __hash__(self):
+        return hash((DayOfWeekAdjustment, self._values))
+
+    def __repr__(self):
+        return 'DayOfWeekAdjustment(values={!r})'.format(self._values)
+
+
 # TODO include one-off dates for holidays
 def dayofweek(default: float, monday: Optional[float] = None, tuesday: Optional[float] = None,
               wednesday: Optional[float] = None, thursday: Optional[float] = None, friday: Optional[float] = None,
@@ -46,27 +97,11 @@ def dayofweek(default: float, monday: Optional[float] = None, tuesday: Optional[
         sunday (float, optional): The value that the returned function returns when it's parameter represents a Sunday.
 
     Returns:
-        callable: Callable accepting a single parameter of type pandas.Period and returning a float. The value 
+        DayOfWeekAdjustment: Callable accepting a single parameter of type pandas.Period and returning a float. The value 
             that the returned function will return depends on the dayofweek attribute of the parameter. If any of the
             parameters monday/tuesday/wednesday etc have been provided, then the value of the parameter which 
             matches the Period day of week will be returned. Otherwise the value provided as the default
             parameter will be returned.
     """
-    adjust_dict = {}
-    _populate_dict(adjust_dict, monday, 0)
-    _populate_dict(adjust_dict, tuesday, 1)
-    _populate_dict(adjust_dict, wednesday, 2)
-    _populate_dict(adjust_dict, thursday, 3)
-    _populate_dict(adjust_dict, friday, 4)
-    _populate_dict(adjust_dict, saturday, 5)
-    _populate_dict(adjust_dict, sunday, 6)
-
-    def day_of_week_adjust(period):
-        return adjust_dict.get(period.dayofweek, default)
-
-    return day_of_week_adjust
-
-
-def _populate_dict(dict_to_populate, arg, dict_index) -> None:
-    if arg is not None:
-        dict_to_populate[dict_index] = arg
+    day_values = (monday, tuesday, wednesday, thursday, friday, saturday, sunday)
+    return DayOfWeekAdjustment(default if value is None else value for value in day_values)
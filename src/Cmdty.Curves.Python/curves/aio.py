@@ -0,0 +1,142 @@
+# Copyright(c) 2026 Jake Fowler
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use, 
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, 
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, 
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+""" Provides awaitable versions of the curve building functions, for use from asyncio applications."""
+
+import asyncio
+import functools
+import typing as tp
+from concurrent.futures import Executor
+from curves._hashing import request_key
+from curves.parallel import EngineType, _resolve_engine, _validate_engine
+
+
+class AsyncCurveBuilder:
+    """
+    Runs curve builds in an executor, so the asyncio event loop isn't blocked while curves are constructed.
+
+    Identical requests made while a build is already in flight are deduplicated, with all callers awaiting the
+    result of the single build. As a consequence, callers can receive the same result object, which should therefore
+    not be mutated.
+
+    Args:
+        executor (concurrent.futures.Executor, optional): The executor used to run builds. If a
+            concurrent.futures.ProcessPoolExecutor, all arguments must be picklable. If omitted, the default executor of
+            the running event loop is used, which is a thread pool.
+        deduplicate (bool, optional): Whether to deduplicate identical in-flight requests. Requests with arguments which
+            can't be pickled, such as lambdas, are never deduplicated. Defaults to True.
+    """
+
+    def __init__(self, executor: tp.Optional[Executor] = None, deduplicate: bool = True):
+        self._executor = executor
+        self._deduplicate = deduplicate
+        self._in_flight = {}
+
+    @property
+    def num_in_flight(self) -> int:
+        """int: Number of distinct deduplicated builds currently running."""
+        return len(self._in_flight)
+
+    async def build(self, engine: EngineType, *args, **kwargs) -> tp.Any:
+        """
+        Builds a curve in the executor.
+
+        Cancelling the awaiting task cancels the build if it hasn't started yet, and no other callers are awaiting the
+        same deduplicated build. A build which has already started runs to completion in the executor, but its result is
+        discarded.
+
+        Args:
+            engine (str or callable): The curve building function. Either one of the names in curves.parallel.ENGINES,
+                or a callable, which must be picklable if the executor is a process pool.
+            *args: Positional arguments for the engine.
+            **kwargs: Keyword arguments for the engine.
+
+        Returns:
+            The value returned by the engine.
+        """
+        _validate_engine(engine)
+        loop = asyncio.get_running_loop()
+        key = request_key(engine, args, kwargs) if self._deduplicate else None
+        in_flight_key = (loop, key)
+        in_flight = self._in_flight.get(in_flight_key) if key is not None else None
+        if in_flight is None:
+            future = loop.run_in_executor(self._executor, functools.partial(_call_engine, engine, args, kwargs))
+            in_flight = _InFlight(future)
+            if key is not None:
+                self._in_flight[in_flight_key] = in_flight
+                future.add_done_callback(functools.partial(self._remove_in_flight, in_flight_key, in_flight))
+        in_flight.num_waiters += 1
+        try:
+            return await asyncio.shield(in_flight.future)
+        except asyncio.CancelledError:
+            if in_flight.num_waiters == 1:
+                in_flight.future.cancel()
+            raise
+        finally:
+            in_flight.num_waiters -= 1
+
+    async def bootstrap_contracts(self, *args, **kwargs):
+        """Awaitable version of curves.bootstrap_contracts, accepting the same arguments."""
+        return await self.build('bootstrap_contracts', *args, **kwargs)
+
+    async def max_smooth_interp(self, *args, **kwargs):
+        """Awaitable version of curves.max_smooth_interp, accepting the same arguments."""
+        return await self.build('max_smooth_interp', *args, **kwargs)
+
+    async def hyperbolic_tension_spline(self, *args, **kwargs):
+        """Awaitable version of curves.hyperbolic_tension_spline, accepting the same arguments."""
+        return await self.build('hyperbolic_tension_spline', *args, **kwargs)
+
+    def _remove_in_flight(self, in_flight_key, in_flight, _) -> None:
+        if self._in_flight.get(in_flight_key) is in_flight:
+            del self._in_flight[in_flight_key]
+
+
+class _InFlight:
+    __slots__ = ('future', 'num_waiters')
+
+    def __init__(self, future):
+        self.future = future
+        self.num_waiters = 0
+
+
+_default_builder = AsyncCurveBuilder()
+
+
+async def bootstrap_contracts(*args, **kwargs):
+    """Awaitable version of curves.bootstrap_contracts, run in the default executor of the event loop."""
+    return await _default_builder.bootstrap_contracts(*args, **kwargs)
+
+
+async def max_smooth_interp(*args, **kwargs):
+    """Awaitable version of curves.max_smooth_interp, run in the default executor of the event loop."""
+    return await _default_builder.max_smooth_interp(*args, **kwargs)
+
+
+async def hyperbolic_tension_spline(*args, **kwargs):
+    """Awaitable version of curves.hyperbolic_tension_spline, run in the default executor of the event loop."""
+    return await _default_builder.hyperbolic_tension_spline(*args, **kwargs)
+
+
+def _call_engine(engine, args, kwargs):
+    return _resolve_engine(engine)(*args, **kwargs)
@@ -0,0 +1,174 @@
+# Copyright(c) 2026 Jake Fowler
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use, 
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, 
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, 
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+""" Provides a compact array-based representation of curves, as an alternative to pandas.Series, and export to Arrow."""
+
+import numpy as np
+import pandas as pd
+import typing as tp
+
+OUTPUT_TYPES = ('series', 'numpy')
+
+
+class CurveArray:
+    """
+    Contiguous curve of homogenous granularity, represented by a values array and the ordinal of the first period.
+
+    Attributes:
+        values (numpy.ndarray): The curve values, with one element per period of granularity freq.
+        start_ordinal (int): pandas.Period ordinal, with freq equal to the freq attribute, of the first curve period.
+        freq (str): Pandas offset alias describing the granularity of the curve.
+        tz (str, optional): Time zone of the curve delivery periods. None if the curve is not time zone aware.
+    """
+    __slots__ = ('values', 'start_ordinal', 'freq', 'tz')
+
+    def __init__(self, values: np.ndarray, start_ordinal: int, freq: str, tz: tp.Optional[tp.Any] = None):
+        self.values = values
+        self.start_ordinal = start_ordinal
+        self.freq = freq
+        self.tz = tz
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __reduce__(self):
+        return CurveArray, (self.values, self.start_ordinal, self.freq, self.tz)
+
+    def __repr__(self):
+        return 'CurveArray(values={!r}, start_ordinal={!r}, freq={!r}, tz={!r})'.format(self.values, self.start_ordinal,
+                                                                                      self.freq, self.tz)
+
+    @property
+    def start(self) -> pd.Period:
+        return pd.Period(ordinal=self.start_ordinal, freq=self.freq)
+
+    def index(self) -> tp.Union[pd.PeriodIndex, pd.DatetimeIndex]:
+        """Creates the index which the curve would have if represented as a pandas.Series."""
+        if self.tz is None:
+            return pd.period_range(start=self.start, periods=len(self.values), freq=self.freq)
+        return pd.date_range(start=self.start.to_timestamp().tz_localize(self.tz), periods=len(self.values),
+                             freq=self.freq)
+
+    def to_series(self) -> pd.Series:
+        """Converts to pandas.Series, with the same index as would have been returned by the curve builders."""
+        return pd.Series(data=self.values, index=self.index())
+
+    def to_arrow(self) -> 'pyarrow.Table':
+        """Converts to a pyarrow.Table without copying the values. See the to_arrow function for details."""
+        return to_arrow(self)
+
+
+def curve_array_from_series(series: pd.Series) -> CurveArray:
+    """Converts a contiguous curve, with PeriodIndex or DatetimeIndex with freq, into a CurveArray."""
+    index = series.index
+    if isinstance(index, pd.PeriodIndex):
+        return CurveArray(series.to_numpy(), index[0].ordinal, index.freqstr, None)
+    freq = index.freqstr
+    start_ordinal = pd.Period(index[0].tz_localize(None), freq=freq).ordinal
+    return CurveArray(series.to_numpy(), start_ordinal, freq, index.tz)
+
+
+def elapsed_periods(from_ordinal: int, to_ordinal: int, freq: str, tz: tp.Optional[tp.Any] = None) -> int:
+    """Number of periods of granularity freq from the period with ordinal from_ordinal to that with to_ordinal, counted
+    in the same way as CurveArray.index, i.e. in elapsed time for time zone aware curves, so that clock changes between
+    the two periods are taken into account."""
+    freq_offset = pd.tseries.frequencies.to_offset(freq)
+    if tz is None or not isinstance(freq_offset, pd.tseries.offsets.Tick):
+        # Ordinals of multiple frequencies, e.g. '30min', count the base unit
+        return (to_ordinal - from_ordinal) // freq_offset.n
+    from_timestamp = pd.Period(ordinal=from_ordinal, freq=freq).to_timestamp().tz_localize(tz)
+    to_timestamp = pd.Period(ordinal=to_ordinal, freq=freq).to_timestamp().tz_localize(tz)
+    return round((to_timestamp - from_timestamp) / freq_offset)
+
+
+def periods_to_ordinals(periods: tp.Iterable[tp.Union[pd.Period, pd.Timestamp]], freq: str) -> np.ndarray:
+    """Converts pandas Period or (possibly time zone aware) Timestamp instances to Period ordinals of wall-clock time."""
+    return np.fromiter((p.ordinal if isinstance(p, pd.Period) else pd.Period(p.tz_localize(None), freq=freq).ordinal
+                        for p in periods), dtype=np.int64)
+
+
+def period_index_from_ordinals(ordinals, freq) -> pd.PeriodIndex:
+    """Creates a pandas PeriodIndex from an array of pandas Period ordinals, without creating Period instances."""
+    ordinals = np.asarray(ordinals, dtype=np.int64)
+    if hasattr(pd.PeriodIndex, 'from_ordinals'):
+        return pd.PeriodIndex.from_ordinals(ordinals, freq=freq)
+    if len(ordinals) == 0:
+        return pd.PeriodIndex([], freq=freq)
+    min_ordinal = ordinals.min()
+    ordinal_range = pd.period_range(start=pd.Period(ordinal=min_ordinal, freq=freq),
+                                    periods=ordinals.max() - min_ordinal + 1, freq=freq)
+    return ordinal_range[ordinals - min_ordinal]
+
+
+def evaluate_on_index(func: tp.Callable[[tp.Union[pd.Period, pd.Timestamp]], float], index: pd.Index) -> np.ndarray:
+    """Evaluates func for each element of index, using the vectorised evaluate method of the callable classes in the
+    curves.weighting and curves.adjustments modules where available."""
+    evaluate = getattr(func, 'evaluate', None)
+    if evaluate is not None:
+        return np.asarray(evaluate(index), dtype=np.float64)
+    return np.fromiter((func(p) for p in index), dtype=np.float64, count=len(index))
+
+
+def to_arrow(data: tp.Union[CurveArray, tp.Mapping[str, np.ndarray], pd.Series, pd.DataFrame]) -> 'pyarrow.Table':
+    """
+    Converts the output of the curve builders into a pyarrow.Table, without copying numeric arrays.
+
+    Args:
+        data (CurveArray, mapping, pandas.Series or pandas.DataFrame): A curve or spline coefficients, as returned by one
+            of the curve builders, with output set to either 'numpy' or 'series'.
+
+    Returns:
+        pyarrow.Table: If data is a CurveArray or pandas.Series, a table with a single 'value' column, and schema metadata
+            containing the start_ordinal, freq and tz. Otherwise a table with one column for each column of data, with
+            pandas index converted to a column.
+
+    Note:
+        This function requires the optional dependency pyarrow to be installed.
+    """
+    try:
+        import pyarrow as pa
+    except ImportError:
+        raise ImportError('The pyarrow package must be installed to convert to Arrow format.')
+    if isinstance(data, pd.Series):
+        data = curve_array_from_series(data)
+    if isinstance(data, CurveArray):
+        metadata = {'start_ordinal': str(data.start_ordinal), 'freq': data.freq}
+        if data.tz is not None:
+            metadata['tz'] = str(data.tz)
+        return pa.table({'value': pa.array(data.values)}, metadata=metadata)
+    if isinstance(data, pd.DataFrame):
+        return pa.Table.from_pandas(data, preserve_index=True)
+    return pa.table({name: pa.array(np.asarray(column)) for name, column in data.items()})
+
+
+def from_arrow(table: 'pyarrow.Table') -> CurveArray:
+    """Converts a pyarrow.Table created by the to_arrow function from a curve back to a CurveArray."""
+    metadata = {key.decode(): value.decode() for key, value in table.schema.metadata.items()}
+    values = table.column('value').to_numpy()
+    return CurveArray(values, int(metadata['start_ordinal']), metadata['freq'], metadata.get('tz'))
+
+
+def _validate_output(output: str) -> None:
+    if output not in OUTPUT_TYPES:
+        raise ValueError("output parameter value of '{}' not supported. Must be one of {}."
+                         .format(output, ', '.join("'{}'".format(o) for o in OUTPUT_TYPES)))
@@ -0,0 +1,272 @@
+# Copyright(c) 2026 Jake Fowler
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use, 
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, 
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, 
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+""" Provides checkpointed, resumable backfill of curve histories into a CurveStore."""
+
+import collections
+import json
+import multiprocessing
+import os
+import time
+import typing as tp
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+import pandas as pd
+from curves._hashing import UnhashableArgument, content_key
+from curves.parallel import BuildResult, EngineType, _build_one, _init_worker, _resolve_engine, \
+    _transferable_exception, _validate_engine
+from curves.store import CurveStore
+
+_FORMAT_VERSION = 1
+_CHECKPOINT_FILE = 'backfill.json'
+
+ContractSource = tp.Callable[[pd.Period], tp.Optional[tp.Sequence[tuple]]]
+
+
+class BackfillSummary(tp.NamedTuple):
+    """
+    Summary of a backfill run.
+
+    Attributes:
+        built (int): Number of curves built and appended to the store by this run.
+        resumed_from (pandas.Period, optional): Last valuation date completed by a previous run, with all earlier
+            valuation dates skipped, or None if the backfill started from the beginning.
+        no_contracts (int): Number of valuation dates skipped because the contract source returned None or no
+            contracts.
+        failed (dict): Mapping from valuation date to error message for curves which failed to build, including those
+            from previous runs, as recorded in the checkpoint.
+        full_builds (int): Number of curves built from scratch.
+        price_only_builds (int): Number of curves built by re-solving the system of a previous valuation date with the
+            same contract delivery periods, for new prices.
+        elapsed (float): Wall time of the run in seconds.
+    """
+    built: int
+    resumed_from: tp.Optional[pd.Period]
+    no_contracts: int
+    failed: tp.Dict[pd.Period, str]
+    full_builds: int
+    price_only_builds: int
+    elapsed: float
+
+
+def backfill(store: CurveStore,
+             name: str,
+             valuation_dates: tp.Iterable[tp.Union[date, pd.Period, str]],
+             contract_source: ContractSource,
+             builder_kwargs: tp.Mapping[str, tp.Any],
+             engine: EngineType = 'hyperbolic_tension_spline',
+             workers: tp.Optional[int] = None,
+             max_group_size: int = 32,
+             checkpoint_path: tp.Optional[tp.Union[str, os.PathLike]] = None,
+             num_columns: tp.Optional[int] = None) -> BackfillSummary:
+    """
+    Builds the curve for each of a range of valuation dates, in parallel, appending them to a CurveStore in valuation
+    date order, and checkpointing progress so that an interrupted backfill resumes where it stopped.
+
+    Consecutive valuation dates for which the contract source returns contracts with the same delivery periods, in the
+    same order, are grouped and sent to a worker process together. For the hyperbolic_tension_spline engine, the spline
+    system is constructed once per group and re-solved for the prices of each valuation date, which avoids repeating
+    the structural work. Other engines build each curve from scratch.
+
+    After the curves of each group are appended to the store, the checkpoint file is atomically replaced. On restart,
+    valuation dates up to the later of the checkpointed date and the last valuation date in the store are skipped.
+    The checkpoint also contains a hash of engine and builder_kwargs, and a ValueError is raised on resumption with
+    different options, as the resulting history would be inconsistent. Delete the checkpoint file, and the curves from
+    the store, to restart a backfill after a methodology change.
+
+    Args:
+        store (CurveStore): Store to which the curves are appended.
+        name (str): Name of the curve in the store.
+        valuation_dates (iterable of date, pandas.Period or str): Valuation dates to build curves for. Sorted before use.
+        contract_source (callable): Called in the calling process with each valuation date, as a daily pandas.Period,
+            returning the contracts for that date, in any of the tuple forms accepted by the contracts argument of the
+            engine, or None if there is no curve for that date.
+        builder_kwargs (mapping): Keyword arguments, other than contracts, for the engine, which must include freq. Must
+            be picklable if workers is not 1. The output argument is set to 'numpy' if the engine supports it.
+        engine (str or callable, optional): The curve building function. Either one of the names in
+            curves.parallel.ENGINES, or a picklable callable. Defaults to 'hyperbolic_tension_spline'.
+        workers (int, optional): Number of worker processes. Defaults to the number of CPUs if omitted. If 1 the curves
+            are built serially in the current process.
+        max_group_size (int, optional): Maximum number of valuation dates sent to a worker process together, which
+            also bounds the work lost on interruption. Defaults to 32.
+        checkpoint_path (str or path-like, optional): Path of the checkpoint file. Defaults to a file next to the store
+            files of the curve.
+        num_columns (int, optional): Passed to CurveStore.append when the first curve for the name is appended.
+
+    Returns:
+        BackfillSummary: Summary of the backfill.
+    """
+    start_time = time.perf_counter()
+    _validate_engine(engine)
+    if 'freq' not in builder_kwargs:
+        raise ValueError('builder_kwargs must contain freq.')
+    if max_group_size < 1:
+        raise ValueError('max_group_size must be at least 1. However {} was specified.'.format(max_group_size))
+    workers = os.cpu_count() if workers is None else workers
+    if workers < 1:
+        raise ValueError('workers argument must be a positive integer, but value of {} has been provided.'
+                         .format(workers))
+    builder_kwargs = dict(builder_kwargs)
+    freq = builder_kwargs['freq']
+    if engine in ('hyperbolic_tension_spline', 'max_smooth_interp', 'bootstrap_contracts'):
+        builder_kwargs['output'] = 'numpy'
+    if checkpoint_path is None:
+        checkpoint_path = os.path.join(store.root, name, freq, _CHECKPOINT_FILE)
+    checkpoint_path = os.fspath(checkpoint_path)
+
+    config_key = _config_key(engine, builder_kwargs)
+    checkpoint = _read_checkpoint(checkpoint_path, name, freq, config_key)
+    resumed_from = _later(checkpoint['last_date'], store.last_valuation_date(name, freq))
+    failed = checkpoint['failed']
+    valuation_dates = sorted({pd.Period(valuation_date, freq='D') for valuation_date in valuation_dates})
+    if resumed_from is not None:
+        valuation_dates = [valuation_date for valuation_date in valuation_dates if valuation_date > resumed_from]
+
+    counts = collections.Counter()
+    groups = _groups(valuation_dates, contract_source, max_group_size, counts)
+
+    def record(group_results):
+        last_date = None
+        for valuation_date, build_result, price_only in group_results:
+            last_date = valuation_date
+            if build_result.ok:
+                store.append(name, valuation_date, build_result.result, num_columns=num_columns)
+                failed.pop(valuation_date, None)
+                counts['built'] += 1
+                counts['price_only_builds' if price_only else 'full_builds'] += 1
+            else:
+                failed[valuation_date] = '{}: {}'.format(type(build_result.error).__name__, build_result.error)
+        if last_date is not None:
+            _write_checkpoint(checkpoint_path, name, freq, config_key, last_date, failed)
+
+    if workers == 1:
+        for group in groups:
+            record(_build_group(engine, builder_kwargs, group))
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 mp_context=multiprocessing.get_context('spawn')) as executor:
+            in_flight = collections.deque()
+            for group in groups:
+                in_flight.append(executor.submit(_build_group, engine, builder_kwargs, group))
+                # Bounds the memory used by results waiting to be appended in order
+                if len(in_flight) >= 2 * workers:
+                    record(in_flight.popleft().result())
+            while in_flight:
+                record(in_flight.popleft().result())
+
+    return BackfillSummary(counts['built'], resumed_from, counts['no_contracts'], dict(failed),
+                           counts['full_builds'], counts['price_only_builds'], time.perf_counter() - start_time)
+
+
+def _groups(valuation_dates, contract_source, max_group_size, counts) -> tp.Iterator[tp.List[tuple]]:
+    group = []
+    group_periods = None
+    for valuation_date in valuation_dates:
+        contracts = contract_source(valuation_date)
+        if not contracts:
+            counts['no_contracts'] += 1
+            continue
+        contracts = [tuple(contract) for contract in contracts]
+        periods = tuple(contract[:-1] for contract in contracts)
+        if group and (periods != group_periods or len(group) == max_group_size):
+            yield group
+            group = []
+        group.append((valuation_date, contracts))
+        group_periods = periods
+    if group:
+        yield group
+
+
+def _build_group(engine, builder_kwargs, group) -> tp.List[tp.Tuple[pd.Period, BuildResult, bool]]:
+    """Builds the curves of a group of valuation dates with contracts for the same delivery periods."""
+    if engine == 'hyperbolic_tension_spline':
+        from curves.hyperbolic_tension_spline import hyperbolic_tension_system
+        start_time = time.perf_counter()
+        try:
+            system = hyperbolic_tension_system(group[0][1], **{key: value for key, value in builder_kwargs.items()
+                                                              if key != 'output'})
+        except Exception as e:
+            build_result = BuildResult(None, _transferable_exception(e), None, time.perf_counter() - start_time)
+            return [(valuation_date, build_result, False) for valuation_date, _ in group]
+        results = []
+        for idx, (valuation_date, contracts) in enumerate(group):
+            build_result = _build_one(system.solve, {'prices': [contract[-1] for contract in contracts],
+                                                     'output': 'numpy'}, 'pickle')
+            results.append((valuation_date, build_result, idx > 0))
+        return results
+    engine_func = _resolve_engine(engine)
+    results = []
+    for valuation_date, contracts in group:
+        build_result = _build_one(engine_func, dict(builder_kwargs, contracts=contracts), 'pickle')
+        if build_result.ok and isinstance(build_result.result, tuple):
+            build_result = build_result._replace(result=build_result.result[0])
+        results.append((valuation_date, build_result, False))
+    return results
+
+
+def _config_key(engine, builder_kwargs) -> tp.Optional[str]:
+    try:
+        return content_key(engine, builder_kwargs)
+    except UnhashableArgument:
+        return None
+
+
+def _later(date1, date2):
+    if date1 is None or date2 is None:
+        return date1 if date2 is None else date2
+    return max(date1, date2)
+
+
+def _read_checkpoint(checkpoint_path, name, freq, config_key) -> tp.Dict[str, tp.Any]:
+    try:
+        with open(checkpoint_path, 'r') as checkpoint_file:
+            checkpoint = json.load(checkpoint_file)
+    except FileNotFoundError:
+        return {'last_date': None, 'failed': {}}
+    if checkpoint['format_version'] > _FORMAT_VERSION:
+        raise ValueError('Backfill checkpoint has format version {}, which is not supported by this version of the '
+                         'curves package.'.format(checkpoint['format_version']))
+    if (checkpoint['name'], checkpoint['freq']) != (name, freq):
+        raise ValueError('Backfill checkpoint {} is for curve {} with freq {}, not {} with freq {}.'
+                         .format(checkpoint_path, checkpoint['name'], checkpoint['freq'], name, freq))
+    if config_key is not None and checkpoint['config_key'] is not None and checkpoint['config_key'] != config_key:
+        raise ValueError('Backfill checkpoint {} was created with a different engine or builder_kwargs. Delete the '
+                         'checkpoint, and the existing curves from the store, to restart the backfill.'
+                         .format(checkpoint_path))
+    last_date = checkpoint['last_date']
+    return {'last_date': None if last_date is None else pd.Period(last_date, freq='D'),
+            'failed': {pd.Period(valuation_date, freq='D'): error
+                       for valuation_date, error in checkpoint['failed'].items()}}
+
+
+def _write_checkpoint(checkpoint_path, name, freq, config_key, last_date, failed) -> None:
+    checkpoint = {'format_version': _FORMAT_VERSION, 'name': name, 'freq': freq, 'config_key': config_key,
+                  'last_date': str(last_date),
+                  'failed': {str(valuation_date): error for valuation_date, error in sorted(failed.items())}}
+    os.makedirs(os.path.dirname(os.path.abspath(checkpoint_path)), exist_ok=True)
+    temp_path = checkpoint_path + '.tmp'
+    with open(temp_path, 'w') as checkpoint_file:
+        json.dump(checkpoint, checkpoint_file)
+        checkpoint_file.flush()
+        os.fsync(checkpoint_file.fileno())
+    os.replace(temp_path, checkpoint_path)
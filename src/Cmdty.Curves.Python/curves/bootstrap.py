@@ -21,6 +21,7 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
 # OTHER DEALINGS IN THE SOFTWARE.
 
+from curves import _runtime  # noqa: F401
 import clr
 from System import Func, Double, DayOfWeek
 from pathlib import Path
@@ -30,31 +31,36 @@
     IBetween, Shaping, IIs, IAnd
 from typing import NamedTuple, List, Optional, Callable, Union, Tuple
 from curves._common import FREQ_TO_PERIOD_TYPE, transform_time_func, net_time_series_to_pandas_series, contract_period, \
-    net_time_period_to_pandas_period, deconstruct_contract, ContractsType, series_to_double_time_series, ShapingTypes
+    net_time_period_to_pandas_period, deconstruct_contract, ContractsType, series_to_double_time_series, ShapingTypes, \
+    ColumnarContractsType, is_columnar_contracts, columnar_contract_periods, net_time_periods, net_time_series_values, \
+    net_time_series_start_ordinal, precomputed_time_func
+from curves.arrays import CurveArray, _validate_output
+from curves.contract_period import Contract
+from curves.instrumentation import BuildStats, instrumented, interop_profile
 import pandas as pd
 
 
-class Contract(NamedTuple):
-    start: pd.Period
-    end: pd.Period
-    price: float
-
-
-def bootstrap_contracts(contracts: ContractsType,
+@instrumented('bootstrap_contracts')
+def bootstrap_contracts(contracts: Union[ContractsType, ColumnarContractsType],
                         freq: str,
                         average_weight: Optional[Callable[[pd.Period], float]] = None,
                         shaping_ratios: Optional[ShapingTypes] = None,
                         shaping_spreads: Optional[ShapingTypes] = None,
                         allow_redundancy: Optional[bool] = False,
                         target_curve: pd.Series = None,
-                        return_target_curve: Optional[bool] = False) \
-        -> Union[Tuple[pd.Series, List[Contract]], Tuple[pd.Series, List[Contract], pd.Series]]:
+                        return_target_curve: Optional[bool] = False,
+                        output: Optional[str] = 'series',
+                        precompute_callbacks: Optional[bool] = False,
+                        *,
+                        stats: Optional[BuildStats] = None) \
+        -> Union[Tuple[Union[pd.Series, CurveArray], List[Contract]],
+                 Tuple[Union[pd.Series, CurveArray], List[Contract], Union[pd.Series, CurveArray]]]:
     """
     Bootstraps a collection of commodity forward/swap/futures prices by removing the overlapping periods and optionally applies shaping.
 
     Args:
-        contracts (iterable): Iterable of tuples, with each tuple describing a forward delivery period and price in one
-            of the following forms:
+        contracts (iterable, pandas.DataFrame or mapping): Iterable of tuples, with each tuple describing a forward delivery
+            period and price in one of the following forms:
                 ([period], [price]) 
                 ([period start], [period end], [price])
                 (([period start], [period end]), [price])
@@ -67,6 +73,11 @@ def bootstrap_contracts(contracts: ContractsType,
                 pandas.Period
                 date
                 datetime
+            Alternatively contracts can be in columnar form, as a pandas.DataFrame, or mapping of str to array-like,
+            with 'start', 'end' and 'price' columns. The start and end columns can contain pandas.Period, date-like or str
+            values, or integer ordinals of pandas.Period with freq equal to the freq parameter, as returned by
+            curves.contract_period.parse_codes. Period values in the end column are converted to their last period at
+            freq granularity.
         freq (str): Describes the granularity of curve being constructed using pandas Offset Alias notation. 
             Must be a key to the dict variable curves.FREQ_TO_PERIOD_TYPE.
         average_weight (callable, optional): Mapping from pandas.Period type to float which describes the weighting
@@ -109,28 +120,57 @@ def bootstrap_contracts(contracts: ContractsType,
             following doc: https://github.com/cmdty/curves/blob/master/docs/bootstrap/bootstrapping_commodity_forwards.pdf
         return_target_curve (bool, optional): Flag determining whether the target curve, described above, should be returned as the third
             element in a 3-tuple. Defaults to False if omitted.
+        output (str, optional): Either 'series' or 'numpy', determining the type used to represent the returned curves. If 'numpy',
+            curves are returned as instances of curves.arrays.CurveArray, rather than pandas.Series, avoiding the creation of
+            an index. Defaults to 'series' if omitted.
+        precompute_callbacks (bool, optional): If True, average_weight is evaluated for every period between the earliest
+            start and latest end of the contracts and shaping periods before bootstrapping, and the results passed into the
+            .NET bootstrapper as a lookup table. The bootstrapper then makes no calls back into Python, so runs without
+            holding the GIL, allowing concurrent builds on multiple threads to execute in parallel. Defaults to False if
+            omitted.
+        stats (BuildStats, optional): If provided, populated with the time spent on each stage of the build and the number
+            of invocations of callable arguments. See also curves.collect_stats.
 
     Returns:
         Either (pandas.Series, list of tuples) 2-tuple, or (pandas.Series, list of tuples, pandas.Series) 3-tuple if return_target_curve
             argument is True. The elements of the tuple are:
         0: A contiguous forward curve, consistent with the contracts parameter.
-            This pandas.Series will have an index of type PeriodIndex and freq equal to the freq parameter.
+            This pandas.Series will have an index of type PeriodIndex and freq equal to the freq parameter. If the output
+            parameter is 'numpy' this will instead be a CurveArray.
         1: Equivalent to contracts parameter, but with overlapping periods removed, represented by a 3-item named tuple (start, end, price):
             start (pandas.Period): Inclusive start of the contract delivery period.
             end (pandas.Period): Inclusive end of the contract delivery period.
             price (float): Forward price of commodity delivered over periods specified by start and end.
         2: The curve to which piecewise_curve is calculated to be closest to, in terms of Euclidian distance.
+
+    Note:
+        This function is thread-safe, with each call using its own instance of the .NET bootstrapper. The GIL is released
+        while the .NET bootstrapper runs, only being re-acquired to call average_weight. Hence builds on multiple threads
+        only run in parallel if average_weight is omitted, or precompute_callbacks is True.
     """
     if freq not in FREQ_TO_PERIOD_TYPE:
         raise ValueError(
             "freq parameter value of '{}' not supported. The allowable values can be found in the keys of the dict curves.FREQ_TO_PERIOD_TYPE.".format(
                 freq))
+    _validate_output(output)
+    stats.mark('standardise')
     time_period_type = FREQ_TO_PERIOD_TYPE[freq]
     bootstrapper = IBootstrapperAddOptionalParameters[time_period_type](Bootstrapper[time_period_type]())
-    for contract in contracts:
-        (period, price) = deconstruct_contract(contract)
-        (start, end) = contract_period(period, freq, time_period_type)
-        BootstrapperExtensions.AddContract[time_period_type](bootstrapper, start, end, price)
+    add_contract = interop_profile().wrap('AddContract', BootstrapperExtensions.AddContract[time_period_type])
+    add_shaping = interop_profile().wrap('AddShaping', bootstrapper.AddShaping)
+    period_bounds = []
+    if is_columnar_contracts(contracts):
+        starts, ends, prices = columnar_contract_periods(contracts, freq)
+        for start, end, price in zip(net_time_periods(starts, time_period_type),
+                                     net_time_periods(ends, time_period_type), prices):
+            add_contract(bootstrapper, start, end, float(price))
+            period_bounds += (start, end)
+    else:
+        for contract in contracts:
+            (period, price) = deconstruct_contract(contract)
+            (start, end) = contract_period(period, freq, time_period_type)
+            add_contract(bootstrapper, start, end, price)
+            period_bounds += (start, end)
     if allow_redundancy:
         bootstrapper.AllowRedundancy()
     if shaping_ratios is not None:
@@ -140,7 +180,8 @@ def bootstrap_contracts(contracts: ContractsType,
             shaping_ratio = IIs[time_period_type](IAnd[time_period_type](
                 IBetween[time_period_type](Shaping[time_period_type].Ratio).Between(num_start, num_end)).And(
                 denom_start, denom_end)).Is(ratio)
-            bootstrapper.AddShaping(shaping_ratio)
+            add_shaping(shaping_ratio)
+            period_bounds += (num_start, num_end, denom_start, denom_end)
     if shaping_spreads is not None:
         for (period1, period2, spread) in shaping_spreads:
             (period1_start, period1_end) = contract_period(period1, freq, time_period_type)
@@ -148,17 +189,31 @@ def bootstrap_contracts(contracts: ContractsType,
             shaping_spread = IIs[time_period_type](IAnd[time_period_type](
                 IBetween[time_period_type](Shaping[time_period_type].Spread).Between(period1_start, period1_end)).And(
                 period2_start, period2_end)).Is(spread)
-            bootstrapper.AddShaping(shaping_spread)
+            add_shaping(shaping_spread)
+            period_bounds += (period1_start, period1_end, period2_start, period2_end)
+    stats.mark('callables')
     if average_weight is not None:
-        transformed_average_weight = transform_time_func(freq, average_weight)
-        bootstrapper.WithAverageWeighting(Func[time_period_type, Double](transformed_average_weight))
+        if precompute_callbacks:
+            bootstrapper.WithAverageWeighting(precomputed_time_func(freq, time_period_type, average_weight,
+                                                                    period_bounds))
+        else:
+            transformed_average_weight = transform_time_func(freq, average_weight)
+            bootstrapper.WithAverageWeighting(Func[time_period_type, Double](transformed_average_weight))
     if target_curve is not None:
         net_target_curve = series_to_double_time_series(target_curve, time_period_type)
         bootstrapper.WithTargetBootstrappedCurve(net_target_curve)
 
+    stats.mark('solve')
     dotnet_bootstrap_results = bootstrapper.Bootstrap()
-    piecewise_curve = net_time_series_to_pandas_series(dotnet_bootstrap_results.Curve, freq)
-    target_curve = net_time_series_to_pandas_series(dotnet_bootstrap_results.TargetCurve, freq)
+    stats.mark('marshal')
+    if output == 'numpy':
+        piecewise_curve = _net_time_series_to_curve_array(dotnet_bootstrap_results.Curve, freq)
+        target_curve = _net_time_series_to_curve_array(dotnet_bootstrap_results.TargetCurve, freq) \
+                        if return_target_curve else None
+    else:
+        piecewise_curve = net_time_series_to_pandas_series(dotnet_bootstrap_results.Curve, freq)
+        target_curve = net_time_series_to_pandas_series(dotnet_bootstrap_results.TargetCurve, freq) \
+                        if return_target_curve else None
     bootstrapped_contracts = []
     for contract in dotnet_bootstrap_results.BootstrappedContracts:
         bootstrapped_contracts.append(Contract(net_time_period_to_pandas_period(contract.Start, freq),
@@ -167,3 +222,8 @@ def bootstrap_contracts(contracts: ContractsType,
         return piecewise_curve, bootstrapped_contracts, target_curve
     else:
         return piecewise_curve, bootstrapped_contracts
+
+
+def _net_time_series_to_curve_array(net_time_series, freq):
+    return CurveArray(net_time_series_values(net_time_series), net_time_series_start_ordinal(net_time_series, freq),
+                      freq)
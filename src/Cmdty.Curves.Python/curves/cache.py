@@ -0,0 +1,322 @@
+# Copyright(c) 2026 Jake Fowler
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use, 
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, 
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, 
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+""" Content-addressed on-disk cache of curve build results, with size-bounded least recently used eviction."""
+
+import inspect
+import json
+import os
+import pickle
+import shutil
+import tempfile
+import threading
+import typing as tp
+import numpy as np
+import pandas as pd
+from curves._hashing import UnhashableArgument, content_key
+from curves.arrays import CurveArray, curve_array_from_series
+from curves.parallel import EngineType, _resolve_engine, _validate_engine
+
+_FORMAT_VERSION = 1
+_META_FILE = 'meta.json'
+_AUX_FILE = 'aux.pkl'
+
+
+class CacheStats(tp.NamedTuple):
+    """
+    Counts of CurveCache lookups since the cache instance was created.
+
+    Attributes:
+        hits (int): Number of builds for which a cached result was returned.
+        misses (int): Number of builds which were not found in the cache, so were built and then stored.
+        uncacheable (int): Number of builds with arguments which couldn't be hashed, e.g. a lambda closing over an
+            object of unknown type, so were built without using the cache.
+        evictions (int): Number of entries deleted to keep the cache within its size limit.
+    """
+    hits: int
+    misses: int
+    uncacheable: int
+    evictions: int
+
+
+class CurveCache:
+    """
+    Opt-in cache of curve build results, held in a local directory and keyed by a hash of the normalised inputs.
+
+    The key covers the contracts, with delivery periods converted to ordinals at the curve freq, all other arguments
+    including defaults, and the version of this package. Callable arguments are identified by their module and
+    qualified name plus their state, so the classes in curves.weighting and curves.adjustments are keyed by their
+    parameters, and plain functions by their bytecode, defaults and closure. Functions which read global or external
+    state, e.g. a discount factor function which looks up a mutable rates table, can't be detected as having changed,
+    so the cache must be cleared when such state changes.
+
+    Curves of a cache hit are returned with values memory-mapped from the cache files, so are read-only. Any
+    non-curve parts of results, such as spline coefficients or bootstrapped contracts, are pickled.
+
+    The directory can be shared by multiple processes. Entries are written to a temporary directory which is then
+    atomically renamed, so readers never see partially written entries.
+
+    Args:
+        directory (str or path-like): Directory in which cache entries are held. Created if it does not exist.
+        max_bytes (int, optional): Approximate upper bound on the total size of the cache files. After each new entry
+            is written, least recently used entries are deleted until the total size is within this bound. Defaults
+            to 1 GiB.
+    """
+
+    def __init__(self, directory: tp.Union[str, os.PathLike], max_bytes: int = 2**30):
+        if max_bytes <= 0:
+            raise ValueError('max_bytes must be positive. However {} was specified.'.format(max_bytes))
+        self.directory = os.fspath(directory)
+        self.max_bytes = max_bytes
+        os.makedirs(self.directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._uncacheable = 0
+        self._evictions = 0
+
+    @property
+    def stats(self) -> CacheStats:
+        """CacheStats: Counts of lookups since this instance was created."""
+        return CacheStats(self._hits, self._misses, self._uncacheable, self._evictions)
+
+    def build(self, engine: EngineType, *args, **kwargs) -> tp.Any:
+        """
+        Returns the cached result of a curve build if present, otherwise builds the curve and caches the result.
+
+        Args:
+            engine (str or callable): The curve building function. Either one of the names in curves.parallel.ENGINES
+                or a callable.
+            *args: Positional arguments of the curve building function.
+            **kwargs: Keyword arguments of the curve building function.
+
+        Returns:
+            The result of the curve building function.
+        """
+        _validate_engine(engine)
+        engine_func = _resolve_engine(engine)
+        key = self.key(engine_func, *args, **kwargs)
+        if key is None:
+            with self._lock:
+                self._uncacheable += 1
+            return engine_func(*args, **kwargs)
+        result = self._get(key)
+        if result is not None:
+            with self._lock:
+                self._hits += 1
+            return result
+        with self._lock:
+            self._misses += 1
+        result = engine_func(*args, **kwargs)
+        self._put(key, result)
+        return result
+
+    def bootstrap_contracts(self, *args, **kwargs) -> tp.Any:
+        """Cached curves.bootstrap_contracts."""
+        return self.build('bootstrap_contracts', *args, **kwargs)
+
+    def max_smooth_interp(self, *args, **kwargs) -> tp.Any:
+        """Cached curves.max_smooth_interp."""
+        return self.build('max_smooth_interp', *args, **kwargs)
+
+    def hyperbolic_tension_spline(self, *args, **kwargs) -> tp.Any:
+        """Cached curves.hyperbolic_tension_spline."""
+        return self.build('hyperbolic_tension_spline', *args, **kwargs)
+
+    def key(self, engine: EngineType, *args, **kwargs) -> tp.Optional[str]:
+        """
+        Returns the cache key of a curve build, or None if the build can't be cached because an argument can't be
+        hashed.
+        """
+        engine_func = _resolve_engine(engine) if isinstance(engine, str) else engine
+        try:
+            bound = inspect.signature(engine_func).bind(*args, **kwargs)
+        except TypeError:
+            return None  # Let the engine raise its own error for invalid arguments
+        bound.apply_defaults()
+        arguments = dict(bound.arguments)
+        arguments.pop('stats', None)  # Instrumentation doesn't affect the result
+        if 'contracts' in arguments and 'freq' in arguments:
+            arguments['contracts'] = _normalise_contracts(arguments['contracts'], arguments['freq'])
+        try:
+            return content_key(engine_func, arguments, salt=_version_salt())
+        except UnhashableArgument:
+            return None
+
+    def clear(self) -> None:
+        """Deletes all entries from the cache."""
+        for entry_dir in self._entry_dirs():
+            shutil.rmtree(entry_dir, ignore_errors=True)
+
+    def size(self) -> int:
+        """Returns the total size in bytes of all cache entries."""
+        return sum(_dir_size(entry_dir) for entry_dir in self._entry_dirs())
+
+    def __len__(self) -> int:
+        return len(self._entry_dirs())
+
+    def __contains__(self, key: str) -> bool:
+        return os.path.isfile(os.path.join(self._entry_dir(key), _META_FILE))
+
+    def _entry_dir(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], key)
+
+    def _entry_dirs(self) -> tp.List[str]:
+        entry_dirs = []
+        for prefix in os.listdir(self.directory):
+            prefix_dir = os.path.join(self.directory, prefix)
+            if len(prefix) == 2 and os.path.isdir(prefix_dir):
+                entry_dirs.extend(os.path.join(prefix_dir, key) for key in os.listdir(prefix_dir))
+        return entry_dirs
+
+    def _get(self, key: str) -> tp.Any:
+        entry_dir = self._entry_dir(key)
+        meta_path = os.path.join(entry_dir, _META_FILE)
+        try:
+            with open(meta_path) as meta_file:
+                meta = json.load(meta_file)
+            if meta.get('format_version') != _FORMAT_VERSION:
+                return None
+            aux = []
+            if meta['num_aux'] > 0:
+                with open(os.path.join(entry_dir, _AUX_FILE), 'rb') as aux_file:
+                    aux = pickle.load(aux_file)
+            result = _decode(meta['structure'], entry_dir, aux)
+            os.utime(meta_path)  # Marks entry as recently used
+        except (OSError, ValueError, KeyError, pickle.UnpicklingError):
+            return None  # Missing, evicted while being read, or corrupt, so treat as a miss
+        return result
+
+    def _put(self, key: str, result: tp.Any) -> None:
+        entry_dir = self._entry_dir(key)
+        os.makedirs(os.path.dirname(entry_dir), exist_ok=True)
+        temp_dir = tempfile.mkdtemp(prefix='.tmp-', dir=self.directory)
+        try:
+            parts, aux = [], []
+            structure = _encode(result, parts, aux)
+            for part, values in enumerate(parts):
+                np.save(os.path.join(temp_dir, 'part_{}.npy'.format(part)), values)
+            if aux:
+                with open(os.path.join(temp_dir, _AUX_FILE), 'wb') as aux_file:
+                    pickle.dump(aux, aux_file, protocol=pickle.HIGHEST_PROTOCOL)
+            meta = {'format_version': _FORMAT_VERSION, 'structure': structure, 'num_aux': len(aux)}
+            with open(os.path.join(temp_dir, _META_FILE), 'w') as meta_file:
+                json.dump(meta, meta_file)
+            try:
+                os.rename(temp_dir, entry_dir)
+            except OSError:
+                pass  # Entry already written by another process
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+        self._evict(keep=entry_dir)
+
+    def _evict(self, keep: str) -> None:
+        entries = []
+        for entry_dir in self._entry_dirs():
+            try:
+                last_used = os.stat(os.path.join(entry_dir, _META_FILE)).st_mtime
+            except OSError:
+                continue
+            entries.append((last_used, entry_dir, _dir_size(entry_dir)))
+        total_size = sum(size for _, _, size in entries)
+        for _, entry_dir, size in sorted(entries):
+            if total_size <= self.max_bytes:
+                break
+            if entry_dir == keep:
+                continue
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            total_size -= size
+            with self._lock:
+                self._evictions += 1
+
+
+def _version_salt() -> str:
+    from curves.__version__ import __version__
+    return 'curves-{}-cache-{}'.format(__version__, _FORMAT_VERSION)
+
+
+def _normalise_contracts(contracts, freq) -> tp.Any:
+    """Converts contracts into arrays of start and end ordinals at freq, plus prices, so that contracts specified
+    differently, e.g. using str or pandas.Period, have the same cache key."""
+    from curves._contracts import (is_columnar_contracts, columnar_contract_periods, deconstruct_contract,
+                                contract_pandas_periods)
+    try:
+        if is_columnar_contracts(contracts):
+            starts, ends, prices = columnar_contract_periods(contracts, freq)
+            return starts.asi8, ends.asi8, prices
+        if isinstance(contracts, pd.Series):
+            periods_prices = list(contracts.items())
+        else:
+            periods_prices = [deconstruct_contract(contract) for contract in contracts]
+        starts_ends = [contract_pandas_periods(period, freq) for period, _ in periods_prices]
+        return (np.array([start.ordinal for start, _ in starts_ends], dtype=np.int64),
+                np.array([end.ordinal for _, end in starts_ends], dtype=np.int64),
+                np.array([price for _, price in periods_prices], dtype=np.float64))
+    except (TypeError, ValueError):
+        return contracts  # Hashed as given, with the engine raising on invalid contracts
+
+
+def _encode(value, parts: tp.List[np.ndarray], aux: tp.List[tp.Any]) -> tp.Dict[str, tp.Any]:
+    if isinstance(value, CurveArray) or (isinstance(value, pd.Series) and _is_contiguous_curve(value)):
+        curve_array = value if isinstance(value, CurveArray) else curve_array_from_series(value)
+        parts.append(np.asarray(curve_array.values))
+        return {'kind': 'series' if isinstance(value, pd.Series) else 'curve_array', 'part': len(parts) - 1,
+                'start_ordinal': int(curve_array.start_ordinal), 'freq': curve_array.freq,
+                'tz': None if curve_array.tz is None else str(curve_array.tz)}
+    if type(value) is tuple:
+        return {'kind': 'tuple', 'items': [_encode(item, parts, aux) for item in value]}
+    aux.append(value)
+    return {'kind': 'aux', 'index': len(aux) - 1}
+
+
+def _decode(structure: tp.Dict[str, tp.Any], entry_dir: str, aux: tp.List[tp.Any]) -> tp.Any:
+    kind = structure['kind']
+    if kind == 'tuple':
+        return tuple(_decode(item, entry_dir, aux) for item in structure['items'])
+    if kind == 'aux':
+        return aux[structure['index']]
+    values = np.load(os.path.join(entry_dir, 'part_{}.npy'.format(structure['part'])), mmap_mode='r')
+    curve_array = CurveArray(values, structure['start_ordinal'], structure['freq'], structure['tz'])
+    return curve_array.to_series() if kind == 'series' else curve_array
+
+
+def _is_contiguous_curve(series: pd.Series) -> bool:
+    index = series.index
+    if len(index) == 0 or series.dtype != np.float64:
+        return False
+    if isinstance(index, pd.PeriodIndex):
+        return bool(np.all(np.diff(index.asi8) == index.freq.n))
+    return isinstance(index, pd.DatetimeIndex) and index.freq is not None
+
+
+def _dir_size(directory: str) -> int:
+    size = 0
+    try:
+        for name in os.listdir(directory):
+            try:
+                size += os.path.getsize(os.path.join(directory, name))
+            except OSError:
+                pass
+    except OSError:
+        pass
+    return size
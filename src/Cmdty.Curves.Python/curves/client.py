@@ -0,0 +1,166 @@
+# Copyright(c) 2026 Jake Fowler
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use, 
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, 
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, 
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+""" Client of curves.server, with methods mirroring the curve building functions of the curves package."""
+
+import http.client
+import json
+import socket
+import threading
+import typing as tp
+from urllib.parse import urlsplit
+from curves import _wire
+from curves._wire import DEFAULT_PORT
+
+
+class CurveServerError(Exception):
+    """Raised when the curve server fails to build a curve, for reasons other than invalid arguments."""
+
+
+class CurveClient:
+    """
+    Client which builds curves using a curves.server.CurveServer.
+
+    The methods accept the same arguments, and return the same results, as the functions of the same names in the
+    curves package. Callable arguments must be instances of the classes in curves.weighting or curves.adjustments, e.g.
+    curves.weighting.num_business_days(holidays), as arbitrary functions can't be sent to the server.
+
+    Connections are kept alive between requests, with one connection per thread, so an instance can be shared by
+    multiple threads.
+
+    Args:
+        url (str, optional): URL of the server, either 'http://host:port' or 'unix:///path/to/socket'. Defaults to
+            'http://127.0.0.1:8765'.
+        timeout (float, optional): Timeout in seconds for socket operations. Defaults to no timeout.
+    """
+
+    def __init__(self, url: str = 'http://127.0.0.1:{}'.format(DEFAULT_PORT), timeout: tp.Optional[float] = None):
+        parts = urlsplit(url)
+        if parts.scheme not in ('http', 'unix'):
+            raise ValueError("url must have scheme 'http' or 'unix'. However '{}' was specified.".format(url))
+        self.url = url
+        self._parts = parts
+        self._timeout = timeout
+        self._local = threading.local()
+
+    def build(self, engine: str, *args, **kwargs) -> tp.Any:
+        """
+        Builds a curve on the server.
+
+        Args:
+            engine (str): Name of the curve building function, being one of the names in curves.parallel.ENGINES.
+            *args: Positional arguments of the curve building function.
+            **kwargs: Keyword arguments of the curve building function.
+
+        Returns:
+            The result of the curve building function.
+
+        Raises:
+            ValueError, TypeError or KeyError: If the server rejected the arguments, with the same message as if the
+                function had been called directly.
+            CurveServerError: If the build failed for any other reason.
+        """
+        if not isinstance(engine, str):
+            raise ValueError('engine must be the name of a curve building function, as callables can\'t be sent to '
+                             'the server.')
+        # Arguments are validated by the server, so the client doesn't need to import the curve builders
+        body = json.dumps({'engine': engine, 'args': _wire.encode(list(args)),
+                           'kwargs': _wire.encode(kwargs)}).encode('utf-8')
+        status, response = self._request('POST', '/build', body)
+        if status == 200:
+            return _wire.decode(response['result'])
+        error_type = {'ValueError': ValueError, 'TypeError': TypeError, 'KeyError': KeyError}.get(response['error'])
+        if status == 400 and error_type is not None:
+            raise error_type(response['message'])
+        raise CurveServerError('{}: {}'.format(response['error'], response['message']))
+
+    def bootstrap_contracts(self, *args, **kwargs) -> tp.Any:
+        """Calls curves.bootstrap_contracts on the server."""
+        return self.build('bootstrap_contracts', *args, **kwargs)
+
+    def max_smooth_interp(self, *args, **kwargs) -> tp.Any:
+        """Calls curves.max_smooth_interp on the server."""
+        return self.build('max_smooth_interp', *args, **kwargs)
+
+    def hyperbolic_tension_spline(self, *args, **kwargs) -> tp.Any:
+        """Calls curves.hyperbolic_tension_spline on the server."""
+        return self.build('hyperbolic_tension_spline', *args, **kwargs)
+
+    def health(self) -> tp.Dict[str, tp.Any]:
+        """Returns the server status and curves package version."""
+        return self._request('GET', '/health')[1]
+
+    def stats(self) -> tp.Dict[str, int]:
+        """Returns the counters of the server, as a dict with the fields of curves.server.ServerStats."""
+        return self._request('GET', '/stats')[1]
+
+    def close(self) -> None:
+        """Closes the connection of the calling thread."""
+        connection = getattr(self._local, 'connection', None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+    def __enter__(self) -> 'CurveClient':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def _request(self, method, path, body=None) -> tp.Tuple[int, tp.Any]:
+        headers = {'Content-Type': 'application/json'}
+        for attempt in range(2):
+            connection = self._connection()
+            try:
+                connection.request(method, path, body=body, headers=headers)
+                response = connection.getresponse()
+                return response.status, json.loads(response.read())
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                # Kept alive connection was closed by the server, so retry once on a new connection
+                self.close()
+                if attempt == 1:
+                    raise
+
+    def _connection(self) -> http.client.HTTPConnection:
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            if self._parts.scheme == 'unix':
+                connection = _UnixHTTPConnection(self._parts.path, timeout=self._timeout)
+            else:
+                connection = http.client.HTTPConnection(self._parts.hostname, self._parts.port or DEFAULT_PORT,
+                                                        timeout=self._timeout)
+            self._local.connection = connection
+        return connection
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+
+    def __init__(self, path, timeout=None):
+        super().__init__('localhost', timeout=timeout)
+        self._path = path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        if self.timeout is not None:
+            self.sock.settimeout(self.timeout)
+        self.sock.connect(self._path)
@@ -23,8 +23,29 @@
 """ Provide convenience function for creating an objects which represent the delivery period of a forward contract."""
 
 from datetime import date
+import re
+from functools import lru_cache
+import numpy as np
 import pandas as pd
-from typing import Tuple
+from typing import Tuple, Union, Iterable, NamedTuple
+from curves.arrays import period_index_from_ordinals
+
+
+class Contract(NamedTuple):
+    """Contract with delivery period from start to end inclusive, as returned by curves.bootstrap_contracts."""
+    start: pd.Period
+    end: pd.Period
+    price: float
+
+
+def _last_period(period, freq):
+    """Find the last pandas Period instance of a specific frequency within a Period instance"""
+    if not freq[0].isdigit():
+        return period.asfreq(freq, 'e')
+    m = re.match(r"(\d+)(\w+)", freq)
+    num = int(m.group(1))
+    sub_freq = m.group(2)
+    return (period.asfreq(sub_freq, 'e') - num + 1).asfreq(freq)
 
 
 def month(year: int, month_num: int) -> pd.Period:
@@ -317,3 +338,157 @@ def gas_year(year: int) -> Tuple[date, date]:
     """
     return date(year, 10, 1), date(year + 1, 9, 30)
 
+
+_MONTH_CODES = {'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
+                'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12,
+                'january': 1, 'february': 2, 'march': 3, 'april': 4, 'june': 6, 'july': 7,
+                'august': 8, 'september': 9, 'october': 10, 'november': 11, 'december': 12}
+_CONTRACT_CODE_REGEX = re.compile(r'^([a-z]+)([1-4]?)[\s\-/]*(\d{4}|\d{2})$')
+
+
+def month_strip(start: Union[pd.Period, date, str], num_months: int) -> pd.PeriodIndex:
+    """
+    Creates a strip of consecutive months, for example the next 36 months from a specific month.
+
+    Args:
+        start (pandas.Period, date or str): The first month of the strip. Anything accepted by the pandas.Period constructor.
+        num_months (int): The number of months in the strip.
+
+    Returns:
+        pandas.PeriodIndex: Index with freqstr 'M' containing num_months consecutive months starting at start.
+    """
+    return pd.period_range(start=pd.Period(start, freq='M'), periods=num_months, freq='M')
+
+
+def quarter_strip(start_year: int, end_year: int) -> pd.PeriodIndex:
+    """
+    Creates a strip of all calendar quarters in a range of years.
+
+    Args:
+        start_year (int): Year of the first quarter of the strip.
+        end_year (int): Year of the last quarter of the strip, inclusive.
+
+    Returns:
+        pandas.PeriodIndex: Index with freqstr 'Q' containing all quarters from Q1 of start_year to Q4 of end_year.
+    """
+    return pd.period_range(start=q_1(start_year), end=q_4(end_year), freq='Q')
+
+
+def season_strip(start: pd.Period, num_seasons: int) -> pd.PeriodIndex:
+    """
+    Creates a strip of consecutive summer and winter seasons.
+
+    Args:
+        start (pandas.Period): The first season of the strip, as created by the summer or winter functions.
+        num_seasons (int): The number of seasons in the strip.
+
+    Returns:
+        pandas.PeriodIndex: Index with freqstr '2Q' containing num_seasons alternating summer and winter seasons.
+    """
+    if start.freqstr != '2Q-DEC' or start.quarter not in (2, 4):
+        raise ValueError('start argument must be a summer or winter season, as created by the summer or winter '
+                         'functions. However {} was provided.'.format(start))
+    return pd.period_range(start=start, periods=num_seasons, freq='2Q')
+
+
+def cal_year_strip(start_year: int, end_year: int) -> pd.PeriodIndex:
+    """
+    Creates a strip of consecutive calendar years.
+
+    Args:
+        start_year (int): The first calendar year of the strip.
+        end_year (int): The last calendar year of the strip, inclusive.
+
+    Returns:
+        pandas.PeriodIndex: Index with freqstr 'A' containing all calendar years from start_year to end_year.
+    """
+    return pd.period_range(start=cal_year(start_year), end=cal_year(end_year), freq='A')
+
+
+@lru_cache(maxsize=4096)
+def from_code(code: str) -> Union[pd.Period, Tuple[date, date]]:
+    """
+    Creates the delivery period represented by a broker-screen style contract code.
+
+    Codes are case insensitive and consist of a product prefix followed by a 2 or 4 digit year, optionally
+    separated by a space, '-' or '/'. The following prefixes are recognised:
+        Month: 'Jan', 'Feb', ..., 'Dec', e.g. 'Jan-26'.
+        Quarter: 'Q1', 'Q2', 'Q3' and 'Q4', e.g. 'Q1-26'.
+        Summer: 'Sum' or 'Summer', e.g. 'Sum-26'.
+        Winter: 'Win' or 'Winter', e.g. 'Win-25' for the winter starting in October 2025.
+        Calendar year: 'Cal', e.g. 'Cal-27'.
+        Gas year: 'GY', e.g. 'GY-26' for the gas year starting in October 2026.
+
+    Args:
+        code (str): The contract code.
+
+    Returns:
+        pandas.Period or (date, date): The delivery period, of the same type as returned by the equivalent constructor
+            function in this module, i.e. month, quarter, summer, winter, cal_year or gas_year.
+    """
+    first_month, num_months = _code_months(code)
+    if num_months == 1:
+        return first_month
+    if num_months == 3:
+        return first_month.asfreq('Q')
+    if num_months == 6:
+        return summer(first_month.year) if first_month.month == 4 else winter(first_month.year)
+    if first_month.month == 1:
+        return cal_year(first_month.year)
+    return gas_year(first_month.year)
+
+
+def parse_codes(codes: Iterable[str], freq: str) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Converts a collection of contract codes into arrays of delivery start and end ordinals.
+
+    Each distinct code is only parsed once, so this is efficient for large collections of quotes with repeated codes.
+    See the from_code function for the format of contract codes recognised.
+
+    Args:
+        codes (iterable of str): The contract codes to convert.
+        freq (str): Pandas offset alias of the ordinals returned, e.g. the freq of the curve being constructed.
+
+    Returns:
+        (numpy.ndarray, numpy.ndarray): 2-tuple of int64 arrays, with the same length as codes, where each element is:
+            The first element contains the pandas.Period ordinals, with freq as specified by the freq parameter, of the
+                first period of each contract delivery period.
+            The second element contains the ordinals of the last (inclusive) period of each contract delivery period.
+    """
+    unique_codes, inverse = np.unique(np.asarray(codes, dtype=object), return_inverse=True)
+    first_month_ordinals = np.empty(len(unique_codes), dtype=np.int64)
+    num_months = np.empty(len(unique_codes), dtype=np.int64)
+    for i, code in enumerate(unique_codes):
+        first_month, num_months[i] = _code_months(code)
+        first_month_ordinals[i] = first_month.ordinal
+    first_months = period_index_from_ordinals(first_month_ordinals, 'M')
+    last_months = period_index_from_ordinals(first_month_ordinals + num_months - 1, 'M')
+    starts = first_months.asfreq(freq, 's').asi8
+    ends = _last_period(last_months, freq).asi8
+    return starts[inverse], ends[inverse]
+
+
+@lru_cache(maxsize=4096)
+def _code_months(code: str) -> Tuple[pd.Period, int]:
+    """Parses a contract code into the first month of delivery and the number of months delivered over."""
+    match = _CONTRACT_CODE_REGEX.match(code.strip().lower())
+    if match is None:
+        raise ValueError('Contract code \'{}\' is not in a recognised format.'.format(code))
+    prefix, quarter_num, year_text = match.groups()
+    year = int(year_text) + (2000 if len(year_text) == 2 else 0)
+    if quarter_num:
+        if prefix != 'q':
+            raise ValueError('Contract code \'{}\' is not in a recognised format.'.format(code))
+        return month(year, int(quarter_num) * 3 - 2), 3
+    if prefix in _MONTH_CODES:
+        return month(year, _MONTH_CODES[prefix]), 1
+    if prefix in ('sum', 'summer'):
+        return month(year, 4), 6
+    if prefix in ('win', 'winter'):
+        return month(year, 10), 6
+    if prefix == 'cal':
+        return month(year, 1), 12
+    if prefix == 'gy':
+        return month(year, 10), 12
+    raise ValueError('Contract code \'{}\' is not in a recognised format.'.format(code))
+
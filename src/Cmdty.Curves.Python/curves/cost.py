@@ -0,0 +1,188 @@
+# Copyright(c) 2026 Jake Fowler
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use, 
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, 
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, 
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+""" Provides cheap estimates of the cost of curve builds, calculated from the contract periods and options without
+building, so that schedulers can reject oversized builds or route them to suitable workers."""
+
+import inspect
+import typing as tp
+import numpy as np
+import pandas as pd
+from curves.parallel import ENGINES, _resolve_engine
+from curves.hyperbolic_tension_spline import _standardise_contracts, _standardise_shaping, _spline_knots
+
+# Rough cost model, calibrated on a development machine, so only the orders of magnitude are meaningful
+_SECONDS_PER_CONTRACT = {'bootstrap_contracts': 5.0E-5, 'max_smooth_interp': 5.0E-5, 'hyperbolic_tension_spline': 1.5E-4}
+_SECONDS_PER_SECTION = {'bootstrap_contracts': 1.0E-5, 'max_smooth_interp': 1.0E-5, 'hyperbolic_tension_spline': 1.0E-4}
+_SECONDS_PER_POINT = {'bootstrap_contracts': 2.0E-6, 'max_smooth_interp': 2.0E-6, 'hyperbolic_tension_spline': 3.0E-7}
+_FLOPS_PER_SECOND = {'bootstrap_contracts': 1.0E9, 'max_smooth_interp': 1.0E9, 'hyperbolic_tension_spline': 1.0E10}
+_BYTES_PER_POINT = {'bootstrap_contracts': 128, 'max_smooth_interp': 128, 'hyperbolic_tension_spline': 200}
+_SECONDS_PER_CALLBACK = 1.0E-5  # .NET calling a Python callable for one period
+_SECONDS_PER_PYTHON_CALL = 2.0E-6  # Python calling a callable for one period
+_SECONDS_PER_VECTORISED_POINT = 5.0E-8  # Callables with an evaluate method, such as those in curves.weighting
+
+_PER_PERIOD_CALLABLES = {
+    'bootstrap_contracts': ('average_weight',),
+    'max_smooth_interp': ('mult_season_adjust', 'add_season_adjust', 'average_weight'),
+    'hyperbolic_tension_spline': ('discount_factor', 'average_weight', 'mult_season_adjust', 'add_season_adjust'),
+}
+
+
+class CostEstimate(tp.NamedTuple):
+    """
+    Estimated cost of a curve build, as returned by estimate.
+
+    Attributes:
+        engine (str): Name of the curve building function.
+        num_points (int): Number of points in the output curve.
+        num_contracts (int): Number of input contracts.
+        num_sections (int): Number of spline sections, i.e. the number of knots, for the spline engines, or the number of
+            bootstrapped contracts for bootstrap_contracts.
+        matrix_shape (tuple of int): Shape of the linear system solved, which for the spline engines is the matrix of the
+            Karush-Kuhn-Tucker conditions if the spline is solved for maximum smoothness.
+        memory_bytes (int): Approximate peak memory of the build.
+        solve_seconds (float): Approximate wall clock time of the build. Only the order of magnitude is meaningful.
+        recommended_engine (str): The engine recommended for the build, which differs from engine if the latter is
+            unsuitable, e.g. max_smooth_interp with overlapping contracts, which it can't handle.
+        recommended_options (dict): Arguments which are recommended to be passed to the engine to reduce the cost of
+            the build, and don't change the result, e.g. {'precompute_callbacks': True}.
+    """
+    engine: str
+    num_points: int
+    num_contracts: int
+    num_sections: int
+    matrix_shape: tp.Tuple[int, int]
+    memory_bytes: int
+    solve_seconds: float
+    recommended_engine: str
+    recommended_options: dict
+
+
+def estimate(engine: str, *args, **kwargs) -> CostEstimate:
+    """
+    Estimates the cost of a curve build without performing the build. The calculation is proportional to the number of
+    contracts, rather than the number of output points, so is cheap even for large builds.
+
+    Args:
+        engine (str): Name of the curve building function, being one of the names in curves.parallel.ENGINES.
+        *args: Positional arguments of the curve building function.
+        **kwargs: Keyword arguments of the curve building function.
+
+    Returns:
+        CostEstimate: The estimated cost.
+
+    Example:
+        >>> cost = estimate('hyperbolic_tension_spline', contracts, freq='15min', tension=0.5)
+        >>> if cost.memory_bytes > max_worker_memory:
+        ...     raise ValueError('Curve too large to build.')
+    """
+    if engine not in ENGINES:
+        raise ValueError("engine parameter value of '{}' not supported. Must be one of {}."
+                         .format(engine, ', '.join(ENGINES)))
+    bound = inspect.signature(_resolve_engine(engine)).bind(*args, **kwargs)
+    bound.apply_defaults()
+    arguments = bound.arguments
+    freq = arguments['freq']
+    time_zone = arguments.get('time_zone')
+    contracts = _standardise_contracts(arguments['contracts'], freq, time_zone)
+    num_contracts = len(contracts.prices)
+    if num_contracts == 0:
+        raise ValueError('contracts argument must not be empty.')
+    shaping_ratios = _standardise_shaping(arguments.get('shaping_ratios'), freq, time_zone, 'numerator', 'denominator',
+                                          'ratio')
+    shaping_spreads = _standardise_shaping(arguments.get('shaping_spreads'), freq, time_zone, 'long', 'short', 'spread')
+    num_shaping = len(shaping_ratios.values) + len(shaping_spreads.values)
+    freq_offset = pd.tseries.frequencies.to_offset(freq)
+    first_period = contracts.starts.min()
+    last_period = contracts.ends.max()
+    num_points = _num_steps(first_period, last_period, freq_offset) + 1
+    num_derivs = sum(arguments.get(name) is not None for name in ('front_1st_deriv', 'back_1st_deriv'))
+
+    if engine == 'hyperbolic_tension_spline':
+        num_sections = len(_spline_knots(contracts, shaping_ratios, shaping_spreads, first_period, last_period, freq_offset, freq,
+                                          time_zone, arguments['knot_positions'], arguments['knots']))
+        num_coeffs = 2 * num_sections + 2
+        num_constraints = num_contracts + num_shaping + num_sections - 1 + num_derivs
+        matrix_size = num_coeffs + num_constraints if num_constraints < num_coeffs else num_coeffs
+    else:
+        boundaries, coverage = _elementary_periods(contracts, freq_offset)
+        if engine == 'max_smooth_interp':
+            # Quartic polynomial for each section, including gaps between contracts, with continuity of value, first and
+            # second derivatives at the knots
+            num_sections = len(boundaries) - 1
+            matrix_size = 5 * num_sections + num_contracts + 3 * (num_sections - 1) + num_derivs
+        else:
+            num_sections = int(np.count_nonzero(coverage))
+            matrix_size = num_sections + num_contracts + num_shaping
+
+    callable_seconds = 0.0
+    recommended_options = {}
+    precompute = arguments.get('precompute_callbacks', False)
+    for name in _PER_PERIOD_CALLABLES[engine]:
+        func = arguments.get(name)
+        if func is None:
+            continue
+        python_seconds = _SECONDS_PER_VECTORISED_POINT if hasattr(func, 'evaluate') else _SECONDS_PER_PYTHON_CALL
+        if engine == 'hyperbolic_tension_spline' or precompute:
+            callable_seconds += num_points * python_seconds
+        else:
+            callable_seconds += num_points * _SECONDS_PER_CALLBACK
+            recommended_options['precompute_callbacks'] = True
+    if arguments.get('time_func') is not None:  # max_smooth_interp always calls back into time_func
+        callable_seconds += num_points * _SECONDS_PER_CALLBACK
+    if callable(arguments.get('tension')):  # Only hyperbolic_tension_spline accepts callable tension
+        callable_seconds += num_sections * _SECONDS_PER_PYTHON_CALL
+
+    # Dense LU factorisation, with LAPACK working on a copy of the matrix
+    matrix_bytes = 2 * 8 * matrix_size * matrix_size
+    solve_seconds = (num_contracts * _SECONDS_PER_CONTRACT[engine] + num_sections * _SECONDS_PER_SECTION[engine] +
+                     num_points * _SECONDS_PER_POINT[engine] + callable_seconds +
+                     2.0 / 3.0 * matrix_size ** 3 / _FLOPS_PER_SECOND[engine])
+    recommended_engine = engine
+    if engine == 'max_smooth_interp' and _has_overlap(contracts):
+        recommended_engine = 'hyperbolic_tension_spline'
+    return CostEstimate(engine, num_points, num_contracts, num_sections, (matrix_size, matrix_size),
+                        matrix_bytes + num_points * _BYTES_PER_POINT[engine], solve_seconds, recommended_engine,
+                        recommended_options)
+
+
+def _num_steps(start, end, freq_offset) -> int:
+    if isinstance(start, pd.Period):
+        return (end.ordinal - start.ordinal) // freq_offset.n
+    return round((end - start) / freq_offset)
+
+
+def _elementary_periods(contracts, freq_offset) -> tp.Tuple[pd.Index, np.ndarray]:
+    """Returns the sorted boundaries between the periods into which the contract starts and ends divide the curve,
+    and the number of contracts covering each period."""
+    contract_ends = contracts.ends + freq_offset
+    boundaries = contracts.starts.append(contract_ends).unique().sort_values()
+    coverage = np.zeros(len(boundaries), dtype=np.int64)
+    np.add.at(coverage, boundaries.get_indexer(contracts.starts), 1)
+    np.add.at(coverage, boundaries.get_indexer(contract_ends), -1)
+    return boundaries, np.cumsum(coverage)[:-1]
+
+
+def _has_overlap(contracts) -> bool:
+    sort_order = np.argsort(contracts.starts.asi8, kind='stable')
+    return bool(np.any(contracts.starts.asi8[sort_order][1:] <= contracts.ends.asi8[sort_order][:-1]))
@@ -0,0 +1,323 @@
+# Copyright(c) 2026 Jake Fowler
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use, 
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, 
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, 
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+""" Provides compact deltas between successive versions of a curve, so publication cost scales with what changed."""
+
+import typing as tp
+import numpy as np
+import pandas as pd
+from curves.arrays import CurveArray, curve_array_from_series, elapsed_periods
+
+CurveType = tp.Union[pd.Series, CurveArray]
+
+
+class DeltaSegment(tp.NamedTuple):
+    """
+    Contiguous range of changed curve values.
+
+    Attributes:
+        start_ordinal (int): pandas.Period ordinal of the first changed period.
+        values (numpy.ndarray): The new values, one per period starting at start_ordinal.
+    """
+    start_ordinal: int
+    values: np.ndarray
+
+
+class CurveDelta(tp.NamedTuple):
+    """
+    Run-length encoded difference between two versions of a curve, as created by curve_delta.
+
+    Attributes:
+        start_ordinal (int): pandas.Period ordinal of the first period of the new curve.
+        length (int): Number of periods in the new curve.
+        freq (str): Pandas offset alias describing the granularity of the curve.
+        tz (str, optional): Time zone of the curve delivery periods. None if the curve is not time zone aware.
+        run_lengths (numpy.ndarray): Lengths of alternating runs of unchanged and changed periods, starting with a run
+            of unchanged periods, which has length zero if the first period changed. Sums to length.
+        values (numpy.ndarray): The new values of all changed periods, concatenated in period order.
+    """
+    start_ordinal: int
+    length: int
+    freq: str
+    tz: tp.Optional[str]
+    run_lengths: np.ndarray
+    values: np.ndarray
+
+    @property
+    def num_changed(self) -> int:
+        """int: Number of changed periods."""
+        return len(self.values)
+
+    @property
+    def is_empty(self) -> bool:
+        """bool: True if no values changed, i.e. applying the delta only changes the curve extent, if anything."""
+        return len(self.values) == 0
+
+    @property
+    def is_full(self) -> bool:
+        """bool: True if all periods changed, in which case the delta can be applied without a previous curve."""
+        return len(self.values) == self.length
+
+    def segments(self) -> tp.List[DeltaSegment]:
+        """Returns the ranges of changed periods, with values as views of the values attribute."""
+        segments = []
+        offset = 0
+        value_offset = 0
+        for run_idx, run_length in enumerate(self.run_lengths.tolist()):
+            if run_idx % 2 == 1 and run_length > 0:
+                segments.append(DeltaSegment(_offset_ordinal(self.start_ordinal, offset, self.freq, self.tz),
+                                             self.values[value_offset:value_offset + run_length]))
+                value_offset += run_length
+            offset += run_length
+        return segments
+
+    def to_dict(self) -> tp.Dict[str, tp.Any]:
+        """Converts to a dict of JSON serialisable values, which can be converted back using CurveDelta.from_dict."""
+        return {'start_ordinal': int(self.start_ordinal), 'length': int(self.length), 'freq': self.freq,
+                'tz': self.tz, 'run_lengths': self.run_lengths.tolist(), 'values': self.values.tolist()}
+
+    @staticmethod
+    def from_dict(data: tp.Mapping[str, tp.Any]) -> 'CurveDelta':
+        return CurveDelta(int(data['start_ordinal']), int(data['length']), data['freq'], data['tz'],
+                          np.asarray(data['run_lengths'], dtype=np.int64),
+                          np.asarray(data['values'], dtype=np.float64))
+
+
+def curve_delta(previous: tp.Optional[CurveType], current: CurveType, atol: float = 0.0, rtol: float = 0.0,
+                max_gap: int = 0) -> CurveDelta:
+    """
+    Calculates the delta which transforms one version of a curve into another.
+
+    Periods are aligned by delivery period, so the curves can have different extents, e.g. if the front period has
+    rolled off. Periods of the current curve which aren't in the previous curve are always included as changed.
+
+    Args:
+        previous (pandas.Series or CurveArray, optional): The previous version of the curve. If None the delta contains
+            all values of the current curve.
+        current (pandas.Series or CurveArray): The new version of the curve, with the same freq and time zone as
+            previous.
+        atol (float, optional): Absolute tolerance. A value is treated as unchanged if the absolute difference between
+            its current and previous value is no greater than atol + rtol * abs(previous value). Defaults to 0.0.
+        rtol (float, optional): Relative tolerance. Defaults to 0.0.
+        max_gap (int, optional): Runs of at most this many unchanged periods which lie between changed periods are
+            included as changed, which reduces the number of segments at the cost of extra values. Defaults to 0.
+
+    Returns:
+        CurveDelta: The delta, which applied to previous using apply_delta gives current, subject to the tolerances.
+    """
+    if atol < 0.0 or rtol < 0.0:
+        raise ValueError('atol and rtol must be non-negative. However atol is {} and rtol is {}.'.format(atol, rtol))
+    if max_gap < 0:
+        raise ValueError('max_gap must be non-negative. However {} was specified.'.format(max_gap))
+    current_array = _to_curve_array(current)
+    current_values = np.asarray(current_array.values, dtype=np.float64)
+    changed = np.ones(len(current_values), dtype=bool)
+    if previous is not None:
+        previous_array = _to_curve_array(previous)
+        _validate_same_granularity(previous_array, current_array)
+        # Positions of the overlapping periods in each curve, which are elapsed periods for time zone aware curves
+        offset = elapsed_periods(previous_array.start_ordinal, current_array.start_ordinal, current_array.freq,
+                                 current_array.tz)
+        current_start = max(0, -offset)
+        current_end = min(len(current_values), len(previous_array) - offset)
+        if current_end > current_start:
+            previous_overlap = np.asarray(previous_array.values[current_start + offset:current_end + offset],
+                                          dtype=np.float64)
+            changed[current_start:current_end] = ~np.isclose(current_values[current_start:current_end],
+                                                             previous_overlap, rtol=rtol, atol=atol, equal_nan=True)
+    if max_gap > 0:
+        _fill_gaps(changed, max_gap)
+    return CurveDelta(int(current_array.start_ordinal), len(current_values), current_array.freq,
+                      None if current_array.tz is None else str(current_array.tz), _run_lengths(changed),
+                      current_values[changed])
+
+
+def apply_delta(previous: tp.Optional[CurveType], delta: CurveDelta) -> CurveType:
+    """
+    Applies a delta, as created by curve_delta, to the previous version of a curve.
+
+    Args:
+        previous (pandas.Series or CurveArray, optional): The previous version of the curve. Can only be None if the
+            delta is full, i.e. was calculated without a previous curve.
+        delta (CurveDelta): The delta to apply.
+
+    Returns:
+        pandas.Series or CurveArray: The new version of the curve, of the same type as previous, or CurveArray if
+        previous is None. previous is not modified.
+    """
+    if int(np.sum(delta.run_lengths)) != delta.length or int(np.sum(delta.run_lengths[1::2])) != len(delta.values):
+        raise ValueError('delta is inconsistent, with run_lengths not matching length and number of values.')
+    new_values = np.empty(delta.length, dtype=np.float64)
+    changed = np.repeat(np.arange(len(delta.run_lengths)) % 2 == 1, delta.run_lengths)
+    if previous is None:
+        if not delta.is_full:
+            raise ValueError('previous can only be None if all values of the delta changed.')
+    else:
+        previous_array = _to_curve_array(previous)
+        _validate_same_granularity(previous_array, delta)
+        offset = elapsed_periods(previous_array.start_ordinal, delta.start_ordinal, delta.freq, delta.tz)
+        start = max(0, -offset)
+        end = min(delta.length, len(previous_array) - offset)
+        unchanged_outside_previous = ~changed
+        if end > start:
+            new_values[start:end] = previous_array.values[start + offset:end + offset]
+            unchanged_outside_previous[start:end] = False
+        if unchanged_outside_previous.any():
+            raise ValueError('delta does not contain values for all periods which are not in previous, so must have '
+                             'been calculated against a different previous curve.')
+    new_values[changed] = delta.values
+    curve_array = CurveArray(new_values, delta.start_ordinal, delta.freq, delta.tz)
+    return curve_array.to_series() if isinstance(previous, pd.Series) else curve_array
+
+
+class PublishedDelta(tp.NamedTuple):
+    """
+    Delta published by DeltaPublisher.
+
+    Attributes:
+        curve_id (str): Identifier of the curve.
+        version (int): Version of the curve which results from applying the delta.
+        base_version (int, optional): Version of the curve to which the delta should be applied, or None if the delta
+            is a full snapshot.
+        delta (CurveDelta): The delta.
+    """
+    curve_id: str
+    version: int
+    base_version: tp.Optional[int]
+    delta: CurveDelta
+
+
+class DeltaPublisher:
+    """
+    Converts successive versions of curves into deltas, which are passed to a sink callback.
+
+    Deltas are calculated against the curve as reconstructed by consumers, i.e. the result of applying all previously
+    published deltas, rather than against the previous version built. Hence differences within tolerance can't
+    accumulate, and the curve held by consumers is always within tolerance of the latest version published.
+
+    Instances are callable with a curves.streaming.PublishedCurve, so can be passed to CurveStreamer.subscribe.
+
+    Args:
+        sink (callable): Called with a PublishedDelta for each curve version published. Its return value is returned
+            by publish, so an async sink can be awaited by CurveStreamer.
+        atol (float, optional): Absolute tolerance passed to curve_delta. Defaults to 0.0.
+        rtol (float, optional): Relative tolerance passed to curve_delta. Defaults to 0.0.
+        max_gap (int, optional): Passed to curve_delta. Defaults to 0.
+        snapshot_every (int, optional): If specified, every snapshot_every-th version of each curve is published as a
+            full snapshot, so that consumers joining late, or which have missed a delta, can resynchronise.
+    """
+
+    def __init__(self, sink: tp.Callable[[PublishedDelta], tp.Any], atol: float = 0.0, rtol: float = 0.0,
+                 max_gap: int = 0, snapshot_every: tp.Optional[int] = None):
+        if snapshot_every is not None and snapshot_every < 1:
+            raise ValueError('snapshot_every must be at least 1. However {} was specified.'.format(snapshot_every))
+        self._sink = sink
+        self._atol = atol
+        self._rtol = rtol
+        self._max_gap = max_gap
+        self._snapshot_every = snapshot_every
+        self._published = {}  # curve_id to (version, CurveArray as held by consumers, number of deltas published)
+
+    def publish(self, curve_id: str, curve: CurveType, version: tp.Optional[int] = None) -> tp.Any:
+        """
+        Publishes a new version of a curve.
+
+        Args:
+            curve_id (str): Identifier of the curve.
+            curve (pandas.Series or CurveArray): The new version of the curve.
+            version (int, optional): Version number of the curve. Defaults to one more than the previous version
+                published for the curve_id, starting at 1.
+
+        Returns:
+            The value returned by the sink.
+        """
+        previous_version, previous_curve, num_published = self._published.get(curve_id, (None, None, 0))
+        if version is None:
+            version = 1 if previous_version is None else previous_version + 1
+        snapshot = previous_curve is None or (self._snapshot_every is not None
+                                              and num_published % self._snapshot_every == 0)
+        delta = curve_delta(None if snapshot else previous_curve, curve, self._atol, self._rtol, self._max_gap)
+        self._published[curve_id] = (version, apply_delta(None if snapshot else previous_curve, delta),
+                                     num_published + 1)
+        return self._sink(PublishedDelta(curve_id, version, None if snapshot else previous_version, delta))
+
+    def __call__(self, published_curve) -> tp.Any:
+        curve = published_curve.curve
+        return self.publish(published_curve.curve_id, curve[0] if isinstance(curve, tuple) else curve,
+                            published_curve.version)
+
+    def latest(self, curve_id: str) -> tp.Optional[CurveArray]:
+        """Returns the curve as held by consumers which have applied all published deltas, or None if no version of
+        the curve has been published."""
+        published = self._published.get(curve_id)
+        return None if published is None else published[1]
+
+    def reset(self, curve_id: str) -> None:
+        """Forgets the published state of a curve, so the next version published is a full snapshot."""
+        self._published.pop(curve_id, None)
+
+
+def _to_curve_array(curve: CurveType) -> CurveArray:
+    if isinstance(curve, CurveArray):
+        return curve
+    if isinstance(curve, pd.Series):
+        return curve_array_from_series(curve)
+    raise ValueError('Curve must be a pandas.Series or CurveArray. However it is of type {}.'
+                     .format(type(curve).__name__))
+
+
+def _offset_ordinal(start_ordinal: int, offset: int, freq: str, tz: tp.Optional[str]) -> int:
+    """Wall-clock pandas.Period ordinal of the period offset periods after that with start_ordinal, with periods of
+    time zone aware curves counted in elapsed time, as in CurveArray.index."""
+    freq_offset = pd.tseries.frequencies.to_offset(freq)
+    if tz is None or not isinstance(freq_offset, pd.tseries.offsets.Tick):
+        # Ordinals of multiple frequencies, e.g. '30min', count the base unit
+        return start_ordinal + offset * freq_offset.n
+    start = pd.Period(ordinal=start_ordinal, freq=freq).to_timestamp().tz_localize(tz)
+    return pd.Period((start + offset * freq_offset).tz_localize(None), freq=freq).ordinal
+
+
+def _validate_same_granularity(previous, current) -> None:
+    previous_tz = None if previous.tz is None else str(previous.tz)
+    current_tz = None if current.tz is None else str(current.tz)
+    if previous.freq != current.freq or previous_tz != current_tz:
+        raise ValueError('Curves must have the same freq and time zone. However the previous curve has freq {} and '
+                         'time zone {}, and the current curve has freq {} and time zone {}.'
+                         .format(previous.freq, previous_tz, current.freq, current_tz))
+
+
+def _run_lengths(changed: np.ndarray) -> np.ndarray:
+    boundaries = np.flatnonzero(changed[1:] != changed[:-1]) + 1
+    run_lengths = np.diff(np.concatenate(([0], boundaries, [len(changed)])))
+    if len(changed) > 0 and changed[0]:
+        run_lengths = np.concatenate(([0], run_lengths))
+    return run_lengths.astype(np.int64)
+
+
+def _fill_gaps(changed: np.ndarray, max_gap: int) -> None:
+    run_lengths = _run_lengths(changed)
+    run_ends = np.cumsum(run_lengths)
+    # Unchanged runs are at even positions, and are interior if not the first or last run
+    for run_idx in range(2, len(run_lengths) - 1, 2):
+        if run_lengths[run_idx] <= max_gap:
+            changed[run_ends[run_idx] - run_lengths[run_idx]:run_ends[run_idx]] = True
@@ -24,7 +24,13 @@
 import pandas as pd
 import numpy as np
 import typing as tp
-from curves._common import ContractsType, _last_period, deconstruct_contract, contract_pandas_periods, ShapingTypes
+from curves._contracts import ContractsType, deconstruct_contract, contract_pandas_periods, ShapingTypes, \
+    ColumnarContractsType, ColumnarShapingType, is_columnar_contracts, columnar_contract_periods, \
+    columnar_shaping_periods, _to_period_index
+from curves.arrays import CurveArray, periods_to_ordinals, evaluate_on_index, _validate_output, \
+    period_index_from_ordinals
+from curves.contract_period import _last_period
+from curves.instrumentation import BuildStats, instrumented
 from datetime import date, datetime
 from enum import Flag, auto
 
@@ -42,22 +48,26 @@ class KnotPositions(Flag):
 
 
 # TODO Update type hints to include str for contract periods
-def hyperbolic_tension_spline(contracts: tp.Union[ContractsType, pd.Series],
+@instrumented('hyperbolic_tension_spline')
+def hyperbolic_tension_spline(contracts: tp.Union[ContractsType, pd.Series, ColumnarContractsType],
                               freq: str,
                               tension: tp.Union[tp.Callable[[tp.Union[pd.Period, pd.Timestamp]], float], float],
                               discount_factor: tp.Optional[tp.Callable[[tp.Union[pd.Period, pd.Timestamp]], float]] = None,
                               average_weight: tp.Optional[tp.Callable[[tp.Union[pd.Period, pd.Timestamp]], float]] = None,
                               mult_season_adjust: tp.Optional[tp.Callable[[tp.Union[pd.Period, pd.Timestamp]], float]] = None,
                               add_season_adjust: tp.Optional[tp.Callable[[tp.Union[pd.Period, pd.Timestamp]], float]] = None,
-                              shaping_ratios: tp.Optional[ShapingTypes] = None,
-                              shaping_spreads: tp.Optional[ShapingTypes] = None,
+                              shaping_ratios: tp.Optional[tp.Union[ShapingTypes, ColumnarShapingType]] = None,
+                              shaping_spreads: tp.Optional[tp.Union[ShapingTypes, ColumnarShapingType]] = None,
                               time_zone: tp.Optional[tp.Union[str, tp.Type['pytz.timezone'], tp.Type['dateutil.tz.tzfile']]] = None, # TODO test that pytz.timezone and dateutil.tz.tzfile type hints work as expected
                               knot_positions: tp.Optional[KnotPositions] = KnotPositions.CONTRACT_START_AND_END,
                               knots: tp.Optional[tp.Iterable[tp.Union[str, pd.Period, pd.Timestamp, date, datetime]]] = None,
                               front_1st_deriv: tp.Optional[float] = None,
                               back_1st_deriv: tp.Optional[float] = None,
-                              return_spline_coeff: tp.Optional[bool] = False
-                              ) -> tp.Union[pd.Series, tp.Tuple[pd.Series, pd.DataFrame]]:
+                              return_spline_coeff: tp.Optional[bool] = False,
+                              output: tp.Optional[str] = 'series',
+                              *,
+                              stats: tp.Optional[BuildStats] = None
+                              ) -> tp.Union[pd.Series, CurveArray, tp.Tuple[pd.Series, pd.DataFrame], tp.Tuple[CurveArray, dict]]:
     """
     Creates a smooth interpolated curve from a collection of commodity forward/swap/futures prices using hyperbolic tension spline algorithm.
 
@@ -67,7 +77,7 @@ def hyperbolic_tension_spline(contracts: tp.Union[ContractsType, pd.Series],
     handles input contracts with overlapping delivery periods, i.e. the bootstrapping step of forward curve construction.
 
     Args:
-        contracts (pd.Series or iterable): The input contracts to be interpolated.
+        contracts (pd.Series, iterable, pd.DataFrame or mapping): The input contracts to be interpolated.
             If iterable of tuples, with each tuple describing a forward delivery period and price in one
             of the following forms:
                 ([period], [price])
@@ -84,6 +94,10 @@ def hyperbolic_tension_spline(contracts: tp.Union[ContractsType, pd.Series],
                 pandas.Timestamp
                 date
                 datetime
+            If pd.DataFrame, or mapping of str to array-like, contracts are in columnar form with 'start', 'end' and 'price'
+            columns. The start and end columns can contain pandas.Period, date-like or str values, or integer ordinals of
+            pandas.Period with freq equal to the freq parameter, as returned by curves.contract_period.parse_codes.
+            Period values in the end column are converted to their last period at freq granularity.
             The delivery periods of all input contracts can be contiguous, overlapping or have gaps. If there are
             overlaps then the spline_knots argument must be provided.
         freq (str): Describes the granularity of curve being constructed using pandas Offset Alias notation.
@@ -124,6 +138,9 @@ def hyperbolic_tension_spline(contracts: tp.Union[ContractsType, pd.Series],
                 date
                 datetime
                 A 2-tuple of any of the above three types, with the elements specifying the period start and end respectively.
+            If pd.DataFrame, or mapping of str to array-like, the ratios are in columnar form with 'numerator_start',
+            'numerator_end', 'denominator_start', 'denominator_end' and 'ratio' columns, the period columns accepting the
+            same values as the start and end columns of columnar contracts.
         shaping_spreads (iterable, optional): iterable of tuples, with each tuple describing a constraint on the spread
             between the prices of different periods on the derived forward curve in the form:
                 ([period long], [period short], [spread])
@@ -137,6 +154,9 @@ def hyperbolic_tension_spline(contracts: tp.Union[ContractsType, pd.Series],
                 date
                 datetime
                 A 2-tuple of any of the above three types, with the elements specifying the period start and end respectively.
+            If pd.DataFrame, or mapping of str to array-like, the spreads are in columnar form with 'long_start',
+            'long_end', 'short_start', 'short_end' and 'spread' columns, the period columns accepting the same values as
+            the start and end columns of columnar contracts.
         time_zone (str, pytz.timezone or dateutil.tz.tzfile, optional): Time zone applicable for the delivery periods of
             the interpolated curve. This should be specified if interpolating to higher than daily granularity (e.g. hourly)
             as time zone information is necessary to determine lost or gain hours due to clock changes. If omitted,
@@ -154,6 +174,10 @@ def hyperbolic_tension_spline(contracts: tp.Union[ContractsType, pd.Series],
             curve must be. If this parameter is omitted no constraint is applied.
         return_spline_coeff (bool, optional): Flag to determine whether the solved spline coefficients should be returned as the second
             element in a 2-tuple. Defaults to False if omitted.
+        output (str, optional): Either 'series' or 'numpy', determining the types of the returned results. Defaults to 'series'
+            if omitted.
+        stats (BuildStats, optional): If provided, populated with the time spent on each stage of the build, the matrix
+            dimensions and the number of invocations of callable arguments. See also curves.collect_stats.
 
     Returns:
         Either pandas.Series, or 2-tuple of (pandas.Series, pandas.DataFrame) if return_spline_coeff argument is True.
@@ -162,6 +186,9 @@ def hyperbolic_tension_spline(contracts: tp.Union[ContractsType, pd.Series],
         and freq equal to the freq parameter.
         If return_spline_coeff is True a 2-tuple will be returned with the 2nd element being a pandas.DataFrame containing
         the solved spline coefficients solved z_i and y_i at each spline knot.
+        If the output parameter is 'numpy', the curve is instead returned as a curves.arrays.CurveArray, and the spline coefficients
+        as a dict of numpy.ndarray, with the Period ordinals of the knots under key 'knot', and the other keys the same as the
+        pandas.DataFrame column names. If time_zone is provided the ordinals are of the local wall-clock time of the knots.
 
     Notes:
         Whether time_zone is provided by the caller determines whether pandas Period or Timestamp type is used to
@@ -172,75 +199,61 @@ def hyperbolic_tension_spline(contracts: tp.Union[ContractsType, pd.Series],
         See the following technical document for full details of the tension spline algorithm:
             https://github.com/cmdty/curves/blob/master/docs/tension_spline/tension_spline.pdf
     """
-    num_contracts = len(contracts)
-    if num_contracts < 2:
-        raise ValueError('contracts argument must have length at least 2. Length of contract used is {}.'
-                         .format(num_contracts))
+    _validate_output(output)
+    system = hyperbolic_tension_system(contracts, freq, tension, discount_factor, average_weight, mult_season_adjust,
+                                       add_season_adjust, shaping_ratios, shaping_spreads, time_zone, knot_positions,
+                                       knots, front_1st_deriv, back_1st_deriv)
+    stats.mark('solve')
+    solution = np.linalg.solve(system.matrix, system.vector)
+    return system._curve_from_solution(solution, return_spline_coeff, output, stats)
 
-    standardised_contracts = []  # Contract as tuples of (Period or Timestamp, Period or Timestamp, price)
-    if isinstance(contracts, pd.Series):
-        for period, price in contracts.items():  # TODO check this works with Series of Timestamps
-            start_period = _to_index_element(period.asfreq(freq, 's'), freq, time_zone)
-            end_period = _to_index_element(_last_period(period, freq), freq, time_zone)
-            standardised_contracts.append((start_period, end_period, price))
-    else:
-        for contract in contracts:
-            period, price = deconstruct_contract(contract)
-            start_period, end_period = contract_pandas_periods(period, freq)
-            start_period = _to_index_element(start_period, freq, time_zone)
-            end_period = _to_index_element(end_period, freq, time_zone)
-            standardised_contracts.append((start_period, end_period, price))
 
-    standardised_contracts = sorted(standardised_contracts, key=lambda x: x[0])  # Sort by start
-    shaping_ratios_list = _standardise_shaping(shaping_ratios, freq, time_zone)
-    shaping_spreads_list = _standardise_shaping(shaping_spreads, freq, time_zone)
+@instrumented('hyperbolic_tension_system')
+def hyperbolic_tension_system(contracts: tp.Union[ContractsType, pd.Series, ColumnarContractsType],
+                              freq: str,
+                              tension: tp.Union[tp.Callable[[tp.Union[pd.Period, pd.Timestamp]], float], float],
+                              discount_factor: tp.Optional[tp.Callable[[tp.Union[pd.Period, pd.Timestamp]], float]] = None,
+                              average_weight: tp.Optional[tp.Callable[[tp.Union[pd.Period, pd.Timestamp]], float]] = None,
+                              mult_season_adjust: tp.Optional[tp.Callable[[tp.Union[pd.Period, pd.Timestamp]], float]] = None,
+                              add_season_adjust: tp.Optional[tp.Callable[[tp.Union[pd.Period, pd.Timestamp]], float]] = None,
+                              shaping_ratios: tp.Optional[tp.Union[ShapingTypes, ColumnarShapingType]] = None,
+                              shaping_spreads: tp.Optional[tp.Union[ShapingTypes, ColumnarShapingType]] = None,
+                              time_zone: tp.Optional[tp.Union[str, tp.Type['pytz.timezone'], tp.Type['dateutil.tz.tzfile']]] = None,
+                              knot_positions: tp.Optional[KnotPositions] = KnotPositions.CONTRACT_START_AND_END,
+                              knots: tp.Optional[tp.Iterable[tp.Union[str, pd.Period, pd.Timestamp, date, datetime]]] = None,
+                              front_1st_deriv: tp.Optional[float] = None,
+                              back_1st_deriv: tp.Optional[float] = None,
+                              *,
+                              stats: tp.Optional[BuildStats] = None) -> 'HyperbolicTensionSystem':
+    """
+    Prepares the linear system solved by hyperbolic_tension_spline, so that curves can be re-solved cheaply for new
+    contract prices, keeping the contract delivery periods and all other arguments the same.
 
-    first_period = standardised_contracts[0][0]
-    last_period = max((x[1] for x in standardised_contracts))
-    freq_offset = pd.tseries.frequencies.to_offset(freq) # TODO find why Pycharm is warning about frequencies and fix
+    Args:
+        The same as the arguments of hyperbolic_tension_spline with the same names.
 
-    starts_ends = {(contract[0], contract[1]) for contract in standardised_contracts} \
-                  .union({(shaping_ratio[0], shaping_ratio[1]) for shaping_ratio in shaping_ratios_list}) \
-                  .union({(shaping_ratio[2], shaping_ratio[3]) for shaping_ratio in shaping_ratios_list}) \
-                  .union({(shaping_spread[0], shaping_spread[1]) for shaping_spread in shaping_spreads_list}) \
-                  .union({(shaping_spread[2], shaping_spread[3]) for shaping_spread in shaping_spreads_list})
+    Returns:
+        HyperbolicTensionSystem: The prepared system, the solve method of which returns the curve for given contract prices.
+    """
+    stats.mark('standardise')
+    standardised_contracts = _standardise_contracts(contracts, freq, time_zone)
+    num_contracts = len(standardised_contracts.prices)
+    if num_contracts < 2:
+        raise ValueError('contracts argument must have length at least 2. Length of contract used is {}.'
+                         .format(num_contracts))
 
-    # TODO this looks like it will break if latest contract is for a single period. Add test.
-    spline_knots_set = set()  # Not worth adding dependency to Sorted Containers package
-    if KnotPositions.CONTRACT_START in knot_positions:
-        for start, _ in starts_ends:
-            spline_knots_set.add(start)
-    if KnotPositions.CONTRACT_END in knot_positions:
-        for _, end in starts_ends:
-            if end < last_period:
-                spline_knots_set.add(end + freq_offset)
-    if KnotPositions.CONTRACT_CENTRE in knot_positions:
-        for start, end in starts_ends:
-            mid_point = _mid_period_or_timestamp(start, end, freq_offset)
-            spline_knots_set.add(mid_point)
-    if KnotPositions.SPACING_CENTRE in knot_positions:
-        start_and_ends_set = ({start for start, _ in starts_ends}
-                    .union({end + freq_offset for _, end in starts_ends}))
-        sorted_start_and_ends_set = sorted(start_and_ends_set)
-        for idx, p2 in enumerate(sorted_start_and_ends_set[1:]):
-            p1 = sorted_start_and_ends_set[idx]
-            mid_point = _mid_period_or_timestamp(p1, p2, freq_offset)
-            spline_knots_set.add(mid_point)
-    # Always include first and last period
-    spline_knots_set.add(first_period)
-    if last_period in spline_knots_set:
-        spline_knots_set.remove(last_period)
+    input_order = np.argsort(standardised_contracts.starts.asi8, kind='stable')  # Sort by start
+    standardised_contracts = _Contracts(*(column[input_order] for column in standardised_contracts))
+    shaping_ratios_list = _standardise_shaping(shaping_ratios, freq, time_zone, 'numerator', 'denominator', 'ratio')
+    shaping_spreads_list = _standardise_shaping(shaping_spreads, freq, time_zone, 'long', 'short', 'spread')
 
-    if knots is not None:
-        for knot in knots:
-            standarised_knot = _to_index_element(knot, freq, time_zone)
-            if standarised_knot > last_period:
-                raise ValueError('spline_knots should not contain items after the latest contract delivery period. '
-                                 'Specified knot {} is after the latest delivery of {}.'
-                                 .format(knot, last_period))
-            spline_knots_set.add(standarised_knot)
+    stats.mark('knots')
+    first_period = standardised_contracts.starts[0]
+    last_period = standardised_contracts.ends.max()
+    freq_offset = pd.tseries.frequencies.to_offset(freq) # TODO find why Pycharm is warning about frequencies and fix
 
-    spline_knots_list = sorted(spline_knots_set)
+    spline_knots_list = _spline_knots(standardised_contracts, shaping_ratios_list, shaping_spreads_list, first_period,
+                                      last_period, freq_offset, freq, time_zone, knot_positions, knots)
 
     if time_zone is None:
         result_curve_index = pd.period_range(start=first_period, end=last_period, freq=freq)
@@ -260,29 +273,27 @@ def int_index(del_period):
 
     num_result_curve_points = len(result_curve_index)
 
+    stats.mark('callables')
     # Calculate vectors of coefficients
     if discount_factor is None:
         discount_factors = np.ones(num_result_curve_points)
     else:
-        discount_factors = np.fromiter((discount_factor(key) for key in result_curve_index), dtype=np.float64,
-                                       count=num_result_curve_points)
+        discount_factors = evaluate_on_index(discount_factor, result_curve_index)
     if average_weight is None:
         average_weights = np.ones(num_result_curve_points)
     else:
-        average_weights = np.fromiter((average_weight(key) for key in result_curve_index), dtype=np.float64,
-                                      count=num_result_curve_points)
+        average_weights = evaluate_on_index(average_weight, result_curve_index)
     weights_times_discounts = discount_factors * average_weights
     if mult_season_adjust is None:
         mult_season_adjusts = np.ones(num_result_curve_points)
     else:
-        mult_season_adjusts = np.fromiter((mult_season_adjust(key) for key in result_curve_index), dtype=np.float64,
-                                          count=num_result_curve_points)
+        mult_season_adjusts = evaluate_on_index(mult_season_adjust, result_curve_index)
     if add_season_adjust is None:
         add_season_adjusts = np.zeros(num_result_curve_points)
     else:
-        add_season_adjusts = np.fromiter((add_season_adjust(key) for key in result_curve_index), dtype=np.float64,
-                                         count=num_result_curve_points)
+        add_season_adjusts = evaluate_on_index(add_season_adjust, result_curve_index)
     weights_x_discounts_x_mult_adjust = weights_times_discounts * mult_season_adjusts
+    stats.mark('assembly')
     # Precalculate sinh vectors
     if isinstance(tension, float):  # TODO handle case if tension is int type?
         if tension <= 0:
@@ -348,8 +359,8 @@ def get_tension(p) -> float:
     yi_minus1_coeffs = (t_to_section_end / h_is_expanded) * weights_x_discounts_x_mult_adjust
 
     num_coeffs_to_solve = num_sections * 2 + 2
-    num_shaping_ratios = len(shaping_ratios_list)
-    num_shaping_spreads = len(shaping_spreads_list)
+    num_shaping_ratios = len(shaping_ratios_list.values)
+    num_shaping_spreads = len(shaping_spreads_list.values)
 
     num_constraints = num_contracts + num_shaping_ratios + num_shaping_spreads + num_sections - 1 + \
                       (0 if back_1st_deriv is None else 1) \
@@ -366,61 +377,360 @@ def get_tension(p) -> float:
                             h_is, tau_sinh, cosh_tau_hi)
         constraint_matrix = matrix[num_coeffs_to_solve:, 0:num_coeffs_to_solve]
         constraint_vector = vector[num_coeffs_to_solve:]
-        _populate_constraint_vector_matrix(constraint_matrix, constraint_vector, add_season_adjusts, front_1st_deriv, back_1st_deriv,
-                                           cosh_tau_hi, freq_offset,
-                                           h_is, int_index, last_period, num_contracts, num_sections, spline_knots_list, standardised_contracts,
-                                           tau_sinh, tension_by_section, weights_times_discounts, weights_x_discounts_x_mult_adjust,
-                                           yi_coeffs, yi_minus1_coeffs, zi_coeffs, zi_minus1_coeffs, shaping_ratios_list, shaping_spreads_list)
+        contract_weight_sums = _populate_constraint_vector_matrix(constraint_matrix, constraint_vector, add_season_adjusts, front_1st_deriv, back_1st_deriv,
+                                                                  cosh_tau_hi, freq_offset,
+                                                                  h_is, int_index, last_period, num_contracts, num_sections, spline_knots_list, standardised_contracts,
+                                                                  tau_sinh, tension_by_section, weights_times_discounts, weights_x_discounts_x_mult_adjust,
+                                                                  yi_coeffs, yi_minus1_coeffs, zi_coeffs, zi_minus1_coeffs, shaping_ratios_list, shaping_spreads_list)
         matrix[0:num_coeffs_to_solve:, num_coeffs_to_solve:] = constraint_matrix.T
         # TODO use block matrix inversion with spare matrices
     else:
         # Not maximum smoothness, so constraint matrix has to be square
         matrix = np.zeros((num_coeffs_to_solve, num_coeffs_to_solve))  # TODO: make this banded matrix
         vector = np.zeros((num_coeffs_to_solve, 1))
-        _populate_constraint_vector_matrix(matrix, vector, add_season_adjusts, front_1st_deriv, back_1st_deriv, cosh_tau_hi, freq_offset,
-                                           h_is, int_index, last_period, num_contracts, num_sections, spline_knots_list, standardised_contracts,
-                                           tau_sinh, tension_by_section, weights_times_discounts, weights_x_discounts_x_mult_adjust,
-                                           yi_coeffs, yi_minus1_coeffs, zi_coeffs, zi_minus1_coeffs, shaping_ratios_list, shaping_spreads_list)
+        contract_weight_sums = _populate_constraint_vector_matrix(matrix, vector, add_season_adjusts, front_1st_deriv, back_1st_deriv, cosh_tau_hi, freq_offset,
+                                                                  h_is, int_index, last_period, num_contracts, num_sections, spline_knots_list, standardised_contracts,
+                                                                  tau_sinh, tension_by_section, weights_times_discounts, weights_x_discounts_x_mult_adjust,
+                                                                  yi_coeffs, yi_minus1_coeffs, zi_coeffs, zi_minus1_coeffs, shaping_ratios_list, shaping_spreads_list)
+
+    stats.record_matrix(matrix)
+    curve_terms = _CurveTerms(freq, time_zone, first_period, last_period, result_curve_index, spline_knots_list,
+                              section_period_indices, section_end_times, tension_by_section, tension_by_section_sqrd,
+                              sinh_tau_t_to_end, sinh_tau_t_from_start, tau_sqrd_sinh_expanded, t_to_section_end,
+                              t_from_section_start, h_is_expanded, add_season_adjusts, mult_season_adjusts,
+                              weights_times_discounts)
+    return HyperbolicTensionSystem(matrix, vector, num_coeffs_to_solve if maximum_smoothness else 0, contract_weight_sums,
+                                   input_order, standardised_contracts.prices, num_coeffs_to_solve if maximum_smoothness else None,
+                                   curve_terms)
+
+
+class _CurveTerms(tp.NamedTuple):
+    freq: str
+    time_zone: tp.Any
+    first_period: tp.Union[pd.Period, pd.Timestamp]
+    last_period: tp.Union[pd.Period, pd.Timestamp]
+    result_curve_index: tp.Union[pd.PeriodIndex, pd.DatetimeIndex]
+    spline_knots_list: list
+    section_period_indices: list
+    section_end_times: np.ndarray
+    tension_by_section: np.ndarray
+    tension_by_section_sqrd: np.ndarray
+    sinh_tau_t_to_end: np.ndarray
+    sinh_tau_t_from_start: np.ndarray
+    tau_sqrd_sinh_expanded: np.ndarray
+    t_to_section_end: np.ndarray
+    t_from_section_start: np.ndarray
+    h_is_expanded: np.ndarray
+    add_season_adjusts: np.ndarray
+    mult_season_adjusts: np.ndarray
+    weights_times_discounts: np.ndarray
+
+
+class HyperbolicTensionSystem:
+    """
+    The linear system solved by hyperbolic_tension_spline for a fixed set of contract delivery periods and other
+    arguments, as created by the hyperbolic_tension_system function.
 
-    solution = np.linalg.solve(matrix, vector)
-    if maximum_smoothness:
-        solution_to_use = solution[:num_coeffs_to_solve]
-    else:
-        solution_to_use = solution
+    The spline coefficients are an affine function of the contract prices, so after the first call of solve, curves
+    for new prices are calculated with a matrix-vector product, rather than by rebuilding and solving the system.
+    """
 
-    # Read results off solution
-    spline_vals = np.zeros(num_result_curve_points)
-    for i, section_start in enumerate(spline_knots_list):
-        z_start = solution_to_use[i * 2, 0]
-        y_start = solution_to_use[i * 2 + 1, 0]
-        z_end = solution_to_use[i * 2 + 2, 0]
-        y_end = solution_to_use[i * 2 + 3, 0]
-        tension_squared = tension_by_section_sqrd[i]
-        start_idx, end_idx = section_period_indices[i]
-        spline_vals[start_idx:end_idx] = (z_start * sinh_tau_t_to_end[start_idx:end_idx] + z_end * sinh_tau_t_from_start[start_idx:end_idx]) \
-                                         / tau_sqrd_sinh_expanded[start_idx:end_idx] + \
-                                         ((y_start - z_start / tension_squared) * t_to_section_end[start_idx:end_idx] +
-                                          (y_end - z_end / tension_squared) * t_from_section_start[start_idx:end_idx]) / h_is_expanded[
-                                                                                                                         start_idx:end_idx]
-    # TODO: handling of periods with zero weight, e.g. power offpeak hours when interpolating peak. Could be:
-    # periods aren't included in index
-    # NaN price for zero-weight periods
-    # Current behaviour: zero price
-    # Controls this behaviour with argument?
-    # TODO: skip adjustments if these aren't provided
-    result_curve_prices = (spline_vals + add_season_adjusts) * mult_season_adjusts
-    result_curve = pd.Series(data=result_curve_prices, index=result_curve_index)
-    if return_spline_coeff:
-        spline_coeff_data = np.zeros(shape=(num_sections + 1, 4))
-        spline_coeff_data[1:, 0] = section_end_times  # Knot times
-        spline_coeff_data[:, 1] = solution_to_use[1::2, 0]  # y params
-        spline_coeff_data[:, 2] = solution_to_use[::2, 0]  # z params
-        spline_coeff_data[:-1, 3] = tension_by_section
-        spline_coeff_data[-1, 3] = np.nan
-        spline_coeffs = pd.DataFrame(data=spline_coeff_data, index=spline_knots_list + [last_period], columns=['t', 'y', 'z', 'tension'])
-        return result_curve, spline_coeffs
+    def __init__(self, matrix, vector, price_rows_start, contract_weight_sums, input_order, sorted_prices,
+                 num_coeffs_to_solve, curve_terms):
+        self.matrix = matrix
+        self.vector = vector
+        self._price_rows_start = price_rows_start
+        self._contract_weight_sums = contract_weight_sums
+        self._input_order = input_order
+        self._sorted_prices = sorted_prices
+        self._num_coeffs_to_solve = num_coeffs_to_solve
+        self._curve_terms = curve_terms
+        self._affine_solution = None
+        self._evaluation_terms = None
+
+    @property
+    def num_contracts(self) -> int:
+        return len(self._input_order)
+
+    @property
+    def contract_prices(self) -> np.ndarray:
+        """numpy.ndarray: The contract prices used to create the system, in the order of the contracts argument."""
+        prices = np.empty_like(self._sorted_prices)
+        prices[self._input_order] = self._sorted_prices
+        return prices
+
+    @property
+    def weights_times_discounts(self) -> np.ndarray:
+        """numpy.ndarray: Product of average_weight and discount_factor for each point of the curve returned by solve, as
+        used to weight the curve when averaging over contract delivery periods."""
+        return self._curve_terms.weights_times_discounts
+
+    @instrumented('HyperbolicTensionSystem.solve')
+    def solve(self, prices: tp.Optional[tp.Iterable[float]] = None, return_spline_coeff: tp.Optional[bool] = False,
+              output: tp.Optional[str] = 'series', *, stats: tp.Optional[BuildStats] = None) \
+            -> tp.Union[pd.Series, CurveArray, tp.Tuple[pd.Series, pd.DataFrame], tp.Tuple[CurveArray, dict]]:
+        """
+        Calculates the curve for new contract prices.
+
+        Args:
+            prices (iterable of float, optional): The contract prices, in the same order as the contracts argument used
+                to create the system. If omitted, the prices from the contracts argument are used.
+            return_spline_coeff (bool, optional): As for hyperbolic_tension_spline.
+            output (str, optional): As for hyperbolic_tension_spline.
+            stats (BuildStats, optional): As for hyperbolic_tension_spline. The first call records the solve of the
+                system for all contract prices, so takes longer than subsequent calls.
+
+        Returns:
+            The same as hyperbolic_tension_spline would return for contracts with the same delivery periods and the
+            new prices.
+        """
+        _validate_output(output)
+        stats.mark('solve')
+        stats.record_matrix(self.matrix)
+        sorted_prices = self._sorted_prices if prices is None else self._sort_prices(prices)
+        const_solution, price_solution = self._get_affine_solution()
+        solution = const_solution + price_solution @ sorted_prices[:, np.newaxis]
+        return self._curve_from_solution(solution, return_spline_coeff, output, stats)
+
+    def solve_many(self, prices: np.ndarray, max_memory_bytes: tp.Optional[int] = 2**28) -> np.ndarray:
+        """
+        Calculates the curves for many sets of contract prices, e.g. scenarios for risk calculations, using a single
+        factorisation of the system and vectorised evaluation of the splines.
+
+        Args:
+            prices (numpy.ndarray): Two-dimensional array of shape (number of price sets, number of contracts), with each
+                row being contract prices in the same order as the contracts argument used to create the system.
+            max_memory_bytes (int, optional): Approximate limit on the temporary memory used, in addition to the
+                returned array, achieved by evaluating the curves in chunks of rows. Defaults to 256MB. If None, all
+                curves are evaluated in a single chunk.
+
+        Returns:
+            numpy.ndarray: Array of shape (number of price sets, number of curve points), with each row being the curve
+            values for the corresponding row of prices, equal to those returned by solve.
+        """
+        prices = np.asarray(prices, dtype=np.float64)
+        if prices.ndim != 2 or prices.shape[1] != self.num_contracts:
+            raise ValueError('prices must have shape (number of price sets, {}), but has shape {}.'
+                             .format(self.num_contracts, prices.shape))
+        const_solution, price_solution = self._get_affine_solution()
+        num_coeffs = const_solution.shape[0] if self._num_coeffs_to_solve is None else self._num_coeffs_to_solve
+        const_coeffs = const_solution[:num_coeffs, 0]
+        sorted_prices = prices[:, self._input_order]
+        price_coeffs_transposed = price_solution[:num_coeffs].T
+        knot_indices, knot_weights, offsets = self._get_evaluation_terms()
+        num_points = len(offsets)
+        curves = np.empty((prices.shape[0], num_points))
+        chunk_size = max(1, prices.shape[0] if max_memory_bytes is None else max_memory_bytes // (16 * num_points))
+        for chunk_start in range(0, prices.shape[0], chunk_size):
+            chunk_curves = curves[chunk_start:chunk_start + chunk_size]
+            solutions = sorted_prices[chunk_start:chunk_start + chunk_size] @ price_coeffs_transposed + const_coeffs
+            term = np.empty_like(chunk_curves)
+            chunk_curves[:] = offsets
+            for knot_offset in range(4):  # z and y of the knots at the start and end of each point's section
+                np.take(solutions, knot_indices + knot_offset, axis=1, out=term)
+                term *= knot_weights[knot_offset]
+                chunk_curves += term
+        return curves
+
+    def _get_evaluation_terms(self):
+        """Returns the spline evaluation as a linear function of the solution, with each curve point equal to
+        offsets + sum over j of knot_weights[j] * solution[knot_indices + j]."""
+        if self._evaluation_terms is None:
+            (freq, time_zone, first_period, last_period, result_curve_index, spline_knots_list, section_period_indices,
+             section_end_times, tension_by_section, tension_by_section_sqrd, sinh_tau_t_to_end, sinh_tau_t_from_start,
+             tau_sqrd_sinh_expanded, t_to_section_end, t_from_section_start, h_is_expanded, add_season_adjusts,
+             mult_season_adjusts, _) = self._curve_terms
+            num_points = len(result_curve_index)
+            section_idx = _create_expanded_np_array(np.arange(len(spline_knots_list), dtype=np.float64), num_points,
+                                                    section_period_indices).astype(np.int64)
+            tension_sqrd_expanded = tension_by_section_sqrd[section_idx]
+            t_to_end_over_h = t_to_section_end / h_is_expanded
+            t_from_start_over_h = t_from_section_start / h_is_expanded
+            knot_weights = np.array([
+                sinh_tau_t_to_end / tau_sqrd_sinh_expanded - t_to_end_over_h / tension_sqrd_expanded,  # z_i
+                t_to_end_over_h,  # y_i
+                sinh_tau_t_from_start / tau_sqrd_sinh_expanded - t_from_start_over_h / tension_sqrd_expanded,  # z_i+1
+                t_from_start_over_h  # y_i+1
+            ]) * mult_season_adjusts
+            self._evaluation_terms = (section_idx * 2, knot_weights, add_season_adjusts * mult_season_adjusts)
+        return self._evaluation_terms
+
+    def _sort_prices(self, prices) -> np.ndarray:
+        prices = np.asarray(prices, dtype=np.float64)
+        if prices.shape != (self.num_contracts,):
+            raise ValueError('prices must have length equal to the number of contracts, {}, but has shape {}.'
+                             .format(self.num_contracts, prices.shape))
+        return prices[self._input_order]
+
+    def _get_affine_solution(self):
+        if self._affine_solution is None:
+            num_contracts = self.num_contracts
+            price_rows = self._price_rows_start + np.arange(num_contracts)
+            rhs = np.zeros((self.vector.shape[0], num_contracts + 1))
+            rhs[:, 0] = self.vector[:, 0]
+            rhs[price_rows, 0] -= self._contract_weight_sums * self._sorted_prices
+            rhs[price_rows, np.arange(1, num_contracts + 1)] = self._contract_weight_sums
+            solution = np.linalg.solve(self.matrix, rhs)
+            self._affine_solution = (solution[:, :1], solution[:, 1:])
+        return self._affine_solution
+
+    def _curve_from_solution(self, solution, return_spline_coeff, output, stats):
+        if self._num_coeffs_to_solve is not None:
+            solution_to_use = solution[:self._num_coeffs_to_solve]
+        else:
+            solution_to_use = solution
+        (freq, time_zone, first_period, last_period, result_curve_index, spline_knots_list, section_period_indices,
+         section_end_times, tension_by_section, tension_by_section_sqrd, sinh_tau_t_to_end, sinh_tau_t_from_start,
+         tau_sqrd_sinh_expanded, t_to_section_end, t_from_section_start, h_is_expanded, add_season_adjusts,
+         mult_season_adjusts, _) = self._curve_terms
+        num_result_curve_points = len(result_curve_index)
+        num_sections = len(spline_knots_list)
+
+        stats.mark('evaluate')
+        # Read results off solution
+        spline_vals = np.zeros(num_result_curve_points)
+        for i, section_start in enumerate(spline_knots_list):
+            z_start = solution_to_use[i * 2, 0]
+            y_start = solution_to_use[i * 2 + 1, 0]
+            z_end = solution_to_use[i * 2 + 2, 0]
+            y_end = solution_to_use[i * 2 + 3, 0]
+            tension_squared = tension_by_section_sqrd[i]
+            start_idx, end_idx = section_period_indices[i]
+            spline_vals[start_idx:end_idx] = (z_start * sinh_tau_t_to_end[start_idx:end_idx] + z_end * sinh_tau_t_from_start[start_idx:end_idx]) \
+                                             / tau_sqrd_sinh_expanded[start_idx:end_idx] + \
+                                             ((y_start - z_start / tension_squared) * t_to_section_end[start_idx:end_idx] +
+                                              (y_end - z_end / tension_squared) * t_from_section_start[start_idx:end_idx]) / h_is_expanded[
+                                                                                                                             start_idx:end_idx]
+        # TODO: handling of periods with zero weight, e.g. power offpeak hours when interpolating peak. Could be:
+        # periods aren't included in index
+        # NaN price for zero-weight periods
+        # Current behaviour: zero price
+        # Controls this behaviour with argument?
+        # TODO: skip adjustments if these aren't provided
+        result_curve_prices = (spline_vals + add_season_adjusts) * mult_season_adjusts
+        stats.mark('marshal')
+        if output == 'numpy':
+            result_curve = CurveArray(result_curve_prices, int(periods_to_ordinals([first_period], freq)[0]), freq, time_zone)
+        else:
+            result_curve = pd.Series(data=result_curve_prices, index=result_curve_index)
+        if return_spline_coeff:
+            spline_coeff_data = np.zeros(shape=(num_sections + 1, 4))
+            spline_coeff_data[1:, 0] = section_end_times  # Knot times
+            spline_coeff_data[:, 1] = solution_to_use[1::2, 0]  # y params
+            spline_coeff_data[:, 2] = solution_to_use[::2, 0]  # z params
+            spline_coeff_data[:-1, 3] = tension_by_section
+            spline_coeff_data[-1, 3] = np.nan
+            if output == 'numpy':
+                spline_coeffs = {'knot': periods_to_ordinals(spline_knots_list + [last_period], freq)}
+                spline_coeffs.update((column, spline_coeff_data[:, i]) for i, column in enumerate(['t', 'y', 'z', 'tension']))
+            else:
+                spline_coeffs = pd.DataFrame(data=spline_coeff_data, index=spline_knots_list + [last_period],
+                                             columns=['t', 'y', 'z', 'tension'])
+            return result_curve, spline_coeffs
+        else:
+            return result_curve
+
+
+class _Contracts(tp.NamedTuple):
+    """Contracts with delivery starts and inclusive ends as PeriodIndex, or DatetimeIndex if time_zone is not None."""
+    starts: pd.Index
+    ends: pd.Index
+    prices: np.ndarray
+
+
+class _Shaping(tp.NamedTuple):
+    """Shaping ratios or spreads with delivery starts and inclusive ends of both periods as PeriodIndex, or
+    DatetimeIndex if time_zone is not None."""
+    first_starts: pd.Index
+    first_ends: pd.Index
+    second_starts: pd.Index
+    second_ends: pd.Index
+    values: np.ndarray
+
+
+def _standardise_contracts(contracts, freq, time_zone) -> _Contracts:
+    """Converts the contracts argument to arrays of starts, ends and prices, with starts and ends being PeriodIndex, or
+    DatetimeIndex if time_zone is not None."""
+    if is_columnar_contracts(contracts):
+        starts, ends, prices = columnar_contract_periods(contracts, freq)
+    elif isinstance(contracts, pd.Series):  # TODO check this works with Series of Timestamps
+        starts = _to_period_index(contracts.index, freq, 's')
+        ends = _to_period_index(contracts.index, freq, 'e')
+        prices = np.asarray(contracts.values, dtype=np.float64)
+    else:
+        start_periods = []
+        end_periods = []
+        prices = []
+        for contract in contracts:
+            period, price = deconstruct_contract(contract)
+            start_period, end_period = contract_pandas_periods(period, freq)
+            start_periods.append(start_period)
+            end_periods.append(end_period)
+            prices.append(price)
+        starts = pd.PeriodIndex(start_periods, freq=freq)
+        ends = pd.PeriodIndex(end_periods, freq=freq)
+        prices = np.array(prices, dtype=np.float64)
+    return _Contracts(_to_index(starts, time_zone), _to_index(ends, time_zone), prices)
+
+
+def _standardise_shaping(shaping_info, freq, tz, first_name, second_name, value_name) -> _Shaping:
+    """Converts the shaping_ratios or shaping_spreads argument to arrays, with the names being those of the columns
+    for the shaping in columnar form, as documented for hyperbolic_tension_spline."""
+    if shaping_info is not None and is_columnar_contracts(shaping_info):
+        *periods, values = columnar_shaping_periods(shaping_info, freq, first_name, second_name, value_name)
     else:
-        return result_curve
+        periods = ([], [], [], [])
+        values = []
+        for (period1, period2, shaping_factor) in (shaping_info or ()):
+            for period_list, period in zip(periods, contract_pandas_periods(period1, freq) +
+                                           contract_pandas_periods(period2, freq)):
+                period_list.append(period)
+            values.append(shaping_factor)
+        periods = [pd.PeriodIndex(period_list, freq=freq) for period_list in periods]
+        values = np.array(values, dtype=np.float64)
+    return _Shaping(*(_to_index(period_index, tz) for period_index in periods), values)
+
+
+def _to_index(period_index, tz) -> pd.Index:
+    return period_index if tz is None else period_index.to_timestamp().tz_localize(tz)
+
+
+def _spline_knots(standardised_contracts, shaping_ratios, shaping_spreads, first_period, last_period,
+                  freq_offset, freq, time_zone, knot_positions, knots) -> list:
+    starts = standardised_contracts.starts.append([shaping_ratios.first_starts, shaping_ratios.second_starts,
+                                                   shaping_spreads.first_starts, shaping_spreads.second_starts])
+    ends = standardised_contracts.ends.append([shaping_ratios.first_ends, shaping_ratios.second_ends,
+                                               shaping_spreads.first_ends, shaping_spreads.second_ends])
+
+    # TODO this looks like it will break if latest contract is for a single period. Add test.
+    # Always include first period
+    spline_knots = [pd.Index([first_period])]
+    if KnotPositions.CONTRACT_START in knot_positions:
+        spline_knots.append(starts)
+    if KnotPositions.CONTRACT_END in knot_positions:
+        spline_knots.append(ends[ends < last_period] + freq_offset)
+    if KnotPositions.CONTRACT_CENTRE in knot_positions:
+        spline_knots.append(_mid_periods_or_timestamps(starts, ends, freq_offset))
+    if KnotPositions.SPACING_CENTRE in knot_positions:
+        sorted_start_and_ends = starts.append(ends + freq_offset).unique().sort_values()
+        spline_knots.append(_mid_periods_or_timestamps(sorted_start_and_ends[:-1], sorted_start_and_ends[1:],
+                                                       freq_offset))
+    spline_knots = spline_knots[0].append(spline_knots[1:]).unique()
+    spline_knots = spline_knots[spline_knots != last_period]
+
+    if knots is not None:
+        standardised_knots = []
+        for knot in knots:
+            standarised_knot = _to_index_element(knot, freq, time_zone)
+            if standarised_knot > last_period:
+                raise ValueError('spline_knots should not contain items after the latest contract delivery period. '
+                                 'Specified knot {} is after the latest delivery of {}.'
+                                 .format(knot, last_period))
+            standardised_knots.append(standarised_knot)
+        if standardised_knots:
+            spline_knots = spline_knots.append(pd.Index(standardised_knots)).unique()
+
+    return list(spline_knots.sort_values())
 
 
 def _populate_constraint_vector_matrix(constraint_matrix, constraint_vector, add_season_adjusts, front_1st_deriv, back_1st_deriv,
@@ -429,20 +739,22 @@ def _populate_constraint_vector_matrix(constraint_matrix, constraint_vector, add
                                        tau_sinh, tension_by_section, weights_times_discounts, weights_x_discounts_x_mult_adjust, yi_coeffs,
                                        yi_minus1_coeffs, zi_coeffs, zi_minus1_coeffs, shaping_ratios, shaping_spreads):
     # Looking online it seems that Pandas index searching isn't particularly efficient, so do this manually
-    for i, (start, end, price) in enumerate(standardised_contracts):
+    contract_weight_sums = np.zeros(len(standardised_contracts.prices))
+    for i, (start, end, price) in enumerate(zip(*standardised_contracts)):
         contract_start_idx = int_index(start)
         contract_end_idx = int_index(end) + 1
         weights_times_discounts_slice = weights_times_discounts[contract_start_idx:contract_end_idx]
         add_season_adjusts_slice = add_season_adjusts[contract_start_idx:contract_end_idx]
         weights_x_discounts_x_mult_adjust_slice = weights_x_discounts_x_mult_adjust[contract_start_idx:contract_end_idx]
-        constraint_vector[i] = price * np.sum(weights_times_discounts_slice) - \
+        contract_weight_sums[i] = np.sum(weights_times_discounts_slice)
+        constraint_vector[i] = price * contract_weight_sums[i] - \
                                np.dot(add_season_adjusts_slice, weights_x_discounts_x_mult_adjust_slice)
     # Forward price constraints
     # This is made more complicated by flexibility of allowing contracts and spline sections to differ
     first_spline_section_idx = 0
     # TODO tidy this up
     spline_knots_updated = spline_knots + [last_period + freq_offset]
-    for contract_idx, (contract_start, contract_end, price) in enumerate(standardised_contracts):
+    for contract_idx, (contract_start, contract_end, price) in enumerate(zip(*standardised_contracts)):
         # Find first spline section
         # TODO use quicker search than this linear scan?
         while not (spline_knots_updated[first_spline_section_idx] <= contract_start < spline_knots_updated[first_spline_section_idx + 1]):
@@ -452,10 +764,10 @@ def _populate_constraint_vector_matrix(constraint_matrix, constraint_vector, add
                              last_period, num_sections, first_spline_section_idx, spline_knots, yi_coeffs, yi_minus1_coeffs,
                              zi_coeffs, zi_minus1_coeffs, 1.0)
     # Shaping constraints
-    num_shaping_ratios = len(shaping_ratios)
-    num_shaping_spreads = len(shaping_spreads)
+    num_shaping_ratios = len(shaping_ratios.values)
+    num_shaping_spreads = len(shaping_spreads.values)
     # Shaping spreads
-    for idx, (long_period_start, long_period_end, short_period_start, short_period_end, spread) in enumerate(shaping_spreads):
+    for idx, (long_period_start, long_period_end, short_period_start, short_period_end, spread) in enumerate(zip(*shaping_spreads)):
         row_idx = idx + num_contracts
         long_add_season_adjust_vector_term, long_start_idx, long_end_idx = _calc_add_season_adjust_vector_term(
                                                                             add_season_adjusts, int_index, long_period_start,
@@ -475,7 +787,7 @@ def _populate_constraint_vector_matrix(constraint_matrix, constraint_vector, add
                              last_period, num_sections, first_spline_section_idx, spline_knots, yi_coeffs, yi_minus1_coeffs,
                              zi_coeffs, zi_minus1_coeffs, -1.0/short_sum_weighting)
 
-    for idx, (num_period_start, num_period_end, denom_period_start, denom_period_end, ratio) in enumerate(shaping_ratios):
+    for idx, (num_period_start, num_period_end, denom_period_start, denom_period_end, ratio) in enumerate(zip(*shaping_ratios)):
         row_idx = idx + num_contracts + num_shaping_spreads
         num_add_season_adjust_vector_term, num_start_idx, num_end_idx = _calc_add_season_adjust_vector_term(
                                                                             add_season_adjusts, int_index, num_period_start,
@@ -527,6 +839,7 @@ def _populate_constraint_vector_matrix(constraint_matrix, constraint_vector, add
         constraint_matrix[-1, -2] = cosh_tau_hi[-1] / tau_sinh[-1] - one_over_h_tau_sqrd[-1]  # z_n
         constraint_matrix[-1, -1] = 1.0 / h_is[-1]  # y_n
         constraint_vector[-1] = back_1st_deriv
+    return contract_weight_sums
 
 
 def _calc_add_season_adjust_vector_term(add_season_adjusts, int_index, period_start, period_end,
@@ -616,19 +929,12 @@ def _create_expanded_np_array(array_from, size, copy_slice_indices):
     return array_to
 
 
-def _mid_period_or_timestamp(p1, p2, freq_offset):
-    diff = p2 - p1
-    num_periods = diff.n / freq_offset.n if isinstance(p1, pd.Period) else diff / freq_offset
-    time_to_mid = int(num_periods / 2) * freq_offset
-    return p1 + time_to_mid
-
-
-def _standardise_shaping(shaping_info, freq, tz):
-    shaping_info_list = []
-    if shaping_info is not None:
-        for (period1, period2, shaping_factor) in shaping_info:
-            period1_start_period, period1_end_period = contract_pandas_periods(period1, freq)
-            period2_start_period, period2_end_period = contract_pandas_periods(period2, freq)
-            shaping_info_list.append((_to_index_element(period1_start_period, freq, tz), _to_index_element(period1_end_period, freq, tz),
-                    _to_index_element(period2_start_period, freq, tz), _to_index_element(period2_end_period, freq, tz), shaping_factor))
-    return shaping_info_list
+def _mid_periods_or_timestamps(starts, ends, freq_offset) -> pd.Index:
+    """Returns the periods, or timestamps, a whole number of periods after each start which are closest to half way to
+    the respective end, rounding down."""
+    if isinstance(starts, pd.PeriodIndex):
+        # Ordinals of multiple frequencies, e.g. '30min', count the base unit, so aren't consecutive integers
+        num_periods = (ends.asi8 - starts.asi8) // freq_offset.n
+        return period_index_from_ordinals(starts.asi8 + num_periods // 2 * freq_offset.n, starts.freq)
+    num_periods = ((ends - starts) / freq_offset).to_numpy()
+    return starts + pd.to_timedelta((num_periods // 2).astype(np.int64) * freq_offset.nanos, unit='ns')
@@ -0,0 +1,365 @@
+# Copyright(c) 2026 Jake Fowler
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use, 
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, 
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, 
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+""" Opt-in instrumentation of the curve builders, recording where the time and memory of each build goes, and how often
+builds cross between Python and .NET."""
+
+import contextvars
+import functools
+import inspect
+import time
+import tracemalloc
+import typing as tp
+from contextlib import contextmanager
+
+_CALLABLE_ARGUMENTS = ('tension', 'discount_factor', 'average_weight', 'mult_season_adjust', 'add_season_adjust',
+                       'time_func')
+
+
+class StatsEvent(tp.NamedTuple):
+    """
+    A single measurement of a build, as passed to the hook of BuildStats.
+
+    Attributes:
+        engine (str): Name of the instrumented function, e.g. 'hyperbolic_tension_spline'.
+        metric (str): One of 'stage_seconds', 'stage_peak_memory_bytes', 'matrix_rows', 'matrix_columns',
+            'callable_calls' and 'total_seconds'.
+        name (str): The stage name for the stage metrics, the argument name for 'callable_calls', otherwise ''.
+        value (float): The measurement.
+    """
+    engine: str
+    metric: str
+    name: str
+    value: float
+
+
+class BuildStats:
+    """
+    Statistics of a curve build, populated when passed as the stats argument of bootstrap_contracts,
+    max_smooth_interp, hyperbolic_tension_spline or hyperbolic_tension_system.
+
+    A build is divided into the following stages, run in this order, with those not applicable to an engine omitted:
+        'standardise': Conversion of the contracts and shaping arguments, including adding them to the .NET builders.
+        'knots': Generation of the spline knots and output index.
+        'callables': Evaluation of the callable arguments over the output index.
+        'assembly': Calculation of the spline terms and population of the linear system.
+        'solve': Solution of the linear system. For the .NET engines this includes all calculations done in .NET,
+            including invocations of callable arguments unless precompute_callbacks is True.
+        'evaluate': Evaluation of the spline on the output index.
+        'marshal': Creation of the returned pandas or numpy objects.
+
+    Args:
+        track_memory (bool, optional): Whether to record the peak memory allocated during each stage, using the
+            tracemalloc module. This substantially slows down builds so defaults to False.
+        hook (callable, optional): Called with a StatsEvent for each measurement, as soon as it is available, e.g. to
+            forward the measurements to a metrics system.
+
+    Attributes:
+        engine (str): Name of the instrumented function.
+        stage_seconds (dict of str to float): Wall clock time of each stage, in the order run.
+        stage_peak_memory (dict of str to int): Peak memory in bytes allocated by each stage in excess of that allocated at
+            its start. Empty unless track_memory is True. On Python versions before 3.9 tracemalloc peaks can't be
+            reset, so each stage's figure is the peak since the start of the build.
+        matrix_shape (tuple of int): Shape of the linear system matrix, or None if not available, as for the .NET engines.
+        callable_calls (dict of str to int): Number of invocations of each callable argument, by argument name, with a
+            call of the vectorised evaluate method of the callables in curves.weighting and curves.adjustments counting
+            as a single invocation.
+        total_seconds (float): Wall clock time of the whole build.
+    """
+
+    def __init__(self, track_memory: tp.Optional[bool] = False,
+                 hook: tp.Optional[tp.Callable[[StatsEvent], None]] = None):
+        self.track_memory = track_memory
+        self.hook = hook
+        self.engine = None
+        self.stage_seconds = {}
+        self.stage_peak_memory = {}
+        self.matrix_shape = None
+        self.callable_calls = {}
+        self.total_seconds = None
+        self._build_start = None
+        self._stage = None
+        self._stage_start = None
+        self._stage_start_memory = 0
+        self._started_tracemalloc = False
+
+    @property
+    def peak_memory(self) -> tp.Optional[int]:
+        """int: The largest of the stage peak memory figures, or None if memory isn't tracked."""
+        return max(self.stage_peak_memory.values()) if self.stage_peak_memory else None
+
+    def to_dict(self) -> dict:
+        """Returns the statistics as a dict suitable for serialising to JSON."""
+        return {'engine': self.engine, 'stage_seconds': dict(self.stage_seconds),
+                'stage_peak_memory': dict(self.stage_peak_memory),
+                'matrix_shape': None if self.matrix_shape is None else list(self.matrix_shape),
+                'callable_calls': dict(self.callable_calls), 'total_seconds': self.total_seconds}
+
+    def mark(self, stage: str) -> None:
+        """Ends the current stage, if any, and starts stage."""
+        self._end_stage()
+        self._stage = stage
+        self._stage_start = time.perf_counter()
+        if self.track_memory:
+            if hasattr(tracemalloc, 'reset_peak'):
+                tracemalloc.reset_peak()
+            self._stage_start_memory = tracemalloc.get_traced_memory()[0]
+
+    def record_matrix(self, matrix) -> None:
+        self.matrix_shape = tuple(matrix.shape)
+
+    def _start(self, engine):
+        self.engine = engine
+        self.stage_seconds = {}
+        self.stage_peak_memory = {}
+        self.matrix_shape = None
+        self.callable_calls = {}
+        self.total_seconds = None
+        if self.track_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        self._build_start = time.perf_counter()
+
+    def _finish(self):
+        self._end_stage()
+        self.total_seconds = time.perf_counter() - self._build_start
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+        if self.matrix_shape is not None:
+            self._emit('matrix_rows', '', self.matrix_shape[0])
+            self._emit('matrix_columns', '', self.matrix_shape[1])
+        for name, calls in self.callable_calls.items():
+            self._emit('callable_calls', name, calls)
+        self._emit('total_seconds', '', self.total_seconds)
+
+    def _end_stage(self):
+        if self._stage is None:
+            return
+        stage, self._stage = self._stage, None
+        seconds = time.perf_counter() - self._stage_start
+        # Stages can be revisited, e.g. by HyperbolicTensionSystem.solve, so accumulate
+        self.stage_seconds[stage] = self.stage_seconds.get(stage, 0.0) + seconds
+        self._emit('stage_seconds', stage, seconds)
+        if self.track_memory:
+            peak_memory = max(tracemalloc.get_traced_memory()[1] - self._stage_start_memory, 0)
+            self.stage_peak_memory[stage] = max(self.stage_peak_memory.get(stage, 0), peak_memory)
+            self._emit('stage_peak_memory_bytes', stage, peak_memory)
+
+    def _emit(self, metric, name, value):
+        if self.hook is not None:
+            self.hook(StatsEvent(self.engine, metric, name, value))
+
+    def _counting_callable(self, name, func):
+        self.callable_calls.setdefault(name, 0)
+        return _CountingCallable(func, self.callable_calls, name)
+
+
+class _NullStats:
+    """Used by the builders when instrumentation is off, so that recording is a no-op."""
+
+    def mark(self, stage):
+        pass
+
+    def record_matrix(self, matrix):
+        pass
+
+
+_NULL_STATS = _NullStats()
+_current_build = contextvars.ContextVar('curves_current_build', default=None)
+_collector = contextvars.ContextVar('curves_stats_collector', default=None)
+
+
+@contextmanager
+def collect_stats(track_memory: tp.Optional[bool] = False,
+                  hook: tp.Optional[tp.Callable[[StatsEvent], None]] = None) -> tp.Iterator[tp.List[BuildStats]]:
+    """
+    Context manager which instruments all builds on the current thread or asyncio task within its scope, without
+    having to pass the stats argument to each.
+
+    Args:
+        track_memory (bool, optional): As for BuildStats.
+        hook (callable, optional): As for BuildStats.
+
+    Returns:
+        list of BuildStats: Populated with a BuildStats for each build as it completes. Builds which are passed the
+        stats argument are also appended.
+
+    Example:
+        >>> with collect_stats(hook=metrics_client.record) as builds:
+        ...     hyperbolic_tension_spline(contracts, 'D', tension=0.5)
+        >>> builds[0].stage_seconds
+    """
+    builds = []
+    token = _collector.set((builds, track_memory, hook))
+    try:
+        yield builds
+    finally:
+        _collector.reset(token)
+
+
+def instrumented(engine: str) -> tp.Callable:
+    """Decorator which passes a BuildStats, or a no-op stand-in, as the stats argument of the decorated builder, and
+    wraps its callable arguments to count invocations. Nested instrumented calls record into the outer build."""
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, stats=None, **kwargs):
+            current = _current_build.get()
+            if current is not None:
+                return func(*args, stats=current, **kwargs)
+            collector = _collector.get()
+            if stats is None and collector is None:
+                return func(*args, stats=_NULL_STATS, **kwargs)
+            if stats is None:
+                stats = BuildStats(collector[1], collector[2])
+            bound = signature.bind(*args, **kwargs)
+            stats._start(engine)
+            for name in _CALLABLE_ARGUMENTS:
+                value = bound.arguments.get(name)
+                if callable(value):
+                    bound.arguments[name] = stats._counting_callable(name, value)
+            token = _current_build.set(stats)
+            try:
+                return func(*bound.args, stats=stats, **bound.kwargs)
+            finally:
+                _current_build.reset(token)
+                stats._finish()
+                if collector is not None:
+                    collector[0].append(stats)
+        return wrapper
+    return decorator
+
+
+class InteropSite(tp.NamedTuple):
+    """
+    Profile of the crossings between Python and .NET at a single call site.
+
+    Attributes:
+        name (str): The call site, being one of 'AddContract', 'AddShaping', 'callback' (.NET calling a Python
+            callable argument), 'Data[idx]' (reading an element of a .NET time series) and 'FromDateTime' (creating a
+            .NET time period).
+        calls (int): Number of crossings.
+        seconds (float): Cumulative wall clock time of the crossings, including time spent in Python callable arguments
+            for the 'callback' site.
+    """
+    name: str
+    calls: int
+    seconds: float
+
+
+class InteropProfile:
+    """
+    Counts and times crossings between Python and .NET made by bootstrap_contracts and max_smooth_interp, as returned
+    by profile_interop.
+
+    Attributes:
+        calls (dict of str to int): Number of crossings by call site name.
+        seconds (dict of str to float): Cumulative wall clock time of the crossings by call site name.
+    """
+
+    def __init__(self):
+        self.calls = {}
+        self.seconds = {}
+
+    def sites(self) -> tp.List[InteropSite]:
+        """Returns the profile of each call site, ordered by descending cumulative time."""
+        return sorted((InteropSite(name, calls, self.seconds[name]) for name, calls in self.calls.items()),
+                      key=lambda site: site.seconds, reverse=True)
+
+    @property
+    def total_calls(self) -> int:
+        return sum(self.calls.values())
+
+    def wrap(self, site: str, func: tp.Callable) -> tp.Callable:
+        """Returns a function which calls func, recording the call against site."""
+        self.calls.setdefault(site, 0)
+        self.seconds.setdefault(site, 0.0)
+        calls = self.calls
+        seconds = self.seconds
+
+        def profiled(*args):
+            start = time.perf_counter()
+            try:
+                return func(*args)
+            finally:
+                seconds[site] += time.perf_counter() - start
+                calls[site] += 1
+        return profiled
+
+
+class _NullInteropProfile:
+
+    def wrap(self, site, func):
+        return func
+
+
+_NULL_INTEROP_PROFILE = _NullInteropProfile()
+_interop_profile = contextvars.ContextVar('curves_interop_profile', default=_NULL_INTEROP_PROFILE)
+
+
+@contextmanager
+def profile_interop() -> tp.Iterator[InteropProfile]:
+    """
+    Context manager which profiles the crossings between Python and .NET made by builds on the current thread or
+    asyncio task within its scope. Intended for diagnosing slow builds of the .NET engines, and for tests asserting
+    upper bounds on the number of crossings, as profiling adds substantial overhead to each crossing.
+
+    Returns:
+        InteropProfile: Accumulates the crossings of all builds within the scope.
+
+    Example:
+        >>> with profile_interop() as profile:
+        ...     bootstrap_contracts(contracts, 'D')
+        >>> profile.calls['AddContract']
+    """
+    profile = InteropProfile()
+    token = _interop_profile.set(profile)
+    try:
+        yield profile
+    finally:
+        _interop_profile.reset(token)
+
+
+def interop_profile() -> tp.Union[InteropProfile, _NullInteropProfile]:
+    """Returns the active InteropProfile, or a stand-in for which wrap returns the function unchanged."""
+    return _interop_profile.get()
+
+
+class _CountingCallable:
+
+    def __init__(self, func, counts, name):
+        self._func = func
+        self._counts = counts
+        self._name = name
+        if hasattr(func, 'evaluate'):
+            self.evaluate = self._evaluate
+
+    def __call__(self, *args):
+        self._counts[self._name] += 1
+        return self._func(*args)
+
+    def _evaluate(self, index):
+        self._counts[self._name] += 1
+        return self._func.evaluate(index)
@@ -21,19 +21,25 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
 # OTHER DEALINGS IN THE SOFTWARE.
 
+from curves import _runtime  # noqa: F401
 import clr
 import pandas as pd
 import numpy as np
 from typing import Optional, Callable, Union, NamedTuple, Tuple
 from System import Func, Double
 from curves._common import FREQ_TO_PERIOD_TYPE, transform_time_func, transform_two_period_func, \
-    net_time_series_to_pandas_series, contract_period, deconstruct_contract, ContractsType, net_time_period_to_pandas_period
+    net_time_series_to_pandas_series, contract_period, deconstruct_contract, ContractsType, net_time_period_to_pandas_period, \
+    ColumnarContractsType, is_columnar_contracts, columnar_contract_periods, net_time_periods, net_time_series_values, \
+    net_time_series_start_ordinal, precomputed_time_func
+from curves.arrays import CurveArray, _validate_output
+from curves.instrumentation import BuildStats, instrumented, interop_profile
 from pathlib import Path
 clr.AddReference(str(Path("curves/lib/Cmdty.Curves")))
 from Cmdty.Curves import MaxSmoothnessSplineCurveBuilder, MaxSmoothnessSplineCurveBuilderExtensions, ISplineAddOptionalParameters
 
 
-def max_smooth_interp(contracts: Union[ContractsType, pd.Series],
+@instrumented('max_smooth_interp')
+def max_smooth_interp(contracts: Union[ContractsType, pd.Series, ColumnarContractsType],
                       freq: str,
                       mult_season_adjust: Optional[Callable[[pd.Period], float]] = None,
                       add_season_adjust: Optional[Callable[[pd.Period], float]] = None,
@@ -42,7 +48,12 @@ def max_smooth_interp(contracts: Union[ContractsType, pd.Series],
                       front_1st_deriv: Optional[float] = None,
                       back_1st_deriv: Optional[float] = None,
                       tension: Optional[float] = None,
-                      return_spline_coeff: Optional[bool] = False) -> Union[pd.Series, Tuple[pd.Series, pd.DataFrame]]:
+                      return_spline_coeff: Optional[bool] = False,
+                      output: Optional[str] = 'series',
+                      precompute_callbacks: Optional[bool] = False,
+                      *,
+                      stats: Optional[BuildStats] = None) \
+        -> Union[pd.Series, CurveArray, Tuple[pd.Series, pd.DataFrame], Tuple[CurveArray, dict]]:
     """
     Creates a smooth interpolated curve from a collection of commodity forward/swap/futures prices using maximum smoothness algorithm.
 
@@ -53,7 +64,7 @@ def max_smooth_interp(contracts: Union[ContractsType, pd.Series],
     this function.
 
     Args:
-        contracts (pd.Series or iterable): The input contracts to be interpolated.
+        contracts (pd.Series, iterable, pd.DataFrame or mapping): The input contracts to be interpolated.
             If iterable of tuples, with each tuple describing a forward delivery period and price in one
             of the following forms:
                 ([period], [price]) 
@@ -68,6 +79,10 @@ def max_smooth_interp(contracts: Union[ContractsType, pd.Series],
                 pandas.Period
                 date
                 datetime
+            If pd.DataFrame, or mapping of str to array-like, contracts are in columnar form with 'start', 'end' and 'price'
+            columns. The start and end columns can contain pandas.Period, date-like or str values, or integer ordinals of
+            pandas.Period with freq equal to the freq parameter, as returned by curves.contract_period.parse_codes.
+            Period values in the end column are converted to their last period at freq granularity.
         freq (str): Describes the granularity of curve being constructed using pandas Offset Alias notation. 
             Must be a key to the dict variable curves.FREQ_TO_PERIOD_TYPE.
         mult_season_adjust (callable, optional): Callable with single parameter of type pandas.Period and return type float.
@@ -97,6 +112,15 @@ def max_smooth_interp(contracts: Union[ContractsType, pd.Series],
             fitted spline. Defaults to 0 if omitted.
         return_spline_coeff (bool, optional): Flag to determine whether the solved spline coefficients should be returned as the second
             element in a 2-tuple. Defaults to False if omitted.
+        output (str, optional): Either 'series' or 'numpy', determining the types of the returned results. Defaults to 'series'
+            if omitted.
+        precompute_callbacks (bool, optional): If True, mult_season_adjust, add_season_adjust and average_weight are
+            evaluated for every period between the earliest contract start and latest contract end before the spline is
+            solved, and the results passed into the .NET spline solver as lookup tables. The solver then makes no calls
+            back into Python for these arguments, so runs without holding the GIL, allowing concurrent builds on multiple
+            threads to execute in parallel. time_func is always called back into. Defaults to False if omitted.
+        stats (BuildStats, optional): If provided, populated with the time spent on each stage of the build and the number
+            of invocations of callable arguments. See also curves.collect_stats.
 
     Returns:
         Either pandas.Series, or 2-tuple of (pandas.Series, pandas.DataFrame) if return_spline_coeff argument is True.
@@ -104,8 +128,16 @@ def max_smooth_interp(contracts: Union[ContractsType, pd.Series],
         This pandas series will have index of type PeriodIndex and freqstr equal to the freq parameter.
         If return_spline_coeff is True a 2-tuple will be returned with the 2nd element being a pandas.DataFrame containing
         the solved spline coefficients.
+        If the output parameter is 'numpy', the curve is instead returned as a curves.arrays.CurveArray, and the spline coefficients
+        as a dict of numpy.ndarray, with the Period ordinals of the polynomial start periods under key 'start', and the other
+        keys the same as the pandas.DataFrame column names.
 
     Note:
+        This function is thread-safe, with each call using its own instance of the .NET spline builder. The GIL is
+        released while the .NET spline solver runs, only being re-acquired to call the Python callable arguments. Hence
+        builds on multiple threads only run in parallel if no callable arguments are provided, or if precompute_callbacks
+        is True and time_func is omitted.
+
         The underlying algorithm uses a fourth-order spline, solved with the constraint of averaging back to the input contract
         prices, under the criteria of maximising the smoothness. In this implementation maximising the smoothness is defined as
         minimising the integral of the second derivative squared.
@@ -114,26 +146,43 @@ def max_smooth_interp(contracts: Union[ContractsType, pd.Series],
     if freq not in FREQ_TO_PERIOD_TYPE:
         raise ValueError("freq parameter value of '{}' not supported. The allowable values can be found in the keys "
                          "of the dict curves.FREQ_TO_PERIOD_TYPE.".format(freq))
+    _validate_output(output)
+    stats.mark('standardise')
     time_period_type = FREQ_TO_PERIOD_TYPE[freq]
     spline_builder = ISplineAddOptionalParameters[time_period_type](MaxSmoothnessSplineCurveBuilder[time_period_type]())
-    if isinstance(contracts, pd.Series):
+    add_contract = interop_profile().wrap('AddContract',
+                                          MaxSmoothnessSplineCurveBuilderExtensions.AddContract[time_period_type])
+    contract_bounds = []
+    if is_columnar_contracts(contracts):
+        starts, ends, prices = columnar_contract_periods(contracts, freq)
+        for start, end, price in zip(net_time_periods(starts, time_period_type),
+                                     net_time_periods(ends, time_period_type), prices):
+            add_contract(spline_builder, start, end, float(price))
+            contract_bounds += (start, end)
+    elif isinstance(contracts, pd.Series):
         for period, price in contracts.items():
             (start, end) = contract_period(period, freq, time_period_type)
-            MaxSmoothnessSplineCurveBuilderExtensions.AddContract[time_period_type](spline_builder, start, end, price)
+            add_contract(spline_builder, start, end, price)
+            contract_bounds += (start, end)
     else:
         for contract in contracts:
             (period, price) = deconstruct_contract(contract)
             (start, end) = contract_period(period, freq, time_period_type)
-            MaxSmoothnessSplineCurveBuilderExtensions.AddContract[time_period_type](spline_builder, start, end, price)
+            add_contract(spline_builder, start, end, price)
+            contract_bounds += (start, end)
+
+    def net_time_func(py_time_func):
+        if precompute_callbacks:
+            return precomputed_time_func(freq, time_period_type, py_time_func, contract_bounds)
+        return Func[time_period_type, Double](transform_time_func(freq, py_time_func))
+
+    stats.mark('callables')
     if mult_season_adjust is not None:
-        transformed_mult_season_adjust = transform_time_func(freq, mult_season_adjust)
-        spline_builder.WithMultiplySeasonalAdjustment(Func[time_period_type, Double](transformed_mult_season_adjust))
+        spline_builder.WithMultiplySeasonalAdjustment(net_time_func(mult_season_adjust))
     if add_season_adjust is not None:
-        transformed_add_season_adjust = transform_time_func(freq, add_season_adjust)
-        spline_builder.WithAdditiveSeasonalAdjustment(Func[time_period_type, Double](transformed_add_season_adjust))
+        spline_builder.WithAdditiveSeasonalAdjustment(net_time_func(add_season_adjust))
     if average_weight is not None:
-        transformed_average_weight = transform_time_func(freq, average_weight)
-        spline_builder.WithWeighting(Func[time_period_type, Double](transformed_average_weight))
+        spline_builder.WithWeighting(net_time_func(average_weight))
     if time_func is not None:
         transformed_time_func = transform_two_period_func(freq, time_func)
         spline_builder.WithTimeFunc(Func[time_period_type, time_period_type, Double](transformed_time_func))
@@ -143,17 +192,32 @@ def max_smooth_interp(contracts: Union[ContractsType, pd.Series],
         spline_builder.WithBackFirstDerivative(back_1st_deriv)
     if tension is not None:
         spline_builder.WithTensionParameter(tension)
+    stats.mark('solve')
     spline_results = spline_builder.BuildCurve()
-    curve = net_time_series_to_pandas_series(spline_results.Curve, freq)
+    stats.mark('marshal')
+    if output == 'numpy':
+        curve = CurveArray(net_time_series_values(spline_results.Curve),
+                           net_time_series_start_ordinal(spline_results.Curve, freq), freq)
+    else:
+        curve = net_time_series_to_pandas_series(spline_results.Curve, freq)
     if return_spline_coeff:
-        spline_parameters = _net_solved_spline_parameters_to_data_frame(spline_results.SolvedSplineParameters, freq)
+        indices, data = _net_solved_spline_parameters_to_arrays(spline_results.SolvedSplineParameters, freq)
+        if output == 'numpy':
+            spline_parameters = {'start': indices.asi8}
+            spline_parameters.update((column, data[:, i]) for i, column in enumerate(_SPLINE_COEFF_COLUMNS))
+        else:
+            spline_parameters = pd.DataFrame(data=data, index=indices, columns=_SPLINE_COEFF_COLUMNS)
         return curve, spline_parameters
     else:
         return curve
 
 
-def _net_solved_spline_parameters_to_data_frame(net_solved_spline_parameters, freq):
-    indices = [net_time_period_to_pandas_period(p.StartPeriod, freq) for p in net_solved_spline_parameters]
+_SPLINE_COEFF_COLUMNS = ['t', 'a', 'b', 'c', 'd', 'e']
+
+
+def _net_solved_spline_parameters_to_arrays(net_solved_spline_parameters, freq):
+    indices = pd.PeriodIndex([net_time_period_to_pandas_period(p.StartPeriod, freq) for p in net_solved_spline_parameters],
+                             freq=freq)
     data = np.zeros(shape=(net_solved_spline_parameters.Count, 6))
     for (i, p) in enumerate(net_solved_spline_parameters):
         data[i, 0] = p.StartTime
@@ -162,4 +226,4 @@ def _net_solved_spline_parameters_to_data_frame(net_solved_spline_parameters, fr
         data[i, 3] = p.C
         data[i, 4] = p.D
         data[i, 5] = p.E
-    return pd.DataFrame(data=data, index=indices, columns=['t', 'a', 'b', 'c', 'd', 'e'])
+    return indices, data
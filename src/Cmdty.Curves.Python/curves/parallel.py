@@ -0,0 +1,167 @@
+# Copyright(c) 2026 Jake Fowler
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use, 
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, 
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, 
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+""" Provides parallel construction of many curves across a pool of worker processes."""
+
+import math
+import multiprocessing
+import os
+import pickle
+import time
+import traceback
+import typing as tp
+from concurrent.futures import ProcessPoolExecutor
+from curves.shm import share_result
+
+ENGINES = ('bootstrap_contracts', 'max_smooth_interp', 'hyperbolic_tension_spline')
+""" Names of the curve building functions which can be used as the engine argument of build_many."""
+
+TRANSPORTS = ('pickle', 'shm')
+""" Methods of returning results from worker processes which can be used as the transport argument of build_many."""
+
+EngineType = tp.Union[str, tp.Callable[..., tp.Any]]
+
+
+class BuildError(Exception):
+    """Raised in place of an exception from a build which could not be transferred back from a worker process."""
+
+
+class BuildResult(tp.NamedTuple):
+    """
+    Result of a single curve build job run by build_many.
+
+    Attributes:
+        result: The value returned by the engine, or None if the build failed.
+        error (Exception, optional): The exception raised by the build, or None if the build succeeded.
+        traceback (str, optional): Formatted traceback of the exception raised by the build, or None if the build succeeded.
+        elapsed (float): Wall time of the build in seconds.
+    """
+    result: tp.Any
+    error: tp.Optional[BaseException]
+    traceback: tp.Optional[str]
+    elapsed: float
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def build_many(jobs: tp.Iterable[tp.Mapping[str, tp.Any]],
+               engine: EngineType = 'hyperbolic_tension_spline',
+               workers: tp.Optional[int] = None,
+               chunksize: tp.Optional[int] = None,
+               transport: str = 'pickle') -> tp.List[BuildResult]:
+    """
+    Builds many curves in parallel, using a pool of worker processes.
+
+    Each worker process loads the .NET runtime and curves assemblies once, when it starts, and jobs are sent to the
+    workers in chunks, to amortise the inter-process communication overhead.
+
+    Args:
+        jobs (iterable of mapping): The curve build jobs, each being a mapping of keyword argument names to values which
+            the engine will be called with, e.g. {'contracts': contracts, 'freq': 'D', 'tension': 0.5}. All arguments
+            must be picklable, so callable arguments must be module-level functions, or instances of the classes in the
+            curves.weighting and curves.adjustments modules, rather than lambdas or closures.
+        engine (str or callable, optional): The function used to build each curve. Either one of the names in
+            curves.parallel.ENGINES, or a picklable callable. Defaults to 'hyperbolic_tension_spline'.
+        workers (int, optional): Number of worker processes. Defaults to the number of CPUs if omitted. If 1 the jobs are
+            run serially in the current process.
+        chunksize (int, optional): Number of jobs sent to a worker process at a time. If omitted, defaults to a value
+            giving approximately four chunks per worker.
+        transport (str, optional): How curves are returned from the worker processes. If 'pickle', the default, results
+            are pickled back to the calling process. If 'shm', workers copy curves into shared memory blocks, and the
+            results contain instances of curves.shm.SharedCurveHandle in place of curves, which can be attached to as
+            zero-copy arrays or pandas.Series using curves.shm.SharedCurve. For large curves this avoids the cost of
+            pickling. The caller owns the shared memory blocks, so must free them, using curves.shm.release or
+            SharedCurve.unlink. Only supported on POSIX platforms.
+
+    Returns:
+        list of BuildResult: One BuildResult for each job, in the same order as jobs. Exceptions raised by individual
+            builds are captured in the BuildResult, rather than aborting the other builds.
+    """
+    jobs = list(jobs)
+    _validate_engine(engine)
+    if transport not in TRANSPORTS:
+        raise ValueError("transport parameter value of '{}' not supported. Must be one of {}."
+                         .format(transport, ', '.join(TRANSPORTS)))
+    workers = os.cpu_count() if workers is None else workers
+    if workers < 1:
+        raise ValueError('workers argument must be a positive integer, but value of {} has been provided.'
+                         .format(workers))
+    if workers == 1 or len(jobs) <= 1:
+        return _build_chunk(engine, jobs, transport)
+    if chunksize is None:
+        chunksize = max(1, math.ceil(len(jobs) / (workers * 4)))
+    chunks = [jobs[i:i + chunksize] for i in range(0, len(jobs), chunksize)]
+    results = []
+    # Workers are spawned rather than forked, as forking a process with a running CoreCLR is unsupported
+    with ProcessPoolExecutor(max_workers=min(workers, len(chunks)), initializer=_init_worker,
+                             mp_context=multiprocessing.get_context('spawn')) as executor:
+        for chunk_results in executor.map(_build_chunk, [engine] * len(chunks), chunks, [transport] * len(chunks)):
+            results.extend(chunk_results)
+    return results
+
+
+def _validate_engine(engine) -> None:
+    if isinstance(engine, str) and engine not in ENGINES:
+        raise ValueError("engine parameter value of '{}' not supported. Must be a callable or one of {}."
+                         .format(engine, ', '.join(ENGINES)))
+
+
+def _init_worker() -> None:
+    # Importing the curve builders loads the .NET runtime and assemblies, so this is only done once per worker process
+    import curves.bootstrap  # noqa: F401
+    import curves.max_smoothness_spline  # noqa: F401
+    import curves.hyperbolic_tension_spline  # noqa: F401
+
+
+def _resolve_engine(engine) -> tp.Callable[..., tp.Any]:
+    if isinstance(engine, str):
+        import curves
+        return getattr(curves, engine)
+    return engine
+
+
+def _build_chunk(engine, jobs, transport='pickle') -> tp.List[BuildResult]:
+    engine_func = _resolve_engine(engine)
+    return [_build_one(engine_func, job, transport) for job in jobs]
+
+
+def _build_one(engine_func, job, transport) -> BuildResult:
+    start_time = time.perf_counter()
+    try:
+        result = engine_func(**job)
+        if transport == 'shm':
+            result = share_result(result)
+    except Exception as e:
+        return BuildResult(None, _transferable_exception(e), traceback.format_exc(), time.perf_counter() - start_time)
+    return BuildResult(result, None, None, time.perf_counter() - start_time)
+
+
+def _transferable_exception(exception) -> BaseException:
+    """Exceptions from .NET, or with unpicklable state, are replaced so they can be returned from a worker process."""
+    try:
+        pickle.loads(pickle.dumps(exception))
+        return exception
+    except Exception:
+        return BuildError('{}: {}'.format(type(exception).__name__, exception))
@@ -0,0 +1,202 @@
+# Copyright(c) 2026 Jake Fowler
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use, 
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, 
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, 
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+""" Provides fast revaluation of many trades, each a weighted average of a curve over a delivery window."""
+
+import typing as tp
+import numpy as np
+import pandas as pd
+from curves._contracts import curve_positions
+from curves.arrays import CurveArray, curve_array_from_series, evaluate_on_index
+from curves.hyperbolic_tension_spline import HyperbolicTensionSystem
+from curves.solved_spline import SolvedSpline
+
+CurveTypes = tp.Union[pd.Series, CurveArray, SolvedSpline, HyperbolicTensionSystem]
+VolumeProfileTypes = tp.Union[np.ndarray, tp.Iterable[tp.Union[tp.Callable[[tp.Union[pd.Period, pd.Timestamp]], float],
+                                                               np.ndarray]]]
+
+FLAT_PROFILE = -1
+""" Volume profile ID of trades with a flat volume shape, i.e. no volume profile."""
+
+
+class Revaluer:
+    """
+    Prefix tables of a curve, from which the weighted average of the curve over any number of delivery windows is
+    calculated with a single vectorised lookup, rather than slicing the curve for each window.
+
+    The average of a window is the sum over its curve points of price x weight, divided by the sum of weights, where the
+    weight of each point is the product of average_weight, discount_factor and the trade volume profile. This is the
+    same as the average used by hyperbolic_tension_spline to constrain the curve to the contract prices, so revaluing
+    the input contracts with the same average_weight and discount_factor returns their prices.
+    """
+
+    def __init__(self, curve: CurveTypes,
+                 discount_factor: tp.Optional[tp.Callable[[tp.Union[pd.Period, pd.Timestamp]], float]] = None,
+                 average_weight: tp.Optional[tp.Callable[[tp.Union[pd.Period, pd.Timestamp]], float]] = None,
+                 volume_profiles: tp.Optional[VolumeProfileTypes] = None):
+        """
+        Creates the prefix tables for a curve. If neither discount_factor nor average_weight is provided, the weights
+        stored in curve are used if it is a SolvedSpline or HyperbolicTensionSystem, otherwise all curve points are
+        equally weighted.
+
+        Args:
+            curve (pandas.Series, CurveArray, SolvedSpline or HyperbolicTensionSystem): The curve, as returned by one of
+                the curve builders, or a solved spline, or tension spline system, in which case the curve is evaluated
+                with the contract prices used to create the system.
+            discount_factor (callable, optional): Mapping from curve period to discount factor, as for the
+                discount_factor argument of hyperbolic_tension_spline.
+            average_weight (callable, optional): Mapping from curve period to weighting, as for the average_weight
+                argument of hyperbolic_tension_spline.
+            volume_profiles (numpy.ndarray or iterable, optional): Volume shapes which trades can reference by profile
+                ID, being the position in volume_profiles. Either a two-dimensional array of shape (number of profiles,
+                number of curve points), or an iterable each element of which is either a callable mapping from curve
+                period to volume, or an array of volumes with one element per curve point.
+        """
+        weights = None
+        if isinstance(curve, SolvedSpline):
+            weights = curve.weights
+            curve = curve.evaluate(output='numpy')
+        elif isinstance(curve, HyperbolicTensionSystem):
+            weights = curve.weights_times_discounts
+            curve = curve.solve(output='numpy')
+        elif isinstance(curve, pd.Series):
+            curve = curve_array_from_series(curve)
+        self.curve = curve
+        num_points = len(curve)
+        if discount_factor is not None or average_weight is not None:
+            index = curve.index()
+            weights = np.ones(num_points)
+            if discount_factor is not None:
+                weights *= evaluate_on_index(discount_factor, index)
+            if average_weight is not None:
+                weights *= evaluate_on_index(average_weight, index)
+        elif weights is None:
+            weights = np.ones(num_points)
+        profiles = self._profiles_matrix(volume_profiles)
+        # Row 0 of the tables is the flat profile, and row i + 1 profile i. Values are offset by their mean before
+        # accumulating, to reduce rounding error in the differences of the cumulative sums
+        self._offset = float(np.mean(curve.values)) if num_points > 0 else 0.0
+        point_weights = np.vstack([weights, weights * profiles])
+        self._weight_sums = self._prefix_table(point_weights)
+        self._value_sums = self._prefix_table(point_weights * (curve.values - self._offset))
+
+    @property
+    def num_profiles(self) -> int:
+        return len(self._weight_sums) - 1
+
+    def revalue(self, starts, ends, profile_ids: tp.Optional[tp.Iterable[int]] = None) -> np.ndarray:
+        """
+        Calculates the weighted average of the curve over many delivery windows.
+
+        Args:
+            starts (array-like): Inclusive starts of the delivery windows, each being a pandas.Period, date-like or str.
+                Periods of lower granularity than the curve start at their first curve period. Integers are
+                interpreted as pandas.Period ordinals at the curve granularity.
+            ends (array-like): Inclusive ends of the delivery windows, in the same forms as starts, with periods of lower
+                granularity than the curve ending at their last curve period.
+            profile_ids (array-like of int, optional): Volume profile ID of each trade, being the position of the
+                profile in the volume_profiles argument used to create this instance, or FLAT_PROFILE for no volume
+                shape. If omitted all trades have a flat volume shape.
+
+        Returns:
+            numpy.ndarray: The weighted average of each window, with NaN for windows over which the sum of weights is
+            zero.
+        """
+        first = curve_positions(self.curve, starts, 's')
+        last = curve_positions(self.curve, ends, 'e')
+        if len(first) != len(last):
+            raise ValueError('starts and ends must have the same length. However the lengths are {} and {} respectively.'
+                             .format(len(first), len(last)))
+        if profile_ids is None:
+            rows = np.zeros(len(first), dtype=np.int64)
+        else:
+            rows = np.asarray(profile_ids, dtype=np.int64) + 1
+            if len(rows) != len(first):
+                raise ValueError('profile_ids must have the same length as starts. However the lengths are {} and {} '
+                                 'respectively.'.format(len(rows), len(first)))
+            invalid_profile = (rows < 0) | (rows > self.num_profiles)
+            if invalid_profile.any():
+                idx = np.argmax(invalid_profile)
+                raise ValueError('Profile ID of trade at position {} is {}, but must be FLAT_PROFILE or between 0 and {}.'
+                                 .format(idx, rows[idx] - 1, self.num_profiles - 1))
+        start_after_end = first > last
+        if start_after_end.any():
+            idx = np.argmax(start_after_end)
+            raise ValueError('Trade start must be earlier than or equal to trade end. However for the trade at position '
+                             '{} start is {} and end is {}.'.format(idx, _item(starts, idx), _item(ends, idx)))
+        outside_curve = (first < 0) | (last >= len(self.curve))
+        if outside_curve.any():
+            idx = np.argmax(outside_curve)
+            raise ValueError('Delivery window of trade at position {}, from {} to {}, is not fully covered by the curve.'
+                             .format(idx, _item(starts, idx), _item(ends, idx)))
+        weight_sums = self._weight_sums[rows, last + 1] - self._weight_sums[rows, first]
+        value_sums = self._value_sums[rows, last + 1] - self._value_sums[rows, first]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            averages = value_sums / weight_sums + self._offset
+        averages[weight_sums == 0.0] = np.nan
+        return averages
+
+    def _profiles_matrix(self, volume_profiles) -> np.ndarray:
+        num_points = len(self.curve)
+        if volume_profiles is None:
+            return np.empty((0, num_points))
+        if isinstance(volume_profiles, np.ndarray):
+            profiles = np.asarray(volume_profiles, dtype=np.float64)
+        else:
+            index = None
+            rows = []
+            for profile in volume_profiles:
+                if callable(profile):
+                    index = self.curve.index() if index is None else index
+                    rows.append(evaluate_on_index(profile, index))
+                else:
+                    rows.append(np.asarray(profile, dtype=np.float64))
+            profiles = np.vstack(rows) if rows else np.empty((0, num_points))
+        if profiles.ndim != 2 or profiles.shape[1] != num_points:
+            raise ValueError('Each volume profile must have one element per curve point, i.e. {}.'.format(num_points))
+        return profiles
+
+    @staticmethod
+    def _prefix_table(point_values) -> np.ndarray:
+        table = np.zeros((point_values.shape[0], point_values.shape[1] + 1))
+        np.cumsum(point_values, axis=1, out=table[:, 1:])
+        return table
+
+
+def _item(values, position):
+    return np.asarray(values, dtype=object)[position]
+
+
+def revalue(curve: CurveTypes,
+            starts,
+            ends,
+            profile_ids: tp.Optional[tp.Iterable[int]] = None,
+            volume_profiles: tp.Optional[VolumeProfileTypes] = None,
+            discount_factor: tp.Optional[tp.Callable[[tp.Union[pd.Period, pd.Timestamp]], float]] = None,
+            average_weight: tp.Optional[tp.Callable[[tp.Union[pd.Period, pd.Timestamp]], float]] = None) -> np.ndarray:
+    """
+    Calculates the weighted average of a curve over many delivery windows in one vectorised call. Equivalent to
+    Revaluer(curve, discount_factor, average_weight, volume_profiles).revalue(starts, ends, profile_ids), so create a
+    Revaluer instead to revalue several batches of trades against the same curve.
+    """
+    return Revaluer(curve, discount_factor, average_weight, volume_profiles).revalue(starts, ends, profile_ids)
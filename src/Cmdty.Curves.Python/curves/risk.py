@@ -0,0 +1,244 @@
+# Copyright(c) 2026 Jake Fowler
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use, 
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, 
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, 
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+""" Provides sensitivities of curves to the input contract prices, calculated by bumping each contract price."""
+
+import os
+import threading
+import typing as tp
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import pandas as pd
+from curves._contracts import deconstruct_contract, is_columnar_contracts, curve_positions
+from curves.arrays import CurveArray, evaluate_on_index, curve_array_from_series, _validate_output
+from curves.parallel import EngineType, _validate_engine, _resolve_engine
+
+_PRECOMPUTABLE_ARGUMENTS = ('average_weight', 'mult_season_adjust', 'add_season_adjust')
+
+_PRECOMPUTING_ENGINES = ('bootstrap_contracts', 'max_smooth_interp')
+
+BucketType = tp.Union[pd.Period, tp.Tuple[tp.Union[pd.Period, str], tp.Union[pd.Period, str]]]
+
+
+def bucket_deltas(builder: EngineType,
+                  contracts,
+                  bump: float = 0.01,
+                  buckets: tp.Optional[tp.Iterable[BucketType]] = None,
+                  bucket_weight: tp.Optional[tp.Callable[[tp.Union[pd.Period, pd.Timestamp]], float]] = None,
+                  workers: tp.Optional[int] = None,
+                  output: str = 'series',
+                  **builder_kwargs) -> tp.Union[pd.DataFrame, np.ndarray]:
+    """
+    Calculates the sensitivities of a curve to the price of each input contract, by bumping the contract prices one at a
+    time and rebuilding the curve.
+
+    The base build and the bumped builds, one per contract, are run as one batch on a pool of threads, with the same
+    builder and arguments. Callable arguments which can be precomputed, i.e. average_weight, mult_season_adjust and
+    add_season_adjust, are evaluated once and shared across all builds. If builder is 'bootstrap_contracts' or
+    'max_smooth_interp', precompute_callbacks defaults to True, so that the builds run in parallel without holding the GIL.
+    If builder is 'hyperbolic_tension_spline' the curve is linear in the contract prices, so the bumped curves are instead
+    all calculated from a single factorisation of the linear system, using HyperbolicTensionSystem.solve_many.
+
+    Args:
+        builder (str or callable): The function used to build the curve. Either one of the names in
+            curves.parallel.ENGINES, or a callable which takes the contracts as the first argument, followed by
+            builder_kwargs, returning the curve either as a pandas.Series, CurveArray, or tuple with the curve as the first
+            element.
+        contracts: The contracts, in any of the forms accepted by builder, i.e. an iterable of tuples, a pandas.Series
+            of prices indexed by delivery period, or a DataFrame or mapping with 'start', 'end' and 'price' columns.
+        bump (float, optional): Amount added to each contract price in the bumped builds. Defaults to 0.01.
+        buckets (iterable, optional): Delivery buckets to which the sensitivities are aggregated. Each is either a
+            pandas.Period, of granularity freq or lower, or a tuple of inclusive start and end. If omitted, the
+            sensitivities of each curve point are returned.
+        bucket_weight (callable, optional): Weighting applied to curve points when averaging the sensitivities over a
+            bucket, with the same semantics as the average_weight argument of the curve builders. Defaults to the
+            average_weight in builder_kwargs, if provided, otherwise the simple average is used.
+        workers (int, optional): Number of threads used to run the builds. Defaults to the number of CPUs.
+        output (str, optional): Either 'series' or 'numpy', determining the type of the result. Defaults to 'series'.
+        **builder_kwargs: Other keyword arguments passed to builder, e.g. freq.
+
+    Returns:
+        pandas.DataFrame or numpy.ndarray: Sensitivities of shape (number of curve points, number of contracts), or
+        (number of buckets, number of contracts) if buckets is provided, each element being the change in curve point, or
+        bucket average, per unit change in contract price, calculated as the difference of the bumped and base curves
+        divided by bump. If output is 'series' the DataFrame is indexed by curve period, or bucket, and has columns
+        labelled with the contract delivery periods, or contract positions for columnar contracts.
+    """
+    _validate_engine(builder)
+    _validate_output(output)
+    if bump == 0.0 or not np.isfinite(bump):
+        raise ValueError('bump must be a non-zero finite number, but value of {} has been provided.'.format(bump))
+    workers = os.cpu_count() if workers is None else workers
+    if workers < 1:
+        raise ValueError('workers argument must be a positive integer, but value of {} has been provided.'
+                         .format(workers))
+    if builder_kwargs.get('return_spline_coeff'):
+        raise ValueError('return_spline_coeff is not supported when calculating bucket deltas.')
+    if bucket_weight is None:
+        bucket_weight = builder_kwargs.get('average_weight')
+    num_contracts = _num_contracts(contracts)
+
+    if builder == 'hyperbolic_tension_spline':
+        base_curve, bumped_curves = _hyperbolic_tension_curves(contracts, bump, builder_kwargs)
+    else:
+        base_curve, bumped_curves = _bumped_builds(builder, contracts, num_contracts, bump, workers, builder_kwargs)
+
+    deltas = (bumped_curves - base_curve.values).T / bump
+    if buckets is None:
+        if output == 'numpy':
+            return deltas
+        return pd.DataFrame(deltas, index=base_curve.index(), columns=_contract_labels(contracts, num_contracts))
+    buckets = list(buckets)
+    bucket_weights = _bucket_weights(base_curve, buckets, bucket_weight)
+    deltas = bucket_weights @ deltas
+    if output == 'numpy':
+        return deltas
+    return pd.DataFrame(deltas, index=pd.Index(buckets, tupleize_cols=False),
+                        columns=_contract_labels(contracts, num_contracts))
+
+
+class _SharedEvaluation:
+    """Wraps a callable argument so that its vectorised evaluation over the curve periods is calculated once and shared
+    between all the builds of a batch."""
+
+    def __init__(self, func):
+        self._func = func
+        self._lock = threading.Lock()
+        self._key = None
+        self._values = None
+
+    def __call__(self, period):
+        return self._func(period)
+
+    def evaluate(self, index: pd.Index) -> np.ndarray:
+        key = (index[0], len(index)) if len(index) > 0 else None
+        with self._lock:
+            if key is None or key != self._key:
+                self._values = evaluate_on_index(self._func, index)
+                self._key = key
+            return self._values
+
+
+def _num_contracts(contracts) -> int:
+    if is_columnar_contracts(contracts):
+        return len(np.asarray(contracts['price']))
+    return len(contracts)
+
+
+def _contract_labels(contracts, num_contracts) -> pd.Index:
+    if isinstance(contracts, pd.Series):
+        return contracts.index
+    if is_columnar_contracts(contracts):
+        return pd.RangeIndex(num_contracts)
+    return pd.Index([deconstruct_contract(contract)[0] for contract in contracts], tupleize_cols=False)
+
+
+def _bumped_contracts(contracts, position, bump):
+    if isinstance(contracts, pd.Series):
+        bumped = contracts.copy()
+        bumped.iloc[position] += bump
+        return bumped
+    if is_columnar_contracts(contracts):
+        prices = np.array(contracts['price'], dtype=np.float64)
+        prices[position] += bump
+        bumped = contracts.copy() if isinstance(contracts, pd.DataFrame) else dict(contracts)
+        bumped['price'] = prices
+        return bumped
+    bumped = list(contracts)
+    period, price = deconstruct_contract(bumped[position])
+    bumped[position] = (period, price + bump)
+    return bumped
+
+
+def _to_curve_array(result) -> CurveArray:
+    if isinstance(result, tuple):
+        result = result[0]
+    if isinstance(result, CurveArray):
+        return result
+    return curve_array_from_series(result)
+
+
+def _hyperbolic_tension_curves(contracts, bump, builder_kwargs) -> tp.Tuple[CurveArray, np.ndarray]:
+    from curves.hyperbolic_tension_spline import hyperbolic_tension_system
+    system_kwargs = {name: value for name, value in builder_kwargs.items() if name not in ('output', 'return_spline_coeff')}
+    system = hyperbolic_tension_system(contracts, **system_kwargs)
+    base_curve = system.solve(output='numpy')
+    prices = np.asarray(system.contract_prices, dtype=np.float64)
+    bumped_prices = prices + bump * np.eye(len(prices))
+    return base_curve, system.solve_many(bumped_prices)
+
+
+def _bumped_builds(builder, contracts, num_contracts, bump, workers, builder_kwargs) \
+        -> tp.Tuple[CurveArray, np.ndarray]:
+    builder_func = _resolve_engine(builder)
+    builder_kwargs = dict(builder_kwargs)
+    for name in _PRECOMPUTABLE_ARGUMENTS:
+        if builder_kwargs.get(name) is not None:
+            builder_kwargs[name] = _SharedEvaluation(builder_kwargs[name])
+    if builder in _PRECOMPUTING_ENGINES:
+        builder_kwargs.setdefault('precompute_callbacks', True)
+        builder_kwargs.setdefault('output', 'numpy')
+
+    def build(position):
+        bumped = contracts if position is None else _bumped_contracts(contracts, position, bump)
+        return _to_curve_array(builder_func(bumped, **builder_kwargs))
+
+    positions = [None] + list(range(num_contracts))
+    if workers == 1:
+        curves = [build(position) for position in positions]
+    else:
+        with ThreadPoolExecutor(max_workers=min(workers, len(positions))) as executor:
+            curves = list(executor.map(build, positions))
+    base_curve = curves[0]
+    for position, curve in enumerate(curves[1:]):
+        if curve.start_ordinal != base_curve.start_ordinal or len(curve) != len(base_curve):
+            raise ValueError('The curve built with the price of the contract at position {} bumped does not cover the '
+                             'same periods as the base curve.'.format(position))
+    return base_curve, np.stack([curve.values for curve in curves[1:]])
+
+
+def _bucket_weights(base_curve: CurveArray, buckets, bucket_weight) -> np.ndarray:
+    """Matrix of shape (number of buckets, number of curve points) with each row being the weights which average the
+    curve over a bucket."""
+    num_points = len(base_curve)
+    if bucket_weight is None:
+        point_weights = np.ones(num_points)
+    else:
+        point_weights = evaluate_on_index(bucket_weight, base_curve.index())
+    weights = np.zeros((len(buckets), num_points))
+    for row, bucket in enumerate(buckets):
+        start, end = bucket if isinstance(bucket, tuple) else (bucket, bucket)
+        first = curve_positions(base_curve, [start], 's')[0]
+        last = curve_positions(base_curve, [end], 'e')[0]
+        if first > last:
+            raise ValueError('Bucket start must be earlier than or equal to bucket end. However for bucket {} start is {} '
+                             'and end is {}.'.format(bucket, start, end))
+        if first < 0 or last >= num_points:
+            raise ValueError('Bucket {} is not fully covered by the curve, which starts at {} and has {} points.'
+                             .format(bucket, base_curve.start, num_points))
+        bucket_point_weights = point_weights[first:last + 1]
+        sum_weight = bucket_point_weights.sum()
+        if sum_weight <= 0.0:
+            raise ValueError('The sum of bucket_weight over bucket {} must be positive.'.format(bucket))
+        weights[row, first:last + 1] = bucket_point_weights / sum_weight
+    return weights
@@ -0,0 +1,96 @@
+# Copyright(c) 2026 Jake Fowler
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use, 
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, 
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, 
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+""" Provides generation of curves for many contract price scenarios, e.g. for VaR and PFE calculations."""
+
+import typing as tp
+import numpy as np
+from curves.hyperbolic_tension_spline import HyperbolicTensionSystem
+
+
+def sample_prices(base_prices: tp.Iterable[float], covariance: np.ndarray, num_scenarios: int,
+                  seed: tp.Optional[int] = None) -> np.ndarray:
+    """
+    Samples contract price scenarios, as the base prices plus multivariate normal price moves.
+
+    Args:
+        base_prices (iterable of float): The unshocked contract prices.
+        covariance (numpy.ndarray): Covariance matrix of the contract price moves, of shape (number of contracts, number
+            of contracts). Must be symmetric and positive semi-definite.
+        num_scenarios (int): Number of scenarios sampled.
+        seed (int, optional): Seed of the random number generator. The same seed gives the same scenarios. If omitted
+            the scenarios are not reproducible.
+
+    Returns:
+        numpy.ndarray: Sampled prices, of shape (num_scenarios, number of contracts).
+    """
+    base_prices = np.asarray(base_prices, dtype=np.float64)
+    covariance = np.asarray(covariance, dtype=np.float64)
+    num_contracts = len(base_prices)
+    if covariance.shape != (num_contracts, num_contracts):
+        raise ValueError('covariance must have shape ({0}, {0}), being the number of contracts, but has shape {1}.'
+                         .format(num_contracts, covariance.shape))
+    if not np.allclose(covariance, covariance.T):
+        raise ValueError('covariance must be symmetric.')
+    rng = np.random.default_rng(seed)
+    return rng.multivariate_normal(base_prices, covariance, size=num_scenarios, check_valid='raise')
+
+
+def scenario_curves(system: HyperbolicTensionSystem,
+                    prices: tp.Optional[np.ndarray] = None,
+                    covariance: tp.Optional[np.ndarray] = None,
+                    num_scenarios: tp.Optional[int] = None,
+                    seed: tp.Optional[int] = None,
+                    max_memory_bytes: tp.Optional[int] = 2**28) -> np.ndarray:
+    """
+    Calculates tension spline curves for many contract price scenarios, with the contract delivery periods, tension and
+    all other arguments fixed, using a single factorisation of the linear system and vectorised evaluation of the
+    splines.
+
+    The scenarios are either specified directly by the prices argument, or sampled using covariance, num_scenarios and
+    seed. In the latter case the sampled prices can be reproduced by calling sample_prices with system.contract_prices
+    and the same covariance, num_scenarios and seed.
+
+    Args:
+        system (HyperbolicTensionSystem): The system created by curves.hyperbolic_tension_system for the contracts and
+            other arguments.
+        prices (numpy.ndarray, optional): Contract prices of each scenario, of shape (number of scenarios, number of
+            contracts), with columns in the same order as the contracts argument used to create system.
+        covariance (numpy.ndarray, optional): Covariance matrix of contract price moves from the prices of the contracts
+            used to create system, from which to sample scenarios. Must be provided if prices is omitted.
+        num_scenarios (int, optional): Number of scenarios to sample. Must be provided with covariance.
+        seed (int, optional): Seed used when sampling scenarios.
+        max_memory_bytes (int, optional): Approximate limit on temporary memory used in addition to the returned array,
+            as for HyperbolicTensionSystem.solve_many. Defaults to 256MB. If None, no limit is applied.
+
+    Returns:
+        numpy.ndarray: Curve values, of shape (number of scenarios, number of curve points), with the curve of each
+        scenario starting at the first period of the curve returned by system.solve.
+    """
+    if prices is None:
+        if covariance is None or num_scenarios is None:
+            raise ValueError('Either prices, or covariance and num_scenarios must be provided.')
+        prices = sample_prices(system.contract_prices, covariance, num_scenarios, seed)
+    elif covariance is not None or num_scenarios is not None:
+        raise ValueError('covariance and num_scenarios must not be provided with prices.')
+    return system.solve_many(prices, max_memory_bytes)
@@ -0,0 +1,313 @@
+# Copyright(c) 2026 Jake Fowler
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use, 
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, 
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, 
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+""" Provides a scheduler running curve builds with priority classes, so that small latency-critical builds aren't
+queued behind large batch builds."""
+
+import collections
+import functools
+import threading
+import time
+import typing as tp
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from curves.aio import _call_engine
+from curves.parallel import EngineType, _validate_engine
+
+_LATENCY_WINDOW = 1000
+
+
+class PriorityClass(tp.NamedTuple):
+    """
+    A class of builds scheduled by BuildScheduler.
+
+    Attributes:
+        name (str): Name of the class, used as the priority argument of BuildScheduler.submit.
+        max_concurrency (int, optional): Maximum number of builds of this class running at once, or None for no limit
+            other than the number of workers. Setting this below the number of workers for low priority classes
+            reserves workers for higher priority builds.
+    """
+    name: str
+    max_concurrency: tp.Optional[int] = None
+
+
+class ClassStats(tp.NamedTuple):
+    """
+    Metrics of a single priority class of a BuildScheduler.
+
+    Attributes:
+        queue_depth (int): Number of builds waiting to start.
+        running (int): Number of builds running.
+        submitted (int): Number of builds submitted.
+        completed (int): Number of builds which returned a result.
+        failed (int): Number of builds which raised an exception.
+        cancelled (int): Number of builds cancelled before starting, either by the caller or because they were
+            superseded by a later build of the same curve.
+        wait_p50 (float): Median seconds from submission to start, over the most recent 1000 started builds.
+        wait_p95 (float): 95th percentile of the seconds from submission to start.
+        latency_p50 (float): Median seconds from submission to completion, over the most recent 1000 finished builds.
+        latency_p95 (float): 95th percentile of the seconds from submission to completion.
+    """
+    queue_depth: int
+    running: int
+    submitted: int
+    completed: int
+    failed: int
+    cancelled: int
+    wait_p50: tp.Optional[float]
+    wait_p95: tp.Optional[float]
+    latency_p50: tp.Optional[float]
+    latency_p95: tp.Optional[float]
+
+
+class BuildScheduler:
+    """
+    Runs curve builds on a fixed number of workers, starting queued builds in order of priority class, then order of
+    submission.
+
+    Builds are only passed to the executor when a worker is free, so a build of a higher priority class submitted
+    while workers are busy starts as soon as the first worker becomes free, ahead of any queued lower priority builds.
+    Running builds are never interrupted, so to guarantee that urgent builds start immediately, limit the
+    max_concurrency of the lower priority classes to fewer than the number of workers. Lower priority builds can be
+    starved by a continuous stream of higher priority builds.
+
+    Args:
+        workers (int, optional): Maximum number of builds running at once. Defaults to 4.
+        classes (sequence of PriorityClass, optional): The priority classes, in descending order of priority. Defaults
+            to an 'interactive' class, and a 'batch' class limited to all but one of the workers.
+        executor (concurrent.futures.Executor, optional): The executor used to run builds, e.g. a
+            concurrent.futures.ProcessPoolExecutor, in which case all arguments must be picklable. It should have at
+            least workers workers. If omitted, a thread pool is created, and shut down by the shutdown method.
+
+    Example:
+        >>> with BuildScheduler(workers=4) as scheduler:
+        ...     future = scheduler.submit('hyperbolic_tension_spline', contracts, 'D', tension=0.5,
+        ...                               priority='interactive', curve_id='nbp')
+        ...     curve = future.result()
+    """
+
+    def __init__(self, workers: int = 4, classes: tp.Optional[tp.Sequence[PriorityClass]] = None,
+                 executor: tp.Optional[Executor] = None):
+        if workers < 1:
+            raise ValueError('workers must be at least 1, but {} was specified.'.format(workers))
+        if classes is None:
+            classes = (PriorityClass('interactive'), PriorityClass('batch', max(workers - 1, 1)))
+        if len(classes) == 0:
+            raise ValueError('classes must contain at least one PriorityClass.')
+        names = [priority_class.name for priority_class in classes]
+        if len(set(names)) != len(names):
+            raise ValueError('classes must have unique names, but {} were specified.'.format(names))
+        for priority_class in classes:
+            if priority_class.max_concurrency is not None and priority_class.max_concurrency < 1:
+                raise ValueError('max_concurrency of class {} must be at least 1, but {} was specified.'
+                                 .format(priority_class.name, priority_class.max_concurrency))
+        self._workers = workers
+        self._classes = tuple(classes)
+        self._owns_executor = executor is None
+        self._executor = ThreadPoolExecutor(max_workers=workers) if executor is None else executor
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._queues = {name: collections.deque() for name in names}
+        self._running = {name: 0 for name in names}
+        self._counters = {name: collections.Counter() for name in names}
+        self._waits = {name: collections.deque(maxlen=_LATENCY_WINDOW) for name in names}
+        self._latencies = {name: collections.deque(maxlen=_LATENCY_WINDOW) for name in names}
+        self._queued_by_curve = {}
+        self._shutdown = False
+
+    @property
+    def classes(self) -> tp.Tuple[PriorityClass, ...]:
+        return self._classes
+
+    def submit(self, engine: EngineType, *args, priority: tp.Optional[str] = None,
+               curve_id: tp.Optional[tp.Hashable] = None, **kwargs) -> Future:
+        """
+        Queues a curve build.
+
+        Args:
+            engine (str or callable): The curve building function. Either one of the names in curves.parallel.ENGINES,
+                or a callable, which must be picklable if the executor is a process pool.
+            *args: Positional arguments for the engine.
+            priority (str, optional): Name of the priority class of the build. Defaults to the highest priority class.
+            curve_id (hashable, optional): Identifier of the curve built. If provided, a build of the same curve_id
+                which is still queued is superseded by this build, so is cancelled. Builds which have already started
+                are not affected.
+            **kwargs: Keyword arguments for the engine.
+
+        Returns:
+            concurrent.futures.Future: Future of the value returned by the engine. Cancelling it before the build starts
+            removes the build from the queue.
+        """
+        _validate_engine(engine)
+        priority = self._classes[0].name if priority is None else priority
+        if priority not in self._queues:
+            raise ValueError("priority parameter value of '{}' not supported. Must be one of {}."
+                             .format(priority, ', '.join(self._queues)))
+        future = Future()
+        job = _Job(engine, args, kwargs, priority, curve_id, future, time.perf_counter())
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError('Cannot submit builds after shutdown.')
+            self._counters[priority]['submitted'] += 1
+            if curve_id is not None:
+                superseded = self._queued_by_curve.get(curve_id)
+                if superseded is not None:
+                    superseded.future.cancel()
+                self._queued_by_curve[curve_id] = job
+            self._queues[priority].append(job)
+            to_start = self._take_startable()
+        self._start(to_start)
+        return future
+
+    def stats(self) -> tp.Dict[str, ClassStats]:
+        """Returns the metrics of each priority class, by class name."""
+        with self._lock:
+            self._discard_cancelled()
+            return {name: ClassStats(len(self._queues[name]), self._running[name], self._counters[name]['submitted'],
+                                     self._counters[name]['completed'], self._counters[name]['failed'],
+                                     self._counters[name]['cancelled'], *_percentiles(self._waits[name]),
+                                     *_percentiles(self._latencies[name]))
+                    for name in self._queues}
+
+    def shutdown(self, wait: bool = True, cancel_pending: bool = False) -> None:
+        """
+        Stops accepting builds.
+
+        Args:
+            wait (bool, optional): Whether to block until all queued and running builds have finished. Defaults to True.
+            cancel_pending (bool, optional): Whether to cancel the queued builds which haven't started. Defaults to False.
+        """
+        with self._lock:
+            self._shutdown = True
+            if cancel_pending:
+                for queue in self._queues.values():
+                    for job in queue:
+                        job.future.cancel()
+            if wait:
+                self._idle.wait_for(self._is_idle)
+        if self._owns_executor:
+            self._executor.shutdown(wait=wait)
+
+    def __enter__(self) -> 'BuildScheduler':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.shutdown()
+
+    def bootstrap_contracts(self, *args, priority: tp.Optional[str] = None, curve_id: tp.Optional[tp.Hashable] = None,
+                            **kwargs) -> Future:
+        """Queues a build using curves.bootstrap_contracts."""
+        return self.submit('bootstrap_contracts', *args, priority=priority, curve_id=curve_id, **kwargs)
+
+    def max_smooth_interp(self, *args, priority: tp.Optional[str] = None, curve_id: tp.Optional[tp.Hashable] = None,
+                          **kwargs) -> Future:
+        """Queues a build using curves.max_smooth_interp."""
+        return self.submit('max_smooth_interp', *args, priority=priority, curve_id=curve_id, **kwargs)
+
+    def hyperbolic_tension_spline(self, *args, priority: tp.Optional[str] = None,
+                                  curve_id: tp.Optional[tp.Hashable] = None, **kwargs) -> Future:
+        """Queues a build using curves.hyperbolic_tension_spline."""
+        return self.submit('hyperbolic_tension_spline', *args, priority=priority, curve_id=curve_id, **kwargs)
+
+    def _take_startable(self) -> tp.List['_Job']:
+        """Removes from the queues the jobs which can start now. Must be called holding the lock."""
+        to_start = []
+        num_running = sum(self._running.values())
+        for priority_class in self._classes:
+            queue = self._queues[priority_class.name]
+            while queue and num_running < self._workers and \
+                    (priority_class.max_concurrency is None or
+                     self._running[priority_class.name] < priority_class.max_concurrency):
+                job = queue.popleft()
+                if job.curve_id is not None and self._queued_by_curve.get(job.curve_id) is job:
+                    del self._queued_by_curve[job.curve_id]
+                if not job.future.set_running_or_notify_cancel():
+                    self._counters[job.priority]['cancelled'] += 1
+                    continue
+                self._running[job.priority] += 1
+                self._waits[job.priority].append(time.perf_counter() - job.submitted)
+                num_running += 1
+                to_start.append(job)
+        return to_start
+
+    def _start(self, jobs) -> None:
+        for job in jobs:
+            try:
+                job.executor_future = self._executor.submit(_call_engine, job.engine, job.args, job.kwargs)
+            except Exception as error:  # e.g. the executor has been shut down
+                job.future.set_exception(error)
+                self._finished(job, None)
+            else:
+                job.executor_future.add_done_callback(functools.partial(self._finished, job))
+
+    def _finished(self, job, executor_future) -> None:
+        if executor_future is not None:
+            error = executor_future.exception()
+            if error is None:
+                job.future.set_result(executor_future.result())
+            else:
+                job.future.set_exception(error)
+        with self._lock:
+            self._running[job.priority] -= 1
+            self._counters[job.priority]['failed' if job.future.exception() is not None else 'completed'] += 1
+            self._latencies[job.priority].append(time.perf_counter() - job.submitted)
+            to_start = self._take_startable()
+            self._idle.notify_all()
+        self._start(to_start)
+
+    def _discard_cancelled(self) -> None:
+        """Removes cancelled jobs from the queues, so that queue depths are accurate. Must be called holding the lock."""
+        for name, queue in self._queues.items():
+            if any(job.future.cancelled() for job in queue):
+                kept = [job for job in queue if not job.future.cancelled()]
+                self._counters[name]['cancelled'] += len(queue) - len(kept)
+                for job in queue:
+                    if job.future.cancelled() and job.curve_id is not None and \
+                            self._queued_by_curve.get(job.curve_id) is job:
+                        del self._queued_by_curve[job.curve_id]
+                self._queues[name] = collections.deque(kept)
+
+    def _is_idle(self) -> bool:
+        self._discard_cancelled()
+        return sum(self._running.values()) == 0 and not any(self._queues.values())
+
+
+class _Job:
+    __slots__ = ('engine', 'args', 'kwargs', 'priority', 'curve_id', 'future', 'submitted', 'executor_future')
+
+    def __init__(self, engine, args, kwargs, priority, curve_id, future, submitted):
+        self.engine = engine
+        self.args = args
+        self.kwargs = kwargs
+        self.priority = priority
+        self.curve_id = curve_id
+        self.future = future
+        self.submitted = submitted
+        self.executor_future = None
+
+
+def _percentiles(values) -> tp.Tuple[tp.Optional[float], tp.Optional[float]]:
+    if not values:
+        return None, None
+    sorted_values = sorted(values)
+    return (sorted_values[(len(sorted_values) - 1) // 2],
+            sorted_values[min(int(0.95 * len(sorted_values)), len(sorted_values) - 1)])
@@ -0,0 +1,279 @@
+# Copyright(c) 2026 Jake Fowler
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use, 
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, 
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, 
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+""" Long-running local server which builds curves on behalf of clients, keeping the .NET runtime and imports warm.
+
+Run with:
+    python -m curves.server --port 8765 --workers 4 --cache-dir /tmp/curve-cache
+
+Requests are made using curves.client.CurveClient.
+"""
+
+import argparse
+import inspect
+import json
+import multiprocessing
+import os
+import socketserver
+import threading
+import time
+import traceback
+import typing as tp
+from concurrent.futures import ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from curves import _wire
+from curves._wire import DEFAULT_PORT
+from curves.parallel import ENGINES, _init_worker, _resolve_engine, _transferable_exception
+
+_cache = None  # CurveCache of the current process, set by _init_server_worker
+
+
+class ServerStats(tp.NamedTuple):
+    """
+    Counters of a CurveServer.
+
+    Attributes:
+        requests (int): Number of build requests received.
+        errors (int): Number of build requests which failed.
+        in_flight (int): Number of build requests currently being served.
+    """
+    requests: int
+    errors: int
+    in_flight: int
+
+
+class CurveServer:
+    """
+    HTTP server which builds curves using the functions in the curves package, serving requests concurrently.
+
+    Requests are JSON, as created by curves.client.CurveClient. Callable arguments are limited to instances of the
+    classes in curves.weighting and curves.adjustments, as the server never imports or executes code named by clients.
+    The server has no authentication so should only listen on the loopback interface, or a Unix domain socket with
+    appropriate file permissions.
+
+    Args:
+        host (str, optional): Host name or address to listen on. Defaults to '127.0.0.1'.
+        port (int, optional): TCP port to listen on. Defaults to 8765. If 0 a free port is chosen, which can be found
+            from the address attribute.
+        unix_socket (str, optional): If specified, the server listens on a Unix domain socket at this path, instead of
+            TCP. Any existing file at the path is replaced.
+        workers (int, optional): Number of worker processes which curves are built in. Defaults to the number of CPUs
+            if omitted. If 0, curves are built in the threads serving requests, which avoids inter-process overhead for
+            small curves, but limits parallelism by the GIL.
+        cache_dir (str, optional): If specified, results are cached in this directory using curves.cache.CurveCache,
+            shared by all worker processes.
+        max_cache_bytes (int, optional): max_bytes argument of CurveCache. Defaults to 1 GiB.
+    """
+
+    def __init__(self, host: str = '127.0.0.1', port: int = DEFAULT_PORT, unix_socket: tp.Optional[str] = None,
+                 workers: tp.Optional[int] = None, cache_dir: tp.Optional[str] = None,
+                 max_cache_bytes: int = 2**30):
+        workers = os.cpu_count() if workers is None else workers
+        if workers < 0:
+            raise ValueError('workers argument must be non-negative, but value of {} has been provided.'
+                             .format(workers))
+        self._executor = None if workers == 0 else \
+            ProcessPoolExecutor(max_workers=workers, initializer=_init_server_worker,
+                                initargs=(cache_dir, max_cache_bytes),
+                                mp_context=multiprocessing.get_context('spawn'))
+        if workers == 0:
+            _init_server_worker(cache_dir, max_cache_bytes)
+        self._stats_lock = threading.Lock()
+        self._requests = 0
+        self._errors = 0
+        self._in_flight = 0
+        if unix_socket is None:
+            self._http_server = ThreadingHTTPServer((host, port), _RequestHandler)
+        else:
+            if os.path.exists(unix_socket):
+                os.remove(unix_socket)
+            self._http_server = _ThreadingUnixHTTPServer(unix_socket, _RequestHandler)
+        self._http_server.curve_server = self
+        self._unix_socket = unix_socket
+        self._thread = None
+
+    @property
+    def address(self) -> tp.Union[str, tp.Tuple[str, int]]:
+        """(str, int) tuple of host and port, or str path of the Unix domain socket."""
+        return self._http_server.server_address
+
+    @property
+    def url(self) -> str:
+        """str: URL of the server, of the form used by curves.client.CurveClient."""
+        if self._unix_socket is not None:
+            return 'unix://' + self._unix_socket
+        host, port = self.address[:2]
+        return 'http://{}:{}'.format(host, port)
+
+    def stats(self) -> ServerStats:
+        with self._stats_lock:
+            return ServerStats(self._requests, self._errors, self._in_flight)
+
+    def serve_forever(self) -> None:
+        """Serves requests until shutdown is called from another thread."""
+        self._http_server.serve_forever()
+
+    def start(self) -> 'CurveServer':
+        """Serves requests on a background daemon thread."""
+        self._thread = threading.Thread(target=self.serve_forever, name='curve-server', daemon=True)
+        self._thread.start()
+        return self
+
+    def shutdown(self) -> None:
+        """Stops serving requests, and shuts down the worker processes."""
+        if self._thread is not None:
+            self._http_server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._http_server.server_close()
+        if self._executor is not None:
+            self._executor.shutdown()
+        if self._unix_socket is not None and os.path.exists(self._unix_socket):
+            os.remove(self._unix_socket)
+
+    def __enter__(self) -> 'CurveServer':
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.shutdown()
+
+    def build(self, engine: str, args: tp.Sequence[tp.Any], kwargs: tp.Mapping[str, tp.Any]) -> tp.Any:
+        """Builds a curve, in a worker process if the server has any, using the cache if enabled."""
+        if engine not in ENGINES:
+            raise ValueError("engine '{}' not supported. Must be one of {}.".format(engine, ', '.join(ENGINES)))
+        # Raises TypeError for invalid arguments before the request is sent to a worker process
+        inspect.signature(_resolve_engine(engine)).bind(*args, **kwargs)
+        with self._stats_lock:
+            self._requests += 1
+            self._in_flight += 1
+        try:
+            if self._executor is None:
+                return _serve_build(engine, args, kwargs)
+            return self._executor.submit(_serve_build, engine, args, kwargs).result()
+        except BaseException:
+            with self._stats_lock:
+                self._errors += 1
+            raise
+        finally:
+            with self._stats_lock:
+                self._in_flight -= 1
+
+
+class _ThreadingUnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def server_bind(self):
+        socketserver.UnixStreamServer.server_bind(self)
+        self.server_name = 'localhost'
+        self.server_port = 0
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # Allows clients to keep connections alive between requests
+
+    def do_GET(self):
+        curve_server = self.server.curve_server
+        if self.path == '/health':
+            from curves.__version__ import __version__
+            self._send_json(200, {'status': 'ok', 'version': __version__})
+        elif self.path == '/stats':
+            self._send_json(200, curve_server.stats()._asdict())
+        else:
+            self._send_json(404, {'error': 'NotFound', 'message': 'Unknown path {}.'.format(self.path)})
+
+    def do_POST(self):
+        if self.path != '/build':
+            self._send_json(404, {'error': 'NotFound', 'message': 'Unknown path {}.'.format(self.path)})
+            return
+        start_time = time.perf_counter()
+        try:
+            request = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))))
+            engine = request['engine']
+            args = _wire.decode(request.get('args', []))
+            kwargs = _wire.decode(request.get('kwargs', {'$map': []}))
+            result = self.server.curve_server.build(engine, args, kwargs)
+            response = {'result': _wire.encode(result), 'elapsed': time.perf_counter() - start_time}
+        except (ValueError, TypeError, KeyError) as e:
+            self._send_json(400, {'error': type(e).__name__, 'message': str(e)})
+            return
+        except Exception as e:
+            self._send_json(500, {'error': type(e).__name__, 'message': str(e), 'traceback': traceback.format_exc()})
+            return
+        self._send_json(200, response)
+
+    def _send_json(self, status, body) -> None:
+        encoded = json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(encoded)))
+        self.end_headers()
+        self.wfile.write(encoded)
+
+    def address_string(self):
+        return self.client_address[0] if isinstance(self.client_address, tuple) else 'unix'
+
+    def log_message(self, format, *args):
+        pass  # Requests aren't logged, as a busy server would produce excessive output
+
+
+def _init_server_worker(cache_dir, max_cache_bytes) -> None:
+    global _cache
+    _init_worker()
+    if cache_dir is not None:
+        from curves.cache import CurveCache
+        _cache = CurveCache(cache_dir, max_cache_bytes)
+
+
+def _serve_build(engine, args, kwargs) -> tp.Any:
+    try:
+        if _cache is not None:
+            result = _cache.build(engine, *args, **kwargs)
+        else:
+            result = _resolve_engine(engine)(*args, **kwargs)
+    except Exception as e:
+        raise _transferable_exception(e) from None
+    return result
+
+
+def main(argv: tp.Optional[tp.Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(prog='python -m curves.server', description=__doc__.splitlines()[0])
+    parser.add_argument('--host', default='127.0.0.1', help='Host name or address to listen on.')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help='TCP port to listen on.')
+    parser.add_argument('--unix-socket', help='Path of a Unix domain socket to listen on, instead of TCP.')
+    parser.add_argument('--workers', type=int, help='Number of worker processes. Defaults to the number of CPUs. '
+                                                    'If 0, curves are built in the request threads.')
+    parser.add_argument('--cache-dir', help='Directory in which to cache build results.')
+    parser.add_argument('--max-cache-bytes', type=int, default=2**30, help='Maximum size of the cache directory.')
+    args = parser.parse_args(argv)
+    server = CurveServer(args.host, args.port, args.unix_socket, args.workers, args.cache_dir, args.max_cache_bytes)
+    print('Serving curve builds at {}'.format(server.url), flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,177 @@
+# Copyright(c) 2026 Jake Fowler
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use, 
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, 
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, 
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+""" Provides transport of curves between processes using shared memory, avoiding pickling of curve values."""
+
+import os
+import typing as tp
+import numpy as np
+import pandas as pd
+from curves.arrays import CurveArray, curve_array_from_series
+
+try:
+    from multiprocessing import shared_memory, resource_tracker
+except ImportError:  # Python 3.7
+    shared_memory = None
+
+
+class SharedCurveHandle(tp.NamedTuple):
+    """
+    Lightweight, picklable reference to a curve held in a shared memory block.
+
+    Attributes:
+        name (str): Name of the multiprocessing.shared_memory.SharedMemory block holding the curve values as float64.
+        shape (tuple of int): Shape of the values array.
+        start_ordinal (int): pandas.Period ordinal, with freq equal to the freq attribute, of the first curve period.
+        freq (str): Pandas offset alias describing the granularity of the curve.
+        tz (str, optional): Time zone of the curve delivery periods. None if the curve is not time zone aware.
+    """
+    name: str
+    shape: tp.Tuple[int, ...]
+    start_ordinal: int
+    freq: str
+    tz: tp.Optional[str] = None
+
+
+def share_curve(curve: tp.Union[pd.Series, CurveArray]) -> SharedCurveHandle:
+    """
+    Copies a curve into a new shared memory block, and returns a handle to it.
+
+    Ownership of the shared memory block passes to the recipient of the handle, which is responsible for freeing it,
+    either by calling release, or SharedCurve.unlink. The calling process doesn't keep the block open, nor register it
+    for clean up at exit, so the block outlives the process which created it. As Windows frees shared memory blocks
+    when the last handle to them is closed, this is only supported on POSIX platforms.
+
+    Args:
+        curve (pandas.Series or CurveArray): The curve, as returned by one of the curve builders.
+
+    Returns:
+        SharedCurveHandle: Handle to the shared memory block, which can be sent cheaply to another process.
+    """
+    _check_shared_memory_available()
+    if os.name != 'posix':
+        raise OSError('Sharing curves between processes using shared memory is only supported on POSIX platforms.')
+    if isinstance(curve, pd.Series):
+        curve = curve_array_from_series(curve)
+    values = np.asarray(curve.values, dtype=np.float64)
+    shm = shared_memory.SharedMemory(create=True, size=max(values.nbytes, 1))
+    try:
+        np.ndarray(values.shape, dtype=np.float64, buffer=shm.buf)[...] = values
+        handle = SharedCurveHandle(shm.name, values.shape, int(curve.start_ordinal), curve.freq,
+                                   None if curve.tz is None else str(curve.tz))
+    except BaseException:
+        shm.close()
+        shm.unlink()
+        raise
+    shm.close()
+    _unregister(shm)
+    return handle
+
+
+class SharedCurve:
+    """
+    Attaches to the shared memory block referenced by a SharedCurveHandle, giving zero-copy access to the curve.
+
+    Arrays and pandas.Series obtained from an instance are views of the shared memory, so must not be used after
+    close has been called. Used as a context manager, the shared memory block is closed and freed on exit.
+
+    Args:
+        handle (SharedCurveHandle): Handle to the shared memory block, as returned by share_curve.
+    """
+
+    def __init__(self, handle: SharedCurveHandle):
+        _check_shared_memory_available()
+        self._handle = handle
+        self._shm = shared_memory.SharedMemory(name=handle.name)
+        self._values = np.ndarray(handle.shape, dtype=np.float64, buffer=self._shm.buf)
+
+    @property
+    def handle(self) -> SharedCurveHandle:
+        return self._handle
+
+    @property
+    def values(self) -> np.ndarray:
+        """numpy.ndarray: The curve values, as a view of the shared memory."""
+        if self._values is None:
+            raise ValueError('SharedCurve has been closed.')
+        return self._values
+
+    def curve_array(self) -> CurveArray:
+        """Returns the curve as a CurveArray, with values being a view of the shared memory."""
+        return CurveArray(self.values, self._handle.start_ordinal, self._handle.freq, self._handle.tz)
+
+    def to_series(self) -> pd.Series:
+        """Returns the curve as a pandas.Series, with the same index as would have been returned by the curve builders,
+        and values being a view of the shared memory."""
+        return self.curve_array().to_series()
+
+    def close(self) -> None:
+        """Detaches from the shared memory block, without freeing it."""
+        if self._values is not None:
+            self._values = None
+            self._shm.close()
+
+    def unlink(self) -> None:
+        """Frees the shared memory block. Should be called once, by the owner of the block, after all processes have
+        finished using it."""
+        self._shm.unlink()
+
+    def __enter__(self) -> 'SharedCurve':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+        self.unlink()
+
+
+def release(handle: SharedCurveHandle) -> None:
+    """Frees the shared memory block referenced by handle."""
+    _check_shared_memory_available()
+    shm = shared_memory.SharedMemory(name=handle.name)
+    shm.close()
+    shm.unlink()
+
+
+def share_result(result: tp.Any) -> tp.Any:
+    """Replaces curves in a curve builder result, which can be a single curve, or a tuple containing curves, with
+    handles to shared memory copies of them."""
+    if _is_curve(result):
+        return share_curve(result)
+    if isinstance(result, tuple):
+        return tuple(share_curve(item) if _is_curve(item) else item for item in result)
+    return result
+
+
+def _is_curve(value) -> bool:
+    return isinstance(value, CurveArray) or \
+        (isinstance(value, pd.Series) and isinstance(value.index, (pd.PeriodIndex, pd.DatetimeIndex)))
+
+
+def _unregister(shm) -> None:
+    # Stop the resource tracker freeing the block when this process exits, as ownership passes to the handle recipient
+    resource_tracker.unregister(shm._name, 'shared_memory')
+
+
+def _check_shared_memory_available() -> None:
+    if shared_memory is None:
+        raise ImportError('Shared memory transport requires multiprocessing.shared_memory, available from Python 3.8.')
@@ -0,0 +1,254 @@
+# Copyright(c) 2026 Jake Fowler
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use, 
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, 
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, 
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+""" Provides persistence of solved splines, and re-evaluation of the interpolated curve without re-solving."""
+
+import json
+import numpy as np
+import pandas as pd
+import typing as tp
+from curves.arrays import CurveArray, curve_array_from_series, periods_to_ordinals, evaluate_on_index, \
+    _validate_output
+
+HYPERBOLIC_TENSION = 'hyperbolic_tension'
+MAX_SMOOTHNESS = 'max_smoothness'
+
+_years_per_second = 1.0 / 60.0 / 60.0 / 24.0 / 365.0
+_FORMAT_VERSION = 1
+
+
+class SolvedSpline:
+    """
+    Solved spline, together with the seasonal adjustment and weighting tables, from which the interpolated curve, or any
+    sub-range of it, can be evaluated without re-solving. Instances should be created using the solved_spline or
+    load_solved_spline functions.
+    """
+
+    def __init__(self, spline_type: str, freq: str, tz: tp.Optional[str], start_ordinal: int, num_points: int,
+                 section_starts: np.ndarray, coefficients: np.ndarray,
+                 mult_season_adjusts: tp.Optional[np.ndarray] = None,
+                 add_season_adjusts: tp.Optional[np.ndarray] = None,
+                 weights: tp.Optional[np.ndarray] = None,
+                 times: tp.Optional[np.ndarray] = None):
+        self.spline_type = spline_type
+        self.freq = freq
+        self.tz = tz
+        self.start_ordinal = start_ordinal
+        self.num_points = num_points
+        self.section_starts = section_starts
+        self.coefficients = coefficients
+        self.mult_season_adjusts = mult_season_adjusts
+        self.add_season_adjusts = add_season_adjusts
+        self.weights = weights
+        self.times = times
+
+    def __len__(self) -> int:
+        return self.num_points
+
+    def evaluate(self, start: tp.Optional[tp.Union[pd.Period, pd.Timestamp, str]] = None,
+                 end: tp.Optional[tp.Union[pd.Period, pd.Timestamp, str]] = None,
+                 output: tp.Optional[str] = 'series') -> tp.Union[pd.Series, CurveArray]:
+        """
+        Evaluates the interpolated curve, or a sub-range of it.
+
+        Args:
+            start (pandas.Period, pandas.Timestamp or str, optional): First period of the sub-range to evaluate. Defaults to
+                the start of the curve if omitted.
+            end (pandas.Period, pandas.Timestamp or str, optional): Last period (inclusive) of the sub-range to evaluate.
+                Defaults to the end of the curve if omitted.
+            output (str, optional): Either 'series' or 'numpy', as for the output parameter of the curve builders.
+
+        Returns:
+            pandas.Series or CurveArray: The curve values, identical to those of the curve from which this instance was
+                created, over the requested sub-range.
+        """
+        _validate_output(output)
+        start_idx = 0 if start is None else self._point_index(start)
+        end_idx = self.num_points if end is None else self._point_index(end) + 1
+        if not 0 <= start_idx < end_idx <= self.num_points:
+            raise ValueError('Evaluation range from {} to {} is not within the curve.'.format(start, end))
+        index = self._index(start_idx, end_idx)
+        point_indices = np.arange(start_idx, end_idx)
+        section_idx = np.searchsorted(self.section_starts, point_indices, side='right') - 1
+        if self.spline_type == HYPERBOLIC_TENSION:
+            values = _evaluate_hyperbolic_tension(section_idx, self._times_from_start(index, start_idx, end_idx),
+                                                  self.coefficients)
+        else:
+            values = _evaluate_max_smoothness(section_idx, self._times_from_start(index, start_idx, end_idx),
+                                              self.coefficients)
+        if self.add_season_adjusts is not None:
+            values += self.add_season_adjusts[start_idx:end_idx]
+        if self.mult_season_adjusts is not None:
+            values *= self.mult_season_adjusts[start_idx:end_idx]
+        if output == 'numpy':
+            return CurveArray(values, self.start_ordinal + start_idx if self.tz is None
+                              else int(periods_to_ordinals(index[:1], self.freq)[0]), self.freq, self.tz)
+        return pd.Series(data=values, index=index)
+
+    def save(self, file) -> None:
+        """Saves to a compressed numpy .npz file, which can be loaded using the load_solved_spline function."""
+        metadata = {'format_version': _FORMAT_VERSION, 'spline_type': self.spline_type, 'freq': self.freq,
+                    'tz': None if self.tz is None else str(self.tz), 'start_ordinal': int(self.start_ordinal),
+                    'num_points': int(self.num_points)}
+        arrays = {'section_starts': self.section_starts, 'coefficients': self.coefficients}
+        for name in ('mult_season_adjusts', 'add_season_adjusts', 'weights', 'times'):
+            array = getattr(self, name)
+            if array is not None:
+                arrays[name] = array
+        np.savez_compressed(file, metadata=np.array(json.dumps(metadata)), **arrays)
+
+    def _point_index(self, period) -> int:
+        if self.tz is None:
+            return pd.Period(period, freq=self.freq).ordinal - self.start_ordinal
+        timestamp = period.to_timestamp() if isinstance(period, pd.Period) else pd.Timestamp(period)
+        timestamp = timestamp.tz_localize(self.tz) if timestamp.tzinfo is None else timestamp
+        freq_offset = pd.tseries.frequencies.to_offset(self.freq)
+        return round((timestamp - self._first_timestamp()) / freq_offset)
+
+    def _first_timestamp(self) -> pd.Timestamp:
+        return pd.Period(ordinal=self.start_ordinal, freq=self.freq).to_timestamp().tz_localize(self.tz)
+
+    def _index(self, start_idx, end_idx) -> tp.Union[pd.PeriodIndex, pd.DatetimeIndex]:
+        if self.tz is None:
+            return pd.period_range(start=pd.Period(ordinal=self.start_ordinal + start_idx, freq=self.freq),
+                                   periods=end_idx - start_idx, freq=self.freq)
+        return pd.date_range(start=self._first_timestamp(), periods=end_idx, freq=self.freq)[start_idx:]
+
+    def _times_from_start(self, index, start_idx, end_idx) -> np.ndarray:
+        if self.times is not None:
+            return self.times[start_idx:end_idx]
+        if self.spline_type == MAX_SMOOTHNESS:
+            return np.arange(start_idx, end_idx, dtype=np.float64)
+        if self.tz is None:
+            first_start_time = pd.Period(ordinal=self.start_ordinal, freq=self.freq).start_time
+            return (index.to_timestamp() - first_start_time).total_seconds().to_numpy() * _years_per_second
+        return (index - self._first_timestamp()).total_seconds().to_numpy() * _years_per_second
+
+
+def solved_spline(curve: tp.Union[pd.Series, CurveArray],
+                  spline_coeff: tp.Union[pd.DataFrame, tp.Mapping[str, np.ndarray]],
+                  mult_season_adjust: tp.Optional[tp.Callable[[tp.Union[pd.Period, pd.Timestamp]], float]] = None,
+                  add_season_adjust: tp.Optional[tp.Callable[[tp.Union[pd.Period, pd.Timestamp]], float]] = None,
+                  average_weight: tp.Optional[tp.Callable[[tp.Union[pd.Period, pd.Timestamp]], float]] = None,
+                  discount_factor: tp.Optional[tp.Callable[[tp.Union[pd.Period, pd.Timestamp]], float]] = None,
+                  time_func: tp.Optional[tp.Callable[[pd.Period, pd.Period], float]] = None) -> SolvedSpline:
+    """
+    Creates a SolvedSpline from the results of either hyperbolic_tension_spline or max_smooth_interp called with
+    return_spline_coeff=True.
+
+    Args:
+        curve (pandas.Series or CurveArray): The interpolated curve, as returned by the spline function.
+        spline_coeff (pandas.DataFrame or dict): The solved spline coefficients, as returned by the spline function.
+        mult_season_adjust (callable, optional): The mult_season_adjust argument used when creating the spline.
+        add_season_adjust (callable, optional): The add_season_adjust argument used when creating the spline.
+        average_weight (callable, optional): The average_weight argument used when creating the spline. This is not required
+            for evaluation, but is stored in the weights table for use in calculating averages over delivery periods.
+        discount_factor (callable, optional): The discount_factor argument used when creating the spline. As with
+            average_weight, this is only stored in the weights table.
+        time_func (callable, optional): The time_func argument used when creating a maximum smoothness spline. The
+            evaluated times are stored, so only provide this if a non-default time_func was used.
+
+    Returns:
+        SolvedSpline: Solved spline which evaluates to curve. This only stores tables for the optional arguments provided,
+            so where no callables were used to create the spline, the storage required is proportional to the number of
+            spline sections, rather than the curve length.
+    """
+    curve_array = curve if isinstance(curve, CurveArray) else curve_array_from_series(curve)
+    index = curve.index if isinstance(curve, pd.Series) else curve_array.index()
+    if isinstance(spline_coeff, pd.DataFrame):
+        knot_ordinals = periods_to_ordinals(spline_coeff.index, curve_array.freq)
+        columns = list(spline_coeff.columns)
+        coefficients = spline_coeff.to_numpy(dtype=np.float64)
+    else:
+        knot_key = 'knot' if 'knot' in spline_coeff else 'start'
+        knot_ordinals = np.asarray(spline_coeff[knot_key], dtype=np.int64)
+        columns = [key for key in spline_coeff if key != knot_key]
+        coefficients = np.column_stack([np.asarray(spline_coeff[column], dtype=np.float64) for column in columns])
+    if columns == ['t', 'y', 'z', 'tension']:
+        spline_type = HYPERBOLIC_TENSION
+        knot_ordinals = knot_ordinals[:-1]  # Last row is for the end of the curve, rather than the start of a section
+    elif columns == ['t', 'a', 'b', 'c', 'd', 'e']:
+        spline_type = MAX_SMOOTHNESS
+    else:
+        raise ValueError('spline_coeff columns {} are not those returned by either hyperbolic_tension_spline '
+                         'or max_smooth_interp.'.format(columns))
+    if curve_array.tz is None:
+        section_starts = knot_ordinals - curve_array.start_ordinal
+    elif isinstance(spline_coeff, pd.DataFrame):
+        section_starts = index.get_indexer(spline_coeff.index[:-1])
+    else:
+        # Wall-clock ordinals can be ambiguous around clock changes so locate knots using their times
+        t_from_start = (index - index[0]).total_seconds().to_numpy() * _years_per_second
+        section_starts = np.searchsorted(t_from_start, coefficients[:-1, 0] - 1E-9)
+
+    weights = None
+    if average_weight is not None or discount_factor is not None:
+        weights = np.ones(len(curve_array))
+        if average_weight is not None:
+            weights *= evaluate_on_index(average_weight, index)
+        if discount_factor is not None:
+            weights *= evaluate_on_index(discount_factor, index)
+    times = None
+    if time_func is not None:
+        times = np.fromiter((time_func(index[0], p) for p in index), dtype=np.float64, count=len(index))
+    return SolvedSpline(spline_type, curve_array.freq, curve_array.tz, curve_array.start_ordinal, len(curve_array),
+                        np.asarray(section_starts, dtype=np.int64), coefficients,
+                        None if mult_season_adjust is None else evaluate_on_index(mult_season_adjust, index),
+                        None if add_season_adjust is None else evaluate_on_index(add_season_adjust, index),
+                        weights, times)
+
+
+def load_solved_spline(file) -> SolvedSpline:
+    """Loads a SolvedSpline previously saved with the SolvedSpline.save method."""
+    with np.load(file, allow_pickle=False) as npz:
+        metadata = json.loads(str(npz['metadata']))
+        if metadata['format_version'] > _FORMAT_VERSION:
+            raise ValueError('Solved spline file has format version {}, which is not supported by this version of the '
+                             'curves package.'.format(metadata['format_version']))
+        optional_arrays = {name: npz[name] if name in npz else None
+                           for name in ('mult_season_adjusts', 'add_season_adjusts', 'weights', 'times')}
+        return SolvedSpline(metadata['spline_type'], metadata['freq'], metadata['tz'], metadata['start_ordinal'],
+                            metadata['num_points'], npz['section_starts'], npz['coefficients'], **optional_arrays)
+
+
+def _evaluate_hyperbolic_tension(section_idx, t_from_start, coefficients) -> np.ndarray:
+    knot_times = coefficients[:, 0]
+    y = coefficients[:, 1]
+    z = coefficients[:, 2]
+    tension_by_section = coefficients[:-1, 3]
+    h_is = np.diff(knot_times)
+    h = h_is[section_idx]
+    tau = tension_by_section[section_idx]
+    tau_sqrd = tau * tau
+    t_from_section_start = t_from_start - knot_times[section_idx]
+    t_to_section_end = h - t_from_section_start
+    z_start = z[section_idx]
+    z_end = z[section_idx + 1]
+    return (z_start * np.sinh(tau * t_to_section_end) + z_end * np.sinh(tau * t_from_section_start)) \
+        / (tau_sqrd * np.sinh(tau * h)) + ((y[section_idx] - z_start / tau_sqrd) * t_to_section_end +
+                                           (y[section_idx + 1] - z_end / tau_sqrd) * t_from_section_start) / h
+
+
+def _evaluate_max_smoothness(section_idx, t_from_start, coefficients) -> np.ndarray:
+    a, b, c, d, e = (coefficients[section_idx, i] for i in range(1, 6))
+    return a + t_from_start * (b + t_from_start * (c + t_from_start * (d + t_from_start * e)))
@@ -0,0 +1,338 @@
+# Copyright(c) 2026 Jake Fowler
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use, 
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, 
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, 
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+""" Provides a memory-mapped columnar store for histories of curves, with one curve for each valuation date."""
+
+import json
+import os
+import numpy as np
+import pandas as pd
+import typing as tp
+from contextlib import contextmanager
+from datetime import date
+from curves.arrays import CurveArray, curve_array_from_series, elapsed_periods, period_index_from_ordinals
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+_FORMAT_VERSION = 2
+_META_FILE = 'meta.json'
+_VALUES_FILE = 'values.f8'
+_DATES_FILE = 'dates.i8'
+_LOCK_FILE = 'write.lock'
+
+
+class CurveHistory(tp.NamedTuple):
+    """
+    History of curves read from a CurveStore, with one row of values for each valuation date.
+
+    Attributes:
+        valuation_dates (pandas.PeriodIndex): Daily PeriodIndex of the valuation dates of the curves.
+        start_ordinal (int): pandas.Period ordinal of the first delivery period, i.e. the first column of values.
+        freq (str): Pandas offset alias describing the granularity of the curves.
+        tz (str, optional): Time zone of the curve delivery periods. None if the curves are not time zone aware.
+        values (numpy.ndarray): 2-dimensional array of curve values, with shape (number of valuation dates, number of
+            delivery periods). This will be a read-only view onto the memory-mapped store file. NaN values represent
+            delivery periods not covered by the curve for a valuation date.
+    """
+    valuation_dates: pd.PeriodIndex
+    start_ordinal: int
+    freq: str
+    tz: tp.Optional[str]
+    values: np.ndarray
+
+    def delivery_index(self) -> tp.Union[pd.PeriodIndex, pd.DatetimeIndex]:
+        """Creates the index of delivery periods corresponding to the columns of values."""
+        return CurveArray(self.values[0] if len(self.values) else np.empty(self.values.shape[1]),
+                          self.start_ordinal, self.freq, self.tz).index()
+
+    def to_frame(self) -> pd.DataFrame:
+        """Converts to pandas.DataFrame with valuation dates as index and delivery periods as columns."""
+        return pd.DataFrame(data=self.values, index=self.valuation_dates, columns=self.delivery_index(), copy=False)
+
+    def curve(self, valuation_date: tp.Union[date, pd.Period, str]) -> CurveArray:
+        """Returns the curve for a single valuation date as a CurveArray, without copying."""
+        row = self.valuation_dates.get_loc(pd.Period(valuation_date, freq='D'))
+        return CurveArray(self.values[row], self.start_ordinal, self.freq, self.tz)
+
+
+class CurveStore:
+    """
+    Store of curve histories in a local directory, with the curves for each name and freq held in a memory-mapped
+    2-dimensional array, with a row for each valuation date, and a column for each delivery period.
+
+    A single writer process can append curves while any number of reader processes read. Appends are made visible to
+    readers by atomically replacing a small JSON metadata sidecar file after the data has been written, so readers
+    never see partially written rows.
+
+    Args:
+        root (str or path-like): Directory in which the store files are held. Created if it does not exist.
+    """
+
+    def __init__(self, root: tp.Union[str, os.PathLike]):
+        self.root = os.fspath(root)
+        os.makedirs(self.root, exist_ok=True)
+
+    def names(self) -> tp.List[str]:
+        """Returns the names of all curves in the store."""
+        return sorted(name for name in os.listdir(self.root) if os.path.isdir(os.path.join(self.root, name)))
+
+    def freqs(self, name: str) -> tp.List[str]:
+        """Returns the freqs of all curves in the store with a specific name."""
+        return sorted(os.listdir(os.path.join(self.root, name)))
+
+    def last_valuation_date(self, name: str, freq: str) -> tp.Optional[pd.Period]:
+        """Returns the valuation date of the last curve appended for a name and freq, or None if there is none."""
+        meta = self._read_meta(self._directory(name, freq))
+        if meta is None or meta['last_date_ordinal'] is None:
+            return None
+        return pd.Period(ordinal=meta['last_date_ordinal'], freq='D')
+
+    def append(self, name: str, valuation_date: tp.Union[date, pd.Period, str], curve: tp.Union[pd.Series, CurveArray],
+               num_columns: tp.Optional[int] = None) -> None:
+        """
+        Appends a curve to the store. Curves for each name and freq must be appended in increasing valuation date order.
+
+        Args:
+            name (str): Name of the curve, e.g. the hub.
+            valuation_date (date, pandas.Period or str): Valuation date of the curve.
+            curve (pandas.Series or CurveArray): The curve, as returned by one of the curve builders.
+            num_columns (int, optional): Only used when the first curve for the name and freq is appended, in which case
+                it determines the number of delivery periods, starting at the first period of the curve, which the store
+                initially holds. Defaults to twice the length of the first curve if omitted. If a later curve has delivery
+                periods outside of those the store holds, the values are copied into a new file with at least double the
+                number of columns, so the cost of growing is amortised over many appends.
+        """
+        curve_array = curve if isinstance(curve, CurveArray) else curve_array_from_series(curve)
+        date_ordinal = pd.Period(valuation_date, freq='D').ordinal
+        directory = self._directory(name, curve_array.freq)
+        os.makedirs(directory, exist_ok=True)
+        with self._write_lock(directory):
+            meta = self._read_meta(directory)
+            if meta is None:
+                meta = {'format_version': _FORMAT_VERSION, 'freq': curve_array.freq,
+                        'tz': None if curve_array.tz is None else str(curve_array.tz),
+                        'start_ordinal': int(curve_array.start_ordinal),
+                        'num_columns': int(num_columns or 2 * len(curve_array)), 'num_rows': 0,
+                        'last_date_ordinal': None, 'values_file': _VALUES_FILE}
+            self._validate_append(meta, name, curve_array, date_ordinal)
+            column_offset = elapsed_periods(meta['start_ordinal'], curve_array.start_ordinal, meta['freq'], meta['tz'])
+            if column_offset < 0 or column_offset + len(curve_array) > meta['num_columns']:
+                column_offset = self._grow(directory, meta, column_offset, len(curve_array))
+            row = np.full(meta['num_columns'], np.nan)
+            row[column_offset:column_offset + len(curve_array)] = curve_array.values
+            num_rows = meta['num_rows']
+            # Any bytes after the last committed row are from an interrupted append, so are overwritten
+            _write_at(self._values_path(directory, meta), num_rows * row.nbytes, row)
+            _write_at(os.path.join(directory, _DATES_FILE), num_rows * 8, np.array([date_ordinal], dtype=np.int64))
+            meta['num_rows'] = num_rows + 1
+            meta['last_date_ordinal'] = int(date_ordinal)
+            self._write_meta(directory, meta)
+            if meta.get('generation', 0) >= 2:
+                self._remove_stale_values_files(directory, meta['generation'])
+
+    def read(self, name: str, freq: str,
+             valuation_start: tp.Optional[tp.Union[date, pd.Period, str]] = None,
+             valuation_end: tp.Optional[tp.Union[date, pd.Period, str]] = None,
+             delivery_start: tp.Optional[tp.Union[pd.Period, pd.Timestamp, str]] = None,
+             delivery_end: tp.Optional[tp.Union[pd.Period, pd.Timestamp, str]] = None) -> CurveHistory:
+        """
+        Reads a range of the curve history from the store, without copying the data.
+
+        Args:
+            name (str): Name of the curve.
+            freq (str): Freq of the curve.
+            valuation_start (date, pandas.Period or str, optional): First valuation date to read. Defaults to the first
+                valuation date in the store.
+            valuation_end (date, pandas.Period or str, optional): Last valuation date (inclusive) to read. Defaults to the
+                last valuation date in the store.
+            delivery_start (pandas.Period, pandas.Timestamp or str, optional): First delivery period to read. Defaults to
+                the first delivery period in the store.
+            delivery_end (pandas.Period, pandas.Timestamp or str, optional): Last delivery period (inclusive) to read.
+                Defaults to the last delivery period the store can hold.
+
+        Returns:
+            CurveHistory: The curve history, with values being a view onto the memory-mapped store file.
+        """
+        directory = self._directory(name, freq)
+        meta = self._read_meta(directory)
+        if meta is None:
+            raise KeyError('No curves in store for name {} and freq {}.'.format(name, freq))
+        while True:
+            try:
+                values = np.memmap(self._values_path(directory, meta), dtype=np.float64, mode='r',
+                                   shape=(meta['num_rows'], meta['num_columns']))
+                break
+            except FileNotFoundError:
+                # The store grew more than once since meta was read, so the values file it refers to has been removed
+                latest_meta = self._read_meta(directory)
+                if latest_meta.get('values_file') == meta.get('values_file'):
+                    raise
+                meta = latest_meta
+        num_rows = meta['num_rows']
+        num_columns = meta['num_columns']
+        date_ordinals = np.memmap(os.path.join(directory, _DATES_FILE), dtype=np.int64, mode='r', shape=(num_rows,))
+        row_start = 0 if valuation_start is None else \
+            np.searchsorted(date_ordinals, pd.Period(valuation_start, freq='D').ordinal, side='left')
+        row_end = num_rows if valuation_end is None else \
+            np.searchsorted(date_ordinals, pd.Period(valuation_end, freq='D').ordinal, side='right')
+        column_start = 0 if delivery_start is None else self._column(meta, delivery_start)
+        column_end = num_columns if delivery_end is None else self._column(meta, delivery_end) + 1
+        column_start = max(column_start, 0)
+        column_end = min(max(column_end, column_start), num_columns)
+        return CurveHistory(period_index_from_ordinals(date_ordinals[row_start:row_end], 'D'),
+                            self._column_ordinal(meta, column_start), meta['freq'], meta['tz'],
+                            values[row_start:row_end, column_start:column_end])
+
+    @staticmethod
+    def _column(meta, period) -> int:
+        if meta['tz'] is None:
+            return elapsed_periods(meta['start_ordinal'], pd.Period(period, freq=meta['freq']).ordinal, meta['freq'])
+        timestamp = period.to_timestamp() if isinstance(period, pd.Period) else pd.Timestamp(period)
+        timestamp = timestamp.tz_localize(meta['tz']) if timestamp.tzinfo is None else timestamp
+        first_timestamp = pd.Period(ordinal=meta['start_ordinal'], freq=meta['freq']).to_timestamp() \
+            .tz_localize(meta['tz'])
+        return round((timestamp - first_timestamp) / pd.tseries.frequencies.to_offset(meta['freq']))
+
+    @staticmethod
+    def _column_ordinal(meta, column) -> int:
+        """pandas.Period ordinal of the wall-clock delivery period of a column."""
+        freq_offset = pd.tseries.frequencies.to_offset(meta['freq'])
+        if meta['tz'] is None or not isinstance(freq_offset, pd.tseries.offsets.Tick):
+            return meta['start_ordinal'] + column * freq_offset.n
+        first_timestamp = pd.Period(ordinal=meta['start_ordinal'], freq=meta['freq']).to_timestamp() \
+            .tz_localize(meta['tz'])
+        return pd.Period((first_timestamp + column * freq_offset).tz_localize(None), freq=meta['freq']).ordinal
+
+    @staticmethod
+    def _values_path(directory, meta) -> str:
+        return os.path.join(directory, meta.get('values_file', _VALUES_FILE))
+
+    def _grow(self, directory, meta, column_offset, curve_length) -> int:
+        """Copies the values into a new file with columns covering both the existing columns and the delivery periods
+        of a curve being appended, updating meta, which isn't written. Returns the column offset of the curve in the
+        new file. Readers of the existing file are unaffected, and see the new file once meta is written. The existing
+        file is kept until the store grows again, and readers which find their file removed since reading meta re-read
+        it."""
+        num_rows = meta['num_rows']
+        num_columns = meta['num_columns']
+        num_new_leading = max(0, -column_offset)
+        new_num_columns = max(num_new_leading + max(num_columns, column_offset + curve_length), 2 * num_columns)
+        generation = meta.get('generation', 0) + 1
+        new_values_file = _values_file_name(generation)
+        new_path = os.path.join(directory, new_values_file)
+        with open(new_path, 'w+b') as new_file:
+            new_file.truncate(num_rows * new_num_columns * 8)
+        if num_rows > 0:
+            old_values = np.memmap(self._values_path(directory, meta), dtype=np.float64, mode='r',
+                                   shape=(num_rows, num_columns))
+            new_values = np.memmap(new_path, dtype=np.float64, mode='r+', shape=(num_rows, new_num_columns))
+            new_values[:] = np.nan
+            new_values[:, num_new_leading:num_new_leading + num_columns] = old_values
+            new_values.flush()
+            del old_values, new_values
+        if column_offset < 0:
+            meta['start_ordinal'] = self._column_ordinal(meta, column_offset)
+        meta.update({'format_version': _FORMAT_VERSION, 'num_columns': int(new_num_columns),
+                     'values_file': new_values_file, 'generation': generation})
+        return column_offset + num_new_leading
+
+    @staticmethod
+    def _remove_stale_values_files(directory, generation) -> None:
+        """Removes the values files of generations before the previous one. A file which can't be removed, e.g. because
+        a reader still has it mapped on Windows, is retried after each later append until it is removed."""
+        keep_files = {_values_file_name(generation), _values_file_name(generation - 1)}
+        for file_name in os.listdir(directory):
+            if (file_name == _VALUES_FILE or file_name.startswith(_VALUES_FILE + '.')) and file_name not in keep_files:
+                try:
+                    os.remove(os.path.join(directory, file_name))
+                except OSError:
+                    pass
+
+    def _directory(self, name, freq) -> str:
+        return os.path.join(self.root, name, freq)
+
+    @staticmethod
+    def _validate_append(meta, name, curve_array, date_ordinal) -> None:
+        if meta['freq'] != curve_array.freq or meta['tz'] != (None if curve_array.tz is None else str(curve_array.tz)):
+            raise ValueError('Curve with freq {} and tz {} cannot be appended to store for {} with freq {} and tz {}.'
+                             .format(curve_array.freq, curve_array.tz, name, meta['freq'], meta['tz']))
+        if meta['last_date_ordinal'] is not None and date_ordinal <= meta['last_date_ordinal']:
+            raise ValueError('Curves must be appended in increasing valuation date order. However {} is not after the '
+                             'last valuation date in the store for {}, which is {}.'
+                             .format(pd.Period(ordinal=date_ordinal, freq='D'), name,
+                                     pd.Period(ordinal=meta['last_date_ordinal'], freq='D')))
+
+    @staticmethod
+    def _read_meta(directory) -> tp.Optional[dict]:
+        try:
+            with open(os.path.join(directory, _META_FILE), 'r') as meta_file:
+                meta = json.load(meta_file)
+        except FileNotFoundError:
+            return None
+        if meta['format_version'] > _FORMAT_VERSION:
+            raise ValueError('Curve store has format version {}, which is not supported by this version of the curves '
+                             'package.'.format(meta['format_version']))
+        return meta
+
+    @staticmethod
+    def _write_meta(directory, meta) -> None:
+        temp_path = os.path.join(directory, _META_FILE + '.tmp')
+        with open(temp_path, 'w') as meta_file:
+            json.dump(meta, meta_file)
+            meta_file.flush()
+            os.fsync(meta_file.fileno())
+        os.replace(temp_path, os.path.join(directory, _META_FILE))
+
+    @staticmethod
+    @contextmanager
+    def _write_lock(directory):
+        with open(os.path.join(directory, _LOCK_FILE), 'a+b') as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            else:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+                else:
+                    lock_file.seek(0)
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def _values_file_name(generation) -> str:
+    return _VALUES_FILE if generation == 0 else '{}.{}'.format(_VALUES_FILE, generation)
+
+
+def _write_at(path, offset, array) -> None:
+    with open(path, 'r+b' if os.path.exists(path) else 'w+b') as file:
+        file.seek(offset)
+        file.write(array.tobytes())
+        file.flush()
+        os.fsync(file.fileno())
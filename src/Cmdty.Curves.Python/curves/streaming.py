@@ -0,0 +1,310 @@
+# Copyright(c) 2026 Jake Fowler
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use, 
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, 
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, 
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+""" Provides rebuilding of curves from a stream of contract price updates, coalescing bursts of updates."""
+
+import asyncio
+import functools
+import inspect
+import time
+import typing as tp
+from curves.hyperbolic_tension_spline import hyperbolic_tension_system
+from curves.parallel import EngineType, _resolve_engine, _validate_engine
+
+
+class PriceUpdate(tp.NamedTuple):
+    """
+    Update to the price of one contract used to build a curve.
+
+    Attributes:
+        curve_id (str): Identifier of the curve, which must be a key of the curve_specs argument of CurveStreamer.
+        period: The contract delivery period, in any of the forms accepted for the contracts argument of the curve
+            builders, e.g. pandas.Period, or 2-tuple of start and end. Must be hashable.
+        price (float, optional): The new contract price, or None to remove the contract.
+    """
+    curve_id: str
+    period: tp.Any
+    price: tp.Optional[float]
+
+
+class PublishedCurve(tp.NamedTuple):
+    """
+    Curve published by CurveStreamer to subscribers.
+
+    Attributes:
+        curve_id (str): Identifier of the curve.
+        version (int): Version number, starting at 1 and incremented for each curve published with the same curve_id.
+        curve: The curve, as returned by the engine.
+        contracts (tuple): The (period, price) contract tuples used to build the curve.
+        latency (float): Seconds from receipt of the earliest update incorporated in this version to publication.
+        price_only (bool): True if the curve was calculated by re-solving a previous build for new prices, rather than
+            by a full build.
+    """
+    curve_id: str
+    version: int
+    curve: tp.Any
+    contracts: tuple
+    latency: float
+    price_only: bool
+
+
+class StreamStats(tp.NamedTuple):
+    """
+    Counters for a single curve streamed by CurveStreamer.
+
+    Attributes:
+        updates (int): Number of price updates received.
+        coalesced (int): Number of price updates superseded, i.e. not resulting in their own published version, because
+            they were coalesced with later updates into a single rebuild.
+        full_builds (int): Number of curves published using a full build.
+        price_only_builds (int): Number of curves published by re-solving a previous build for new prices.
+        errors (int): Number of failed builds.
+        subscriber_errors (int): Number of exceptions raised by subscriber callbacks for published curves.
+        last_latency (float): Latency, in seconds, of the most recently published curve, or NaN if none published.
+        max_latency (float): Maximum latency of published curves, or NaN if none published.
+        total_latency (float): Sum of the latencies of published curves.
+    """
+    updates: int
+    coalesced: int
+    full_builds: int
+    price_only_builds: int
+    errors: int
+    subscriber_errors: int
+    last_latency: float
+    max_latency: float
+    total_latency: float
+
+    @property
+    def mean_latency(self) -> float:
+        num_published = self.full_builds + self.price_only_builds
+        return self.total_latency / num_published if num_published else float('nan')
+
+
+class CurveStreamer:
+    """
+    Maintains the current contract prices for one or more curves from a stream of price updates, and rebuilds and
+    publishes the curves, limiting the rebuild rate of each curve.
+
+    Updates which arrive while a curve is waiting to be rebuilt, or is being rebuilt, are coalesced into the next
+    rebuild, so that only the latest prices are built. For curves built by hyperbolic_tension_spline, if the contract
+    delivery periods haven't changed since the last build, the curve is calculated cheaply by re-solving the previous
+    build for new prices, using curves.hyperbolic_tension_system.
+
+    Args:
+        curve_specs (mapping): Mapping from curve identifier to a mapping of the keyword arguments used to build the
+            curve, other than contracts, e.g. {'NBP': {'freq': 'D', 'tension': 0.5}}. The optional item with key
+            'engine' specifies the build function, either as one of the names in curves.parallel.ENGINES, or a callable,
+            defaulting to 'hyperbolic_tension_spline'. The optional item with key 'contracts' gives the initial
+            contracts, as an iterable of (period, price) tuples.
+        max_rebuilds_per_second (float, optional): Maximum rate at which each curve is rebuilt. Defaults to 4.
+        executor (concurrent.futures.Executor, optional): Executor used to run builds, and to re-solve previous builds
+            for new prices. If omitted, the default executor of the event loop is used.
+    """
+
+    def __init__(self, curve_specs: tp.Mapping[str, tp.Mapping[str, tp.Any]], max_rebuilds_per_second: float = 4.0,
+                 executor=None):
+        if max_rebuilds_per_second <= 0:
+            raise ValueError('max_rebuilds_per_second must be positive, but value of {} has been provided.'
+                             .format(max_rebuilds_per_second))
+        self._min_rebuild_interval = 1.0 / max_rebuilds_per_second
+        self._executor = executor
+        self._states = {curve_id: _CurveState(spec) for curve_id, spec in curve_specs.items()}
+        self._subscribers = []
+
+    def subscribe(self, callback: tp.Callable[[PublishedCurve], tp.Any]) -> None:
+        """Registers a callback, which is called with each PublishedCurve. If the callback returns an awaitable, this is
+        awaited before the next curve is published."""
+        self._subscribers.append(callback)
+
+    def unsubscribe(self, callback: tp.Callable[[PublishedCurve], tp.Any]) -> None:
+        self._subscribers.remove(callback)
+
+    def latest(self, curve_id: str) -> tp.Optional[PublishedCurve]:
+        """Returns the most recently published version of a curve, or None if no version has been published."""
+        return self._states[curve_id].latest
+
+    def stats(self, curve_id: str) -> StreamStats:
+        """Returns a snapshot of the counters for a curve."""
+        return self._states[curve_id].stats()
+
+    def last_error(self, curve_id: str) -> tp.Optional[BaseException]:
+        """Returns the exception raised by the most recent failed build of a curve, or by a subscriber callback for it,
+        or None if neither has failed."""
+        return self._states[curve_id].last_error
+
+    def update(self, price_update: PriceUpdate) -> None:
+        """Applies a price update, scheduling a rebuild of the curve. Must be called from within the running event
+        loop, with run being awaited."""
+        state = self._states.get(price_update.curve_id)
+        if state is None:
+            raise ValueError("Price update received for curve_id '{}' which isn't in curve_specs."
+                             .format(price_update.curve_id))
+        if price_update.price is None:
+            state.contracts.pop(price_update.period, None)
+        else:
+            state.contracts[price_update.period] = float(price_update.price)
+        state.num_updates += 1
+        state.num_pending += 1
+        if state.first_pending_time is None:
+            state.first_pending_time = time.perf_counter()
+        if state.dirty is not None:
+            state.dirty.set()
+
+    async def run(self, price_updates: tp.AsyncIterable[PriceUpdate]) -> None:
+        """
+        Consumes price updates, rebuilding and publishing curves, until price_updates is exhausted, after which
+        pending rebuilds are completed before returning. Cancelling the task running this method stops all rebuilds.
+
+        Args:
+            price_updates (async iterable of PriceUpdate): The price updates.
+        """
+        for state in self._states.values():
+            state.dirty = asyncio.Event()
+            state.closing = False
+            if state.contracts and state.latest is None and state.first_pending_time is None:
+                state.first_pending_time = time.perf_counter()
+            if state.first_pending_time is not None:
+                state.dirty.set()
+        workers = [asyncio.ensure_future(self._curve_worker(curve_id, state))
+                   for curve_id, state in self._states.items()]
+        try:
+            async for price_update in price_updates:
+                self.update(price_update)
+            for state in self._states.values():
+                state.closing = True
+                state.dirty.set()
+            await asyncio.gather(*workers)
+        finally:
+            for worker in workers:
+                worker.cancel()
+
+    async def _curve_worker(self, curve_id, state) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            if state.first_pending_time is None:
+                if state.closing:
+                    return
+                state.dirty.clear()
+                await state.dirty.wait()
+                continue
+            delay = state.last_build_time + self._min_rebuild_interval - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            contracts = tuple(state.contracts.items())
+            first_pending_time = state.first_pending_time
+            state.num_coalesced += max(state.num_pending - 1, 0)
+            state.num_pending = 0
+            state.first_pending_time = None
+            state.last_build_time = loop.time()
+            try:
+                curve, price_only = await self._build(loop, state, contracts)
+            except Exception as e:
+                state.num_errors += 1
+                state.last_error = e
+                continue
+            latency = time.perf_counter() - first_pending_time
+            state.record_published(latency, price_only)
+            published = PublishedCurve(curve_id, state.version, curve, contracts, latency, price_only)
+            state.latest = published
+            for callback in list(self._subscribers):
+                # A failing subscriber mustn't stop the curve being rebuilt, or other subscribers being called
+                try:
+                    result = callback(published)
+                    if inspect.isawaitable(result):
+                        await result
+                except Exception as e:
+                    state.num_subscriber_errors += 1
+                    state.last_error = e
+
+    async def _build(self, loop, state, contracts):
+        periods = tuple(period for period, _ in contracts)
+        prices = [price for _, price in contracts]
+        if state.system is not None and state.system_periods == periods:
+            curve = await loop.run_in_executor(self._executor, functools.partial(state.system.solve, prices,
+                                                                                 output=state.output))
+            return curve, True
+        if state.engine == 'hyperbolic_tension_spline':
+            system = await loop.run_in_executor(self._executor, _build_hyperbolic_tension_system, contracts,
+                                                state.builder_kwargs)
+            state.system, state.system_periods = system, periods
+            curve = await loop.run_in_executor(self._executor, functools.partial(system.solve, output=state.output))
+            return curve, False
+        curve = await loop.run_in_executor(self._executor, _build_curve, state.engine, contracts, state.builder_kwargs)
+        return curve, False
+
+
+class _CurveState:
+
+    def __init__(self, spec):
+        spec = dict(spec)
+        self.engine = spec.pop('engine', 'hyperbolic_tension_spline')
+        _validate_engine(self.engine)
+        self.contracts = dict(spec.pop('contracts', ()))
+        if self.engine == 'hyperbolic_tension_spline':
+            if spec.get('return_spline_coeff'):
+                raise ValueError('return_spline_coeff is not supported for streamed hyperbolic tension spline curves.')
+            self.output = spec.pop('output', 'series')
+        else:
+            self.output = None
+        self.builder_kwargs = spec
+        self.dirty = None
+        self.closing = False
+        self.first_pending_time = None
+        self.last_build_time = float('-inf')
+        self.system = None
+        self.system_periods = None
+        self.latest = None
+        self.last_error = None
+        self.version = 0
+        self.num_updates = 0
+        self.num_pending = 0
+        self.num_coalesced = 0
+        self.num_full_builds = 0
+        self.num_price_only_builds = 0
+        self.num_errors = 0
+        self.num_subscriber_errors = 0
+        self.last_latency = float('nan')
+        self.max_latency = float('nan')
+        self.total_latency = 0.0
+
+    def record_published(self, latency, price_only) -> None:
+        self.version += 1
+        if price_only:
+            self.num_price_only_builds += 1
+        else:
+            self.num_full_builds += 1
+        self.last_latency = latency
+        self.max_latency = latency if self.version == 1 else max(self.max_latency, latency)
+        self.total_latency += latency
+
+    def stats(self) -> StreamStats:
+        return StreamStats(self.num_updates, self.num_coalesced, self.num_full_builds, self.num_price_only_builds,
+                           self.num_errors, self.num_subscriber_errors, self.last_latency, self.max_latency, self.total_latency)
+
+
+def _build_hyperbolic_tension_system(contracts, builder_kwargs):
+    return hyperbolic_tension_system(list(contracts), **builder_kwargs)
+
+
+def _build_curve(engine: EngineType, contracts, builder_kwargs):
+    return _resolve_engine(engine)(list(contracts), **builder_kwargs)
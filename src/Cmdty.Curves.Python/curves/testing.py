@@ -0,0 +1,357 @@
+# Copyright(c) 2026 Jake Fowler
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use, 
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, 
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, 
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+""" Seeded, deterministic generators of synthetic market data, for benchmarks, load and stress tests.
+
+Prices are derived from a synthetic "true" curve, so that the generated contracts, overlapping quotes and shaping
+constraints are consistent with each other, and curves built from them are well-posed. All generators taking a seed
+return identical output for identical arguments.
+"""
+
+import typing as tp
+from datetime import date, timedelta
+import numpy as np
+import pandas as pd
+from curves import contract_period as cp
+from curves._contracts import contract_pandas_periods
+
+PeriodSpec = tp.Union[pd.Period, tp.Tuple[pd.Period, pd.Period]]
+Contract = tp.Tuple[PeriodSpec, float]
+
+
+def synthetic_curve(start: tp.Union[pd.Period, date, str], end: tp.Union[pd.Period, date, str], freq: str = 'D',
+                    seed: int = 0, base_price: float = 50.0, seasonality: float = 0.2, weekend_discount: float = 0.0,
+                    peak_premium: float = 0.0, volatility: float = 0.01) -> pd.Series:
+    """
+    Creates a synthetic forward curve with annual seasonality, optional weekend and intraday shape, plus a seeded
+    random walk.
+
+    Args:
+        start (pandas.Period, date or str): First delivery period of the curve. Converted to a Period of freq.
+        end (pandas.Period, date or str): Last delivery period (inclusive) of the curve. If a Period of lower
+            granularity than freq, e.g. a month, the curve ends at its last period of freq.
+        freq (str, optional): Granularity of the curve, as pandas Offset Alias. Defaults to 'D'.
+        seed (int, optional): Seed of the random walk. Defaults to 0.
+        base_price (float, optional): Average price level. Defaults to 50.0.
+        seasonality (float, optional): Amplitude of the annual seasonality as a proportion of base_price, with the
+            highest prices in mid-January. Defaults to 0.2.
+        weekend_discount (float, optional): Proportional discount applied on Saturdays and Sundays, e.g. 0.15 for
+            power. Defaults to 0.0.
+        peak_premium (float, optional): Proportional premium applied to hours from 08:00 to 20:00, for sub-daily
+            freq. Defaults to 0.0.
+        volatility (float, optional): Standard deviation of the daily log change of the random walk. Defaults to 0.01.
+
+    Returns:
+        pandas.Series: The curve, with PeriodIndex of freq.
+    """
+    start_period = _first_period(start, freq)
+    end_period = _last_period(end, freq)
+    index = pd.period_range(start=start_period, end=end_period, freq=freq)
+    days = index.asfreq('D', 's') if freq != 'D' else index
+    day_of_year = days.dayofyear.to_numpy()
+    values = base_price * (1.0 + seasonality * np.cos(2.0 * np.pi * (day_of_year - 15) / 365.25))
+    values *= np.where(days.dayofweek.to_numpy() >= 5, 1.0 - weekend_discount, 1.0)
+    if peak_premium != 0.0 and _is_sub_daily(freq):
+        hours = index.hour.to_numpy()
+        values *= np.where((hours >= 8) & (hours < 20), 1.0 + peak_premium, 1.0)
+    # Random walk is daily, so curves of different freq with the same seed have the same daily shape
+    rng = np.random.default_rng(seed)
+    day_ordinals = days.asi8
+    day_offsets = day_ordinals - day_ordinals[0]
+    walk = np.cumsum(rng.normal(0.0, volatility, size=int(day_offsets[-1]) + 1))
+    values *= np.exp(walk[day_offsets])
+    return pd.Series(data=values, index=index)
+
+
+def contracts_from_curve(curve: pd.Series, periods: tp.Iterable[PeriodSpec], noise: float = 0.0,
+                         seed: int = 0) -> tp.List[Contract]:
+    """
+    Creates contracts priced as the average of a curve over their delivery periods, optionally with seeded noise.
+
+    Args:
+        curve (pandas.Series): Curve with PeriodIndex, such as created by synthetic_curve.
+        periods (iterable): Contract delivery periods, each being a pandas.Period or 2-tuple of start and end.
+        noise (float, optional): Standard deviation of proportional noise added to each price, to simulate quotes
+            which are inconsistent with each other. Defaults to 0.0.
+        seed (int, optional): Seed of the noise. Defaults to 0.
+
+    Returns:
+        list of (period, price) tuples: One contract for each element of periods, in the same order.
+    """
+    freq = curve.index.freqstr
+    step = curve.index.freq.n
+    first_ordinal = curve.index[0].ordinal
+    cumulative = np.concatenate(([0.0], np.cumsum(curve.to_numpy())))
+    rng = np.random.default_rng(seed)
+    contracts = []
+    for period in periods:
+        start, end = contract_pandas_periods(period, freq)
+        start_idx = (start.ordinal - first_ordinal) // step
+        end_idx = (end.ordinal - first_ordinal) // step + 1
+        if start_idx < 0 or end_idx > len(curve):
+            raise ValueError('Contract period {} is outside of the curve, which spans {} to {}.'
+                             .format(period, curve.index[0], curve.index[-1]))
+        price = (cumulative[end_idx] - cumulative[start_idx]) / (end_idx - start_idx)
+        if noise > 0.0:
+            price *= 1.0 + rng.normal(0.0, noise)
+        contracts.append((period, float(price)))
+    return contracts
+
+
+def power_contracts(valuation_date: tp.Union[date, pd.Period, str], seed: int = 0, day_ahead: bool = True,
+                    week_ahead: bool = True, num_months: int = 24, num_quarters: int = 8, num_seasons: int = 4,
+                    overlapping: bool = False, base_price: float = 60.0, freq: str = 'D') -> tp.List[Contract]:
+    """
+    Creates a power contract set, consisting of day-ahead, week-ahead, monthly, quarterly and seasonal contracts.
+
+    Args:
+        valuation_date (date, pandas.Period or str): Valuation date, after which the day-ahead contract delivers.
+        seed (int, optional): Seed of the synthetic curve from which prices are derived. Defaults to 0.
+        day_ahead (bool, optional): Whether to include the day-ahead contract. Defaults to True.
+        week_ahead (bool, optional): Whether to include the week-ahead contract, being the next Monday to Sunday week
+            after the day-ahead. Defaults to True.
+        num_months (int, optional): Number of monthly contracts, starting with the month after the valuation date.
+            Defaults to 24.
+        num_quarters (int, optional): Number of quarterly contracts. Defaults to 8.
+        num_seasons (int, optional): Number of summer and winter seasonal contracts. Defaults to 4.
+        overlapping (bool, optional): If False, the default, contracts don't overlap, with quarters starting after the
+            last month, seasons starting after the last quarter, and the week-ahead omitted if it overlaps the front
+            month. If True, quarters and seasons start at the first quarter and season after the valuation month, so
+            overlap the monthly contracts, as in the traded market, and the week-ahead is always included.
+        base_price (float, optional): Average price level. Defaults to 60.0.
+        freq (str, optional): Granularity of the curve to be built from the contracts, as pandas Offset Alias, which
+            is the freq of the start and end of the week-ahead. Defaults to 'D'.
+
+    Returns:
+        list of (period, price) tuples: Contracts ordered by product, with pandas.Period for standard products and
+        2-tuples of pandas.Period start and end, with freq equal to the freq parameter, for the week-ahead.
+    """
+    return _contract_set(valuation_date, seed, day_ahead, week_ahead, False, num_months, num_quarters, num_seasons,
+                         overlapping, freq, dict(base_price=base_price, weekend_discount=0.15, seasonality=0.15))
+
+
+def gas_contracts(valuation_date: tp.Union[date, pd.Period, str], seed: int = 0, day_ahead: bool = True,
+                  balance_of_month: bool = True, num_months: int = 12, num_quarters: int = 4, num_seasons: int = 6,
+                  overlapping: bool = False, base_price: float = 30.0, freq: str = 'D') -> tp.List[Contract]:
+    """
+    Creates a gas contract set, for building daily curves, consisting of day-ahead, balance-of-month, monthly,
+    quarterly and seasonal contracts.
+
+    Args:
+        valuation_date (date, pandas.Period or str): Valuation date, after which the day-ahead contract delivers.
+        seed (int, optional): Seed of the synthetic curve from which prices are derived. Defaults to 0.
+        day_ahead (bool, optional): Whether to include the day-ahead contract. Defaults to True.
+        balance_of_month (bool, optional): Whether to include the balance-of-month contract, delivering from the day
+            after the day-ahead to the end of the month. Omitted if the day-ahead is the last day of the month.
+            Defaults to True.
+        num_months (int, optional): Number of monthly contracts, starting with the month after the day-ahead's month.
+            Defaults to 12.
+        num_quarters (int, optional): Number of quarterly contracts. Defaults to 4.
+        num_seasons (int, optional): Number of summer and winter seasonal contracts. Defaults to 6.
+        overlapping (bool, optional): As for power_contracts. Defaults to False.
+        base_price (float, optional): Average price level. Defaults to 30.0.
+        freq (str, optional): Granularity of the curve to be built from the contracts, as pandas Offset Alias, which
+            is the freq of the start and end of the balance-of-month. Defaults to 'D'.
+
+    Returns:
+        list of (period, price) tuples: Contracts ordered by product, with pandas.Period for standard products and
+        2-tuples of pandas.Period start and end, with freq equal to the freq parameter, for the balance-of-month.
+    """
+    return _contract_set(valuation_date, seed, day_ahead, False, balance_of_month, num_months, num_quarters,
+                         num_seasons, overlapping, freq, dict(base_price=base_price, seasonality=0.3))
+
+
+def redundant_quotes(contracts: tp.Sequence[Contract], curve: pd.Series, num_duplicates: int = 0,
+                     aggregate_months: bool = False, noise: float = 0.0, seed: int = 0) -> tp.List[Contract]:
+    """
+    Adds overlapping and duplicate quotes to a contract set, e.g. to test bootstrap_contracts with allow_redundancy.
+
+    Args:
+        contracts (sequence): The contract set, such as created by power_contracts.
+        curve (pandas.Series): The curve the contracts were priced from, used to price the added quotes.
+        num_duplicates (int, optional): Number of randomly chosen contracts which are quoted a second time. Defaults
+            to 0.
+        aggregate_months (bool, optional): Whether to add a quarterly quote for each calendar quarter fully covered by
+            monthly contracts. Defaults to False.
+        noise (float, optional): Standard deviation of proportional noise on the added quotes. With the default of 0.0
+            the added quotes are exactly consistent with the contracts.
+        seed (int, optional): Seed of the choice of duplicates and the noise. Defaults to 0.
+
+    Returns:
+        list of (period, price) tuples: The contracts followed by the added quotes.
+    """
+    rng = np.random.default_rng(seed)
+    added_periods = []
+    if aggregate_months:
+        months = {period for period, _ in contracts if isinstance(period, pd.Period) and period.freqstr == 'M'}
+        quarters = sorted({month.asfreq('Q') for month in months})
+        added_periods.extend(quarter for quarter in quarters
+                             if all(month in months for month in pd.period_range(quarter.asfreq('M', 's'),
+                                                                                   quarter.asfreq('M', 'e'),
+                                                                                   freq='M')))
+    if num_duplicates > 0:
+        duplicate_idx = rng.choice(len(contracts), size=min(num_duplicates, len(contracts)), replace=False)
+        added_periods.extend(contracts[idx][0] for idx in sorted(duplicate_idx))
+    noise_seed = int(rng.integers(0, 2**31))
+    return list(contracts) + contracts_from_curve(curve, added_periods, noise=noise, seed=noise_seed)
+
+
+def shaping_ratios(curve: pd.Series, num_constraints: int, seed: int = 0) -> tp.List[tp.Tuple[pd.Period, pd.Period, float]]:
+    """
+    Creates ratio constraints, consistent with a curve, between randomly chosen pairs of consecutive periods, e.g.
+    hourly shaping ratios for an hourly curve.
+
+    Returns:
+        list of (numerator period, denominator period, ratio) tuples: Suitable for the shaping_ratios argument of the
+        curve builders, with the periods at the granularity of the curve.
+    """
+    return [(curve.index[idx + 1], curve.index[idx], float(curve.iloc[idx + 1] / curve.iloc[idx]))
+            for idx in _constraint_positions(curve, num_constraints, seed)]
+
+
+def shaping_spreads(curve: pd.Series, num_constraints: int, seed: int = 0) -> tp.List[tp.Tuple[pd.Period, pd.Period, float]]:
+    """
+    Creates spread constraints, consistent with a curve, between randomly chosen pairs of consecutive periods.
+
+    Returns:
+        list of (period 1, period 2, spread) tuples: Suitable for the shaping_spreads argument of the curve builders,
+        with the periods at the granularity of the curve, and spread being the price of period 1 minus that of period 2.
+    """
+    return [(curve.index[idx + 1], curve.index[idx], float(curve.iloc[idx + 1] - curve.iloc[idx]))
+            for idx in _constraint_positions(curve, num_constraints, seed)]
+
+
+def holiday_calendar(start_year: int, end_year: int, num_random: int = 0, seed: int = 0) -> tp.List[date]:
+    """
+    Creates a holiday calendar with the English bank holidays which fall on fixed dates or are determined by Easter,
+    plus optional seeded random weekday holidays.
+
+    Args:
+        start_year (int): First year of the calendar.
+        end_year (int): Last year (inclusive) of the calendar.
+        num_random (int, optional): Number of additional holidays per year, on randomly chosen weekdays. Defaults to 0.
+        seed (int, optional): Seed of the random holidays. Defaults to 0.
+
+    Returns:
+        list of date: Sorted holidays, suitable for curves.weighting.num_business_days.
+    """
+    rng = np.random.default_rng(seed)
+    holidays = set()
+    for year in range(start_year, end_year + 1):
+        easter = _easter_sunday(year)
+        holidays.update([date(year, 1, 1), easter - timedelta(days=2), easter + timedelta(days=1),
+                         _first_weekday_on_or_after(date(year, 5, 1), 0),
+                         _first_weekday_on_or_after(date(year, 5, 25), 0),
+                         _first_weekday_on_or_after(date(year, 8, 25), 0),
+                         date(year, 12, 25), date(year, 12, 26)])
+        weekdays = [day for day in pd.date_range(date(year, 1, 1), date(year, 12, 31), freq='B').date
+                    if day not in holidays]
+        holidays.update(weekdays[idx] for idx in rng.choice(len(weekdays), size=num_random, replace=False))
+    return sorted(holidays)
+
+
+def _contract_set(valuation_date, seed, day_ahead, week_ahead, balance_of_month, num_months, num_quarters,
+                  num_seasons, overlapping, freq, curve_kwargs) -> tp.List[Contract]:
+    valuation_date = pd.Period(valuation_date, freq='D')
+    day_ahead_date = valuation_date + 1
+    front_month = day_ahead_date.asfreq('M') + 1
+    months = cp.month_strip(front_month, num_months)
+    if overlapping:
+        first_quarter = front_month.asfreq('Q') + (0 if front_month.month in (1, 4, 7, 10) else 1)
+    else:
+        first_quarter = (front_month + num_months).asfreq('Q')
+        first_quarter += 0 if (front_month + num_months).month in (1, 4, 7, 10) else 1
+    quarters = pd.period_range(start=first_quarter, periods=num_quarters, freq='Q')
+    next_season_start = first_quarter if overlapping else first_quarter + num_quarters
+    seasons = cp.season_strip(_first_season_on_or_after(next_season_start), num_seasons)
+
+    periods = []
+    if day_ahead:
+        periods.append(day_ahead_date)
+    if week_ahead:
+        week_start = day_ahead_date + (7 - day_ahead_date.dayofweek)
+        week_end = week_start + 6
+        if overlapping or week_end < front_month.asfreq('D', 's'):
+            periods.append(_day_range(week_start, week_end, freq))
+    if balance_of_month:
+        month_end = day_ahead_date.asfreq('M').asfreq('D', 'e')
+        if day_ahead_date < month_end:
+            periods.append(_day_range(day_ahead_date + 1, month_end, freq))
+    periods.extend(months)
+    periods.extend(quarters)
+    periods.extend(seasons)
+
+    last_day = max(contract_pandas_periods(period, 'D')[1] for period in periods)
+    curve = synthetic_curve(day_ahead_date, last_day, 'D', seed=seed, **curve_kwargs)
+    return contracts_from_curve(curve, periods)
+
+
+def _day_range(first_day, last_day, freq) -> tp.Tuple[pd.Period, pd.Period]:
+    """Start and end, with granularity freq, of the delivery period covering whole days from first_day to last_day."""
+    return first_day.asfreq(freq, 's'), contract_pandas_periods(last_day, freq)[1]
+
+
+def _first_season_on_or_after(quarter: pd.Period) -> pd.Period:
+    """Summer starts in Q2 and winter in Q4."""
+    quarter += quarter.quarter % 2  # Q1 and Q3 move to the next quarter
+    return pd.Period(year=quarter.year, quarter=quarter.quarter, freq='2Q')
+
+
+def _constraint_positions(curve, num_constraints, seed) -> np.ndarray:
+    if num_constraints > len(curve) - 1:
+        raise ValueError('num_constraints must be less than the curve length, but {} was specified for a curve of '
+                         'length {}.'.format(num_constraints, len(curve)))
+    rng = np.random.default_rng(seed)
+    return np.sort(rng.choice(len(curve) - 1, size=num_constraints, replace=False))
+
+
+def _first_period(value, freq) -> pd.Period:
+    return value.asfreq(freq, 's') if isinstance(value, pd.Period) else pd.Period(value, freq=freq)
+
+
+def _last_period(value, freq) -> pd.Period:
+    return contract_pandas_periods(value, freq)[1] if isinstance(value, pd.Period) else pd.Period(value, freq=freq)
+
+
+def _is_sub_daily(freq) -> bool:
+    offset = pd.tseries.frequencies.to_offset(freq)
+    return isinstance(offset, pd.offsets.Tick) and offset.nanos < pd.Timedelta(days=1).value
+
+
+def _easter_sunday(year) -> date:
+    """Anonymous Gregorian algorithm."""
+    a = year % 19
+    b, c = divmod(year, 100)
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    month, day = divmod(h + l - 7 * m + 114, 31)
+    return date(year, month, day + 1)
+
+
+def _first_weekday_on_or_after(day, weekday) -> date:
+    return day + timedelta(days=(weekday - day.weekday()) % 7)
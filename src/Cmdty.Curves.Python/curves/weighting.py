@@ -22,9 +22,146 @@
 # OTHER DEALINGS IN THE SOFTWARE.
 
 """ Provides functions to use as the average_weight parameter to curve construction functions."""
+import numpy as np
 import pandas as pd
 from datetime import date, datetime
-from typing import Callable, Union, Iterable
+from typing import Callable, Union, Iterable, Optional
+
+_NANOS_PER_DAY = 86_400_000_000_000
+
+
+class NumBusinessDays:
+    """
+    Callable which returns the number of business days in a pandas.Period. Instances are picklable, comparable and
+    hashable, so can be sent to worker processes and used as part of cache keys.
+
+    Args:
+        holidays (iterable): Collection of date-like objects which represent the holidays for the business day count.
+    """
+    __slots__ = ('_holidays',)
+
+    def __init__(self, holidays: Iterable[Union[date, datetime, pd.Timestamp, pd.Period, str]] = ()):
+        self._holidays = tuple(sorted({_to_date_str(holiday) for holiday in holidays}))
+
+    @property
+    def holidays(self) -> tuple:
+        """tuple of str: The holiday dates, in ISO format, sorted ascending."""
+        return self._holidays
+
+    def __call__(self, period: pd.Period) -> float:
+        start_day = np.datetime64(period.asfreq('D', 's').to_timestamp().date(), 'D')
+        end_day = np.datetime64(period.asfreq('D', 'e').to_timestamp().date(), 'D')
+        return float(np.busday_count(start_day, end_day + 1, holidays=self._holiday_array()))
+
+    def evaluate(self, index: pd.Index) -> np.ndarray:
+        """
+        Calculates the number of business days in each element of an index.
+
+        Args:
+            index (pandas.PeriodIndex): The periods to count the business days in.
+
+        Returns:
+            numpy.ndarray: Number of business days in each element of index, as float64.
+        """
+        if not isinstance(index, pd.PeriodIndex):
+            return _evaluate_elementwise(self, index)
+        start_days = index.asfreq('D', 's').asi8.astype('datetime64[D]')
+        end_days = index.asfreq('D', 'e').asi8.astype('datetime64[D]')
+        return np.busday_count(start_days, end_days + 1, holidays=self._holiday_array()).astype(np.float64)
+
+    def _holiday_array(self) -> np.ndarray:
+        return np.array(self._holidays, dtype='datetime64[D]')
+
+    def __reduce__(self):
+        return NumBusinessDays, (self._holidays,)
+
+    def __eq__(self, other):
+        return isinstance(other, NumBusinessDays) and self._holidays == other._holidays
+
+    def __hash__(self):
+        return hash((NumBusinessDays, self._holidays))
+
+    def __repr__(self):
+        return 'NumBusinessDays(holidays={!r})'.format(self._holidays)
+
+
+class NumPeriods:
+    """
+    Callable which returns the number of occurrences of pandas.Period of a specific freq in an instance of another
+    pandas.Period. Instances are picklable, comparable and hashable, so can be sent to worker processes and used as part
+    of cache keys.
+
+    Args:
+        freq (str): Pandas offset alias string for the Period being counted.
+        tz (str, optional): Time zone used in calculating the number of periods. If omitted, Periods can be assumed to
+            be in UTC with no clock changes. Otherwise periods of freq which don't exist because of clock changes are
+            counted zero times, and periods which occur twice are counted twice.
+    """
+    __slots__ = ('_freq', '_tz')
+
+    def __init__(self, freq: str, tz: Optional[str] = None):
+        self._freq = freq
+        self._tz = None if tz is None else str(tz)
+
+    @property
+    def freq(self) -> str:
+        return self._freq
+
+    @property
+    def tz(self) -> Optional[str]:
+        return self._tz
+
+    def __call__(self, period: pd.Period) -> float:
+        start = period.asfreq(self._freq, 's').to_timestamp()
+        end = period.asfreq(self._freq, 'e').to_timestamp()
+        date_range = pd.date_range(start=start, end=end, freq=self._freq)
+        if self._tz is None:
+            return float(len(date_range))
+        # Periods which don't exist because of clock changes are counted zero times, and duplicated periods twice
+        first_occurrences = date_range.tz_localize(self._tz, ambiguous=np.ones(len(date_range), dtype=bool),
+                                                   nonexistent='NaT')
+        last_occurrences = date_range.tz_localize(self._tz, ambiguous=np.zeros(len(date_range), dtype=bool),
+                                                  nonexistent='NaT')
+        exists = ~first_occurrences.isna()
+        duplicated = exists & (first_occurrences != last_occurrences)
+        return float(exists.sum() + duplicated.sum())
+
+    def evaluate(self, index: pd.Index) -> np.ndarray:
+        """
+        Calculates the number of periods of freq in each element of an index.
+
+        Args:
+            index (pandas.PeriodIndex): The periods to count the number of periods of freq in.
+
+        Returns:
+            numpy.ndarray: Number of periods in each element of index, as float64.
+        """
+        if not isinstance(index, pd.PeriodIndex):
+            return _evaluate_elementwise(self, index)
+        starts = index.asfreq(self._freq, 's')
+        if self._tz is None or not isinstance(starts.freq, pd.offsets.Tick) or starts.freq.nanos >= _NANOS_PER_DAY:
+            return ((index.asfreq(self._freq, 'e').asi8 - starts.asi8) // starts.freq.n + 1).astype(np.float64)
+        # Count by elapsed time between localised start and end, so clock changes are accounted for
+        next_starts = (index + 1).asfreq(self._freq, 's')
+        local_starts = starts.to_timestamp().tz_localize(self._tz, ambiguous='NaT', nonexistent='NaT')
+        local_next_starts = next_starts.to_timestamp().tz_localize(self._tz, ambiguous='NaT', nonexistent='NaT')
+        counts = ((local_next_starts - local_starts) / pd.Timedelta(starts.freq.nanos, 'ns')).to_numpy(dtype=np.float64)
+        # Boundaries falling on ambiguous or non-existent times are counted individually
+        for i in np.flatnonzero(np.isnan(counts)):
+            counts[i] = self(index[i])
+        return counts
+
+    def __reduce__(self):
+        return NumPeriods, (self._freq, self._tz)
+
+    def __eq__(self, other):
+        return isinstance(other, NumPeriods) and self._freq == other._freq and self._tz == other._tz
+
+    def __hash__(self):
+        return hash((NumPeriods, self._freq, self._tz))
+
+    def __repr__(self):
+        return 'NumPeriods(freq={!r}, tz={!r})'.format(self._freq, self._tz)
 
 
 def num_business_days(holidays: Iterable[Union[date, datetime, pd.Timestamp, pd.Period]]) -> Callable[[pd.Period], float]:
@@ -35,31 +172,23 @@ def num_business_days(holidays: Iterable[Union[date, datetime, pd.Timestamp, pd.
         holidays (iterable): Collection of date-like objects which represent the holidays for the resulting business day count.
 
     Returns:
-        callable: Function accepting a single parameter of type pandas.Period and returning the number of business days within this
+        NumBusinessDays: Callable accepting a single parameter of type pandas.Period and returning the number of business days within this
             period as a float.
     """
-    def num_business_days_func(period):
-        start_day = period.asfreq('D', 's').to_timestamp()
-        end_day = period.asfreq('D', 'e').to_timestamp()
-        bday_range = pd.bdate_range(start=start_day, end=end_day, freq='C', holidays=holidays)
-        return float(len(bday_range))
-    return num_business_days_func
+    return NumBusinessDays(holidays)
 
 
-# TODO make more efficient by not calling into num_business_days?
 def num_weekdays() -> Callable[[pd.Period], float]:
     """
     Creates a function which returns the number of weekdays in a pandas.Period, typically for use as the average_weight parameter for other functions.
 
     Returns:
-        callable: Function accepting a single parameter of type pandas.Period and returning the number of weekdays within this
+        NumBusinessDays: Callable accepting a single parameter of type pandas.Period and returning the number of weekdays within this
             period as a float.
     """
-    return num_business_days([])
+    return NumBusinessDays([])
 
 
-# TODO return zero for non-existent period, and 2 times for duplicated periods
-# TODO example in docstring
 def num_periods(freq: str, tz: str = None) -> Callable[[pd.Period], float]:
     """
     Creates a function which returns the number of occurrences of pandas.Period of a specific freq in an instance of another pandas.Period.
@@ -70,13 +199,17 @@ def num_periods(freq: str, tz: str = None) -> Callable[[pd.Period], float]:
             UTC with no clock changes.
 
     Returns:
-        callable: Function accepting a single parameter of type pandas.Period, returning the number of pandas.Period instances, with
+        NumPeriods: Callable accepting a single parameter of type pandas.Period, returning the number of pandas.Period instances, with
             offset specified by the freq parameter, which fit within the parameter Period, as a float.
     """
-    def num_periods_func(period):
-        start = period.asfreq(freq, 's').to_timestamp()
-        end = period.asfreq(freq, 'e').to_timestamp()
-        date_range = pd.date_range(start=start, end=end, freq=freq, tz=tz)
-        return float(len(date_range))
-    return num_periods_func
+    return NumPeriods(freq, tz)
+
+
+def _to_date_str(date_like) -> str:
+    if isinstance(date_like, pd.Period):
+        date_like = date_like.start_time
+    return pd.Timestamp(date_like).strftime('%Y-%m-%d')
+
 
+def _evaluate_elementwise(func, index) -> np.ndarray:
+    return np.fromiter((func(p) for p in index), dtype=np.float64, count=len(index))
@@ -41,7 +41,7 @@
     long_description=long_description,
     long_description_content_type='text/markdown',
     url='https://github.com/cmdty/curves',
-    packages=setuptools.find_packages(),
+    packages=setuptools.find_packages(exclude=['benchmarks', 'benchmarks.*', 'tests', 'tests.*']),
     keywords = 'commodities trading curves oil gas power quantitative finance',
     classifiers=[
         'Development Status :: 5 - Production/Stable',
@@ -73,5 +73,6 @@
                         'lib/*.dll',
                         'lib/*.pdb'
                     ]},
-    include_package_data=True
+    include_package_data=True,
+    entry_points={'console_scripts': ['curves=curves.__main__:main']}
 )
\ No newline at end of file
@@ -22,6 +22,10 @@
 # OTHER DEALINGS IN THE SOFTWARE.
 
 import pandas as pd
+from curves import contract_period as cp
+
+CONTRACTS = [(cp.jan(2020), 21.3), (cp.feb(2020), 22.1), (cp.mar(2020), 20.5), (cp.q_2(2020), 19.8),
+             (cp.q_3(2020), 18.2)]
 
 
 def _num_calendar_days(period):
@@ -22,8 +22,10 @@
 # OTHER DEALINGS IN THE SOFTWARE.
 
 import unittest
+import pickle
 from curves import adjustments
 import pandas as pd
+import numpy as np
 
 
 class TestAdjustments(unittest.TestCase):
@@ -50,6 +52,21 @@ def test_dayofweek_value_not_specified_default_returned(self):
         self.assertEqual(default_value, dayofweek_adjust(pd.Period('2019-05-18', freq='D')))  # saturday
         self.assertEqual(default_value, dayofweek_adjust(pd.Period('2019-05-19', freq='D')))  # sunday
 
+    def test_dayofweek_evaluate_same_as_call(self):
+        dayofweek_adjust = adjustments.dayofweek(0.5, monday=3.4, saturday=0.2, sunday=0.1)
+        for index in (pd.period_range('2019-05-01', '2019-06-30', freq='D'),
+                      pd.date_range('2019-10-26', '2019-10-28', freq='h', tz='Europe/London')):
+            expected = np.array([dayofweek_adjust(p) for p in index])
+            np.testing.assert_array_equal(expected, dayofweek_adjust.evaluate(index))
+
+    def test_dayofweek_pickle_round_trip_equal_with_same_hash(self):
+        dayofweek_adjust = adjustments.dayofweek(0.5, monday=3.4, sunday=0.1)
+        unpickled = pickle.loads(pickle.dumps(dayofweek_adjust))
+        self.assertEqual(dayofweek_adjust, unpickled)
+        self.assertEqual(hash(dayofweek_adjust), hash(unpickled))
+        self.assertEqual(repr(dayofweek_adjust), repr(unpickled))
+        self.assertNotEqual(dayofweek_adjust, adjustments.dayofweek(0.5, monday=3.4))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,122 @@
+# Copyright(c) 2026 Jake Fowler
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use, 
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, 
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, 
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+import unittest
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import pandas as pd
+from curves import hyperbolic_tension_spline
+from curves import contract_period as cp
+from curves import aio
+
+_engine_calls = []
+_engine_calls_lock = threading.Lock()
+_release_event = threading.Event()
+
+
+def _recording_engine(label, wait_for_release=False, offset=0.0):
+    with _engine_calls_lock:
+        _engine_calls.append(label)
+    if wait_for_release:
+        _release_event.wait(5.0)
+    return label
+
+
+class TestAio(unittest.TestCase):
+
+    contracts = [(cp.month(2023, 1), 50.0), (cp.month(2023, 2), 55.0), (cp.month(2023, 3), 48.0)]
+
+    def setUp(self):
+        _engine_calls.clear()
+        _release_event.clear()
+
+    def test_hyperbolic_tension_spline_same_as_synchronous(self):
+        expected_curve = hyperbolic_tension_spline(self.contracts, freq='D', tension=0.5)
+        curve = asyncio.run(aio.hyperbolic_tension_spline(self.contracts, freq='D', tension=0.5))
+        pd.testing.assert_series_equal(expected_curve, curve)
+
+    def test_identical_in_flight_requests_built_once(self):
+        builder = aio.AsyncCurveBuilder(ThreadPoolExecutor(max_workers=2))
+
+        async def run():
+            task1 = asyncio.ensure_future(builder.build(_recording_engine, 'a', wait_for_release=True))
+            task2 = asyncio.ensure_future(builder.build(_recording_engine, 'a', wait_for_release=True))
+            await asyncio.sleep(0.05)
+            self.assertEqual(1, builder.num_in_flight)
+            _release_event.set()
+            return await asyncio.gather(task1, task2)
+
+        self.assertEqual(['a', 'a'], asyncio.run(run()))
+        self.assertEqual(['a'], _engine_calls)
+        self.assertEqual(0, builder.num_in_flight)
+
+    def test_requests_with_unpicklable_arguments_not_deduplicated(self):
+        builder = aio.AsyncCurveBuilder()
+
+        async def run():
+            return await asyncio.gather(builder.build(_recording_engine, 'a', offset=lambda x: x),
+                                        builder.build(_recording_engine, 'a', offset=lambda x: x))
+
+        asyncio.run(run())
+        self.assertEqual(['a', 'a'], _engine_calls)
+
+    def test_cancelled_request_not_started_is_not_built(self):
+        builder = aio.AsyncCurveBuilder(ThreadPoolExecutor(max_workers=1))
+
+        async def run():
+            blocking_task = asyncio.ensure_future(builder.build(_recording_engine, 'a', wait_for_release=True))
+            queued_task = asyncio.ensure_future(builder.build(_recording_engine, 'b'))
+            await asyncio.sleep(0.05)
+            queued_task.cancel()
+            await asyncio.sleep(0.01)
+            _release_event.set()
+            with self.assertRaises(asyncio.CancelledError):
+                await queued_task
+            return await blocking_task
+
+        self.assertEqual('a', asyncio.run(run()))
+        self.assertEqual(['a'], _engine_calls)
+        self.assertEqual(0, builder.num_in_flight)
+
+    def test_cancelling_one_waiter_does_not_cancel_shared_build(self):
+        builder = aio.AsyncCurveBuilder(ThreadPoolExecutor(max_workers=1))
+
+        async def run():
+            task1 = asyncio.ensure_future(builder.build(_recording_engine, 'a', wait_for_release=True))
+            task2 = asyncio.ensure_future(builder.build(_recording_engine, 'a', wait_for_release=True))
+            await asyncio.sleep(0.05)
+            task1.cancel()
+            await asyncio.sleep(0.01)
+            _release_event.set()
+            return await task2
+
+        self.assertEqual('a', asyncio.run(run()))
+
+    def test_invalid_engine_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            asyncio.run(aio.AsyncCurveBuilder().build('not_an_engine'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+# Copyright(c) 2026 Jake Fowler
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use, 
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, 
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, 
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+import unittest
+import pickle
+import pandas as pd
+import numpy as np
+from curves import hyperbolic_tension_spline, CurveArray, to_arrow
+from curves import contract_period as cp
+from curves.arrays import curve_array_from_series, from_arrow
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+
+class TestArrays(unittest.TestCase):
+    contracts = [
+        (cp.q_1(2024), 21.3),
+        (cp.q_2(2024), 19.8),
+        (cp.summer(2024), 20.1),
+        (cp.winter(2024), 25.6)
+    ]
+
+    def test_numpy_output_same_values_and_index_as_series(self):
+        for freq, time_zone in (('D', None), ('H', 'Europe/London')):
+            with self.subTest(freq=freq, time_zone=time_zone):
+                series_curve, series_coeffs = hyperbolic_tension_spline(self.contracts, freq=freq, tension=0.5,
+                                                                        time_zone=time_zone, return_spline_coeff=True)
+                array_curve, array_coeffs = hyperbolic_tension_spline(self.contracts, freq=freq, tension=0.5,
+                                                                      time_zone=time_zone, return_spline_coeff=True,
+                                                                      output='numpy')
+                self.assertIsInstance(array_curve, CurveArray)
+                pd.testing.assert_series_equal(series_curve, array_curve.to_series())
+                for column in ('t', 'y', 'z', 'tension'):
+                    np.testing.assert_array_equal(series_coeffs[column].to_numpy(), array_coeffs[column])
+                self.assertEqual(len(series_coeffs), len(array_coeffs['knot']))
+
+    def test_invalid_output_raises_value_error(self):
+        self.assertRaises(ValueError, hyperbolic_tension_spline, self.contracts, freq='D', tension=0.5, output='list')
+
+    def test_curve_array_from_series_round_trip(self):
+        curve = pd.Series(data=[1.0, 2.0, 3.0], index=pd.period_range(start='2024-01-01', periods=3, freq='15min'))
+        curve_array = curve_array_from_series(curve)
+        self.assertEqual(curve.index[0].ordinal, curve_array.start_ordinal)
+        pd.testing.assert_series_equal(curve, curve_array.to_series())
+
+    def test_curve_array_not_mistaken_for_result_tuple(self):
+        curve_array = CurveArray(np.array([1.0, 2.0]), pd.Period('2024-03-31', freq='D').ordinal, 'D', 'Europe/Berlin')
+        self.assertNotIsInstance(curve_array, tuple)
+        round_trip_curve = pickle.loads(pickle.dumps(curve_array))
+        np.testing.assert_array_equal(curve_array.values, round_trip_curve.values)
+        self.assertEqual((curve_array.start_ordinal, 'D', 'Europe/Berlin'),
+                         (round_trip_curve.start_ordinal, round_trip_curve.freq, round_trip_curve.tz))
+
+    @unittest.skipIf(pyarrow is None, 'pyarrow not installed')
+    def test_to_arrow_does_not_copy_values(self):
+        curve = hyperbolic_tension_spline(self.contracts, freq='D', tension=0.5, output='numpy')
+        table = to_arrow(curve)
+        arrow_values = table.column('value').chunk(0).to_numpy(zero_copy_only=True)
+        self.assertTrue(np.shares_memory(curve.values, arrow_values))
+        round_trip_curve = from_arrow(table)
+        self.assertEqual(curve.start_ordinal, round_trip_curve.start_ordinal)
+        self.assertEqual(curve.freq, round_trip_curve.freq)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,143 @@
+# Copyright(c) 2026 Jake Fowler
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use, 
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, 
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, 
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+import unittest
+import os
+import tempfile
+import numpy as np
+import pandas as pd
+from curves import contract_period as cp
+from curves import hyperbolic_tension_spline
+from curves.backfill import backfill
+from curves.store import CurveStore
+
+_builder_kwargs = {'freq': 'D', 'tension': 1.0}
+
+
+class _InterruptedError(Exception):
+    pass
+
+
+def _contracts(valuation_date):
+    """Front month contract rolls off at the start of each month, so the contract set changes monthly."""
+    front_month = (valuation_date + 1).asfreq('M')
+    offset = valuation_date.ordinal % 7
+    return [(front_month + i, 10.0 + i + 0.1 * offset) for i in range(3)]
+
+
+class _ContractSource:
+
+    def __init__(self, fail_on=None):
+        self.fail_on = None if fail_on is None else pd.Period(fail_on, freq='D')
+        self.calls = []
+
+    def __call__(self, valuation_date):
+        if valuation_date == self.fail_on:
+            raise _InterruptedError()
+        self.calls.append(valuation_date)
+        if valuation_date.dayofweek >= 5:
+            return None
+        return _contracts(valuation_date)
+
+
+class TestBackfill(unittest.TestCase):
+
+    def setUp(self):
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.store = CurveStore(self._temp_dir.name)
+        self.valuation_dates = pd.period_range(start='2024-01-24', end='2024-02-09', freq='D')
+
+    def tearDown(self):
+        self._temp_dir.cleanup()
+
+    def test_curves_appended_equal_to_curves_built_directly(self):
+        summary = backfill(self.store, 'nbp', self.valuation_dates, _ContractSource(), _builder_kwargs,
+                           workers=1, num_columns=200)
+        history = self.store.read('nbp', 'D')
+        weekdays = [d for d in self.valuation_dates if d.dayofweek < 5]
+        self.assertEqual(weekdays, history.valuation_dates.tolist())
+        self.assertEqual((len(weekdays), len(self.valuation_dates) - len(weekdays)),
+                         (summary.built, summary.no_contracts))
+        for valuation_date in weekdays:
+            expected = hyperbolic_tension_spline(_contracts(valuation_date), **_builder_kwargs)
+            actual = history.curve(valuation_date).to_series()
+            np.testing.assert_allclose(expected.values, actual[expected.index].values)
+
+    def test_consecutive_dates_with_same_contract_periods_are_price_only_builds(self):
+        summary = backfill(self.store, 'nbp', self.valuation_dates, _ContractSource(), _builder_kwargs, workers=1,
+                           num_columns=200)
+        # Contract periods change on the last business day of January, so there are two groups
+        self.assertEqual(2, summary.full_builds)
+        self.assertEqual(summary.built - 2, summary.price_only_builds)
+
+    def test_max_group_size_limits_price_only_builds(self):
+        summary = backfill(self.store, 'nbp', self.valuation_dates, _ContractSource(), _builder_kwargs, workers=1,
+                           max_group_size=2, num_columns=200)
+        self.assertGreater(summary.full_builds, 2)
+
+    def test_resumes_after_interruption_without_rebuilding_completed_dates(self):
+        with self.assertRaises(_InterruptedError):
+            backfill(self.store, 'nbp', self.valuation_dates, _ContractSource(fail_on='2024-02-06'), _builder_kwargs,
+                     workers=1, max_group_size=2, num_columns=200)
+        completed = self.store.last_valuation_date('nbp', 'D')
+        contract_source = _ContractSource()
+        summary = backfill(self.store, 'nbp', self.valuation_dates, contract_source, _builder_kwargs, workers=1,
+                           max_group_size=2, num_columns=200)
+        self.assertEqual(completed, summary.resumed_from)
+        self.assertTrue(all(valuation_date > completed for valuation_date in contract_source.calls))
+        history = self.store.read('nbp', 'D')
+        self.assertEqual([d for d in self.valuation_dates if d.dayofweek < 5], history.valuation_dates.tolist())
+
+    def test_failed_builds_are_recorded_and_skipped(self):
+        def contract_source(valuation_date):
+            contracts = _contracts(valuation_date)
+            return contracts[:1] if valuation_date == pd.Period('2024-01-25', freq='D') else contracts
+        summary = backfill(self.store, 'nbp', self.valuation_dates[:5], contract_source, _builder_kwargs, workers=1,
+                           num_columns=200)
+        self.assertEqual([pd.Period('2024-01-25', freq='D')], list(summary.failed))
+        self.assertEqual(4, summary.built)
+        summary = backfill(self.store, 'nbp', self.valuation_dates[:5], contract_source, _builder_kwargs, workers=1)
+        self.assertEqual(0, summary.built)
+        self.assertIn(pd.Period('2024-01-25', freq='D'), summary.failed)
+
+    def test_resuming_with_different_builder_kwargs_raises_value_error(self):
+        backfill(self.store, 'nbp', self.valuation_dates[:3], _ContractSource(), _builder_kwargs, workers=1,
+                 num_columns=200)
+        with self.assertRaises(ValueError):
+            backfill(self.store, 'nbp', self.valuation_dates, _ContractSource(), {'freq': 'D', 'tension': 2.0},
+                     workers=1)
+
+    def test_process_pool_gives_same_history_as_serial(self):
+        backfill(self.store, 'nbp', self.valuation_dates, _ContractSource(), _builder_kwargs, workers=1,
+                 max_group_size=3, num_columns=200)
+        parallel_store = CurveStore(os.path.join(self._temp_dir.name, 'parallel'))
+        backfill(parallel_store, 'nbp', self.valuation_dates, _ContractSource(), _builder_kwargs, workers=2,
+                 max_group_size=3, num_columns=200)
+        serial = self.store.read('nbp', 'D')
+        parallel = parallel_store.read('nbp', 'D')
+        self.assertEqual(serial.valuation_dates.tolist(), parallel.valuation_dates.tolist())
+        np.testing.assert_allclose(serial.values, parallel.values)
+
+
+if __name__ == '__main__':
+    unittest.main()
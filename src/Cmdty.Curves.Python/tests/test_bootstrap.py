@@ -22,9 +22,10 @@
 # OTHER DEALINGS IN THE SOFTWARE.
 
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime
 from curves.contract_period import month, quarter, winter, summer, gas_year
-from curves import bootstrap_contracts, weighting
+from curves import bootstrap_contracts, weighting, profile_interop
 from curves._common import deconstruct_contract
 import pandas as pd
 import numpy as np
@@ -132,6 +133,63 @@ def average_weight(period):
         expected_arg_values = [expected_first_arg + i for i in range(0, 90)] * 2
         self.assertListEqual(expected_arg_values, weight_arg_values)
 
+    def test_bootstrap_contracts_columnar_contracts_same_as_tuples(self):
+        input_contracts = [
+            (month(2019, 1), 12.35),
+            (month(2019, 2), 13.20),
+            (quarter(2019, 1), 12.85)
+        ]
+        columnar_contracts = pd.DataFrame({
+            'start': [date(2019, 1, 1), date(2019, 2, 1), date(2019, 1, 1)],
+            'end': [date(2019, 1, 31), date(2019, 2, 28), date(2019, 3, 31)],
+            'price': [12.35, 13.20, 12.85]
+        })
+        tuples_curve, tuples_bootstrapped_contracts = bootstrap_contracts(input_contracts, freq='D')
+        columnar_curve, columnar_bootstrapped_contracts = bootstrap_contracts(columnar_contracts, freq='D')
+        pd.testing.assert_series_equal(tuples_curve, columnar_curve)
+        self.assertListEqual(tuples_bootstrapped_contracts, columnar_bootstrapped_contracts)
+
+    _precompute_callbacks_args = dict(contracts=[(month(2019, 1), 12.35), (month(2019, 2), 13.20),
+                                                 (quarter(2019, 1), 12.85), (quarter(2019, 2), 11.9)],
+                                      freq='D', average_weight=weighting.num_weekdays(),
+                                      shaping_ratios=[(month(2019, 4), month(2019, 5), 1.01)],
+                                      shaping_spreads=[(month(2019, 5), month(2019, 6), 0.2)])
+
+    def test_bootstrap_contracts_precompute_callbacks_same_as_callbacks(self):
+        callbacks_curve, callbacks_contracts = bootstrap_contracts(**self._precompute_callbacks_args)
+        precomputed_curve, precomputed_contracts = bootstrap_contracts(**self._precompute_callbacks_args,
+                                                                       precompute_callbacks=True)
+        pd.testing.assert_series_equal(callbacks_curve, precomputed_curve)
+        self.assertListEqual(callbacks_contracts, precomputed_contracts)
+
+    def test_bootstrap_contracts_concurrent_threads_same_as_serial(self):
+        expected_curve, expected_contracts = bootstrap_contracts(**self._precompute_callbacks_args)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(bootstrap_contracts, **self._precompute_callbacks_args,
+                                       precompute_callbacks=precompute) for precompute in (True, False) * 4]
+            for future in futures:
+                curve, bootstrapped_contracts = future.result()
+                pd.testing.assert_series_equal(expected_curve, curve)
+                self.assertListEqual(expected_contracts, bootstrapped_contracts)
+
+    def test_bootstrap_contracts_interop_crossings_within_bounds(self):
+        with profile_interop() as profile:
+            curve, _ = bootstrap_contracts(**self._precompute_callbacks_args, precompute_callbacks=True)
+        num_days = len(curve)
+        self.assertEqual(4, profile.calls['AddContract'])
+        self.assertEqual(2, profile.calls['AddShaping'])
+        self.assertNotIn('callback', profile.calls)
+        # Start and end of 4 contracts and 2 pairs of shaping periods, with the lookup table of average_weight created
+        # within .NET from its start
+        self.assertLessEqual(profile.calls['FromDateTime'], 2 * (4 + 2 * 2))
+        self.assertLessEqual(profile.calls['Data[idx]'], num_days)
+
+    def test_bootstrap_contracts_interop_callbacks_profiled(self):
+        with profile_interop() as profile:
+            bootstrap_contracts(**self._precompute_callbacks_args)
+        self.assertGreater(profile.calls['callback'], 0)
+        self.assertGreaterEqual(profile.seconds['callback'], 0.0)
+
     def test_error_raised_when_redundant_contracts_allow_redundancy_default_false(self):
         input_contracts = [
             (month(2019, 1), 68.64),
@@ -0,0 +1,151 @@
+# Copyright(c) 2026 Jake Fowler
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use, 
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, 
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, 
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+import unittest
+import os
+import tempfile
+import threading
+import numpy as np
+import pandas as pd
+from curves import contract_period as cp
+from curves import weighting
+from curves.arrays import CurveArray
+from curves.cache import CurveCache
+
+_contracts = [(cp.jan(2020), 10.1), (cp.feb(2020), 12.5), (cp.q_2(2020), 11.2), (cp.q_3(2020), 9.8)]
+
+_engine_calls = []
+
+
+def _recording_engine(contracts, freq, tension=1.0):
+    _engine_calls.append(freq)
+    return pd.Series(data=np.full(3, tension), index=pd.period_range(start='2020-01-01', periods=3, freq=freq))
+
+
+class TestCurveCache(unittest.TestCase):
+
+    def setUp(self):
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.cache = CurveCache(self._temp_dir.name)
+        _engine_calls.clear()
+
+    def tearDown(self):
+        self._temp_dir.cleanup()
+
+    def test_hit_returns_memory_mapped_curve_equal_to_built_curve(self):
+        built = self.cache.hyperbolic_tension_spline(_contracts, 'D', 1.5)
+        cached = self.cache.hyperbolic_tension_spline(_contracts, 'D', 1.5)
+        self.assertEqual((1, 1), (self.cache.stats.hits, self.cache.stats.misses))
+        self.assertIsInstance(cached.values, np.memmap)
+        pd.testing.assert_series_equal(built, cached)
+
+    def test_numpy_output_is_cached_as_curve_array(self):
+        built = self.cache.hyperbolic_tension_spline(_contracts, 'D', 1.5, output='numpy')
+        cached = self.cache.hyperbolic_tension_spline(_contracts, 'D', 1.5, output='numpy')
+        self.assertIsInstance(cached, CurveArray)
+        self.assertIsInstance(cached.values, np.memmap)
+        np.testing.assert_array_equal(built.values, cached.values)
+        self.assertEqual((built.start_ordinal, built.freq), (cached.start_ordinal, cached.freq))
+
+    def test_non_curve_parts_of_result_are_cached(self):
+        built_curve, built_coeffs = self.cache.hyperbolic_tension_spline(_contracts, 'D', 1.5,
+                                                                         return_spline_coeff=True)
+        cached_curve, cached_coeffs = self.cache.hyperbolic_tension_spline(_contracts, 'D', 1.5,
+                                                                           return_spline_coeff=True)
+        self.assertEqual(1, self.cache.stats.hits)
+        pd.testing.assert_frame_equal(built_coeffs, cached_coeffs)
+
+    def test_equivalent_contract_representations_and_defaults_have_equal_keys(self):
+        contracts_as_dates = [(('2020-01-01', '2020-01-31'), 10.1), ('2020-02-01', '2020-02-29', 12.5), (cp.q_2(2020), 11.2),
+                            (cp.q_3(2020), 9.8)]
+        key = self.cache.key('hyperbolic_tension_spline', _contracts, 'D', 1.5)
+        self.assertEqual(key, self.cache.key('hyperbolic_tension_spline', contracts_as_dates, freq='D', tension=1.5))
+        self.assertEqual(key, self.cache.key('hyperbolic_tension_spline', _contracts, 'D', 1.5, discount_factor=None))
+        self.assertNotEqual(key, self.cache.key('hyperbolic_tension_spline', _contracts, 'D', 1.6))
+
+    def test_key_depends_on_state_of_weighting_objects(self):
+        def key(average_weight):
+            return self.cache.key('hyperbolic_tension_spline', _contracts, 'D', 1.5, average_weight=average_weight)
+        self.assertEqual(key(weighting.num_business_days(['2020-01-01'])),
+                         key(weighting.num_business_days(['2020-01-01'])))
+        self.assertNotEqual(key(weighting.num_business_days(['2020-01-01'])),
+                            key(weighting.num_business_days(['2020-12-25'])))
+        self.assertNotEqual(key(weighting.num_weekdays()), key(weighting.num_periods('D')))
+
+    def test_key_depends_on_closure_of_functions(self):
+        def tension_func(tension):
+            return lambda period: tension
+        key = self.cache.key('hyperbolic_tension_spline', _contracts, 'D', tension_func(1.0))
+        self.assertEqual(key, self.cache.key('hyperbolic_tension_spline', _contracts, 'D', tension_func(1.0)))
+        self.assertNotEqual(key, self.cache.key('hyperbolic_tension_spline', _contracts, 'D', tension_func(2.0)))
+
+    def test_build_with_unhashable_argument_is_not_cached(self):
+        lock = threading.Lock()
+
+        def tension(period):
+            with lock:
+                return 1.5
+        for _ in range(2):
+            self.cache.hyperbolic_tension_spline(_contracts, 'D', tension)
+        self.assertEqual((0, 0, 2), self.cache.stats[:3])
+        self.assertEqual(0, len(self.cache))
+
+    def test_callable_engine_is_built_once(self):
+        first = self.cache.build(_recording_engine, _contracts, 'D', tension=2.0)
+        second = self.cache.build(_recording_engine, _contracts, 'D', 2.0)
+        self.assertEqual(['D'], _engine_calls)
+        pd.testing.assert_series_equal(first, second)
+
+    def test_least_recently_used_entries_evicted_when_size_exceeds_max_bytes(self):
+        self.cache.hyperbolic_tension_spline(_contracts, 'D', 1.0)
+        entry_size = self.cache.size()
+        cache = CurveCache(self._temp_dir.name, max_bytes=int(entry_size * 2.5))
+        key_1 = cache.key('hyperbolic_tension_spline', _contracts, 'D', 1.0)
+        key_2 = cache.key('hyperbolic_tension_spline', _contracts, 'D', 2.0)
+        key_3 = cache.key('hyperbolic_tension_spline', _contracts, 'D', 3.0)
+        cache.hyperbolic_tension_spline(_contracts, 'D', 2.0)
+        # Make the first entry the most recently used
+        meta_path = os.path.join(self._temp_dir.name, key_2[:2], key_2, 'meta.json')
+        os.utime(meta_path, (0, 0))
+        cache.hyperbolic_tension_spline(_contracts, 'D', 1.0)
+        cache.hyperbolic_tension_spline(_contracts, 'D', 3.0)
+        self.assertIn(key_1, cache)
+        self.assertNotIn(key_2, cache)
+        self.assertIn(key_3, cache)
+        self.assertEqual(1, cache.stats.evictions)
+        self.assertLessEqual(cache.size(), cache.max_bytes)
+
+    def test_clear_deletes_all_entries(self):
+        self.cache.hyperbolic_tension_spline(_contracts, 'D', 1.0)
+        self.cache.hyperbolic_tension_spline(_contracts, 'D', 2.0)
+        self.assertEqual(2, len(self.cache))
+        self.cache.clear()
+        self.assertEqual(0, len(self.cache))
+
+    def test_max_bytes_not_positive_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            CurveCache(self._temp_dir.name, max_bytes=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
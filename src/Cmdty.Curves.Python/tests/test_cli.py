@@ -0,0 +1,159 @@
+# Copyright(c) 2026 Jake Fowler
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use, 
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, 
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, 
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+import unittest
+import contextlib
+import io
+import json
+import os
+import tempfile
+import numpy as np
+import pandas as pd
+from curves import hyperbolic_tension_spline, weighting
+from curves.__main__ import main, _ParquetWriter
+from curves.arrays import CurveArray
+
+_CONTRACTS_CSV = """curve,start,end,price
+nbp,2025-01-01,,80.5
+nbp,2025-02-01,,82.0
+nbp,2025-04-01,2025-06-30,70.25
+ttf,2025-01-01,2025-01-31,40.5
+ttf,2025-02-01,2025-02-28,41.0
+ttf,2025-03-01,2025-05-31,39.0
+"""
+
+_SPEC = {'defaults': {'freq': 'D', 'tension': 0.5},
+         'curves': {'nbp': {'freq': 'M'},
+                    'ttf': {'tension': 1.5, 'average_weight': {'num_business_days': {'holidays': ['2025-01-01']}}}}}
+
+
+class TestBuildCommand(unittest.TestCase):
+
+    def setUp(self):
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.contracts_path = self._path('contracts.csv')
+        with open(self.contracts_path, 'w') as contracts_file:
+            contracts_file.write(_CONTRACTS_CSV)
+        self.spec_path = self._write_spec(_SPEC)
+
+    def tearDown(self):
+        self._temp_dir.cleanup()
+
+    def _path(self, name):
+        return os.path.join(self._temp_dir.name, name)
+
+    def _write_spec(self, spec):
+        spec_path = self._path('spec.json')
+        with open(spec_path, 'w') as spec_file:
+            json.dump(spec, spec_file)
+        return spec_path
+
+    def _run(self, *args):
+        stderr = io.StringIO()
+        with contextlib.redirect_stderr(stderr):
+            exit_status = main(['build', '--contracts', self.contracts_path, '--spec', self.spec_path] + list(args))
+        return exit_status, stderr.getvalue()
+
+    def _expected_ttf(self):
+        contracts = [(('2025-01-01', '2025-01-31'), 40.5), (('2025-02-01', '2025-02-28'), 41.0),
+                     (('2025-03-01', '2025-05-31'), 39.0)]
+        return hyperbolic_tension_spline(contracts, 'D', 1.5,
+                                         average_weight=weighting.num_business_days(['2025-01-01']))
+
+    def test_npz_output_contains_curves_built_with_spec_arguments(self):
+        output_path = self._path('curves.npz')
+        exit_status, progress = self._run('--output', output_path, '--workers', '1')
+        self.assertEqual(0, exit_status)
+        self.assertIn('[2/2]', progress)
+        with np.load(output_path) as output:
+            expected = self._expected_ttf()
+            np.testing.assert_allclose(expected.values, output['ttf'])
+            self.assertEqual(expected.index[0].ordinal, output['ttf.start_ordinal'])
+            self.assertEqual('D', output['ttf.freq'].item())
+            self.assertEqual('M', output['nbp.freq'].item())
+            self.assertEqual(6, len(output['nbp']))
+
+    def test_parquet_output_built_in_worker_processes(self):
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            self.skipTest('pyarrow not installed')
+        output_path = self._path('curves.parquet')
+        exit_status, _ = self._run('--output', output_path, '--workers', '2', '--quiet')
+        self.assertEqual(0, exit_status)
+        output = pd.read_parquet(output_path)
+        ttf = output[output['curve'] == 'ttf']
+        expected = self._expected_ttf()
+        np.testing.assert_allclose(expected.values, ttf['value'].to_numpy())
+        self.assertEqual(pd.Timestamp('2025-01-01'), ttf['delivery_start'].iloc[0])
+
+    def test_parquet_delivery_start_of_time_zone_aware_curve_across_clock_change(self):
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            self.skipTest('pyarrow not installed')
+        output_path = self._path('curves.parquet')
+        curve = CurveArray(np.arange(5.0), pd.Period('2025-03-30 00:00', freq='h').ordinal, 'h', 'Europe/Berlin')
+        with _ParquetWriter(output_path) as writer:
+            writer.write('de', curve)
+        output = pd.read_parquet(output_path)
+        self.assertEqual(pd.to_datetime(['2025-03-30 00:00', '2025-03-30 01:00', '2025-03-30 03:00',
+                                         '2025-03-30 04:00', '2025-03-30 05:00']).tolist(),
+                         output['delivery_start'].tolist())
+        np.testing.assert_array_equal(np.arange(5.0), output['value'].to_numpy())
+
+    def test_failed_curve_gives_exit_status_one_and_other_curves_written(self):
+        self.spec_path = self._write_spec({'defaults': {'freq': 'D', 'tension': 0.5},
+                                           'curves': {'ttf': {'tension': -1.0}}})
+        output_path = self._path('curves.npz')
+        exit_status, progress = self._run('--output', output_path, '--workers', '1')
+        self.assertEqual(1, exit_status)
+        self.assertIn('ttf', progress)
+        self.assertIn('FAILED', progress)
+        with np.load(output_path) as output:
+            self.assertIn('nbp', output.files)
+            self.assertNotIn('ttf', output.files)
+
+    def test_invalid_spec_gives_exit_status_two(self):
+        self.spec_path = self._write_spec({'defaults': {'freq': 'D', 'tension': 0.5},
+                                           'curves': {'ttf': {'average_weight': 'num_fortnights'}}})
+        exit_status, message = self._run('--output', self._path('curves.npz'))
+        self.assertEqual(2, exit_status)
+        self.assertIn('num_fortnights', message)
+
+    def test_yaml_spec(self):
+        try:
+            import yaml
+        except ImportError:
+            self.skipTest('PyYAML not installed')
+        self.spec_path = self._path('spec.yaml')
+        with open(self.spec_path, 'w') as spec_file:
+            yaml.safe_dump(_SPEC, spec_file)
+        output_path = self._path('curves.npz')
+        self.assertEqual(0, self._run('--output', output_path, '--workers', '1')[0])
+        with np.load(output_path) as output:
+            np.testing.assert_allclose(self._expected_ttf().values, output['ttf'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+# Copyright(c) 2026 Jake Fowler
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use, 
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, 
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, 
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+import unittest
+import pandas as pd
+import numpy as np
+from datetime import date
+from curves import contract_period as cp
+
+
+class TestContractPeriod(unittest.TestCase):
+
+    def test_from_code_returns_same_as_constructor_functions(self):
+        self.assertEqual(cp.jan(2026), cp.from_code('Jan-26'))
+        self.assertEqual(cp.dec(2026), cp.from_code('december 2026'))
+        self.assertEqual(cp.q_1(2026), cp.from_code('Q1-26'))
+        self.assertEqual(cp.summer(2026), cp.from_code('Sum-26'))
+        self.assertEqual(cp.winter(2025), cp.from_code('Win-25'))
+        self.assertEqual(cp.cal_year(2027), cp.from_code('Cal-27'))
+        self.assertEqual(cp.gas_year(2026), cp.from_code('GY-2026'))
+
+    def test_from_code_unrecognised_code_raises_value_error(self):
+        for code in ('X1-26', 'Q5-26', 'Cal', 'Jan-126'):
+            with self.subTest(code=code):
+                self.assertRaises(ValueError, cp.from_code, code)
+
+    def test_parse_codes_daily_freq_returns_start_and_end_ordinals(self):
+        starts, ends = cp.parse_codes(['Q1-26', 'Win-25', 'Cal-27', 'GY-26', 'Q1-26'], 'D')
+        expected_starts = pd.PeriodIndex(['2026-01-01', '2025-10-01', '2027-01-01', '2026-10-01', '2026-01-01'],
+                                         freq='D')
+        expected_ends = pd.PeriodIndex(['2026-03-31', '2026-03-31', '2027-12-31', '2027-09-30', '2026-03-31'],
+                                       freq='D')
+        np.testing.assert_array_equal(expected_starts.asi8, starts)
+        np.testing.assert_array_equal(expected_ends.asi8, ends)
+
+    def test_parse_codes_multiple_freq_end_is_last_period(self):
+        starts, ends = cp.parse_codes(['Feb-26'], '15min')
+        self.assertEqual(pd.Period('2026-02-01 00:00', freq='15min').ordinal, starts[0])
+        self.assertEqual(pd.Period('2026-02-28 23:45', freq='15min').ordinal, ends[0])
+
+    def test_month_strip(self):
+        strip = cp.month_strip(date(2026, 11, 1), 36)
+        self.assertEqual(36, len(strip))
+        self.assertEqual(cp.nov(2026), strip[0])
+        self.assertEqual(cp.oct(2029), strip[-1])
+
+    def test_quarter_strip(self):
+        strip = cp.quarter_strip(2026, 2030)
+        self.assertEqual(20, len(strip))
+        self.assertEqual(cp.q_1(2026), strip[0])
+        self.assertEqual(cp.q_4(2030), strip[-1])
+
+    def test_season_strip_alternates_summer_and_winter(self):
+        strip = cp.season_strip(cp.winter(2025), 3)
+        self.assertEqual([cp.winter(2025), cp.summer(2026), cp.winter(2026)], list(strip))
+
+    def test_season_strip_non_season_start_raises_value_error(self):
+        self.assertRaises(ValueError, cp.season_strip, cp.q_1(2026), 3)
+
+    def test_cal_year_strip(self):
+        strip = cp.cal_year_strip(2026, 2028)
+        self.assertEqual([cp.cal_year(2026), cp.cal_year(2027), cp.cal_year(2028)], list(strip))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+# Copyright(c) 2026 Jake Fowler
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use, 
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, 
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, 
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+import unittest
+import pandas as pd
+from curves import estimate, hyperbolic_tension_spline, BuildStats, KnotPositions, weighting
+from curves import contract_period as cp
+from tests._test_common import CONTRACTS
+
+
+class TestEstimate(unittest.TestCase):
+
+    def _assert_hyperbolic_estimate_matches_build(self, *args, **kwargs):
+        cost = estimate('hyperbolic_tension_spline', *args, **kwargs)
+        stats = BuildStats()
+        curve = hyperbolic_tension_spline(*args, **kwargs, stats=stats)
+        self.assertEqual(len(curve), cost.num_points)
+        self.assertEqual(stats.matrix_shape, cost.matrix_shape)
+        self.assertGreater(cost.memory_bytes, 8 * cost.num_points)
+        self.assertGreater(cost.solve_seconds, 0.0)
+        return cost
+
+    def test_hyperbolic_estimate_matches_build(self):
+        cost = self._assert_hyperbolic_estimate_matches_build(CONTRACTS, 'D', tension=0.5)
+        self.assertEqual(5, cost.num_contracts)
+        self.assertEqual(5, cost.num_sections)
+        self.assertEqual('hyperbolic_tension_spline', cost.recommended_engine)
+        self.assertEqual({}, cost.recommended_options)
+
+    def test_hyperbolic_estimate_with_options_matches_build(self):
+        self._assert_hyperbolic_estimate_matches_build(
+            CONTRACTS + [(cp.q_1(2020), 21.0)], 'D', 0.5, shaping_ratios=[(cp.jul(2020), cp.aug(2020), 1.01)],
+            shaping_spreads=[(cp.apr(2020), cp.may(2020), 0.1)], front_1st_deriv=0.0,
+            knot_positions=KnotPositions.CONTRACT_START_AND_END | KnotPositions.CONTRACT_CENTRE,
+            knots=['2020-02-15'], average_weight=weighting.num_weekdays())
+
+    def test_hyperbolic_estimate_with_time_zone_matches_build(self):
+        self._assert_hyperbolic_estimate_matches_build(CONTRACTS, 'h', tension=0.5, time_zone='Europe/London')
+
+    def test_larger_build_has_larger_estimate(self):
+        daily = estimate('hyperbolic_tension_spline', CONTRACTS, 'D', tension=0.5)
+        hourly = estimate('hyperbolic_tension_spline', CONTRACTS, 'h', tension=0.5)
+        self.assertEqual(24 * daily.num_points, hourly.num_points)
+        self.assertGreater(hourly.memory_bytes, daily.memory_bytes)
+        self.assertGreater(hourly.solve_seconds, daily.solve_seconds)
+
+    def test_max_smooth_interp_with_overlapping_contracts_recommends_hyperbolic(self):
+        cost = estimate('max_smooth_interp', CONTRACTS + [(cp.q_1(2020), 21.0)], 'D')
+        self.assertEqual('hyperbolic_tension_spline', cost.recommended_engine)
+        cost = estimate('max_smooth_interp', CONTRACTS, 'D')
+        self.assertEqual('max_smooth_interp', cost.recommended_engine)
+        self.assertEqual(5, cost.num_sections)
+
+    def test_callbacks_recommend_precompute_callbacks(self):
+        cost = estimate('max_smooth_interp', CONTRACTS, 'D', average_weight=lambda p: 1.0)
+        self.assertEqual({'precompute_callbacks': True}, cost.recommended_options)
+        precomputed_cost = estimate('max_smooth_interp', CONTRACTS, 'D', average_weight=lambda p: 1.0,
+                                    precompute_callbacks=True)
+        self.assertEqual({}, precomputed_cost.recommended_options)
+        self.assertLess(precomputed_cost.solve_seconds, cost.solve_seconds)
+
+    def test_bootstrap_sections_are_bootstrapped_contracts(self):
+        contracts = [(cp.jan(2020), 21.3), (cp.feb(2020), 22.1), (cp.q_1(2020), 21.0), (cp.q_3(2020), 18.2)]
+        cost = estimate('bootstrap_contracts', contracts, 'M')
+        self.assertEqual(4, cost.num_sections)  # Jan, Feb, Mar and Q3, but not the gap of Q2
+        self.assertEqual(9, cost.num_points)
+
+    def test_invalid_engine_raises(self):
+        with self.assertRaises(ValueError):
+            estimate('cubic_spline', CONTRACTS, 'D')
+
+    def test_invalid_arguments_raise(self):
+        with self.assertRaises(TypeError):
+            estimate('hyperbolic_tension_spline', CONTRACTS, 'D', 0.5, smoothness=1.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
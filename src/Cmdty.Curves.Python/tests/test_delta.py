@@ -0,0 +1,173 @@
+# Copyright(c) 2026 Jake Fowler
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use, 
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, 
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, 
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+import unittest
+import asyncio
+import json
+import numpy as np
+import pandas as pd
+from curves.arrays import CurveArray
+from curves.delta import curve_delta, apply_delta, CurveDelta, DeltaPublisher
+
+
+def _curve(start, values, freq='D'):
+    return pd.Series(data=np.asarray(values, dtype=np.float64),
+                     index=pd.period_range(start=start, periods=len(values), freq=freq))
+
+
+class TestCurveDelta(unittest.TestCase):
+
+    def test_only_changed_ranges_are_included(self):
+        previous = _curve('2024-01-01', [1.0, 2.0, 3.0, 4.0, 5.0, 6.0])
+        current = _curve('2024-01-01', [1.5, 2.0, 3.0, 4.5, 5.5, 6.0])
+        delta = curve_delta(previous, current)
+        self.assertEqual(3, delta.num_changed)
+        np.testing.assert_array_equal([0, 1, 2, 2, 1], delta.run_lengths)
+        segments = delta.segments()
+        self.assertEqual(2, len(segments))
+        self.assertEqual(pd.Period('2024-01-04', freq='D').ordinal, segments[1].start_ordinal)
+        np.testing.assert_array_equal([4.5, 5.5], segments[1].values)
+        pd.testing.assert_series_equal(current, apply_delta(previous, delta))
+
+    def test_changes_within_tolerance_are_excluded(self):
+        previous = _curve('2024-01-01', [100.0, 200.0, 300.0])
+        current = _curve('2024-01-01', [100.005, 200.0, 301.0])
+        delta = curve_delta(previous, current, atol=0.01)
+        self.assertEqual(1, delta.num_changed)
+        np.testing.assert_array_equal([100.0, 200.0, 301.0], apply_delta(previous, delta).values)
+        self.assertEqual(2, curve_delta(previous, current, rtol=1E-5).num_changed)
+
+    def test_equal_nan_values_are_unchanged(self):
+        previous = _curve('2024-01-01', [np.nan, 2.0])
+        self.assertTrue(curve_delta(previous, _curve('2024-01-01', [np.nan, 2.0])).is_empty)
+
+    def test_extent_changes_are_applied(self):
+        previous = _curve('2024-01-01', [1.0, 2.0, 3.0, 4.0])
+        current = _curve('2024-01-02', [2.0, 3.0, 4.0, 5.0, 6.0])
+        delta = curve_delta(previous, current)
+        np.testing.assert_array_equal([5.0, 6.0], delta.values)
+        pd.testing.assert_series_equal(current, apply_delta(previous, delta))
+
+    def test_max_gap_merges_segments_separated_by_short_unchanged_runs(self):
+        previous = _curve('2024-01-01', np.zeros(8))
+        current = _curve('2024-01-01', [1.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0, 0.0])
+        self.assertEqual(3, len(curve_delta(previous, current).segments()))
+        delta = curve_delta(previous, current, max_gap=1)
+        self.assertEqual(2, len(delta.segments()))
+        np.testing.assert_array_equal([1.0, 0.0, 1.0], delta.segments()[0].values)
+        pd.testing.assert_series_equal(current, apply_delta(previous, delta))
+
+    def test_delta_without_previous_is_full(self):
+        current = CurveArray(np.array([1.0, 2.0]), pd.Period('2024-01-01 00:00', freq='30min').ordinal, '30min')
+        delta = curve_delta(None, current)
+        self.assertTrue(delta.is_full)
+        applied = apply_delta(None, delta)
+        np.testing.assert_array_equal(current.values, applied.values)
+        self.assertEqual(current.start_ordinal, applied.start_ordinal)
+
+    def test_segments_of_multiple_freq_curve_have_correct_start(self):
+        previous = _curve('2024-01-01 00:00', [1.0, 2.0, 3.0], freq='30min')
+        current = _curve('2024-01-01 00:00', [1.0, 2.0, 3.5], freq='30min')
+        segment = curve_delta(previous, current).segments()[0]
+        self.assertEqual(pd.Period('2024-01-01 01:00', freq='30min').ordinal, segment.start_ordinal)
+        pd.testing.assert_series_equal(current, apply_delta(previous, curve_delta(previous, current)))
+
+    def test_time_zone_aware_curve_rolled_across_clock_change_aligned_by_delivery_period(self):
+        # Clocks go forward at 2024-03-31 02:00 Europe/Berlin, so the day only has 23 hours
+        values = np.arange(96, dtype=np.float64)
+        previous = CurveArray(values[:72], pd.Period('2024-03-30 00:00', freq='h').ordinal, 'h', 'Europe/Berlin')
+        current = CurveArray(values[24:], pd.Period('2024-03-31 00:00', freq='h').ordinal, 'h', 'Europe/Berlin')
+        delta = curve_delta(previous, current)
+        self.assertEqual(24, delta.num_changed)
+        np.testing.assert_array_equal(values[72:], delta.values)
+        self.assertEqual(pd.Period('2024-04-02 01:00', freq='h').ordinal, delta.segments()[0].start_ordinal)
+        applied = apply_delta(previous, delta)
+        np.testing.assert_array_equal(current.values, applied.values)
+        pd.testing.assert_series_equal(current.to_series(), apply_delta(previous.to_series(), delta))
+
+    def test_to_dict_round_trips_through_json(self):
+        delta = curve_delta(_curve('2024-01-01', [1.0, 2.0]), _curve('2024-01-01', [1.0, 3.0]))
+        round_tripped = CurveDelta.from_dict(json.loads(json.dumps(delta.to_dict())))
+        np.testing.assert_array_equal(delta.run_lengths, round_tripped.run_lengths)
+        np.testing.assert_array_equal(delta.values, round_tripped.values)
+        self.assertEqual(delta[:4], round_tripped[:4])
+
+    def test_different_freq_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            curve_delta(_curve('2024-01-01', [1.0]), _curve('2024-01', [1.0], freq='M'))
+
+    def test_apply_to_previous_missing_unchanged_periods_raises_value_error(self):
+        delta = curve_delta(_curve('2024-01-01', [1.0, 2.0, 3.0]), _curve('2024-01-01', [1.0, 2.0, 4.0]))
+        with self.assertRaises(ValueError):
+            apply_delta(_curve('2024-01-02', [2.0, 3.0]), delta)
+        with self.assertRaises(ValueError):
+            apply_delta(None, delta)
+
+
+class TestDeltaPublisher(unittest.TestCase):
+
+    def test_first_version_is_snapshot_then_deltas_against_consumer_state(self):
+        published = []
+        publisher = DeltaPublisher(published.append, atol=0.1)
+        publisher.publish('nbp', _curve('2024-01-01', [1.0, 2.0, 3.0]))
+        publisher.publish('nbp', _curve('2024-01-01', [1.06, 2.0, 3.0]))
+        publisher.publish('nbp', _curve('2024-01-01', [1.12, 2.0, 3.0]))
+        self.assertEqual([(1, None), (2, 1), (3, 2)], [(p.version, p.base_version) for p in published])
+        self.assertTrue(published[0].delta.is_full)
+        # Second change is within tolerance of the original, but the cumulative change is not
+        self.assertTrue(published[1].delta.is_empty)
+        np.testing.assert_array_equal([1.12], published[2].delta.values)
+        np.testing.assert_array_equal([1.12, 2.0, 3.0], publisher.latest('nbp').values)
+
+    def test_snapshot_every_publishes_periodic_full_snapshots(self):
+        published = []
+        publisher = DeltaPublisher(published.append, snapshot_every=2)
+        for value in range(4):
+            publisher.publish('nbp', _curve('2024-01-01', [float(value), 1.0]))
+        self.assertEqual([None, 1, None, 3], [p.base_version for p in published])
+
+    def test_subscribed_to_streamer_publishes_deltas(self):
+        from curves.streaming import CurveStreamer, PriceUpdate
+        from curves import contract_period as cp
+        published = []
+        streamer = CurveStreamer({'nbp': {'engine': 'hyperbolic_tension_spline', 'freq': 'D', 'tension': 1.0,
+                                          'output': 'numpy'}},
+                                 max_rebuilds_per_second=1000.0)
+        publisher = DeltaPublisher(published.append)
+        streamer.subscribe(publisher)
+
+        async def price_updates():
+            yield PriceUpdate('nbp', cp.jan(2020), 10.0)
+            yield PriceUpdate('nbp', cp.feb(2020), 11.0)
+            yield PriceUpdate('nbp', cp.q_2(2020), 12.0)
+            await asyncio.sleep(0.05)
+            yield PriceUpdate('nbp', cp.q_2(2020), 12.5)
+
+        asyncio.run(streamer.run(price_updates()))
+        self.assertEqual(streamer.latest('nbp').version, published[-1].version)
+        self.assertEqual(published[-2].version, published[-1].base_version)
+        np.testing.assert_array_equal(streamer.latest('nbp').curve.values, publisher.latest('nbp').values)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -25,7 +25,7 @@
 import pandas as pd
 import numpy as np
 from datetime import date, datetime
-from curves import hyperbolic_tension_spline, KnotPositions
+from curves import hyperbolic_tension_spline, hyperbolic_tension_system, KnotPositions
 from curves import contract_period as cp
 from math import exp
 from tests._test_common import weighted_average_slice_curve
@@ -305,6 +305,80 @@ def discounted_average_weight(del_period):
                                                                        discounted_average_weight)
                     self.assertAlmostEqual(curve_average_price, contract_price, delta=tol)
 
+    def test_columnar_contracts_same_as_tuples(self):
+        codes = ['Q1-20', 'Q2-20', 'Sum-20', 'Win-20', 'Cal-21']
+        prices = [21.3, 19.8, 20.1, 25.6, 23.5]
+        tuple_contracts = [(cp.from_code(code), price) for code, price in zip(codes, prices)]
+        starts, ends = cp.parse_codes(codes, 'D')
+        columnar_contracts = pd.DataFrame({'start': starts, 'end': ends, 'price': prices})
+        for time_zone in (None, 'Europe/London'):
+            with self.subTest(time_zone=time_zone):
+                tuples_curve = hyperbolic_tension_spline(tuple_contracts, freq='D', tension=self.flat_tension,
+                                                         time_zone=time_zone, discount_factor=discount_factor)
+                columnar_curve = hyperbolic_tension_spline(columnar_contracts, freq='D', tension=self.flat_tension,
+                                                           time_zone=time_zone, discount_factor=discount_factor)
+                pd.testing.assert_series_equal(tuples_curve, columnar_curve)
+
+    def test_system_solve_new_prices_same_as_building_with_new_prices(self):
+        periods = [cp.quarter(2019, 2), cp.jan(2019), cp.feb(2019), cp.mar(2019), cp.summer(2019)]
+        prices = [18.3, 31.66, 29.3, 24.6, 19.9]
+        new_prices = [17.9, 32.1, 29.0, 25.2, 19.5]
+        spreads = [(cp.jul(2019), cp.aug(2019), -0.5)]
+        for kwargs in ({}, {'front_1st_deriv': 0.0, 'back_1st_deriv': 0.0}, {'time_zone': 'Europe/London'}):
+            with self.subTest(**kwargs):
+                system = hyperbolic_tension_system(list(zip(periods, prices)), freq='D', tension=self.flat_tension,
+                                                   discount_factor=discount_factor, shaping_spreads=spreads, **kwargs)
+                np.testing.assert_array_equal(prices, system.contract_prices)
+                expected_curve, expected_coeffs = hyperbolic_tension_spline(list(zip(periods, new_prices)), freq='D',
+                                                                            tension=self.flat_tension,
+                                                                            discount_factor=discount_factor,
+                                                                            shaping_spreads=spreads,
+                                                                            return_spline_coeff=True, **kwargs)
+                curve, coeffs = system.solve(new_prices, return_spline_coeff=True)
+                pd.testing.assert_series_equal(expected_curve, curve, check_exact=False, rtol=1E-10)
+                pd.testing.assert_frame_equal(expected_coeffs, coeffs, check_exact=False, rtol=1E-8)
+
+    def test_system_solve_prices_wrong_length_raises_value_error(self):
+        system = hyperbolic_tension_system([(cp.jan(2019), 31.66), (cp.feb(2019), 29.3)], freq='D',
+                                           tension=self.flat_tension)
+        self.assertRaises(ValueError, system.solve, [31.0])
+
+    def test_columnar_contracts_start_after_end_raises_value_error(self):
+        columnar_contracts = {
+            'start': [cp.jan(2020), cp.mar(2020)],
+            'end': [cp.feb(2020), cp.feb(2020)],
+            'price': [21.3, 19.8]
+        }
+        self.assertRaises(ValueError, hyperbolic_tension_spline, columnar_contracts, freq='D', tension=self.flat_tension)
+
+    def test_columnar_shaping_same_as_tuples(self):
+        contracts = [(cp.q_4(2023), 58.65), (cp.q_1(2024), 57.09), (cp.q_2(2024), 53.06), (cp.q_3(2024), 52.17)]
+        shaping_spreads = [(cp.jan(2024), cp.mar(2024), 2.45), (cp.jan(2024), cp.feb(2024), 1.05)]
+        shaping_ratios = [(cp.mar(2024), cp.jul(2024), 1.05)]
+        long_starts, long_ends = cp.parse_codes(['Jan-24', 'Jan-24'], 'D')
+        short_starts, short_ends = cp.parse_codes(['Mar-24', 'Feb-24'], 'D')
+        columnar_spreads = pd.DataFrame({'long_start': long_starts, 'long_end': long_ends, 'short_start': short_starts,
+                                         'short_end': short_ends, 'spread': [2.45, 1.05]})
+        columnar_ratios = {'numerator_start': [cp.mar(2024)], 'numerator_end': [cp.mar(2024)],
+                           'denominator_start': [cp.jul(2024)], 'denominator_end': [cp.jul(2024)], 'ratio': [1.05]}
+        for time_zone in (None, 'Europe/London'):
+            with self.subTest(time_zone=time_zone):
+                tuples_curve = hyperbolic_tension_spline(contracts, freq='D', tension=0.9, time_zone=time_zone,
+                                                         shaping_spreads=shaping_spreads, shaping_ratios=shaping_ratios,
+                                                         knot_positions=KnotPositions.CONTRACT_CENTRE)
+                columnar_curve = hyperbolic_tension_spline(contracts, freq='D', tension=0.9, time_zone=time_zone,
+                                                           shaping_spreads=columnar_spreads,
+                                                           shaping_ratios=columnar_ratios,
+                                                           knot_positions=KnotPositions.CONTRACT_CENTRE)
+                pd.testing.assert_series_equal(tuples_curve, columnar_curve)
+
+    def test_columnar_shaping_missing_column_raises_value_error(self):
+        contracts = [(cp.q_1(2024), 57.09), (cp.q_2(2024), 53.06)]
+        columnar_spreads = {'long_start': [cp.jan(2024)], 'long_end': [cp.jan(2024)], 'short_start': [cp.feb(2024)],
+                            'spread': [1.05]}
+        self.assertRaises(ValueError, hyperbolic_tension_spline, contracts, freq='D', tension=0.9,
+                          shaping_spreads=columnar_spreads)
+
     def test_shaping_spreads_curve_has_expected_spreads(self):
         shaping_spreads = [
             (cp.jan(2024), cp.mar(2024), 2.45),
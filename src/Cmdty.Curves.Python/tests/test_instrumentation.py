@@ -0,0 +1,124 @@
+# Copyright(c) 2026 Jake Fowler
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use, 
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, 
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, 
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+import unittest
+import threading
+import numpy as np
+import pandas as pd
+from curves import hyperbolic_tension_spline, hyperbolic_tension_system, BuildStats, collect_stats, weighting, \
+    profile_interop
+from curves.instrumentation import interop_profile
+from tests._test_common import CONTRACTS
+
+
+class TestInstrumentation(unittest.TestCase):
+
+    def test_stats_records_stages_and_matrix(self):
+        stats = BuildStats()
+        curve = hyperbolic_tension_spline(CONTRACTS, 'D', tension=0.5, stats=stats)
+        self.assertEqual('hyperbolic_tension_spline', stats.engine)
+        self.assertEqual(['standardise', 'knots', 'callables', 'assembly', 'solve', 'evaluate', 'marshal'],
+                         list(stats.stage_seconds))
+        self.assertTrue(all(seconds >= 0.0 for seconds in stats.stage_seconds.values()))
+        self.assertGreaterEqual(stats.total_seconds, sum(stats.stage_seconds.values()))
+        self.assertEqual(2, len(stats.matrix_shape))
+        self.assertEqual(stats.matrix_shape[0], stats.matrix_shape[1])
+        self.assertEqual({}, stats.stage_peak_memory)
+        self.assertIsNone(stats.peak_memory)
+        pd.testing.assert_series_equal(hyperbolic_tension_spline(CONTRACTS, 'D', tension=0.5), curve)
+
+    def test_callable_invocations_counted(self):
+        stats = BuildStats()
+        calls = []
+
+        def discount_factor(period):
+            calls.append(period)
+            return 1.0
+
+        hyperbolic_tension_spline(CONTRACTS, 'D', tension=lambda p: 0.5, discount_factor=discount_factor,
+                                  average_weight=weighting.num_weekdays(), stats=stats)
+        self.assertEqual(len(calls), stats.callable_calls['discount_factor'])
+        self.assertEqual(1, stats.callable_calls['average_weight'])  # Vectorised evaluate
+        self.assertGreater(stats.callable_calls['tension'], 0)
+
+    def test_track_memory(self):
+        stats = BuildStats(track_memory=True)
+        hyperbolic_tension_spline(CONTRACTS, 'D', tension=0.5, stats=stats)
+        self.assertEqual(list(stats.stage_seconds), list(stats.stage_peak_memory))
+        self.assertGreater(stats.peak_memory, 0)
+
+    def test_hook_receives_events(self):
+        events = []
+        stats = BuildStats(hook=events.append)
+        hyperbolic_tension_spline(CONTRACTS, 'D', tension=0.5, stats=stats)
+        stage_events = [event for event in events if event.metric == 'stage_seconds']
+        self.assertEqual(list(stats.stage_seconds), [event.name for event in stage_events])
+        self.assertEqual(('hyperbolic_tension_spline', 'total_seconds', '', stats.total_seconds), events[-1])
+        self.assertIn(('hyperbolic_tension_spline', 'matrix_rows', '', stats.matrix_shape[0]), events)
+
+    def test_collect_stats_records_each_build(self):
+        with collect_stats() as builds:
+            hyperbolic_tension_spline(CONTRACTS, 'D', tension=0.5)
+            system = hyperbolic_tension_system(CONTRACTS, 'M', tension=0.5)
+            system.solve(np.array([21.0, 22.0, 20.0, 19.0, 18.0]), output='numpy')
+        hyperbolic_tension_spline(CONTRACTS, 'D', tension=0.5)
+        self.assertEqual(['hyperbolic_tension_spline', 'hyperbolic_tension_system', 'HyperbolicTensionSystem.solve'],
+                         [build.engine for build in builds])
+        self.assertEqual(['solve', 'evaluate', 'marshal'], list(builds[2].stage_seconds))
+
+    def test_collect_stats_is_local_to_thread(self):
+        with collect_stats() as builds:
+            thread = threading.Thread(target=hyperbolic_tension_spline, args=(CONTRACTS, 'D', 0.5))
+            thread.start()
+            thread.join()
+        self.assertEqual([], builds)
+
+
+class TestInteropProfile(unittest.TestCase):
+
+    def test_wrap_counts_and_times_calls(self):
+        with profile_interop() as profile:
+            add = interop_profile().wrap('AddContract', lambda x, y: x + y)
+            self.assertEqual(3, add(1, 2))
+            add(3, 4)
+        self.assertEqual({'AddContract': 2}, profile.calls)
+        self.assertEqual(2, profile.total_calls)
+        self.assertEqual('AddContract', profile.sites()[0].name)
+        self.assertGreaterEqual(profile.sites()[0].seconds, 0.0)
+
+    def test_wrap_counts_calls_which_raise(self):
+        def raises():
+            raise ValueError('error')
+
+        with profile_interop() as profile:
+            with self.assertRaises(ValueError):
+                interop_profile().wrap('callback', raises)()
+        self.assertEqual(1, profile.calls['callback'])
+
+    def test_wrap_returns_function_unchanged_when_not_profiling(self):
+        func = lambda x: x  # noqa: E731
+        self.assertIs(func, interop_profile().wrap('callback', func))
+
+
+if __name__ == '__main__':
+    unittest.main()
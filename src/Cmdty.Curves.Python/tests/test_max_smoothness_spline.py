@@ -22,9 +22,10 @@
 # OTHER DEALINGS IN THE SOFTWARE.
 
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
 from datetime import date, datetime
-from curves import max_smooth_interp, FREQ_TO_PERIOD_TYPE
+from curves import max_smooth_interp, FREQ_TO_PERIOD_TYPE, weighting, adjustments, profile_interop
 from curves._common import deconstruct_contract
 from curves.contract_period import quarter, winter, summer, gas_year
 from tests._test_common import weighted_average_slice_curve
@@ -120,6 +121,16 @@ def test_max_smooth_interp_averages_back_to_inputs(self):
         ((pd.Period('2019-5-17', freq='D'), pd.Period('2019-5-18', freq='d')), 13.18),
     ]
 
+    def test_max_smooth_interp_columnar_contracts_same_as_tuples(self):
+        columnar_contracts = {
+            'start': ['2019-05-14', '2019-05-15', '2019-05-17'],
+            'end': ['2019-05-14', '2019-05-16', '2019-05-18'],
+            'price': [15.2, 14.05, 13.18]
+        }
+        tuples_curve = max_smooth_interp(self.daily_contracts, freq='D')
+        columnar_curve = max_smooth_interp(columnar_contracts, freq='D')
+        pd.testing.assert_series_equal(tuples_curve, columnar_curve)
+
     def test_max_smooth_interp_mult_season_adjust_called_as_expected(self):
         adjust_arg_values = []
 
@@ -153,6 +164,38 @@ def average_weight(period):
         expected_arg_values = [expected_first_arg + i for i in range(0, 5)]
         self.assertListEqual(expected_arg_values, weight_arg_values)
 
+    def _precompute_callbacks_args(self):
+        return dict(contracts=self.contracts_list, freq='D', average_weight=weighting.num_weekdays(),
+                    mult_season_adjust=adjustments.dayofweek(1.0, saturday=0.9, sunday=0.85),
+                    add_season_adjust=lambda p: 0.01 * p.month)
+
+    def test_max_smooth_interp_precompute_callbacks_same_as_callbacks(self):
+        args = self._precompute_callbacks_args()
+        callbacks_curve = max_smooth_interp(**args)
+        precomputed_curve = max_smooth_interp(**args, precompute_callbacks=True)
+        pd.testing.assert_series_equal(callbacks_curve, precomputed_curve)
+
+    def test_max_smooth_interp_interop_crossings_within_bounds(self):
+        contracts = [(quarter(2019, 1), 32.7), (quarter(2019, 2), 29.3)]
+        with profile_interop() as profile:
+            curve = max_smooth_interp(contracts, freq='D', average_weight=weighting.num_weekdays(),
+                                      precompute_callbacks=True)
+        num_days = len(curve)
+        self.assertEqual(2, profile.calls['AddContract'])
+        self.assertNotIn('callback', profile.calls)
+        # Start and end of 2 contracts, with the lookup table of average_weight created within .NET from its start
+        self.assertLessEqual(profile.calls['FromDateTime'], 2 * 2)
+        self.assertLessEqual(profile.calls['Data[idx]'], num_days)
+
+    def test_max_smooth_interp_concurrent_threads_same_as_serial(self):
+        args = self._precompute_callbacks_args()
+        expected_curve = max_smooth_interp(**args)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(max_smooth_interp, **args, precompute_callbacks=precompute)
+                       for precompute in (True, False) * 4]
+            for future in futures:
+                pd.testing.assert_series_equal(expected_curve, future.result())
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,95 @@
+# Copyright(c) 2026 Jake Fowler
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use, 
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, 
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, 
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+import unittest
+import pandas as pd
+from curves import hyperbolic_tension_spline
+from curves import contract_period as cp
+from curves import weighting, adjustments
+from curves.parallel import build_many, BuildResult
+
+
+def _failing_engine(**kwargs):
+    raise ValueError('build failed for {}'.format(kwargs['label']))
+
+
+class TestBuildMany(unittest.TestCase):
+
+    @staticmethod
+    def _jobs():
+        return [{'contracts': [(cp.month(2023, 1), 50.0 + i), (cp.month(2023, 2), 55.0), (cp.month(2023, 3), 48.0 - i)],
+                 'freq': 'D', 'tension': 0.5} for i in range(5)]
+
+    def assert_results_same_as_serial(self, results, jobs):
+        self.assertEqual(len(jobs), len(results))
+        for job, result in zip(jobs, results):
+            self.assertIsInstance(result, BuildResult)
+            self.assertTrue(result.ok)
+            self.assertGreaterEqual(result.elapsed, 0.0)
+            expected = hyperbolic_tension_spline(**job)
+            pd.testing.assert_series_equal(expected, result.result)
+
+    def test_build_many_worker_processes_results_same_as_serial_in_input_order(self):
+        jobs = self._jobs()
+        results = build_many(jobs, engine='hyperbolic_tension_spline', workers=2, chunksize=2)
+        self.assert_results_same_as_serial(results, jobs)
+
+    def test_build_many_single_worker_results_same_as_serial(self):
+        jobs = self._jobs()
+        results = build_many(jobs, workers=1)
+        self.assert_results_same_as_serial(results, jobs)
+
+    def test_build_many_weighting_and_adjustment_callables_sent_to_workers(self):
+        jobs = [dict(job, average_weight=weighting.num_weekdays(),
+                     mult_season_adjust=adjustments.dayofweek(1.0, saturday=0.8, sunday=0.7)) for job in self._jobs()]
+        results = build_many(jobs, workers=2, chunksize=2)
+        self.assert_results_same_as_serial(results, jobs)
+
+    def test_build_many_errors_captured_per_job(self):
+        jobs = self._jobs()
+        jobs[2] = dict(jobs[2], tension=-1.0)
+        results = build_many(jobs, workers=2, chunksize=1)
+        self.assertEqual(len(jobs), len(results))
+        for i, result in enumerate(results):
+            if i == 2:
+                self.assertFalse(result.ok)
+                self.assertIsNone(result.result)
+                self.assertIsInstance(result.error, ValueError)
+                self.assertIn('ValueError', result.traceback)
+            else:
+                self.assertTrue(result.ok)
+
+    def test_build_many_callable_engine(self):
+        jobs = [{'label': 'a'}, {'label': 'b'}]
+        results = build_many(jobs, engine=_failing_engine, workers=2)
+        self.assertEqual(['build failed for a', 'build failed for b'], [str(r.error) for r in results])
+
+    def test_build_many_invalid_engine_raises_value_error(self):
+        self.assertRaises(ValueError, build_many, self._jobs(), engine='not_an_engine')
+
+    def test_build_many_non_positive_workers_raises_value_error(self):
+        self.assertRaises(ValueError, build_many, self._jobs(), workers=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,142 @@
+# Copyright(c) 2026 Jake Fowler
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use, 
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, 
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, 
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+import unittest
+import numpy as np
+import pandas as pd
+from curves import hyperbolic_tension_spline, hyperbolic_tension_system, weighting
+from curves import contract_period as cp
+from curves.solved_spline import solved_spline
+from curves.revaluation import Revaluer, revalue, FLAT_PROFILE
+from tests._test_common import CONTRACTS
+
+
+def _discount_factor(period):
+    return np.exp(-0.05 * (period.ordinal - pd.Period('2020-01-01', freq='D').ordinal) / 365.0)
+
+
+class TestRevaluer(unittest.TestCase):
+
+    def setUp(self):
+        self.curve = hyperbolic_tension_spline(CONTRACTS, 'D', 0.5)
+        rng = np.random.default_rng(3)
+        starts = rng.integers(0, len(self.curve), size=200)
+        lengths = rng.integers(0, 60, size=200)
+        self.starts = self.curve.index[starts]
+        self.ends = self.curve.index[np.minimum(starts + lengths, len(self.curve) - 1)]
+
+    def test_revaluing_contracts_returns_contract_prices(self):
+        average_weight = weighting.num_weekdays()
+        system = hyperbolic_tension_system(CONTRACTS, 'D', 0.5, discount_factor=_discount_factor,
+                                           average_weight=average_weight)
+        periods = [period for period, _ in CONTRACTS]
+        prices = [price for _, price in CONTRACTS]
+        np.testing.assert_allclose(prices, Revaluer(system).revalue(periods, periods), atol=1E-10)
+        curve = system.solve()
+        np.testing.assert_allclose(prices, revalue(curve, periods, periods, discount_factor=_discount_factor,
+                                                   average_weight=average_weight), atol=1E-10)
+        self.assertFalse(np.allclose(prices, revalue(curve, periods, periods), atol=1E-4))
+
+    def test_solved_spline_weights_used_by_default(self):
+        average_weight = weighting.num_weekdays()
+        curve, spline_coeff = hyperbolic_tension_spline(CONTRACTS, 'D', 0.5, average_weight=average_weight,
+                                                        return_spline_coeff=True)
+        spline = solved_spline(curve, spline_coeff, average_weight=average_weight)
+        periods = [period for period, _ in CONTRACTS]
+        np.testing.assert_allclose([price for _, price in CONTRACTS], revalue(spline, periods, periods), atol=1E-10)
+
+    def test_same_as_weighted_average_of_slices(self):
+        volume_profiles = [lambda p: 2.0 if p.dayofweek < 5 else 0.5,
+                           np.linspace(1.0, 3.0, len(self.curve))]
+        profile_ids = np.random.default_rng(4).integers(FLAT_PROFILE, 2, size=len(self.starts))
+        revaluer = Revaluer(self.curve, discount_factor=_discount_factor, volume_profiles=volume_profiles)
+        self.assertEqual(2, revaluer.num_profiles)
+        averages = revaluer.revalue(self.starts, self.ends, profile_ids)
+        discount_factors = np.array([_discount_factor(p) for p in self.curve.index])
+        volumes = np.vstack([np.array([volume_profiles[0](p) for p in self.curve.index]), volume_profiles[1]])
+        for start, end, profile_id, average in zip(self.starts, self.ends, profile_ids, averages):
+            window = slice(self.curve.index.get_loc(start), self.curve.index.get_loc(end) + 1)
+            weights = discount_factors[window] * (1.0 if profile_id == FLAT_PROFILE else volumes[profile_id, window])
+            expected = np.sum(self.curve.values[window] * weights) / np.sum(weights)
+            self.assertAlmostEqual(expected, average, places=10)
+
+    def test_profile_matrix_same_as_profile_arrays(self):
+        volume_profiles = np.random.default_rng(5).uniform(0.5, 1.5, size=(3, len(self.curve)))
+        profile_ids = np.arange(len(self.starts)) % 3
+        np.testing.assert_array_equal(revalue(self.curve, self.starts, self.ends, profile_ids, volume_profiles),
+                                      revalue(self.curve, self.starts, self.ends, profile_ids, list(volume_profiles)))
+
+    def test_window_types(self):
+        expected = revalue(self.curve, [pd.Period('2020-02-03', freq='D')], [pd.Period('2020-02-09', freq='D')])
+        np.testing.assert_array_equal(expected, revalue(self.curve, ['2020-02-03'], ['2020-02-09']))
+        ordinals = np.array([pd.Period('2020-02-03', freq='D').ordinal, pd.Period('2020-02-09', freq='D').ordinal])
+        np.testing.assert_array_equal(expected, revalue(self.curve, ordinals[:1], ordinals[1:]))
+        monthly = revalue(self.curve, [cp.feb(2020), cp.q_2(2020)], [cp.feb(2020), cp.q_2(2020)])
+        np.testing.assert_allclose([22.1, 19.8], monthly, atol=1E-10)
+
+    def test_sub_hourly_curves(self):
+        for freq, points_per_hour in (('15min', 4), ('30min', 2)):
+            with self.subTest(freq=freq):
+                num_points = 24 * points_per_hour
+                curve = pd.Series(data=np.arange(num_points, dtype=np.float64),
+                                  index=pd.period_range('2024-01-01', periods=num_points, freq=freq))
+                averages = np.concatenate([
+                    revalue(curve, ['2024-01-01 00:00', '2024-01-01 00:15'], ['2024-01-01 00:30', '2024-01-01 00:30']),
+                    revalue(curve, [pd.Period('2024-01-01', freq='D'), pd.Period('2024-01-01 01:00', freq='h')],
+                            [pd.Period('2024-01-01', freq='D'), pd.Period('2024-01-01 01:00', freq='h')])])
+                expected = [1.0, 1.5, (num_points - 1) / 2.0, 5.5] if freq == '15min' else \
+                    [0.5, 0.5, (num_points - 1) / 2.0, 2.5]
+                np.testing.assert_allclose(expected, averages)
+
+    def test_time_zone_aware_curve(self):
+        curve = hyperbolic_tension_spline([(cp.mar(2020), 21.3), (cp.apr(2020), 22.1)], 'h', 0.5,
+                                          time_zone='Europe/London')
+        day = pd.Period('2020-03-29', freq='D')
+        clock_change_day = curve[curve.index.strftime('%Y-%m-%d') == '2020-03-29']
+        self.assertEqual(23, len(clock_change_day))
+        self.assertAlmostEqual(clock_change_day.mean(), revalue(curve, [day], [day])[0], places=10)
+
+    def test_zero_weight_window_is_nan(self):
+        averages = revalue(self.curve, ['2020-02-08', '2020-02-03'], ['2020-02-09', '2020-02-09'],
+                           average_weight=weighting.num_weekdays())
+        self.assertTrue(np.isnan(averages[0]))
+        self.assertFalse(np.isnan(averages[1]))
+
+    def test_invalid_trades_raise(self):
+        revaluer = Revaluer(self.curve, volume_profiles=[np.ones(len(self.curve))])
+        with self.assertRaises(ValueError):
+            revaluer.revalue(['2020-02-09'], ['2020-02-03'])
+        with self.assertRaises(ValueError):
+            revaluer.revalue(['2019-12-31'], ['2020-01-03'])
+        with self.assertRaises(ValueError):
+            revaluer.revalue(['2020-09-01'], ['2020-10-01'])
+        with self.assertRaises(ValueError):
+            revaluer.revalue(['2020-02-03'], ['2020-02-09'], [1])
+        with self.assertRaises(ValueError):
+            revaluer.revalue(['2020-02-03', '2020-02-04'], ['2020-02-09'])
+        with self.assertRaises(ValueError):
+            Revaluer(self.curve, volume_profiles=[np.ones(10)])
+
+
+if __name__ == '__main__':
+    unittest.main()
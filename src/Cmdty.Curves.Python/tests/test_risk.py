@@ -0,0 +1,133 @@
+# Copyright(c) 2026 Jake Fowler
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use, 
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, 
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, 
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+import unittest
+import functools
+import numpy as np
+import pandas as pd
+from curves import hyperbolic_tension_spline, weighting
+from curves import contract_period as cp
+from curves.risk import bucket_deltas
+from tests._test_common import CONTRACTS
+
+
+def _tension_spline_builder(contracts, **kwargs):
+    return hyperbolic_tension_spline(contracts, **kwargs)
+
+
+class TestBucketDeltas(unittest.TestCase):
+
+    def test_deltas_same_as_bumping_and_rebuilding(self):
+        bump = 0.5
+        deltas = bucket_deltas('hyperbolic_tension_spline', CONTRACTS, bump=bump, freq='D', tension=0.5)
+        base_curve = hyperbolic_tension_spline(CONTRACTS, 'D', 0.5)
+        self.assertEqual((len(base_curve), len(CONTRACTS)), deltas.shape)
+        pd.testing.assert_index_equal(base_curve.index, deltas.index)
+        self.assertEqual(cp.feb(2020), deltas.columns[1])
+        bumped_contracts = list(CONTRACTS)
+        bumped_contracts[1] = (cp.feb(2020), 22.1 + bump)
+        expected = (hyperbolic_tension_spline(bumped_contracts, 'D', 0.5) - base_curve) / bump
+        np.testing.assert_allclose(expected.values, deltas.iloc[:, 1].values, atol=1E-8)
+
+    def test_callable_builder_same_as_tension_spline_system(self):
+        kwargs = dict(freq='D', tension=0.5, average_weight=weighting.num_weekdays())
+        expected = bucket_deltas('hyperbolic_tension_spline', CONTRACTS, output='numpy', **kwargs)
+        threaded = bucket_deltas(_tension_spline_builder, CONTRACTS, output='numpy', workers=3, **kwargs)
+        serial = bucket_deltas(_tension_spline_builder, CONTRACTS, output='numpy', workers=1, **kwargs)
+        np.testing.assert_allclose(expected, threaded, atol=1E-8)
+        np.testing.assert_array_equal(threaded, serial)
+
+    def test_builder_returning_tuple_uses_first_element(self):
+        builder = functools.partial(_tension_spline_builder, return_spline_coeff=True)
+        expected = bucket_deltas(_tension_spline_builder, CONTRACTS, output='numpy', freq='D', tension=0.5)
+        np.testing.assert_array_equal(expected, bucket_deltas(builder, CONTRACTS, output='numpy', freq='D',
+                                                              tension=0.5))
+
+    def test_contract_buckets_have_unit_delta_to_own_contract(self):
+        # The curve average over each contract delivery period equals the contract price, so each contract bucket
+        # moves one-for-one with its own contract and not at all with the others
+        average_weight = weighting.num_weekdays()
+        buckets = [period for period, _ in CONTRACTS]
+        deltas = bucket_deltas('hyperbolic_tension_spline', CONTRACTS, buckets=buckets, freq='D', tension=0.5,
+                               average_weight=average_weight)
+        self.assertEqual(buckets, list(deltas.index))
+        np.testing.assert_allclose(np.eye(len(CONTRACTS)), deltas.values, atol=1E-8)
+
+    def test_bucket_weight_overrides_average_weight(self):
+        point_deltas = bucket_deltas('hyperbolic_tension_spline', CONTRACTS, freq='D', tension=0.5,
+                                     average_weight=weighting.num_weekdays())
+        deltas = bucket_deltas('hyperbolic_tension_spline', CONTRACTS, buckets=[('2020-01-06', '2020-01-12')],
+                               bucket_weight=lambda p: 1.0, freq='D', tension=0.5,
+                               average_weight=weighting.num_weekdays())
+        expected = point_deltas.loc['2020-01-06':'2020-01-12'].mean()
+        np.testing.assert_allclose(expected.values, deltas.values[0], atol=1E-12)
+
+    def test_buckets_of_time_zone_aware_curve(self):
+        contracts = [(cp.mar(2020), 21.3), (cp.apr(2020), 22.1)]
+        point_deltas = bucket_deltas('hyperbolic_tension_spline', contracts, freq='h', tension=0.5,
+                                     time_zone='Europe/London')
+        deltas = bucket_deltas('hyperbolic_tension_spline', contracts, buckets=[pd.Period('2020-03-29', freq='D')],
+                               freq='h', tension=0.5, time_zone='Europe/London')
+        clock_change_day = point_deltas[point_deltas.index.strftime('%Y-%m-%d') == '2020-03-29']
+        self.assertEqual(23, len(clock_change_day))
+        np.testing.assert_allclose(clock_change_day.mean().values, deltas.values[0], atol=1E-12)
+
+    def test_buckets_of_sub_hourly_curves(self):
+        contracts = [(pd.Period('2024-01-01', freq='D'), 21.3), (pd.Period('2024-01-02', freq='D'), 22.1),
+                     (pd.Period('2024-01-03', freq='D'), 20.5)]
+        for freq in ('15min', '30min'):
+            with self.subTest(freq=freq):
+                point_deltas = bucket_deltas('hyperbolic_tension_spline', contracts, freq=freq, tension=0.5)
+                buckets = [period for period, _ in contracts] + [('2024-01-01 01:00', '2024-01-01 02:30')]
+                deltas = bucket_deltas('hyperbolic_tension_spline', contracts, buckets=buckets, freq=freq, tension=0.5)
+                np.testing.assert_allclose(np.eye(len(contracts)), deltas.values[:3], atol=1E-8)
+                expected = point_deltas.loc[pd.Period('2024-01-01 01:00', freq=freq):
+                                            pd.Period('2024-01-01 02:30', freq=freq)]
+                self.assertEqual(4 if freq == '30min' else 7, len(expected))
+                np.testing.assert_allclose(expected.mean().values, deltas.values[3], atol=1E-12)
+
+    def test_columnar_and_series_contracts(self):
+        expected = bucket_deltas('hyperbolic_tension_spline', CONTRACTS, output='numpy', freq='D', tension=0.5)
+        columnar = {'start': [cp.jan(2020), cp.feb(2020), cp.mar(2020), cp.apr(2020), cp.jul(2020)],
+                    'end': [cp.jan(2020), cp.feb(2020), cp.mar(2020), cp.jun(2020), cp.sep(2020)],
+                    'price': [price for _, price in CONTRACTS]}
+        columnar_deltas = bucket_deltas(_tension_spline_builder, columnar, freq='D', tension=0.5)
+        pd.testing.assert_index_equal(pd.RangeIndex(len(CONTRACTS)), columnar_deltas.columns)
+        np.testing.assert_allclose(expected, columnar_deltas.values, atol=1E-8)
+        series = pd.Series(data=[21.3, 22.1, 20.5], index=pd.period_range('2020-01', periods=3, freq='M'))
+        series_deltas = bucket_deltas(_tension_spline_builder, series, freq='D', tension=0.5)
+        pd.testing.assert_index_equal(series.index, series_deltas.columns)
+
+    def test_invalid_arguments_raise(self):
+        with self.assertRaises(ValueError):
+            bucket_deltas('hyperbolic_tension_spline', CONTRACTS, bump=0.0, freq='D', tension=0.5)
+        with self.assertRaises(ValueError):
+            bucket_deltas('not_an_engine', CONTRACTS, freq='D', tension=0.5)
+        with self.assertRaises(ValueError):
+            bucket_deltas('hyperbolic_tension_spline', CONTRACTS, output='arrow', freq='D', tension=0.5)
+        with self.assertRaises(ValueError):
+            bucket_deltas('hyperbolic_tension_spline', CONTRACTS, buckets=[cp.q_4(2020)], freq='D', tension=0.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+# Copyright(c) 2026 Jake Fowler
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use, 
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, 
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, 
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+import unittest
+import numpy as np
+from curves import hyperbolic_tension_system, weighting
+from curves.scenarios import sample_prices, scenario_curves
+from tests._test_common import CONTRACTS
+
+# Not in delivery period order, so that the ordering of contracts by the system is exercised
+_CONTRACTS = [CONTRACTS[3]] + CONTRACTS[:3] + CONTRACTS[4:]
+
+
+class TestScenarios(unittest.TestCase):
+
+    def setUp(self):
+        self.system = hyperbolic_tension_system(_CONTRACTS, 'D', 0.5, average_weight=weighting.num_weekdays(),
+                                                mult_season_adjust=lambda p: 1.0 + 0.01 * p.dayofweek,
+                                                add_season_adjust=lambda p: 0.1 * (p.dayofweek >= 5))
+        self.prices = self.system.contract_prices + np.random.default_rng(1).normal(0.0, 2.0, size=(20, 5))
+
+    def _assert_same_as_solve(self, curves, prices):
+        self.assertEqual((len(prices), len(self.system.solve(output='numpy').values)), curves.shape)
+        for scenario_prices, curve in zip(prices, curves):
+            np.testing.assert_allclose(self.system.solve(scenario_prices, output='numpy').values, curve, atol=1E-10)
+
+    def test_solve_many_same_as_solve(self):
+        self._assert_same_as_solve(self.system.solve_many(self.prices), self.prices)
+
+    def test_solve_many_chunked_same_as_unchunked(self):
+        np.testing.assert_allclose(self.system.solve_many(self.prices),
+                                   self.system.solve_many(self.prices, max_memory_bytes=1), rtol=1E-14)
+
+    def test_solve_many_without_memory_limit_same_as_solve(self):
+        self._assert_same_as_solve(self.system.solve_many(self.prices, max_memory_bytes=None), self.prices)
+        self._assert_same_as_solve(scenario_curves(self.system, self.prices, max_memory_bytes=None), self.prices)
+        self.assertEqual((0, len(self.system.solve(output='numpy').values)),
+                         self.system.solve_many(self.prices[:0], max_memory_bytes=None).shape)
+
+    def test_solve_many_with_time_zone_same_as_solve(self):
+        system = hyperbolic_tension_system(_CONTRACTS, 'h', 0.5, time_zone='Europe/London')
+        curves = system.solve_many(self.prices[:3])
+        for scenario_prices, curve in zip(self.prices[:3], curves):
+            np.testing.assert_allclose(system.solve(scenario_prices, output='numpy').values, curve, atol=1E-10)
+
+    def test_solve_many_invalid_shape_raises(self):
+        with self.assertRaises(ValueError):
+            self.system.solve_many(self.prices[:, :4])
+        with self.assertRaises(ValueError):
+            self.system.solve_many(self.prices[0])
+
+    def test_scenario_curves_from_prices(self):
+        self._assert_same_as_solve(scenario_curves(self.system, self.prices), self.prices)
+
+    def test_scenario_curves_from_covariance(self):
+        covariance = 0.5 * np.eye(5) + 0.5
+        curves = scenario_curves(self.system, covariance=covariance, num_scenarios=10, seed=3)
+        prices = sample_prices(self.system.contract_prices, covariance, 10, seed=3)
+        self._assert_same_as_solve(curves, prices)
+
+    def test_zero_covariance_gives_base_curve(self):
+        curves = scenario_curves(self.system, covariance=np.zeros((5, 5)), num_scenarios=2, seed=0)
+        np.testing.assert_allclose(self.system.solve(output='numpy').values, curves[1], atol=1E-10)
+
+    def test_sample_prices_reproducible_and_distributed(self):
+        covariance = np.array([[1.0, 0.8], [0.8, 2.0]])
+        prices = sample_prices([10.0, 20.0], covariance, 20000, seed=5)
+        np.testing.assert_array_equal(prices, sample_prices([10.0, 20.0], covariance, 20000, seed=5))
+        np.testing.assert_allclose([10.0, 20.0], prices.mean(axis=0), atol=0.05)
+        np.testing.assert_allclose(covariance, np.cov(prices.T), atol=0.1)
+
+    def test_invalid_covariance_raises(self):
+        with self.assertRaises(ValueError):
+            sample_prices([10.0, 20.0], np.eye(3), 10)
+        with self.assertRaises(ValueError):
+            sample_prices([10.0, 20.0], np.array([[1.0, 0.5], [0.0, 1.0]]), 10)
+        with self.assertRaises(ValueError):
+            sample_prices([10.0, 20.0], np.array([[1.0, 2.0], [2.0, 1.0]]), 10)
+
+    def test_invalid_arguments_raise(self):
+        with self.assertRaises(ValueError):
+            scenario_curves(self.system)
+        with self.assertRaises(ValueError):
+            scenario_curves(self.system, covariance=np.eye(5))
+        with self.assertRaises(ValueError):
+            scenario_curves(self.system, self.prices, covariance=np.eye(5), num_scenarios=2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,171 @@
+# Copyright(c) 2026 Jake Fowler
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use, 
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, 
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, 
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+import unittest
+import threading
+import pandas as pd
+from curves import hyperbolic_tension_spline
+from curves import contract_period as cp
+from curves.scheduler import BuildScheduler, PriorityClass
+
+_TIMEOUT = 10.0
+
+
+class _Engine:
+    """Engine which records the order builds start in, and blocks until released."""
+
+    def __init__(self):
+        self.started = []
+        self.release = threading.Event()
+        self.lock = threading.Lock()
+        self.started_event = threading.Condition(self.lock)
+
+    def __call__(self, name, block=False):
+        with self.lock:
+            self.started.append(name)
+            self.started_event.notify_all()
+        if block:
+            self.release.wait(_TIMEOUT)
+        if name == 'error':
+            raise ValueError('Build failed.')
+        return name
+
+    def wait_started(self, num_started):
+        with self.lock:
+            self.started_event.wait_for(lambda: len(self.started) >= num_started, _TIMEOUT)
+
+
+class TestBuildScheduler(unittest.TestCase):
+
+    def test_higher_priority_builds_start_first(self):
+        engine = _Engine()
+        with BuildScheduler(workers=1) as scheduler:
+            scheduler.submit(engine, 'batch_1', block=True, priority='batch')
+            engine.wait_started(1)
+            batch_2 = scheduler.submit(engine, 'batch_2', priority='batch')
+            interactive = scheduler.submit(engine, 'interactive')
+            engine.release.set()
+            self.assertEqual('interactive', interactive.result(_TIMEOUT))
+            self.assertEqual('batch_2', batch_2.result(_TIMEOUT))
+        self.assertEqual(['batch_1', 'interactive', 'batch_2'], engine.started)
+
+    def test_concurrency_limit_reserves_workers(self):
+        engine = _Engine()
+        with BuildScheduler(workers=2) as scheduler:
+            scheduler.submit(engine, 'batch_1', block=True, priority='batch')
+            scheduler.submit(engine, 'batch_2', block=True, priority='batch')
+            engine.wait_started(1)
+            stats = scheduler.stats()['batch']
+            self.assertEqual(1, stats.running)
+            self.assertEqual(1, stats.queue_depth)
+            self.assertEqual('interactive', scheduler.submit(engine, 'interactive').result(_TIMEOUT))
+            engine.release.set()
+        self.assertEqual(['batch_1', 'interactive', 'batch_2'], engine.started)
+
+    def test_queued_build_superseded_by_build_of_same_curve(self):
+        engine = _Engine()
+        with BuildScheduler(workers=1) as scheduler:
+            scheduler.submit(engine, 'blocker', block=True)
+            engine.wait_started(1)
+            first = scheduler.submit(engine, 'first', curve_id='nbp')
+            other = scheduler.submit(engine, 'other', curve_id='ttf')
+            second = scheduler.submit(engine, 'second', curve_id='nbp')
+            self.assertTrue(first.cancelled())
+            engine.release.set()
+            self.assertEqual('second', second.result(_TIMEOUT))
+            self.assertEqual('other', other.result(_TIMEOUT))
+        self.assertEqual(['blocker', 'other', 'second'], engine.started)
+        stats = scheduler.stats()['interactive']
+        self.assertEqual(4, stats.submitted)
+        self.assertEqual(3, stats.completed)
+        self.assertEqual(1, stats.cancelled)
+
+    def test_cancelled_build_removed_from_queue(self):
+        engine = _Engine()
+        with BuildScheduler(workers=1) as scheduler:
+            scheduler.submit(engine, 'blocker', block=True)
+            engine.wait_started(1)
+            future = scheduler.submit(engine, 'cancelled')
+            self.assertEqual(1, scheduler.stats()['interactive'].queue_depth)
+            self.assertTrue(future.cancel())
+            self.assertEqual(0, scheduler.stats()['interactive'].queue_depth)
+            engine.release.set()
+        self.assertEqual(['blocker'], engine.started)
+
+    def test_shutdown_cancel_pending(self):
+        engine = _Engine()
+        scheduler = BuildScheduler(workers=1)
+        scheduler.submit(engine, 'blocker', block=True)
+        engine.wait_started(1)
+        pending = scheduler.submit(engine, 'pending')
+        engine.release.set()
+        scheduler.shutdown(cancel_pending=True)
+        self.assertTrue(pending.cancelled())
+        with self.assertRaises(RuntimeError):
+            scheduler.submit(engine, 'after_shutdown')
+
+    def test_exception_set_on_future_and_counted(self):
+        engine = _Engine()
+        with BuildScheduler(workers=2) as scheduler:
+            future = scheduler.submit(engine, 'error', priority='batch')
+            with self.assertRaises(ValueError):
+                future.result(_TIMEOUT)
+        stats = scheduler.stats()['batch']
+        self.assertEqual(1, stats.failed)
+        self.assertEqual(0, stats.completed)
+
+    def test_latency_metrics(self):
+        engine = _Engine()
+        with BuildScheduler(workers=2, classes=[PriorityClass('urgent'), PriorityClass('bulk', 1)]) as scheduler:
+            self.assertIsNone(scheduler.stats()['urgent'].latency_p50)
+            futures = [scheduler.submit(engine, str(i), priority='bulk') for i in range(5)]
+            for future in futures:
+                future.result(_TIMEOUT)
+        stats = scheduler.stats()
+        self.assertEqual(['urgent', 'bulk'], list(stats))
+        self.assertEqual(5, stats['bulk'].completed)
+        self.assertGreaterEqual(stats['bulk'].latency_p95, stats['bulk'].latency_p50)
+        self.assertGreaterEqual(stats['bulk'].latency_p50, stats['bulk'].wait_p50)
+
+    def test_builds_curve_by_engine_name(self):
+        contracts = [(cp.jan(2020), 21.3), (cp.feb(2020), 22.1), (cp.q_2(2020), 19.8)]
+        with BuildScheduler() as scheduler:
+            curve = scheduler.hyperbolic_tension_spline(contracts, 'D', tension=0.5, curve_id='nbp').result(_TIMEOUT)
+        pd.testing.assert_series_equal(hyperbolic_tension_spline(contracts, 'D', tension=0.5), curve)
+
+    def test_invalid_arguments_raise(self):
+        with self.assertRaises(ValueError):
+            BuildScheduler(workers=0)
+        with self.assertRaises(ValueError):
+            BuildScheduler(classes=[PriorityClass('a'), PriorityClass('a')])
+        with self.assertRaises(ValueError):
+            BuildScheduler(classes=[PriorityClass('a', 0)])
+        with BuildScheduler() as scheduler:
+            with self.assertRaises(ValueError):
+                scheduler.submit('hyperbolic_tension_spline', priority='urgent')
+            with self.assertRaises(ValueError):
+                scheduler.submit('cubic_spline')
+
+
+if __name__ == '__main__':
+    unittest.main()
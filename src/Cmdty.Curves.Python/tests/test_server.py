@@ -0,0 +1,142 @@
+# Copyright(c) 2026 Jake Fowler
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use, 
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, 
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, 
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+import unittest
+import os
+import subprocess
+import sys
+import tempfile
+import numpy as np
+import pandas as pd
+from curves import contract_period as cp
+from curves import hyperbolic_tension_spline, weighting, adjustments
+from curves.arrays import CurveArray
+from curves.client import CurveClient
+from curves.server import CurveServer
+from curves import _wire
+
+_contracts = [(cp.jan(2020), 10.1), (cp.feb(2020), 12.5), (cp.q_2(2020), 11.2)]
+
+
+class TestWire(unittest.TestCase):
+
+    def _round_trip(self, value):
+        import json
+        return _wire.decode(json.loads(json.dumps(_wire.encode(value))))
+
+    def test_round_trips_arguments(self):
+        value = {'contracts': [(cp.jan(2020), 10.1), (('2020-02-01', '2020-02-29'), 12.5)],
+                 'knots': [pd.Timestamp('2020-10-25 01:30+00:00').tz_convert('Europe/London')],
+                 'average_weight': weighting.num_business_days(['2020-01-01']),
+                 'add_season_adjust': adjustments.dayofweek(0.0, saturday=-1.0),
+                 'columnar': {'start': np.array([1, 2]), 'price': np.array([1.5, 2.5])}}
+        round_tripped = self._round_trip(value)
+        self.assertEqual(value['contracts'], round_tripped['contracts'])
+        self.assertEqual(value['knots'], round_tripped['knots'])
+        self.assertEqual(value['average_weight'], round_tripped['average_weight'])
+        self.assertEqual(value['add_season_adjust'], round_tripped['add_season_adjust'])
+        np.testing.assert_array_equal(value['columnar']['price'], round_tripped['columnar']['price'])
+
+    def test_round_trips_time_zone_aware_curve_over_clock_change(self):
+        curve = pd.Series(np.arange(48.0), index=pd.date_range('2020-10-25', periods=48, freq='h',
+                                                               tz='Europe/London'))
+        pd.testing.assert_series_equal(curve, self._round_trip(curve))
+
+    def test_arbitrary_function_raises_type_error(self):
+        with self.assertRaises(TypeError):
+            _wire.encode(lambda period: 1.0)
+
+    def test_unsupported_callable_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            _wire.decode({'$callable': 'os.system', 'args': {'$tuple': ['ls']}})
+
+
+class TestClientImport(unittest.TestCase):
+
+    def test_package_client_and_contract_period_import_without_dotnet(self):
+        code = ('import sys, curves, curves.client, curves.contract_period; '
+                'print(sorted(name for name in ("clr", "pythonnet", "curves.bootstrap", "curves.max_smoothness_spline", '
+                '"curves._common") if name in sys.modules))')
+        output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+        self.assertEqual('[]', output.stdout.strip())
+
+
+class TestCurveServer(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls._temp_dir = tempfile.TemporaryDirectory()
+        cls.server = CurveServer(port=0, workers=0, cache_dir=os.path.join(cls._temp_dir.name, 'cache')).start()
+        cls.client = CurveClient(cls.server.url)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.client.close()
+        cls.server.shutdown()
+        cls._temp_dir.cleanup()
+
+    def test_build_returns_same_curve_as_local_function(self):
+        expected = hyperbolic_tension_spline(_contracts, 'D', 1.5,
+                                             average_weight=weighting.num_business_days(['2020-01-01']))
+        actual = self.client.hyperbolic_tension_spline(_contracts, 'D', tension=1.5,
+                                                       average_weight=weighting.num_business_days(['2020-01-01']))
+        pd.testing.assert_series_equal(expected, actual)
+
+    def test_build_returns_curve_array_and_spline_coefficients(self):
+        curve, coeffs = self.client.hyperbolic_tension_spline(_contracts, 'D', 1.5, return_spline_coeff=True,
+                                                              output='numpy')
+        expected_curve, expected_coeffs = hyperbolic_tension_spline(_contracts, 'D', 1.5, return_spline_coeff=True,
+                                                                    output='numpy')
+        self.assertIsInstance(curve, CurveArray)
+        np.testing.assert_array_equal(expected_curve.values, curve.values)
+        self.assertEqual(sorted(expected_coeffs), sorted(coeffs))
+
+    def test_invalid_arguments_raise_value_error(self):
+        with self.assertRaises(ValueError):
+            self.client.hyperbolic_tension_spline(_contracts[:1], 'D', 1.5)
+
+    def test_unknown_argument_raises_type_error_without_build(self):
+        requests = self.client.stats()['requests']
+        with self.assertRaises(TypeError):
+            self.client.hyperbolic_tension_spline(_contracts, 'D', 1.5, tensoin=1.0)
+        self.assertEqual(requests, self.client.stats()['requests'])
+
+    def test_health_reports_version(self):
+        from curves import __version__
+        self.assertEqual({'status': 'ok', 'version': __version__}, self.client.health())
+
+
+@unittest.skipIf(os.name != 'posix', 'Unix domain sockets only used on POSIX')
+class TestCurveServerUnixSocketWithWorkers(unittest.TestCase):
+
+    def test_build_over_unix_socket_in_worker_process(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with CurveServer(unix_socket=os.path.join(temp_dir, 'curves.sock'), workers=1) as server:
+                with CurveClient(server.url) as client:
+                    curve = client.hyperbolic_tension_spline(_contracts, 'D', 1.5)
+                    pd.testing.assert_series_equal(hyperbolic_tension_spline(_contracts, 'D', 1.5), curve)
+                    self.assertEqual({'requests': 1, 'errors': 0, 'in_flight': 0}, client.stats())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+# Copyright(c) 2026 Jake Fowler
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use, 
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, 
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, 
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+import unittest
+import os
+import numpy as np
+import pandas as pd
+from curves import hyperbolic_tension_spline, CurveArray
+from curves import contract_period as cp
+from curves.parallel import build_many
+from curves.shm import share_curve, SharedCurve, SharedCurveHandle, release
+
+
+@unittest.skipIf(os.name != 'posix', 'Shared memory transport only supported on POSIX platforms.')
+class TestShm(unittest.TestCase):
+
+    contracts = [(cp.month(2023, 1), 50.0), (cp.month(2023, 2), 55.0), (cp.quarter(2023, 2), 48.0)]
+
+    def test_share_curve_series_attached_as_same_series(self):
+        curve = hyperbolic_tension_spline(self.contracts, freq='D', tension=0.5)
+        handle = share_curve(curve)
+        with SharedCurve(handle) as shared_curve:
+            pd.testing.assert_series_equal(curve, shared_curve.to_series())
+
+    def test_share_curve_time_zone_aware_series_attached_as_same_series(self):
+        index = pd.date_range('2023-03-25', '2023-03-27', freq='h', tz='Europe/London', inclusive='left')
+        curve = pd.Series(np.arange(len(index), dtype=np.float64), index=index)
+        with SharedCurve(share_curve(curve)) as shared_curve:
+            pd.testing.assert_series_equal(curve, shared_curve.to_series(), check_freq=False)
+
+    def test_shared_curve_values_view_shared_memory(self):
+        curve_array = CurveArray(np.array([1.0, 2.0, 3.0]), 100, 'D')
+        handle = share_curve(curve_array)
+        with SharedCurve(handle) as shared_curve1:
+            shared_curve2 = SharedCurve(handle)
+            shared_curve1.values[1] = 5.0
+            self.assertEqual(5.0, shared_curve2.values[1])
+            self.assertEqual(curve_array.start_ordinal, shared_curve2.curve_array().start_ordinal)
+            shared_curve2.close()
+
+    def test_release_frees_shared_memory(self):
+        handle = share_curve(CurveArray(np.array([1.0, 2.0]), 100, 'D'))
+        release(handle)
+        self.assertRaises(FileNotFoundError, SharedCurve, handle)
+
+    def test_build_many_shm_transport_same_as_pickle(self):
+        jobs = [{'contracts': self.contracts, 'freq': 'D', 'tension': 0.5 + i * 0.1} for i in range(4)]
+        pickle_results = build_many(jobs, workers=2, chunksize=1)
+        shm_results = build_many(jobs, workers=2, chunksize=1, transport='shm')
+        for pickle_result, shm_result in zip(pickle_results, shm_results):
+            self.assertIsInstance(shm_result.result, SharedCurveHandle)
+            with SharedCurve(shm_result.result) as shared_curve:
+                pd.testing.assert_series_equal(pickle_result.result, shared_curve.to_series())
+
+    def test_build_many_shm_transport_shares_curves_in_tuple_results(self):
+        jobs = [{'contracts': self.contracts, 'freq': 'D', 'tension': 0.5, 'return_spline_coeff': True}]
+        (shm_result,) = build_many(jobs, workers=1, transport='shm')
+        handle, spline_coeff = shm_result.result
+        self.assertIsInstance(handle, SharedCurveHandle)
+        self.assertIsInstance(spline_coeff, pd.DataFrame)
+        release(handle)
+
+    def test_build_many_invalid_transport_raises_value_error(self):
+        self.assertRaises(ValueError, build_many, [], transport='not_a_transport')
+
+
+if __name__ == '__main__':
+    unittest.main()
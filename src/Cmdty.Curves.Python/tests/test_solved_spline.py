@@ -0,0 +1,109 @@
+# Copyright(c) 2026 Jake Fowler
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use, 
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, 
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, 
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+import unittest
+import io
+import pandas as pd
+import numpy as np
+from curves import hyperbolic_tension_spline, max_smooth_interp
+from curves import contract_period as cp
+from curves.solved_spline import solved_spline, load_solved_spline
+
+
+def _add_season_adjust(period):
+    return 0.15 * period.dayofweek
+
+
+class TestSolvedSpline(unittest.TestCase):
+    contracts = [
+        (cp.q_1(2024), 21.3),
+        (cp.q_2(2024), 19.8),
+        (cp.summer(2024), 20.1),
+        (cp.winter(2024), 25.6)
+    ]
+
+    def test_hyperbolic_tension_spline_saved_and_loaded_evaluates_to_curve(self):
+        for freq, time_zone, output in (('D', None, 'series'), ('H', 'Europe/London', 'series'),
+                                        ('D', None, 'numpy'), ('H', 'Europe/London', 'numpy')):
+            with self.subTest(freq=freq, time_zone=time_zone, output=output):
+                curve, spline_coeff = hyperbolic_tension_spline(self.contracts, freq=freq, tension=0.5,
+                                                                time_zone=time_zone, add_season_adjust=_add_season_adjust,
+                                                                return_spline_coeff=True, output=output)
+                spline = solved_spline(curve, spline_coeff, add_season_adjust=_add_season_adjust)
+                loaded_spline = self._save_and_load(spline)
+                evaluated_curve = loaded_spline.evaluate(output=output)
+                if output == 'numpy':
+                    self.assertEqual(curve.start_ordinal, evaluated_curve.start_ordinal)
+                    curve = curve.to_series()
+                    evaluated_curve = evaluated_curve.to_series()
+                pd.testing.assert_series_equal(curve, evaluated_curve, rtol=1E-12)
+
+    def test_hyperbolic_tension_spline_evaluate_sub_range(self):
+        curve, spline_coeff = hyperbolic_tension_spline(self.contracts, freq='H', tension=0.5,
+                                                        time_zone='Europe/London', return_spline_coeff=True)
+        spline = solved_spline(curve, spline_coeff)
+        sub_range_curve = spline.evaluate(start='2024-10-26', end='2024-10-28')
+        self.assertEqual(2 * 24 + 2, len(sub_range_curve))  # Includes extra hour from clock change
+        pd.testing.assert_series_equal(curve[sub_range_curve.index], sub_range_curve, rtol=1E-12)
+
+    def test_evaluate_range_outside_curve_raises_value_error(self):
+        curve, spline_coeff = hyperbolic_tension_spline(self.contracts, freq='D', tension=0.5, return_spline_coeff=True)
+        spline = solved_spline(curve, spline_coeff)
+        self.assertRaises(ValueError, spline.evaluate, start='2023-12-01')
+
+    def test_weights_table_is_product_of_average_weight_and_discount_factor(self):
+        curve, spline_coeff = hyperbolic_tension_spline(self.contracts, freq='D', tension=0.5, return_spline_coeff=True)
+        spline = solved_spline(curve, spline_coeff, average_weight=lambda p: 2.0, discount_factor=lambda p: 0.9)
+        np.testing.assert_array_equal(np.full(len(curve), 1.8), self._save_and_load(spline).weights)
+
+    def test_no_callables_only_coefficients_stored(self):
+        curve, spline_coeff = hyperbolic_tension_spline(self.contracts, freq='15min', tension=0.5,
+                                                        return_spline_coeff=True)
+        spline = solved_spline(curve, spline_coeff)
+        self.assertIsNone(spline.add_season_adjusts)
+        self.assertIsNone(spline.mult_season_adjusts)
+        self.assertIsNone(spline.weights)
+        self.assertEqual(len(spline_coeff), len(spline.coefficients))
+
+    def test_max_smooth_interp_saved_and_loaded_evaluates_to_curve(self):
+        curve, spline_coeff = max_smooth_interp(self.contracts, freq='D', add_season_adjust=_add_season_adjust,
+                                                return_spline_coeff=True)
+        spline = solved_spline(curve, spline_coeff, add_season_adjust=_add_season_adjust)
+        evaluated_curve = self._save_and_load(spline).evaluate()
+        pd.testing.assert_series_equal(curve, evaluated_curve, rtol=1E-10)
+
+    def test_unrecognised_coefficient_columns_raises_value_error(self):
+        curve = pd.Series(data=[1.0, 2.0], index=pd.period_range(start='2024-01-01', periods=2, freq='D'))
+        spline_coeff = pd.DataFrame(data=[[0.0, 1.0]], index=curve.index[:1], columns=['t', 'x'])
+        self.assertRaises(ValueError, solved_spline, curve, spline_coeff)
+
+    @staticmethod
+    def _save_and_load(spline):
+        file = io.BytesIO()
+        spline.save(file)
+        file.seek(0)
+        return load_solved_spline(file)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,170 @@
+# Copyright(c) 2026 Jake Fowler
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use, 
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, 
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, 
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+import unittest
+from unittest import mock
+import os
+import tempfile
+import pandas as pd
+import numpy as np
+from curves.store import CurveStore
+from curves.arrays import CurveArray
+
+
+def _daily_curve(start, values):
+    return pd.Series(data=values, index=pd.period_range(start=start, periods=len(values), freq='D'))
+
+
+class TestCurveStore(unittest.TestCase):
+
+    def setUp(self):
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.store = CurveStore(self._temp_dir.name)
+
+    def tearDown(self):
+        self._temp_dir.cleanup()
+
+    def test_read_returns_appended_curves_aligned_by_delivery_period(self):
+        self.store.append('nbp', '2024-01-02', _daily_curve('2024-01-03', [1.0, 2.0, 3.0]), num_columns=10)
+        self.store.append('nbp', '2024-01-03', _daily_curve('2024-01-04', [4.0, 5.0, 6.0]))
+        history = self.store.read('nbp', 'D')
+        self.assertEqual(pd.PeriodIndex(['2024-01-02', '2024-01-03'], freq='D').tolist(),
+                         history.valuation_dates.tolist())
+        self.assertEqual(pd.Period('2024-01-03', freq='D'), history.delivery_index()[0])
+        np.testing.assert_array_equal([1.0, 2.0, 3.0, np.nan], history.values[0, :4])
+        np.testing.assert_array_equal([np.nan, 4.0, 5.0, 6.0], history.values[1, :4])
+
+    def test_read_slices_valuation_dates_and_delivery_periods_without_copying(self):
+        for day in range(1, 6):
+            valuation_date = pd.Period(year=2024, month=1, day=day, freq='D')
+            self.store.append('ttf', valuation_date, _daily_curve(valuation_date + 1, np.arange(5.0) + day),
+                              num_columns=20)
+        history = self.store.read('ttf', 'D', valuation_start='2024-01-02', valuation_end='2024-01-04',
+                                  delivery_start='2024-01-05', delivery_end='2024-01-06')
+        self.assertEqual(3, len(history.valuation_dates))
+        self.assertEqual(pd.Period('2024-01-05', freq='D').ordinal, history.start_ordinal)
+        self.assertEqual((3, 2), history.values.shape)
+        self.assertIsInstance(history.values.base, np.memmap)
+        np.testing.assert_array_equal([4.0, 5.0], history.curve('2024-01-03').values)
+
+    def test_append_out_of_order_raises_value_error(self):
+        self.store.append('nbp', '2024-01-03', _daily_curve('2024-01-04', [1.0, 2.0]))
+        self.assertRaises(ValueError, self.store.append, 'nbp', '2024-01-02', _daily_curve('2024-01-04', [1.0, 2.0]))
+
+    def test_append_curve_outside_capacity_grows_store(self):
+        self.store.append('nbp', '2024-01-02', _daily_curve('2024-01-03', [1.0, 2.0]), num_columns=3)
+        history_before = self.store.read('nbp', 'D')
+        self.store.append('nbp', '2024-01-03', _daily_curve('2024-01-04', [3.0, 4.0, 5.0]))
+        self.store.append('nbp', '2024-01-04', _daily_curve('2024-01-01', [6.0, 7.0]))
+        history = self.store.read('nbp', 'D')
+        self.assertEqual(pd.Period('2024-01-01', freq='D'), history.delivery_index()[0])
+        np.testing.assert_array_equal([np.nan, np.nan, 1.0, 2.0, np.nan, np.nan], history.values[0, :6])
+        np.testing.assert_array_equal([np.nan, np.nan, np.nan, 3.0, 4.0, 5.0], history.values[1, :6])
+        np.testing.assert_array_equal([6.0, 7.0], history.values[2, :2])
+        self.assertTrue(np.isnan(history.values[2, 2:]).all())
+        np.testing.assert_array_equal([[1.0, 2.0, np.nan]], history_before.values)  # Existing readers unaffected
+
+    def test_rolling_history_grows_store(self):
+        for day in range(100):
+            valuation_date = pd.Period('2024-01-01', freq='D') + day
+            self.store.append('nbp', valuation_date, _daily_curve(valuation_date + 1, np.full(10, float(day))))
+        history = self.store.read('nbp', 'D', delivery_start='2024-04-10', delivery_end='2024-04-10')
+        np.testing.assert_array_equal(np.arange(90.0, 100.0), history.values[90:, 0])
+        self.assertLessEqual(len(os.listdir(os.path.join(self._temp_dir.name, 'nbp', 'D'))), 5)
+
+    def _values_files(self, name):
+        return sorted(file_name for file_name in os.listdir(os.path.join(self._temp_dir.name, name, 'D'))
+                      if file_name.startswith('values'))
+
+    def _grow(self, name, num_times):
+        directory = os.path.join(self._temp_dir.name, name, 'D')
+        for _ in range(num_times):
+            meta = CurveStore._read_meta(directory)
+            valuation_date = pd.Period(ordinal=meta['last_date_ordinal'], freq='D') + 1
+            start = pd.Period(ordinal=meta['start_ordinal'], freq='D')
+            self.store.append(name, valuation_date, _daily_curve(start, np.ones(meta['num_columns'] + 1)))
+
+    def test_reader_with_meta_read_before_store_grew_twice_reads_latest_values(self):
+        self.store.append('nbp', '2024-01-02', _daily_curve('2024-01-03', [1.0, 2.0]), num_columns=2)
+        stale_meta = CurveStore._read_meta(os.path.join(self._temp_dir.name, 'nbp', 'D'))
+        self._grow('nbp', 2)
+        self.assertNotIn('values.f8', self._values_files('nbp'))
+        read_meta = CurveStore._read_meta
+        with mock.patch.object(CurveStore, '_read_meta', side_effect=[stale_meta, read_meta(
+                os.path.join(self._temp_dir.name, 'nbp', 'D'))]):
+            history = self.store.read('nbp', 'D')
+        self.assertEqual(3, len(history.valuation_dates))
+        np.testing.assert_array_equal([1.0, 2.0], history.values[0, :2])
+
+    def test_store_keeps_previous_values_file_and_retries_failed_removals(self):
+        self.store.append('nbp', '2024-01-02', _daily_curve('2024-01-03', [1.0, 2.0]), num_columns=2)
+        with mock.patch('curves.store.os.remove', side_effect=PermissionError):
+            self._grow('nbp', 3)
+        self.assertEqual(['values.f8', 'values.f8.1', 'values.f8.2', 'values.f8.3'], self._values_files('nbp'))
+        self.store.append('nbp', self.store.last_valuation_date('nbp', 'D') + 1, _daily_curve('2024-01-03', [1.0]))
+        self.assertEqual(['values.f8.2', 'values.f8.3'], self._values_files('nbp'))
+
+    def test_time_zone_aware_curves_aligned_across_clock_change(self):
+        for day in range(3):
+            start = pd.Period('2024-03-30 00:00', freq='H') + 24 * day
+            self.store.append('n2ex', start.asfreq('D') - 1, CurveArray(np.arange(47.0, 51.0), start.ordinal, 'H',
+                                                                       'Europe/London'), num_columns=100)
+        history = self.store.read('n2ex', 'H')
+        self.assertEqual(pd.Timestamp('2024-03-30 00:00', tz='Europe/London'), history.delivery_index()[0])
+        frame = history.to_frame()
+        for day, valuation_date in enumerate(history.valuation_dates):
+            start = pd.Timestamp('2024-03-30 00:00', tz='Europe/London') + pd.DateOffset(days=day)
+            np.testing.assert_array_equal(np.arange(47.0, 51.0),
+                                          frame.loc[valuation_date, start:start + pd.Timedelta(hours=3)].values)
+        history = self.store.read('n2ex', 'H', delivery_start='2024-04-01 00:00')
+        self.assertEqual(pd.Timestamp('2024-04-01 00:00', tz='Europe/London'), history.delivery_index()[0])
+        np.testing.assert_array_equal(np.arange(47.0, 51.0), history.values[2, :4])
+
+    def test_sub_hourly_curves_aligned_by_delivery_period(self):
+        start = pd.Period('2024-01-01 00:00', freq='30min')
+        self.store.append('gb', '2023-12-31', CurveArray(np.arange(4.0), start.ordinal, '30min'))
+        self.store.append('gb', '2024-01-01', CurveArray(np.arange(4.0), (start + 2).ordinal, '30min'))
+        history = self.store.read('gb', '30min', delivery_start='2024-01-01 01:00')
+        self.assertEqual(pd.Period('2024-01-01 01:00', freq='30min'), history.delivery_index()[0])
+        np.testing.assert_array_equal([[2.0, 3.0, np.nan, np.nan], [0.0, 1.0, 2.0, 3.0]], history.values[:, :4])
+
+    def test_time_zone_aware_curve_array_round_trip(self):
+        start_ordinal = pd.Period('2024-10-27 00:00', freq='H').ordinal
+        curve = CurveArray(np.arange(25.0), start_ordinal, 'H', 'Europe/London')
+        self.store.append('n2ex', '2024-10-26', curve)
+        history = self.store.read('n2ex', 'H', delivery_start='2024-10-27 23:00', delivery_end='2024-10-27 23:00')
+        np.testing.assert_array_equal([[24.0]], history.values)  # 25 hours due to clock change
+        self.assertEqual('Europe/London', history.tz)
+
+    def test_reader_only_sees_committed_rows(self):
+        self.store.append('nbp', '2024-01-02', _daily_curve('2024-01-03', [1.0, 2.0]))
+        history_before = self.store.read('nbp', 'D')
+        self.store.append('nbp', '2024-01-03', _daily_curve('2024-01-03', [3.0, 4.0]))
+        self.assertEqual(1, len(history_before.valuation_dates))
+        self.assertEqual(2, len(self.store.read('nbp', 'D').valuation_dates))
+        self.assertEqual(['nbp'], self.store.names())
+        self.assertEqual(['D'], self.store.freqs('nbp'))
+
+
+if __name__ == '__main__':
+    unittest.main()
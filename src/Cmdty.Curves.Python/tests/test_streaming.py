@@ -0,0 +1,155 @@
+# Copyright(c) 2026 Jake Fowler
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use, 
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, 
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, 
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+import unittest
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import pandas as pd
+from curves import hyperbolic_tension_spline
+from curves import contract_period as cp
+from curves.streaming import CurveStreamer, PriceUpdate
+
+
+async def _async_iter(items, delay=0.0):
+    for item in items:
+        if delay:
+            await asyncio.sleep(delay)
+        yield item
+
+
+def _failing_engine(contracts, **kwargs):
+    raise ValueError('build failed')
+
+
+class _CountingExecutor(ThreadPoolExecutor):
+
+    def __init__(self):
+        super().__init__(max_workers=1)
+        self.num_submitted = 0
+
+    def submit(self, fn, *args, **kwargs):
+        self.num_submitted += 1
+        return super().submit(fn, *args, **kwargs)
+
+
+class TestCurveStreamer(unittest.TestCase):
+
+    initial_contracts = [(cp.month(2023, 1), 50.0), (cp.month(2023, 2), 55.0), (cp.quarter(2023, 2), 48.0)]
+
+    def _streamer(self, **kwargs):
+        curve_specs = {'hub': {'contracts': self.initial_contracts, 'freq': 'D', 'tension': 0.5}}
+        return CurveStreamer(curve_specs, **kwargs)
+
+    def test_burst_of_updates_coalesced_and_latest_prices_published(self):
+        streamer = self._streamer(max_rebuilds_per_second=20.0)
+        published = []
+        streamer.subscribe(published.append)
+        updates = [PriceUpdate('hub', cp.month(2023, 1), 50.0 + i * 0.1) for i in range(20)]
+        asyncio.run(streamer.run(_async_iter(updates, delay=0.005)))
+
+        stats = streamer.stats('hub')
+        self.assertEqual(20, stats.updates)
+        self.assertGreater(stats.coalesced, 0)
+        self.assertLess(len(published), 21)
+        self.assertEqual(list(range(1, len(published) + 1)), [p.version for p in published])
+        self.assertEqual(published[-1], streamer.latest('hub'))
+        self.assertEqual(len(published), stats.full_builds + stats.price_only_builds)
+        self.assertGreater(stats.price_only_builds, 0)
+        final_contracts = [(cp.month(2023, 1), 51.9)] + self.initial_contracts[1:]
+        expected_curve = hyperbolic_tension_spline(final_contracts, freq='D', tension=0.5)
+        pd.testing.assert_series_equal(expected_curve, published[-1].curve, check_exact=False, rtol=1E-10)
+
+    def test_rebuild_rate_limited(self):
+        streamer = self._streamer(max_rebuilds_per_second=10.0)
+        published = []
+        streamer.subscribe(published.append)
+        updates = [PriceUpdate('hub', cp.month(2023, 2), 55.0 + i * 0.1) for i in range(10)]
+        asyncio.run(streamer.run(_async_iter(updates, delay=0.01)))
+        # Updates spread over ~0.1 seconds, so at most ~2 rebuilds plus the initial build and final flush
+        self.assertLessEqual(len(published), 4)
+
+    def test_contract_added_full_build(self):
+        streamer = self._streamer()
+        published = []
+        streamer.subscribe(published.append)
+        updates = [PriceUpdate('hub', cp.quarter(2023, 3), 45.0)]
+        asyncio.run(streamer.run(_async_iter(updates, delay=0.01)))
+        self.assertFalse(published[-1].price_only)
+        self.assertEqual(4, len(published[-1].contracts))
+        self.assertEqual(pd.Period('2023-09-30', freq='D'), published[-1].curve.index[-1])
+
+    def test_failed_build_counted_and_stream_continues(self):
+        streamer = CurveStreamer({'bad': {'engine': _failing_engine, 'freq': 'D'},
+                                  'hub': {'contracts': self.initial_contracts, 'freq': 'D', 'tension': 0.5}})
+        updates = [PriceUpdate('bad', cp.month(2023, 1), 50.0), PriceUpdate('hub', cp.month(2023, 1), 51.0)]
+        asyncio.run(streamer.run(_async_iter(updates)))
+        self.assertEqual(1, streamer.stats('bad').errors)
+        self.assertIsInstance(streamer.last_error('bad'), ValueError)
+        self.assertIsNone(streamer.latest('bad'))
+        self.assertEqual(0, streamer.stats('hub').errors)
+        self.assertIsNotNone(streamer.latest('hub'))
+
+    def test_async_subscriber_awaited(self):
+        streamer = self._streamer()
+        versions = []
+
+        async def subscriber(published_curve):
+            await asyncio.sleep(0)
+            versions.append(published_curve.version)
+        streamer.subscribe(subscriber)
+        asyncio.run(streamer.run(_async_iter([])))
+        self.assertEqual([1], versions)
+
+    def test_failing_subscriber_recorded_and_stream_continues(self):
+        streamer = self._streamer(max_rebuilds_per_second=100.0)
+        published = []
+
+        def failing_subscriber(published_curve):
+            raise RuntimeError('subscriber failed')
+        streamer.subscribe(failing_subscriber)
+        streamer.subscribe(published.append)
+        updates = [PriceUpdate('hub', cp.month(2023, 1), 51.0), PriceUpdate('hub', cp.month(2023, 1), 52.0)]
+        asyncio.run(streamer.run(_async_iter(updates, delay=0.05)))
+        self.assertEqual(3, len(published))
+        self.assertEqual(52.0, dict(published[-1].contracts)[cp.month(2023, 1)])
+        self.assertEqual(3, streamer.stats('hub').subscriber_errors)
+        self.assertEqual(0, streamer.stats('hub').errors)
+        self.assertIsInstance(streamer.last_error('hub'), RuntimeError)
+
+    def test_price_only_builds_run_on_executor(self):
+        with _CountingExecutor() as executor:
+            streamer = self._streamer(max_rebuilds_per_second=100.0, executor=executor)
+            updates = [PriceUpdate('hub', cp.month(2023, 1), 51.0), PriceUpdate('hub', cp.month(2023, 1), 52.0)]
+            asyncio.run(streamer.run(_async_iter(updates, delay=0.05)))
+        stats = streamer.stats('hub')
+        self.assertEqual(2, stats.price_only_builds)
+        # Full build of the system and its solve, followed by one solve per price-only build
+        self.assertEqual(2 + stats.price_only_builds, executor.num_submitted)
+
+    def test_update_for_unknown_curve_raises_value_error(self):
+        streamer = self._streamer()
+        self.assertRaises(ValueError, streamer.update, PriceUpdate('unknown', cp.month(2023, 1), 50.0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,157 @@
+# Copyright(c) 2026 Jake Fowler
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use, 
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, 
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, 
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+import unittest
+from datetime import date
+import numpy as np
+import pandas as pd
+from curves import testing, hyperbolic_tension_spline
+from curves._common import contract_pandas_periods
+
+
+def _day_ranges(contracts):
+    return sorted((start.ordinal, end.ordinal) for start, end in
+                  (contract_pandas_periods(period, 'D') for period, _ in contracts))
+
+
+class TestSyntheticCurve(unittest.TestCase):
+
+    def test_same_seed_gives_identical_curve(self):
+        curve1 = testing.synthetic_curve('2025-01-01', '2026-12-31', seed=7)
+        curve2 = testing.synthetic_curve('2025-01-01', '2026-12-31', seed=7)
+        pd.testing.assert_series_equal(curve1, curve2)
+
+    def test_different_seed_gives_different_curve(self):
+        curve1 = testing.synthetic_curve('2025-01-01', '2025-12-31', seed=1)
+        curve2 = testing.synthetic_curve('2025-01-01', '2025-12-31', seed=2)
+        self.assertFalse(np.allclose(curve1.to_numpy(), curve2.to_numpy()))
+
+    def test_period_end_covers_whole_period(self):
+        curve = testing.synthetic_curve(pd.Period('2025-01', freq='M'), pd.Period('2025-03', freq='M'), freq='h')
+        self.assertEqual(pd.Period('2025-01-01 00:00', freq='h'), curve.index[0])
+        self.assertEqual(pd.Period('2025-03-31 23:00', freq='h'), curve.index[-1])
+
+    def test_peak_premium_applied_to_peak_hours(self):
+        curve = testing.synthetic_curve(date(2025, 1, 1), pd.Period('2025-01-01', freq='D'), freq='h', peak_premium=0.25,
+                                         volatility=0.0)
+        self.assertAlmostEqual(1.25, curve.iloc[8] / curve.iloc[7])
+        self.assertAlmostEqual(1.0 / 1.25, curve.iloc[20] / curve.iloc[19])
+
+
+class TestContractSets(unittest.TestCase):
+
+    def test_power_contracts_product_counts(self):
+        contracts = testing.power_contracts(date(2025, 3, 14), seed=3)
+        periods = [period for period, _ in contracts]
+        self.assertEqual(pd.Period('2025-03-15', freq='D'), periods[0])
+        self.assertEqual((pd.Period('2025-03-17', freq='D'), pd.Period('2025-03-23', freq='D')), periods[1])
+        self.assertEqual(24, sum(isinstance(p, pd.Period) and p.freqstr == 'M' for p in periods))
+        self.assertEqual(8, sum(isinstance(p, pd.Period) and p.freqstr == 'Q-DEC' for p in periods))
+        self.assertEqual(4, sum(isinstance(p, pd.Period) and p.freqstr == '2Q-DEC' for p in periods))
+
+    def test_non_overlapping_contracts_do_not_overlap(self):
+        for valuation_date in ['2025-01-30', '2025-03-14', '2025-06-29', '2025-11-03']:
+            for contracts in [testing.power_contracts(valuation_date), testing.gas_contracts(valuation_date)]:
+                day_ranges = _day_ranges(contracts)
+                for (_, end), (next_start, _) in zip(day_ranges[:-1], day_ranges[1:]):
+                    self.assertLess(end, next_start)
+
+    def test_overlapping_contracts_overlap_months(self):
+        contracts = testing.power_contracts('2025-03-14', overlapping=True)
+        periods = [period for period, _ in contracts]
+        self.assertIn(pd.Period('2025Q3', freq='Q'), periods)
+        self.assertIn(pd.Period('2025-07', freq='M'), periods)
+
+    def test_gas_balance_of_month(self):
+        contracts = testing.gas_contracts('2025-03-14', seed=1)
+        self.assertEqual((pd.Period('2025-03-16', freq='D'), pd.Period('2025-03-31', freq='D')), contracts[1][0])
+        self.assertEqual(pd.Period('2025-04', freq='M'), contracts[2][0])
+
+    def test_gas_balance_of_month_omitted_when_day_ahead_is_month_end(self):
+        contracts = testing.gas_contracts('2025-03-30')
+        self.assertEqual(pd.Period('2025-04', freq='M'), contracts[1][0])
+
+    def test_sub_daily_contracts_reprice_from_built_curve(self):
+        for freq in ('h', '15min'):
+            for contracts in (testing.power_contracts('2025-03-14', num_months=2, num_quarters=1, num_seasons=0,
+                                                      freq=freq),
+                              testing.gas_contracts('2025-03-14', num_months=2, num_quarters=1, num_seasons=0,
+                                                    freq=freq)):
+                with self.subTest(freq=freq):
+                    curve = hyperbolic_tension_spline(contracts, freq=freq, tension=0.5)
+                    for period, price in contracts:
+                        start, end = contract_pandas_periods(period, freq)
+                        self.assertAlmostEqual(price, curve[start:end].mean(), places=8)
+
+    def test_same_seed_gives_identical_contracts(self):
+        self.assertEqual(testing.power_contracts('2025-03-14', seed=5), testing.power_contracts('2025-03-14', seed=5))
+        self.assertNotEqual(testing.power_contracts('2025-03-14', seed=5),
+                            testing.power_contracts('2025-03-14', seed=6))
+
+    def test_contract_prices_are_curve_averages(self):
+        curve = testing.synthetic_curve('2025-01-01', '2025-06-30', seed=2)
+        contracts = testing.contracts_from_curve(curve, [pd.Period('2025-02', freq='M'),
+                                                         (date(2025, 3, 3), date(2025, 3, 9))])
+        self.assertAlmostEqual(curve['2025-02'].mean(), contracts[0][1])
+        self.assertAlmostEqual(curve['2025-03-03':'2025-03-09'].mean(), contracts[1][1])
+
+    def test_contract_outside_curve_raises(self):
+        curve = testing.synthetic_curve('2025-01-01', '2025-06-30')
+        with self.assertRaises(ValueError):
+            testing.contracts_from_curve(curve, [pd.Period('2025-07', freq='M')])
+
+    def test_redundant_quotes_aggregate_months_consistently(self):
+        curve = testing.synthetic_curve('2025-01-01', '2025-12-31', seed=4)
+        contracts = testing.contracts_from_curve(curve, pd.period_range('2025-01', '2025-05', freq='M'))
+        quotes = testing.redundant_quotes(contracts, curve, num_duplicates=2, aggregate_months=True)
+        self.assertEqual(contracts, quotes[:5])
+        self.assertEqual(pd.Period('2025Q1', freq='Q'), quotes[5][0])
+        self.assertAlmostEqual(curve['2025-01':'2025-03'].mean(), quotes[5][1])
+        self.assertEqual(8, len(quotes))
+
+
+class TestShapingAndHolidays(unittest.TestCase):
+
+    def test_shaping_ratios_and_spreads_consistent_with_curve(self):
+        curve = testing.synthetic_curve('2025-01-01', '2025-01-07', freq='h', peak_premium=0.3, seed=9)
+        for num, denom, ratio in testing.shaping_ratios(curve, 20, seed=1):
+            self.assertAlmostEqual(curve[num] / curve[denom], ratio)
+        for period1, period2, spread in testing.shaping_spreads(curve, 20, seed=1):
+            self.assertAlmostEqual(curve[period1] - curve[period2], spread)
+
+    def test_holiday_calendar(self):
+        holidays = testing.holiday_calendar(2024, 2025)
+        self.assertIn(date(2024, 3, 29), holidays)  # Good Friday
+        self.assertIn(date(2025, 4, 21), holidays)  # Easter Monday
+        self.assertIn(date(2025, 5, 26), holidays)
+        self.assertEqual(16, len(holidays))
+
+    def test_holiday_calendar_random_holidays_are_seeded_weekdays(self):
+        holidays = testing.holiday_calendar(2025, 2025, num_random=3, seed=11)
+        self.assertEqual(holidays, testing.holiday_calendar(2025, 2025, num_random=3, seed=11))
+        self.assertEqual(11, len(holidays))
+        self.assertTrue(all(day.weekday() < 5 for day in set(holidays) - set(testing.holiday_calendar(2025, 2025))))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -22,7 +22,9 @@
 # OTHER DEALINGS IN THE SOFTWARE.
 
 import unittest
+import pickle
 import pandas as pd
+import numpy as np
 from curves import weighting
 from datetime import date
 
@@ -75,3 +77,45 @@ def test_num_periods_equals_50_half_hours_for_clock_change_back_day(self):
         day = pd.Period('2019-10-27 00:00', freq='D')
         num_half_hours = half_hours_count(day)
         self.assertEqual(50, num_half_hours)
+
+    def test_num_periods_zero_for_non_existent_and_two_for_duplicated_periods(self):
+        hours_count = weighting.num_periods(freq='h', tz='Europe/London')
+        half_hours_count = weighting.num_periods(freq='30min', tz='Europe/London')
+        non_existent_hour = pd.Period('2019-03-31 01:00', freq='h')
+        duplicated_hour = pd.Period('2019-10-27 01:00', freq='h')
+        self.assertEqual(0, hours_count(non_existent_hour))
+        self.assertEqual(2, hours_count(duplicated_hour))
+        self.assertEqual(4, half_hours_count(duplicated_hour))
+        self.assertEqual(1, hours_count(pd.Period('2019-10-27 02:00', freq='h')))
+        index = pd.period_range('2019-10-26 22:00', '2019-10-27 04:00', freq='h')
+        expected = np.array([hours_count(p) for p in index])
+        np.testing.assert_array_equal(expected, hours_count.evaluate(index))
+        np.testing.assert_array_equal([0.0, 1.0], hours_count.evaluate(pd.PeriodIndex([non_existent_hour,
+                                                                                       non_existent_hour + 1])))
+
+    def test_num_business_days_evaluate_same_as_call(self):
+        business_days_count = weighting.num_business_days([date(2019, 5, 6), date(2019, 5, 27), date(2019, 12, 25)])
+        for index in (pd.period_range('2019-01', '2020-12', freq='M'),
+                      pd.period_range('2019-05-01', '2019-06-30', freq='D')):
+            expected = np.array([business_days_count(p) for p in index])
+            np.testing.assert_array_equal(expected, business_days_count.evaluate(index))
+
+    def test_num_periods_evaluate_same_as_call(self):
+        for freq, tz in (('h', 'Europe/London'), ('30min', 'Europe/London'), ('h', None), ('D', 'Europe/London')):
+            periods_count = weighting.num_periods(freq=freq, tz=tz)
+            for index in (pd.period_range('2019-01-01', '2020-12-31', freq='D'),
+                          pd.period_range('2019-01', '2020-12', freq='M')):
+                expected = np.array([periods_count(p) for p in index])
+                np.testing.assert_array_equal(expected, periods_count.evaluate(index))
+
+    def test_weightings_pickle_round_trip_equal_with_same_hash(self):
+        for weighting_func in (weighting.num_business_days([date(2019, 5, 6)]), weighting.num_weekdays(),
+                               weighting.num_periods(freq='h', tz='Europe/London')):
+            unpickled = pickle.loads(pickle.dumps(weighting_func))
+            self.assertEqual(weighting_func, unpickled)
+            self.assertEqual(hash(weighting_func), hash(unpickled))
+            self.assertEqual(repr(weighting_func), repr(unpickled))
+
+    def test_num_business_days_equal_regardless_of_holiday_order_and_type(self):
+        self.assertEqual(weighting.num_business_days([date(2019, 5, 27), date(2019, 5, 6)]),
+                         weighting.num_business_days([pd.Timestamp(2019, 5, 6), '2019-05-27']))